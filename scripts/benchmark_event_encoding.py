@@ -0,0 +1,131 @@
+"""Benchmark stream event serialization: to_sse_dict() + json.dumps vs StreamEventEncoder.
+
+Replays a recorded event trace through both paths and reports per-event cost.
+A trace is either a JSONL file of SSE payload dicts or a raw SSE capture
+(``data: {...}`` lines), e.g. recorded with:
+
+    curl -N "http://localhost:8000/api/chat/<conversation_id>/stream?message=..." > trace.sse
+
+Without ``--trace`` a representative synthetic trace is generated (routing and
+analysis thoughts, agent lifecycle events, many response deltas, heartbeats).
+
+Usage:
+    uv run python scripts/benchmark_event_encoding.py [--trace trace.sse] [--repeat 20]
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+from agentic_fleet.api.events.encoding import StreamEventEncoder, orjson
+from agentic_fleet.api.events.mapping import classify_event
+from agentic_fleet.models import StreamEvent, StreamEventType
+
+
+def _synthetic_trace(workflow_id: str, deltas: int = 400) -> list[dict]:
+    payloads: list[dict] = [
+        {"type": "connected", "message": "Connected", "data": {"conversation_id": "c-1"}},
+        {"type": "orchestrator.thought", "kind": "analysis", "message": "Analyzing task"},
+        {
+            "type": "orchestrator.thought",
+            "kind": "routing",
+            "message": "Routing to researcher, writer",
+            "data": {"assigned_to": ["researcher", "writer"], "mode": "sequential"},
+        },
+    ]
+    for agent in ("researcher", "writer"):
+        payloads.append({"type": "agent.start", "agent_id": agent, "author": agent.title()})
+        payloads.extend(
+            {"type": "response.delta", "delta": f"token {i} ", "agent_id": agent}
+            for i in range(deltas // 2)
+        )
+        payloads.append({"type": "agent.complete", "agent_id": agent})
+        payloads.append({"type": "heartbeat", "message": "heartbeat"})
+    payloads.append({"type": "response.completed", "message": "Final answer " * 40})
+    payloads.append({"type": "done"})
+    for payload in payloads:
+        payload["workflow_id"] = workflow_id
+    return payloads
+
+
+def _load_trace(path: Path) -> list[dict]:
+    payloads = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line.startswith("data:"):
+            line = line[len("data:") :].strip()
+        if line.startswith("{"):
+            payloads.append(json.loads(line))
+    return payloads
+
+
+def _to_event(payload: dict) -> StreamEvent:
+    event_type = StreamEventType(payload["type"])
+    category, ui_hint = classify_event(event_type, payload.get("kind"))
+    fields = {
+        key: value
+        for key, value in payload.items()
+        if key not in {"type", "category", "ui_hint", "timestamp"}
+    }
+    timestamp = payload.get("timestamp")
+    return StreamEvent(
+        type=event_type,
+        category=category,
+        ui_hint=ui_hint,
+        timestamp=datetime.fromisoformat(timestamp) if timestamp else datetime.now(),
+        **fields,
+    )
+
+
+def _time(label: str, fn, events: list[StreamEvent], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(events)
+        best = min(best, time.perf_counter() - start)
+    per_event_us = best / len(events) * 1e6
+    print(f"  {label:<40} {per_event_us:8.2f} us/event  ({len(events) / best:,.0f} events/s)")
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trace", type=Path, help="Recorded SSE capture or JSONL payloads")
+    parser.add_argument("--repeat", type=int, default=20, help="Timed repetitions (best of)")
+    args = parser.parse_args()
+
+    workflow_id = "wf-benchmark-0001"
+    payloads = _load_trace(args.trace) if args.trace else _synthetic_trace(workflow_id)
+    events = [_to_event(payload) for payload in payloads]
+    if not events:
+        raise SystemExit("Trace contains no events")
+    workflow_id = events[0].workflow_id or workflow_id
+
+    def legacy(batch: list[StreamEvent]) -> None:
+        for event in batch:
+            f"data: {json.dumps(event.to_sse_dict())}\n\n".encode()
+
+    def encoder_path(batch: list[StreamEvent]) -> None:
+        encoder = StreamEventEncoder(workflow_id)
+        for event in batch:
+            encoder.encode_sse(event)
+
+    # Sanity check: both paths must produce the same payloads.
+    encoder = StreamEventEncoder(workflow_id)
+    for event in events:
+        assert json.loads(encoder.encode(event)) == event.to_sse_dict()
+
+    backend = "orjson" if orjson is not None else "stdlib json"
+    print(f"Replaying {len(events)} events x{args.repeat} (encoder backend: {backend})")
+    legacy_time = _time("to_sse_dict() + json.dumps", legacy, events, args.repeat)
+    encoder_time = _time("StreamEventEncoder.encode_sse", encoder_path, events, args.repeat)
+    print(f"  speedup: {legacy_time / encoder_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
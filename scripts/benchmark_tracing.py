@@ -0,0 +1,111 @@
+"""Benchmark the per-call cost of optional_span and the Langfuse span helpers.
+
+Compares the previous generator-based ``optional_span`` (import + get_tracer on
+every call) with the current facade, first with tracing off (the default for
+most deployments) and then with an OpenTelemetry SDK provider installed, at
+full and 10% sampling, with a task-sized attribute that gets truncated.
+
+Usage:
+    uv run python scripts/benchmark_tracing.py [--calls 200000]
+"""
+
+import argparse
+import sys
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).parents[1] / "src"))
+
+from agentic_fleet.utils.infra.langfuse import create_dspy_span
+from agentic_fleet.utils.infra.telemetry import (
+    SpanPolicy,
+    configure_span_policy,
+    optional_span,
+    tracing_active,
+)
+
+TASK = "Summarize the quarterly revenue report and list three risks. " * 40
+
+
+@contextmanager
+def legacy_optional_span(
+    name: str, tracer_name: str | None = None, attributes: dict[str, Any] | None = None
+) -> Iterator[Any]:
+    """``optional_span`` before the facade, for comparison."""
+    span_cm = None
+    try:
+        from opentelemetry import trace
+
+        tracer = trace.get_tracer(tracer_name or __name__)
+        span_cm = tracer.start_as_current_span(name, attributes=attributes)
+    except (ImportError, AttributeError):
+        pass
+    if span_cm:
+        with span_cm as span:
+            yield span
+    else:
+        yield None
+
+
+def _time(label: str, fn, calls: int, baseline: float = 0.0) -> float:
+    best = float("inf")
+    for _ in range(5):
+        start = time.perf_counter()
+        fn(calls)
+        best = min(best, time.perf_counter() - start)
+    per_call_ns = best / calls * 1e9
+    print(f"  {label:<52} {per_call_ns - baseline:9.0f} ns/call")
+    return per_call_ns
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000, help="Calls per timed run")
+    args = parser.parse_args()
+    attributes = {"task": TASK}
+
+    def empty(n: int) -> None:
+        for _ in range(n):
+            pass
+
+    def legacy(n: int) -> None:
+        for _ in range(n):
+            with legacy_optional_span("DSPyReasoner.route_task", attributes=attributes):
+                pass
+
+    def facade(n: int) -> None:
+        for _ in range(n):
+            with optional_span("DSPyReasoner.route_task", attributes=attributes):
+                pass
+
+    def decision(n: int) -> None:
+        for _ in range(n):
+            with (
+                create_dspy_span("route_task", module_name="router"),
+                optional_span("DSPyReasoner.route_task", attributes=attributes),
+            ):
+                pass
+
+    print(f"Tracing off (active={tracing_active()}), net of loop overhead:")
+    baseline = _time("empty loop (absolute)", empty, args.calls)
+    _time("legacy optional_span", legacy, args.calls, baseline)
+    _time("optional_span", facade, args.calls, baseline)
+    _time("create_dspy_span + optional_span", decision, args.calls, baseline)
+
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+
+    trace.set_tracer_provider(TracerProvider())
+    calls = max(1, args.calls // 20)
+    for rate in (1.0, 0.1):
+        configure_span_policy(SpanPolicy(sample_rates={"default": rate}))
+        print(f"Tracing on (SDK provider, no exporter), sample rate {rate:g}:")
+        _time("legacy optional_span (full attribute)", legacy, calls, baseline)
+        _time("optional_span (truncated attribute)", facade, calls, baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,9 @@
+import argparse
 import json
 import sys
 from pathlib import Path
 
+import dspy
 from dotenv import load_dotenv
 
 # Add src to path
@@ -9,12 +11,13 @@ sys.path.append(str(Path(__file__).parents[1] / "src"))
 
 from agentic_fleet.dspy_modules.lifecycle import configure_dspy_settings
 from agentic_fleet.dspy_modules.reasoner import DSPyReasoner
+from agentic_fleet.evaluation.routing_replay import ReplayLM, RoutingReplayStore
 from agentic_fleet.utils.logger import setup_logger
 
 logger = setup_logger("evaluate_routing")
 
 
-def evaluate_routing() -> None:
+def evaluate_routing(replay_store: str | None = None, offline: bool = False) -> None:
     """
     Evaluate routing accuracy against golden dataset.
 
@@ -22,10 +25,22 @@ def evaluate_routing() -> None:
     compares predictions against ground truth, and generates a Markdown report
     with agent assignment accuracy and execution mode accuracy metrics.
 
+    With ``replay_store``, LM responses are recorded to (and on later runs
+    answered from) that SQLite store, so only changed prompts reach the model.
+    With ``offline`` as well, unrecorded prompts fail instead.
+
     Report is written to evaluation_report.md.
     """
     load_dotenv()
     configure_dspy_settings(model="gpt-4.1-mini")
+    replay_lm = None
+    if replay_store:
+        replay_lm = ReplayLM(
+            dspy.settings.lm,
+            RoutingReplayStore(replay_store),
+            mode="offline" if offline else "replay",
+        )
+        dspy.configure(lm=replay_lm)
 
     dataset_path = Path("src/agentic_fleet/data/golden_dataset.json")
     if not dataset_path.exists():
@@ -127,7 +142,15 @@ def evaluate_routing() -> None:
         f.write(report)
 
     logger.info(f"Evaluation complete. Report saved to {output_path}")
+    if replay_lm is not None:
+        logger.info(f"LM calls replayed: {replay_lm.hits}, sent to the model: {replay_lm.misses}")
 
 
 if __name__ == "__main__":
-    evaluate_routing()
+    parser = argparse.ArgumentParser(description="Evaluate routing against the golden dataset")
+    parser.add_argument("--replay-store", help="SQLite file to record and replay LM responses")
+    parser.add_argument(
+        "--offline", action="store_true", help="With --replay-store, never call the model"
+    )
+    args = parser.parse_args()
+    evaluate_routing(args.replay_store, args.offline)
@@ -1,3 +1,4 @@
+import argparse
 import os
 import sys
 
@@ -7,9 +8,24 @@ import uvicorn
 sys.path.append(os.path.join(os.getcwd(), "src"))
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Start the AgenticFleet API server.")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Pre-forked workers sharing preloaded DSPy artifacts (disables reload when > 1)",
+    )
+    args = parser.parse_args()
+
     try:
         print("Starting server...")
-        uvicorn.run("agentic_fleet.main:app", host="0.0.0.0", port=8000, reload=True)
+        if args.workers > 1:
+            from agentic_fleet.api.prefork import serve_prefork
+
+            sys.exit(serve_prefork(host=args.host, port=args.port, workers=args.workers))
+        uvicorn.run("agentic_fleet.main:app", host=args.host, port=args.port, reload=True)
     except Exception as e:
         print(f"Failed to start server: {e}")
         with open("server_error.log", "w") as f:
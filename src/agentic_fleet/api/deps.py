@@ -6,18 +6,17 @@ to FastAPI's full-stack template `api/deps.py`.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Annotated
+from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import Depends, HTTPException, status
 
 if TYPE_CHECKING:
-    from fastapi import Request
+    from agentic_fleet.workflows.supervisor import SupervisorWorkflow
 
 from fastapi import Request
 
 from agentic_fleet.services.conversation import ConversationManager, WorkflowSessionManager
 from agentic_fleet.utils.cfg.settings import AppSettings, get_settings
-from agentic_fleet.workflows.supervisor import SupervisorWorkflow
 
 
 def _get_from_app_state[T](
@@ -124,7 +123,12 @@ async def get_or_create_workflow(request: Request) -> SupervisorWorkflow:
 
 
 # Annotated dependency types for cleaner injection in route handlers
-WorkflowDep = Annotated[SupervisorWorkflow, Depends(get_workflow)]
+if TYPE_CHECKING:
+    WorkflowDep = Annotated[SupervisorWorkflow, Depends(get_workflow)]
+else:
+    # FastAPI resolves annotations at route registration; ``Any`` keeps the
+    # workflow stack (dspy, agent-framework, litellm) out of API import time.
+    WorkflowDep = Annotated[Any, Depends(get_workflow)]
 SessionManagerDep = Annotated[WorkflowSessionManager, Depends(get_session_manager)]
 ConversationManagerDep = Annotated[ConversationManager, Depends(get_conversation_manager)]
 SettingsDep = Annotated[AppSettings, Depends(get_app_settings)]
@@ -1,5 +1,32 @@
-"""API event mapping and helpers."""
+"""API event mapping and helpers.
 
-from agentic_fleet.api.events.mapping import classify_event, map_workflow_event
+``map_workflow_event`` dispatches on agent-framework event types, so it is
+resolved lazily: classifying or encoding events must not import the workflow
+stack.
+"""
 
-__all__ = ["classify_event", "map_workflow_event"]
+from __future__ import annotations
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from agentic_fleet.api.events.encoding import EventRecord, StreamEventEncoder
+    from agentic_fleet.api.events.mapping import classify_event, map_workflow_event
+
+_EXPORTS = {
+    "EventRecord": "encoding",
+    "StreamEventEncoder": "encoding",
+    "classify_event": "mapping",
+    "map_workflow_event": "mapping",
+}
+
+__all__ = ["EventRecord", "StreamEventEncoder", "classify_event", "map_workflow_event"]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import for public API."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module_name}"), name)
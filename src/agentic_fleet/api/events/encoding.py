@@ -0,0 +1,265 @@
+"""Fast byte-level encoding of stream events for SSE and WebSocket transports.
+
+``StreamEvent.to_sse_dict()`` followed by ``json.dumps`` copies every field into
+an intermediate dict and re-encodes the same ``workflow_id`` and ``ui_hint``
+payload for every event of a run. This module encodes events straight to JSON
+bytes instead:
+
+- ``EventRecord`` is a slotted, validation-free event representation for events
+  built on hot paths (heartbeats, control events). ``StreamEvent`` instances are
+  accepted as-is because both expose the same attributes.
+- ``StreamEventEncoder`` is created once per workflow session. It pre-encodes
+  the ``workflow_id`` fragment and caches every ``ui_hint`` fragment it sees,
+  so only the dynamic fields are serialized per event.
+
+With orjson the static fragments are held as ``orjson.Fragment`` values and each
+event costs a single ``orjson.dumps`` call; without it a compact stdlib ``json``
+encoder is used. The produced JSON is field-for-field identical to ``to_sse_dict()``,
+which remains the compatibility shim for callers that need a dict.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Protocol
+
+from agentic_fleet.models import EventCategory, StreamEventType, UIHint
+
+if TYPE_CHECKING:
+    from agentic_fleet.models import StreamEvent
+
+try:
+    import orjson
+
+    _Fragment = orjson.Fragment
+except (ImportError, AttributeError):  # pragma: no cover - orjson ships with the default install
+    orjson = None  # type: ignore[assignment]
+    _Fragment = None
+
+
+# Fields serialized between ``type`` and ``category``, in to_sse_dict() order.
+_BODY_FIELDS: tuple[str, ...] = (
+    "message",
+    "delta",
+    "reasoning",
+    "agent_id",
+    "author",
+    "role",
+    "kind",
+    "error",
+    "reasoning_partial",
+    "data",
+)
+
+# Fields serialized after ``workflow_id`` and before ``timestamp``.
+_TAIL_FIELDS: tuple[str, ...] = ("log_line", "quality_score", "quality_flag")
+
+
+def _json_default(value: Any) -> Any:
+    """Fallback for values the JSON backend cannot encode natively."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return str(value)
+
+
+if orjson is not None and _Fragment is not None:
+    _fragment = _Fragment
+
+    def _dumps(value: Any) -> bytes:
+        return orjson.dumps(value, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+
+    def _pre_encode(value: Any) -> Any:
+        # Encoded once; orjson copies the bytes verbatim on every later dumps().
+        return _fragment(_dumps(value))
+
+else:  # pragma: no cover - exercised only without orjson
+
+    def _dumps(value: Any) -> bytes:
+        return json.dumps(
+            value, separators=(",", ":"), ensure_ascii=False, default=_json_default
+        ).encode("utf-8")
+
+    def _pre_encode(value: Any) -> Any:
+        return value
+
+
+_CATEGORY_FRAGMENTS: dict[EventCategory, Any] = {
+    category: _pre_encode(category.value) for category in EventCategory
+}
+
+
+class EncodableEvent(Protocol):
+    """Attributes read by ``StreamEventEncoder`` (satisfied by StreamEvent and EventRecord)."""
+
+    type: StreamEventType
+    message: str | None
+    delta: str | None
+    reasoning: str | None
+    agent_id: str | None
+    author: str | None
+    role: str | None
+    kind: str | None
+    error: str | None
+    reasoning_partial: bool | None
+    data: dict[str, Any] | None
+    timestamp: datetime
+    category: EventCategory | None
+    ui_hint: UIHint | None
+    workflow_id: str | None
+    log_line: str | None
+    quality_score: float | None
+    quality_flag: str | None
+
+
+@dataclass(slots=True)
+class EventRecord:
+    """Slotted, validation-free stream event.
+
+    Mirrors the public fields of ``StreamEvent`` so it can be passed to the
+    encoder or to ``to_sse_dict()`` consumers interchangeably.
+    """
+
+    type: StreamEventType
+    message: str | None = None
+    delta: str | None = None
+    reasoning: str | None = None
+    agent_id: str | None = None
+    author: str | None = None
+    role: str | None = None
+    kind: str | None = None
+    error: str | None = None
+    reasoning_partial: bool | None = None
+    data: dict[str, Any] | None = None
+    timestamp: datetime = field(default_factory=datetime.now)
+    category: EventCategory | None = None
+    ui_hint: UIHint | None = None
+    workflow_id: str | None = None
+    log_line: str | None = None
+    quality_score: float | None = None
+    quality_flag: str | None = None
+
+    @classmethod
+    def from_stream_event(cls, event: StreamEvent) -> EventRecord:
+        """Build a record from a pydantic ``StreamEvent``."""
+        return cls(
+            type=event.type,
+            message=event.message,
+            delta=event.delta,
+            reasoning=event.reasoning,
+            agent_id=event.agent_id,
+            author=event.author,
+            role=event.role,
+            kind=event.kind,
+            error=event.error,
+            reasoning_partial=event.reasoning_partial,
+            data=event.data,
+            timestamp=event.timestamp,
+            category=event.category,
+            ui_hint=event.ui_hint,
+            workflow_id=event.workflow_id,
+            log_line=event.log_line,
+            quality_score=event.quality_score,
+            quality_flag=event.quality_flag,
+        )
+
+    def to_sse_dict(self) -> dict[str, Any]:
+        """Return the same dict shape as ``StreamEvent.to_sse_dict()``."""
+        result: dict[str, Any] = {"type": self.type.value}
+        for name in _BODY_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
+        if self.category is not None:
+            result["category"] = self.category.value
+        if self.ui_hint is not None:
+            result["ui_hint"] = {
+                "component": self.ui_hint.component,
+                "priority": self.ui_hint.priority,
+                "collapsible": self.ui_hint.collapsible,
+            }
+            if self.ui_hint.icon_hint is not None:
+                result["ui_hint"]["icon_hint"] = self.ui_hint.icon_hint
+        if self.workflow_id is not None:
+            result["workflow_id"] = self.workflow_id
+        for name in _TAIL_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                result[name] = value
+        result["timestamp"] = self.timestamp.isoformat()
+        return result
+
+
+class StreamEventEncoder:
+    """Per-session encoder producing SSE/WebSocket JSON payloads as bytes.
+
+    Args:
+        workflow_id: Workflow the session streams. Its JSON fragment is encoded
+            once; events carrying a different workflow_id are still encoded
+            correctly, just without the cached fragment.
+    """
+
+    __slots__ = ("_ui_hint_fragments", "_workflow_fragment", "workflow_id")
+
+    def __init__(self, workflow_id: str | None = None) -> None:
+        self.workflow_id = workflow_id
+        self._workflow_fragment = _pre_encode(workflow_id)
+        self._ui_hint_fragments: dict[tuple[str, str, bool, str | None], Any] = {}
+
+    def _ui_hint_fragment(self, ui_hint: UIHint) -> Any:
+        key = (ui_hint.component, ui_hint.priority, ui_hint.collapsible, ui_hint.icon_hint)
+        cached = self._ui_hint_fragments.get(key)
+        if cached is None:
+            payload: dict[str, Any] = {
+                "component": ui_hint.component,
+                "priority": ui_hint.priority,
+                "collapsible": ui_hint.collapsible,
+            }
+            if ui_hint.icon_hint is not None:
+                payload["icon_hint"] = ui_hint.icon_hint
+            cached = self._ui_hint_fragments[key] = _pre_encode(payload)
+        return cached
+
+    def encode(self, event: EncodableEvent) -> bytes:
+        """Encode an event to a compact JSON object.
+
+        Args:
+            event: ``StreamEvent`` or ``EventRecord``.
+
+        Returns:
+            UTF-8 JSON bytes equivalent to ``json.dumps(event.to_sse_dict())``.
+        """
+        body: dict[str, Any] = {"type": event.type.value}
+        for name in _BODY_FIELDS:
+            value = getattr(event, name)
+            if value is not None:
+                body[name] = value
+        if event.category is not None:
+            body["category"] = _CATEGORY_FRAGMENTS[event.category]
+        if event.ui_hint is not None:
+            body["ui_hint"] = self._ui_hint_fragment(event.ui_hint)
+        workflow_id = event.workflow_id
+        if workflow_id is not None:
+            body["workflow_id"] = (
+                self._workflow_fragment if workflow_id == self.workflow_id else workflow_id
+            )
+        for name in _TAIL_FIELDS:
+            value = getattr(event, name)
+            if value is not None:
+                body[name] = value
+        body["timestamp"] = event.timestamp
+        return _dumps(body)
+
+    def encode_sse(self, event: EncodableEvent) -> bytes:
+        """Encode an event as an SSE ``data:`` frame."""
+        return b"data: " + self.encode(event) + b"\n\n"
+
+    def encode_text(self, event: EncodableEvent) -> str:
+        """Encode an event as a text frame for ``WebSocket.send_text``."""
+        return self.encode(event).decode("utf-8")
+
+
+__all__ = ["EncodableEvent", "EventRecord", "StreamEventEncoder"]
@@ -1,23 +1,40 @@
 """Application lifecycle management for the AgenticFleet FastAPI app."""
 
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
 from fastapi import FastAPI
 
-from agentic_fleet.dspy_modules.compiled_registry import load_required_compiled_modules
+from agentic_fleet.api.startup import StartupReport
+from agentic_fleet.dspy_modules.compiled_registry import (
+    ArtifactRegistry,
+    load_required_compiled_modules,
+)
+from agentic_fleet.services.admission import AdmissionController
+from agentic_fleet.services.chat_helpers import configure_thread_state
 from agentic_fleet.services.conversation import ConversationManager, WorkflowSessionManager
 from agentic_fleet.services.optimization_service import get_optimization_service
 from agentic_fleet.utils.cfg import load_config
 from agentic_fleet.utils.cfg.settings import get_settings
 from agentic_fleet.utils.infra.tracing import initialize_tracing
 from agentic_fleet.utils.storage.conversation import ConversationStore
-from agentic_fleet.workflows.supervisor import create_supervisor_workflow
+from agentic_fleet.utils.storage.shared_state import create_shared_state
 
 logger = logging.getLogger(__name__)
 
 
+async def create_supervisor_workflow(*args: Any, **kwargs: Any) -> Any:
+    """Create the supervisor workflow; the workflow stack is imported at startup, not import."""
+    from agentic_fleet.workflows.supervisor import (
+        create_supervisor_workflow as _create_supervisor_workflow,
+    )
+
+    return await _create_supervisor_workflow(*args, **kwargs)
+
+
 def _configure_litellm_retry() -> None:
     """Configure LiteLLM global retry settings.
 
@@ -36,59 +53,22 @@ def _configure_litellm_retry() -> None:
         logger.debug("LiteLLM config: %s", e)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
-    """Manage application lifespan events.
-
-    Creates and initializes the SupervisorWorkflow on startup,
-    and handles cleanup on shutdown.
+async def _load_decision_modules(
+    app: FastAPI,
+    startup: StartupReport,
+    artifacts_task: asyncio.Task[ArtifactRegistry],
+    require_compiled: bool,
+) -> dict[str, Any] | None:
+    """Await the artifact registry and build the Phase 2 decision modules.
 
-    Args:
-        app: The FastAPI application instance.
+    Returns the modules as ``attach_decision_modules`` keyword arguments, or
+    ``None`` when loading failed and ``require_compiled`` is off (degraded mode).
 
-    Yields:
-        None after startup initialization is complete.
+    Raises:
+        RuntimeError: If required compiled artifacts are missing or fail to load.
     """
-    logger.info("Starting AgenticFleet API...")
-
-    # Configure LiteLLM retry settings before workflow initialization
-    _configure_litellm_retry()
-
-    settings = get_settings()
-    app.state.settings = settings
-
-    # Phase 0: Initialize Langfuse and DSPy instrumentation EARLY
-    # This must happen before any DSPy modules are loaded or used
-    # to ensure native DSPy traces are captured
     try:
-        from agentic_fleet.dspy_modules.lifecycle import initialize_langfuse
-
-        initialize_langfuse()
-        logger.info("Langfuse and DSPy instrumentation initialized early for native tracing")
-    except Exception as e:
-        logger.debug(f"Langfuse early initialization skipped: {e}")
-
-    # Phase 1: Load and validate compiled DSPy artifacts with fail-fast enforcement
-    try:
-        # Load workflow config to get DSPy settings
-        config = load_config(validate=False)
-        # Store YAML config in app.state for reuse by WebSocket sessions
-        app.state.yaml_config = config
-
-        # Initialize tracing early using YAML config so `tracing.enabled: true`
-        # works without requiring environment flags.
-        # This will configure Agent Framework observability to export to Langfuse
-        initialize_tracing(config)
-        dspy_config = config.get("dspy", {})
-        require_compiled = dspy_config.get("require_compiled", False)
-
-        logger.info("Loading compiled DSPy artifacts (require_compiled=%s)...", require_compiled)
-
-        # Load all required compiled modules using the registry
-        artifact_registry = load_required_compiled_modules(
-            dspy_config=dspy_config,
-            require_compiled=require_compiled,
-        )
+        artifact_registry = await artifacts_task
 
         # Attach registry to app state for use by workflow and services
         app.state.dspy_artifacts = artifact_registry
@@ -98,6 +78,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         loaded_status = validate_artifact_registry(artifact_registry)
         logger.info("DSPy artifacts loaded: %s", loaded_status)
+        startup.steps["artifacts"].detail = {
+            "loaded": loaded_status,
+            "seconds": {
+                name: round(seconds, 4)
+                for name, seconds in getattr(artifact_registry, "timings", {}).items()
+            },
+        }
 
         # Initialize decision modules from preloaded artifacts
         from agentic_fleet.dspy_modules.decisions import (
@@ -106,10 +93,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             get_tool_planning_module,
         )
 
-        # Set up decision modules using preloaded artifacts
-        quality_module = get_quality_module(artifact_registry.quality)
-        routing_module = get_routing_module(artifact_registry.routing)
-        tool_planning_module = get_tool_planning_module(artifact_registry.tool_planning)
+        with startup.step("decision_modules"):
+            # Set up decision modules using preloaded artifacts
+            quality_module = get_quality_module(artifact_registry.quality)
+            routing_module = get_routing_module(artifact_registry.routing)
+            tool_planning_module = get_tool_planning_module(artifact_registry.tool_planning)
 
         # Attach decision modules to app state for easy access
         app.state.dspy_quality_module = quality_module
@@ -117,15 +105,11 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         app.state.dspy_tool_planning_module = tool_planning_module
 
         logger.info("DSPy decision modules initialized successfully")
-
-        # Phase 2: Create workflow with preloaded decision modules
-        workflow = await create_supervisor_workflow(
-            dspy_routing_module=routing_module,
-            dspy_quality_module=quality_module,
-            dspy_tool_planning_module=tool_planning_module,
-        )
-        app.state.workflow = workflow
-        logger.info("Workflow initialized with Phase 2 decision modules")
+        return {
+            "routing_module": routing_module,
+            "quality_module": quality_module,
+            "tool_planning_module": tool_planning_module,
+        }
 
     except RuntimeError as e:
         # Fail-fast: Required compiled artifacts missing
@@ -135,9 +119,7 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         # Unexpected error during artifact loading
         logger.error("Unexpected error loading DSPy artifacts: %s", e, exc_info=True)
         # In production with require_compiled=True, we should fail-fast
-        config = load_config(validate=False)
-        dspy_config = config.get("dspy", {})
-        if dspy_config.get("require_compiled", False):
+        if require_compiled:
             raise RuntimeError(
                 f"Failed to initialize DSPy artifacts (require_compiled=True): {e}"
             ) from e
@@ -145,34 +127,179 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
         logger.warning(
             "Continuing with degraded DSPy functionality due to artifact loading error: %s", e
         )
+        return None
+
+
+async def _await_workflow(
+    startup: StartupReport, workflow_task: asyncio.Task[Any], require_compiled: bool
+) -> tuple[Any, bool]:
+    """Await the concurrently created workflow, retrying once in lenient mode.
+
+    An unexpected (non-``RuntimeError``) failure is retried with a fresh
+    ``create_supervisor_workflow()`` call when ``require_compiled`` is off, as
+    the sequential startup did; the retry is timed as ``workflow_retry``.
+
+    Returns:
+        The workflow and whether it came from the retry (degraded startup).
+
+    Raises:
+        RuntimeError: If creation fails with ``require_compiled`` on, or the
+            retry fails too.
+    """
+    try:
+        return await workflow_task, False
+    except RuntimeError:
+        raise
+    except Exception as e:
+        logger.error("Unexpected error creating the workflow: %s", e, exc_info=True)
+        if require_compiled:
+            raise RuntimeError(f"Failed to initialize workflow (require_compiled=True): {e}") from e
+        logger.warning("Retrying workflow creation in degraded mode")
+        return await startup.run("workflow_retry", create_supervisor_workflow()), True
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
+    """Manage application lifespan events.
+
+    Creates and initializes the SupervisorWorkflow on startup, recording
+    per-step timings in ``app.state.startup`` (served by ``/ready``), and
+    handles cleanup on shutdown.
+
+    Args:
+        app: The FastAPI application instance.
+
+    Yields:
+        None after startup initialization is complete.
+    """
+    logger.info("Starting AgenticFleet API...")
+
+    # Configure LiteLLM retry settings before workflow initialization
+    _configure_litellm_retry()
+
+    settings = get_settings()
+    app.state.settings = settings
+
+    startup = StartupReport()
+    app.state.startup = startup
+
+    # Phase 0: Initialize Langfuse and DSPy instrumentation EARLY
+    # This must happen before any DSPy modules are loaded or used
+    # to ensure native DSPy traces are captured
+    with startup.step("langfuse"):
+        try:
+            from agentic_fleet.dspy_modules.lifecycle import initialize_langfuse
+
+            initialize_langfuse()
+            logger.info("Langfuse and DSPy instrumentation initialized early for native tracing")
+        except Exception as e:
+            logger.debug(f"Langfuse early initialization skipped: {e}")
+
+    # Phase 1: Load config, then compiled DSPy artifacts (fail-fast) and the
+    # workflow concurrently: building agents does not depend on the artifacts,
+    # which are attached to the workflow's reasoner once both are done.
+    with startup.step("config"):
+        config = load_config(validate=False)
+        # Store YAML config in app.state for reuse by WebSocket sessions
+        app.state.yaml_config = config
+
+    # Initialize tracing early using YAML config so `tracing.enabled: true`
+    # works without requiring environment flags.
+    # This will configure Agent Framework observability to export to Langfuse
+    with startup.step("tracing"):
+        initialize_tracing(config)
+
+    dspy_config = config.get("dspy", {})
+    require_compiled = dspy_config.get("require_compiled", False)
+    logger.info("Loading compiled DSPy artifacts (require_compiled=%s)...", require_compiled)
+
+    artifacts_task = asyncio.create_task(
+        startup.run(
+            "artifacts",
+            asyncio.to_thread(
+                load_required_compiled_modules,
+                dspy_config=dspy_config,
+                require_compiled=require_compiled,
+            ),
+        )
+    )
+    workflow_task = asyncio.create_task(startup.run("workflow", create_supervisor_workflow()))
+    try:
+        decision_modules = await _load_decision_modules(
+            app, startup, artifacts_task, require_compiled
+        )
+        workflow, workflow_retried = await _await_workflow(startup, workflow_task, require_compiled)
+    except BaseException:
+        for task in (artifacts_task, workflow_task):
+            task.cancel()
+        await asyncio.gather(artifacts_task, workflow_task, return_exceptions=True)
+        raise
 
-        # Ensure YAML config is stored even in fallback path
-        if not hasattr(app.state, "yaml_config"):
-            app.state.yaml_config = config
+    workflow_context = getattr(workflow, "context", None)
+    if decision_modules is not None and workflow_context is not None:
+        from agentic_fleet.workflows.supervisor import attach_decision_modules
 
-        # Create workflow without preloaded decision modules (fallback)
-        workflow = await create_supervisor_workflow()
-        app.state.workflow = workflow
+        with startup.step("attach_decision_modules"):
+            attach_decision_modules(workflow_context, **decision_modules)
+        logger.info("Workflow initialized with Phase 2 decision modules")
+    else:
         logger.info("Workflow initialized without Phase 2 decision modules (fallback mode)")
+    app.state.workflow = workflow
+
+    # Shared state lets several workers enforce one concurrency limit and relay
+    # cancel signals, HITL responses and conversation threads to each other.
+    with startup.step("shared_state"):
+        shared_state = create_shared_state(settings)
+        app.state.shared_state = shared_state
+        configure_thread_state(shared_state)
 
     # Initialize managers with settings-aware configuration and attach to app state
-    app.state.session_manager = WorkflowSessionManager(
-        max_concurrent=settings.max_concurrent_workflows
+    admission = AdmissionController(
+        shared_state,
+        settings.max_concurrent_workflows,
+        fast_path_max_concurrent=settings.fast_path_max_concurrent,
+        max_queue=settings.admission_queue_size,
+        max_queue_per_user=settings.admission_queue_per_user,
+        queue_timeout_seconds=settings.admission_queue_timeout_seconds,
+        lease_seconds=settings.state_slot_lease_seconds,
+        poll_interval_seconds=settings.state_poll_interval_seconds,
     )
-    app.state.conversation_manager = ConversationManager(
-        ConversationStore(settings.conversations_path)
+    app.state.session_manager = WorkflowSessionManager(
+        max_concurrent=settings.max_concurrent_workflows,
+        state=shared_state,
+        admission=admission,
     )
-    app.state.optimization_service = get_optimization_service()
+    with startup.step("conversations"):
+        app.state.conversation_manager = ConversationManager(
+            ConversationStore(settings.conversations_path)
+        )
+    optimization_service = get_optimization_service()
+    await optimization_service.recover_jobs()
+    app.state.optimization_service = optimization_service
+    startup.mark_ready(degraded=decision_modules is None or workflow_retried)
 
     logger.info(
-        "AgenticFleet API ready: max_concurrent_workflows=%s, conversations_path=%s",
+        "AgenticFleet API ready: max_concurrent_workflows=%s, conversations_path=%s, "
+        "state_backend=%s",
         settings.max_concurrent_workflows,
         settings.conversations_path,
+        settings.state_backend,
     )
     yield
 
     # Cleanup
     logger.info("Shutting down AgenticFleet API...")
+    # Fail readiness first so load balancers stop routing to this instance.
+    startup.ready = False
+    configure_thread_state(None)
+    await admission.close()
+    await shared_state.close()
+
+    from agentic_fleet.tools.mcp_pool import close_mcp_pools
+
+    await close_mcp_pools()
+    await optimization_service.shutdown()
+    app.state.shared_state = None
     app.state.session_manager = None
     app.state.conversation_manager = None
     app.state.optimization_service = None
@@ -9,10 +9,8 @@ import uuid
 from collections.abc import Callable
 from contextvars import ContextVar
 from datetime import datetime
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
-import dspy
-from agent_framework._types import ChatMessage, Role
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
@@ -20,6 +18,10 @@ from agentic_fleet.utils.infra.logging import setup_logger
 from agentic_fleet.utils.storage.history import HistoryManager
 from agentic_fleet.utils.types import MessageLike
 
+if TYPE_CHECKING:
+    import dspy
+    from agent_framework._types import ChatMessage
+
 logger = setup_logger(__name__)
 
 # Type alias for message types - union of known message types
@@ -76,6 +78,8 @@ class BridgeConverter:
         Returns:
             dict[str, Any]: A mapping with "role" set to the message role as a string and "content" set to the message text content. If the input is a dict it is returned as-is; unknown types produce {"role": "unknown", "content": str(message)}.
         """
+        from agent_framework._types import ChatMessage
+
         # Handle dict first (before hasattr checks)
         if isinstance(message, dict):
             return cast(dict[str, Any], message)
@@ -125,6 +129,8 @@ class BridgeConverter:
         Returns:
             dspy.Example: An example containing the constructed inputs ("task", "context", "current_context"); if `labels` is provided, those label fields are included on the example.
         """
+        import dspy
+
         history = [cls.message_to_dict(m) for m in messages]
 
         task = task_override
@@ -158,6 +164,8 @@ class BridgeConverter:
     @staticmethod
     def example_to_messages(example: dspy.Example) -> list[ChatMessage]:
         """Convert a DSPy example back to a list of ChatMessages (for replay/debug)."""
+        from agent_framework._types import ChatMessage, Role
+
         messages = []
 
         if hasattr(example, "context") and example.context:
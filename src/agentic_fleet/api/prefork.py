@@ -0,0 +1,362 @@
+"""Pre-fork multi-worker server.
+
+Running ``uvicorn --workers N`` makes every worker import the stack and load
+the YAML config (agent definitions included), prompt templates and compiled
+DSPy artifacts on its own, so memory grows linearly with the worker count.
+``PreforkServer`` does that read-only work once in a parent process, then
+forks workers that inherit it copy-on-write:
+
+1. ``preload()`` disables the cyclic GC, imports the workflow stack, loads the
+   config (memoised by ``load_config``) and the compiled artifacts (kept in
+   the process-wide ``ArtifactCache``), then calls ``gc.freeze()`` so the
+   collector never writes to those objects' headers in the workers.
+2. The parent binds the listening socket and forks the workers.
+3. Each worker re-enables the GC and runs the normal FastAPI lifespan. Its
+   config and artifact loads are cache hits on the inherited objects, while
+   everything that owns a socket or a client (LLM clients, agents, shared
+   state backend, tracing exporters, logging handlers) is created after the
+   fork, per worker. The parent never opens connections during preload.
+
+The parent restarts workers that die, stops if they die during startup, logs
+per-worker memory (RSS/PSS/USS) on ``SIGUSR1``, and forwards ``SIGTERM`` /
+``SIGINT`` so that workers shut down gracefully. POSIX only (``os.fork``).
+"""
+
+from __future__ import annotations
+
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from dataclasses import dataclass, field
+from importlib import import_module
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+from agentic_fleet.utils.infra.profiling import get_process_memory_breakdown_mb
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import FrameType
+
+logger = logging.getLogger(__name__)
+
+#: Modules imported by the parent before forking (the bulk of import time).
+PRELOAD_MODULES: tuple[str, ...] = (
+    "agentic_fleet.workflows.supervisor",
+    "agentic_fleet.dspy_modules.decisions",
+    "agentic_fleet.agents.prompts",
+    "agentic_fleet.api.lifespan",
+    "agentic_fleet.api.main",
+)
+
+WORKER_ID_ENV = "AGENTIC_FLEET_WORKER_ID"
+
+
+@dataclass(slots=True)
+class PreloadReport:
+    """What the parent loaded before forking, and how long it took."""
+
+    seconds: dict[str, float] = field(default_factory=dict)
+    artifacts: dict[str, bool] = field(default_factory=dict)
+    frozen_objects: int = 0
+
+
+def preload(modules: tuple[str, ...] = PRELOAD_MODULES) -> PreloadReport:
+    """Run the read-only part of startup in the parent, then freeze the GC.
+
+    Artifact loading is best effort here: with ``dspy.require_compiled`` the
+    workers' lifespan still fails fast when artifacts are missing.
+
+    Leaves the cyclic GC disabled; workers re-enable it after the fork.
+    """
+    from agentic_fleet.dspy_modules.compiled_registry import (
+        load_required_compiled_modules,
+        validate_artifact_registry,
+    )
+    from agentic_fleet.utils.cfg import load_config
+
+    report = PreloadReport()
+    # Collections in the parent would free objects and leave holes in pages
+    # the workers share; disable the GC until everything is loaded and frozen.
+    gc.disable()
+
+    start = perf_counter()
+    for name in modules:
+        import_module(name)
+    report.seconds["imports"] = perf_counter() - start
+
+    start = perf_counter()
+    # Same arguments as the lifespan, so the workers hit ``load_config``'s cache.
+    config = load_config(validate=False)
+    report.seconds["config"] = perf_counter() - start
+
+    start = perf_counter()
+    try:
+        registry = load_required_compiled_modules(
+            dspy_config=config.get("dspy", {}), require_compiled=False
+        )
+        report.artifacts = validate_artifact_registry(registry)
+    except Exception as exc:
+        logger.warning("Pre-fork artifact preload failed; workers will load their own: %s", exc)
+    report.seconds["artifacts"] = perf_counter() - start
+
+    start = perf_counter()
+    gc.collect()
+    gc.freeze()
+    report.seconds["freeze"] = perf_counter() - start
+    report.frozen_objects = gc.get_freeze_count()
+
+    logger.info(
+        "Preloaded in %.3fs (%s); froze %d objects; artifacts: %s",
+        sum(report.seconds.values()),
+        ", ".join(f"{name}={seconds:.3f}s" for name, seconds in report.seconds.items()),
+        report.frozen_objects,
+        report.artifacts,
+    )
+    return report
+
+
+def _run_worker(
+    sock: socket.socket,
+    worker_id: int,
+    app: str,
+    log_level: str,
+) -> int:
+    """Worker body after the fork; returns the process exit code."""
+    for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGUSR1):
+        signal.signal(signum, signal.SIG_DFL)
+    os.environ[WORKER_ID_ENV] = str(worker_id)
+    gc.enable()
+
+    import uvicorn
+    from uvicorn.importer import import_from_string
+
+    config = uvicorn.Config(import_from_string(app), log_level=log_level, lifespan="on")
+    server = uvicorn.Server(config)
+    server.run(sockets=[sock])
+    return 0 if server.started else 3
+
+
+@dataclass(slots=True)
+class _Worker:
+    worker_id: int
+    pid: int
+    started_at: float
+
+
+class PreforkServer:
+    """Preload once, fork ``workers`` uvicorn workers and supervise them.
+
+    Args:
+        app: Import string of the ASGI app, resolved in each worker.
+        host: Interface to bind.
+        port: Port to bind.
+        workers: Number of worker processes.
+        log_level: Uvicorn log level for the workers.
+        preload: Callable run in the parent before forking; ``None`` skips it.
+        graceful_timeout: Seconds to wait for workers after ``SIGTERM``.
+        min_uptime: Workers that exit sooner are treated as failed startups,
+            which stops the server instead of restarting them in a loop.
+    """
+
+    def __init__(
+        self,
+        app: str = "agentic_fleet.main:app",
+        *,
+        host: str = "127.0.0.1",
+        port: int = 8000,
+        workers: int = 2,
+        log_level: str = "info",
+        preload: Callable[[], Any] | None = preload,
+        graceful_timeout: float = 30.0,
+        min_uptime: float = 5.0,
+    ) -> None:
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Pre-fork workers require os.fork (POSIX only)")
+        if workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.app = app
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.log_level = log_level
+        self.preload = preload
+        self.graceful_timeout = graceful_timeout
+        self.min_uptime = min_uptime
+        self._workers: dict[int, _Worker] = {}
+        self._stopping = False
+        self._memory_report_requested = False
+        self._exit_code = 0
+
+    def run(self) -> int:
+        """Serve until ``SIGTERM``/``SIGINT``; returns the exit code."""
+        if self.preload is not None:
+            self.preload()
+
+        sock = self._bind()
+        previous = {
+            signum: signal.signal(signum, self._on_signal)
+            for signum in (signal.SIGINT, signal.SIGTERM, signal.SIGUSR1)
+        }
+        try:
+            logger.info(
+                "Pre-fork server on http://%s:%d with %d worker(s)",
+                self.host,
+                self.port,
+                self.workers,
+            )
+            for worker_id in range(self.workers):
+                self._spawn(sock, worker_id)
+            while not self._stopping:
+                self._reap(sock)
+                if self._memory_report_requested:
+                    self._memory_report_requested = False
+                    self.log_memory()
+                time.sleep(0.2)
+        finally:
+            self._shutdown()
+            sock.close()
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+        return self._exit_code
+
+    def worker_memory(self) -> dict[int, dict[str, float]]:
+        """Memory breakdown in MB per worker id (see ``get_process_memory_breakdown_mb``)."""
+        usage: dict[int, dict[str, float]] = {}
+        for worker in self._workers.values():
+            try:
+                usage[worker.worker_id] = get_process_memory_breakdown_mb(worker.pid)
+            except Exception as exc:
+                logger.debug("Memory breakdown unavailable for pid %d: %s", worker.pid, exc)
+        return usage
+
+    def log_memory(self) -> None:
+        """Log parent and per-worker RSS/PSS/USS (triggered by ``SIGUSR1``)."""
+        parent = get_process_memory_breakdown_mb()
+        logger.info(
+            "Memory parent pid=%d: rss=%.1fMB pss=%.1fMB uss=%.1fMB",
+            os.getpid(),
+            parent["rss"],
+            parent["pss"],
+            parent["uss"],
+        )
+        for worker_id, usage in sorted(self.worker_memory().items()):
+            logger.info(
+                "Memory worker %d: rss=%.1fMB pss=%.1fMB uss=%.1fMB shared=%.1fMB",
+                worker_id,
+                usage["rss"],
+                usage["pss"],
+                usage["uss"],
+                usage["shared"],
+            )
+
+    def _bind(self) -> socket.socket:
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        self.port = sock.getsockname()[1]
+        return sock
+
+    def _spawn(self, sock: socket.socket, worker_id: int) -> None:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child
+            code = 1
+            try:
+                code = _run_worker(sock, worker_id, self.app, self.log_level)
+            except BaseException:
+                logger.exception("Worker %d crashed", worker_id)
+            finally:
+                logging.shutdown()
+                os._exit(code)
+        self._workers[pid] = _Worker(worker_id, pid, time.monotonic())
+        logger.info("Started worker %d (pid %d)", worker_id, pid)
+
+    def _reap(self, sock: socket.socket) -> None:
+        """Collect exited workers and restart them."""
+        while self._workers:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if pid == 0:
+                return
+            worker = self._workers.pop(pid, None)
+            if worker is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            uptime = time.monotonic() - worker.started_at
+            if self._stopping:
+                continue
+            if uptime < self.min_uptime:
+                logger.error(
+                    "Worker %d (pid %d) exited with %d after %.1fs during startup; stopping",
+                    worker.worker_id,
+                    pid,
+                    code,
+                    uptime,
+                )
+                self._exit_code = code or 1
+                self._stopping = True
+                return
+            logger.warning(
+                "Worker %d (pid %d) exited with %d; restarting", worker.worker_id, pid, code
+            )
+            self._spawn(sock, worker.worker_id)
+
+    def _on_signal(self, signum: int, frame: FrameType | None) -> None:  # noqa: ARG002
+        if signum == signal.SIGUSR1:
+            self._memory_report_requested = True
+        else:
+            self._stopping = True
+
+    def _shutdown(self) -> None:
+        """Stop workers gracefully, killing those that outlive ``graceful_timeout``."""
+        for pid in list(self._workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._workers.pop(pid, None)
+        deadline = time.monotonic() + self.graceful_timeout
+        while self._workers and time.monotonic() < deadline:
+            for pid in list(self._workers):
+                try:
+                    done, _status = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    done = pid
+                if done:
+                    self._workers.pop(pid, None)
+            time.sleep(0.1)
+        for pid in list(self._workers):
+            logger.warning("Worker pid %d did not stop in time; killing", pid)
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self._workers.pop(pid, None)
+
+
+def serve_prefork(
+    app: str = "agentic_fleet.main:app",
+    *,
+    host: str = "127.0.0.1",
+    port: int = 8000,
+    workers: int = 2,
+    log_level: str = "info",
+) -> int:
+    """Run the API with pre-forked workers sharing preloaded state."""
+    if not logging.getLogger().handlers:
+        # Workers replace this with the app's own logging setup on import.
+        from agentic_fleet.utils.cfg.settings import get_settings
+
+        logging.basicConfig(level=log_level.upper(), format=get_settings().log_format)
+    return PreforkServer(app, host=host, port=port, workers=workers, log_level=log_level).run()
+
+
+__all__ = ["PRELOAD_MODULES", "PreforkServer", "PreloadReport", "preload", "serve_prefork"]
@@ -71,6 +71,39 @@ class HITLResponse(BaseModel):
 # --------------------------------------------------------------------------
 
 
+async def _get_sse_service(request: Request) -> Any:
+    """Get or create the SSE service (cached per app for cancel/response tracking)."""
+    app = request.app
+    sse_service = getattr(app.state, "sse_service", None)
+    if sse_service is not None:
+        return sse_service
+
+    # Lazy imports to avoid circular dependencies
+    from agentic_fleet.api.deps import (
+        get_conversation_manager,
+        get_or_create_workflow,
+        get_session_manager,
+    )
+    from agentic_fleet.services.chat_sse import ChatSSEService
+
+    settings = getattr(app.state, "settings", None)
+    sse_service = ChatSSEService(
+        workflow=await get_or_create_workflow(request),
+        session_manager=get_session_manager(request),
+        conversation_manager=get_conversation_manager(request),
+        state=getattr(app.state, "shared_state", None),
+        signal_poll_interval=getattr(settings, "state_poll_interval_seconds", 0.25),
+    )
+    app.state.sse_service = sse_service
+    return sse_service
+
+
+def _relays_through_shared_state(request: Request) -> bool:
+    """Return True if streams owned by other workers are reachable via shared state."""
+    shared_state = getattr(request.app.state, "shared_state", None)
+    return bool(getattr(shared_state, "shared", False))
+
+
 @router.get("/chat/{conversation_id}/stream")
 @observe
 async def stream_chat_sse(
@@ -104,28 +137,10 @@ async def stream_chat_sse(
     Returns:
         StreamingResponse with text/event-stream content type
     """
-    # Lazy imports to avoid circular dependencies
-    from agentic_fleet.api.deps import (
-        get_conversation_manager,
-        get_or_create_workflow,
-        get_session_manager,
-    )
-    from agentic_fleet.services.chat_sse import ChatSSEService
-
-    session_manager = get_session_manager(request)
-    conversation_manager = get_conversation_manager(request)
-    workflow = await get_or_create_workflow(request)
+    # Lazy import to avoid circular dependencies
+    from agentic_fleet.services.admission import admission_key
 
-    # Get or create SSE service (cached per app for cancel/response tracking)
-    app = request.app
-    sse_service = getattr(app.state, "sse_service", None)
-    if sse_service is None:
-        sse_service = ChatSSEService(
-            workflow=workflow,
-            session_manager=session_manager,
-            conversation_manager=conversation_manager,
-        )
-        app.state.sse_service = sse_service
+    sse_service = await _get_sse_service(request)
 
     return StreamingResponse(
         sse_service.stream_chat(
@@ -133,6 +148,7 @@ async def stream_chat_sse(
             message=message,
             reasoning_effort=reasoning_effort,
             enable_checkpointing=enable_checkpointing,
+            user_id=admission_key(request),
         ),
         media_type="text/event-stream",
         headers={
@@ -166,6 +182,9 @@ async def submit_hitl_response(
     """
     app = request.app
     sse_service = getattr(app.state, "sse_service", None)
+    if sse_service is None and _relays_through_shared_state(request):
+        # The stream may be owned by another worker; relay through shared state.
+        sse_service = await _get_sse_service(request)
 
     if sse_service is None:
         raise HTTPException(status_code=503, detail="No active SSE service")
@@ -200,6 +219,9 @@ async def cancel_stream(
     """
     app = request.app
     sse_service = getattr(app.state, "sse_service", None)
+    if sse_service is None and _relays_through_shared_state(request):
+        # The stream may be owned by another worker; relay through shared state.
+        sse_service = await _get_sse_service(request)
 
     if sse_service is None:
         raise HTTPException(status_code=503, detail="No active SSE service")
@@ -5,23 +5,31 @@ Provides endpoints for inspecting and managing DSPy modules.
 
 from __future__ import annotations
 
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from agentic_fleet.api.deps import WorkflowDep
 from agentic_fleet.models import CacheInfo, ReasonerSummary
-from agentic_fleet.services.dspy_service import DSPyService
+
+if TYPE_CHECKING:
+    from agentic_fleet.services.dspy_service import DSPyService
 
 router = APIRouter()
 
 
 def get_dspy_service(workflow: WorkflowDep) -> DSPyService:
     """Get DSPyService instance for a workflow."""
+    # Imported per request: the service pulls in dspy and the compiler cache.
+    from agentic_fleet.services.dspy_service import DSPyService
+
     return DSPyService(workflow)
 
 
-DSPyServiceDep = Annotated[DSPyService, Depends(get_dspy_service)]
+if TYPE_CHECKING:
+    DSPyServiceDep = Annotated[DSPyService, Depends(get_dspy_service)]
+else:
+    DSPyServiceDep = Annotated[Any, Depends(get_dspy_service)]
 
 
 @router.get("/dspy/prompts", response_model=dict[str, Any])
@@ -72,26 +72,12 @@ async def create_optimization_job(
     """
     Start a new optimization job.
     """
-    # In a real app, we'd dynamically load the module here or use a registry.
-    # For safety/simplicity in this demo, we might restrict it or mock it.
-    # We'll assume the module is the 'DSPyReasoner' for now as it's the main target.
-    from agentic_fleet.dspy_modules.reasoner import DSPyReasoner
-
     if request.module_name != "DSPyReasoner":
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Only 'DSPyReasoner' optimization is currently supported via API.",
         )
 
-    # We need an instance to compile.
-    # Note: Creating a fresh instance for optimization.
-    # In a real scenario, we might want to load a specific version or configuration.
-    module_instance = DSPyReasoner()
-
-    # Ensure modules are initialized before optimization
-    # This is critical for GEPA to access predictor signatures correctly
-    module_instance._ensure_modules_initialized()
-
     # Build gepa_options from request
     gepa_options = {
         **request.options,
@@ -101,7 +87,8 @@ async def create_optimization_job(
     }
 
     job_id = await service.submit_job(
-        module=module_instance,
+        # The worker process instantiates the module; nothing DSPy-heavy loads here.
+        module=request.module_name,
         base_examples_path=request.examples_path,
         user_id=request.user_id,
         auto_mode=request.auto_mode,
@@ -126,3 +113,15 @@ async def get_job_status(
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
+
+
+@router.post("/jobs/{job_id}/cancel", response_model=JobStatusResponse)
+async def cancel_job(
+    job_id: str,
+    service: OptimizationServiceDep,
+) -> dict[str, Any]:
+    """Cancel a pending or running optimization job."""
+    job = await service.cancel_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -0,0 +1,108 @@
+"""Startup bookkeeping for the FastAPI lifespan.
+
+``StartupReport`` times each startup step (config, artifacts, workflow, ...),
+including steps that run concurrently, and backs the ``/ready`` readiness
+probe: the app is ready once every step has finished and a workflow exists.
+``/health`` stays a liveness probe and does not depend on startup.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from time import perf_counter
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class StartupStep:
+    """Timing and outcome of one startup step."""
+
+    name: str
+    status: str = "running"
+    started_at: float = field(default_factory=perf_counter)
+    seconds: float | None = None
+    error: str | None = None
+    detail: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the ``/ready`` response."""
+        data: dict[str, Any] = {
+            "status": self.status,
+            "seconds": round(self.seconds, 4) if self.seconds is not None else None,
+        }
+        if self.error:
+            data["error"] = self.error
+        if self.detail:
+            data["detail"] = self.detail
+        return data
+
+
+class StartupReport:
+    """Per-step startup timings and readiness state for one app instance."""
+
+    def __init__(self) -> None:
+        self.started_at = datetime.now(UTC)
+        self.steps: dict[str, StartupStep] = {}
+        self.ready = False
+        self.degraded = False
+        self.total_seconds: float | None = None
+        self._t0 = perf_counter()
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[StartupStep]:
+        """Time a block as the step ``name``; exceptions mark it failed and propagate."""
+        step = self.steps[name] = StartupStep(name)
+        try:
+            yield step
+        except BaseException as exc:
+            step.status = "cancelled" if isinstance(exc, asyncio.CancelledError) else "failed"
+            step.error = f"{type(exc).__name__}: {exc}"
+            raise
+        else:
+            step.status = "ok"
+        finally:
+            step.seconds = perf_counter() - step.started_at
+            logger.info("Startup step %s: %s in %.3fs", name, step.status, step.seconds)
+
+    async def run[T](self, name: str, awaitable: Awaitable[T]) -> T:
+        """Await ``awaitable`` as the step ``name`` (use with ``asyncio.gather``)."""
+        with self.step(name):
+            return await awaitable
+
+    def mark_ready(self, *, degraded: bool = False) -> None:
+        """Record the end of startup; ``/ready`` reports ready from now on."""
+        self.total_seconds = perf_counter() - self._t0
+        self.degraded = degraded
+        self.ready = True
+        logger.info(
+            "Startup finished in %.3fs (degraded=%s): %s",
+            self.total_seconds,
+            degraded,
+            ", ".join(
+                f"{step.name}={step.seconds:.3f}s"
+                for step in self.steps.values()
+                if step.seconds is not None
+            ),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the ``/ready`` response."""
+        return {
+            "ready": self.ready,
+            "degraded": self.degraded,
+            "started_at": self.started_at.isoformat(),
+            "total_seconds": (
+                round(self.total_seconds, 4) if self.total_seconds is not None else None
+            ),
+            "steps": {name: step.to_dict() for name, step in self.steps.items()},
+        }
+
+
+__all__ = ["StartupReport", "StartupStep"]
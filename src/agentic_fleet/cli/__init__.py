@@ -7,35 +7,46 @@ double-loading warnings when invoked via `python -m agentic_fleet.cli.console`.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from agentic_fleet.cli.display import display_result, show_help, show_status
-from agentic_fleet.cli.runner import WorkflowRunner
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:  # pragma: no cover - helps IDEs without eager import
     from typer import Typer
 
+    from agentic_fleet.cli.display import display_result, show_help, show_status
+    from agentic_fleet.cli.runner import WorkflowRunner
+
 __all__ = ["WorkflowRunner", "app", "display_result", "show_help", "show_status"]
 
 # Satisfy type checker - actual app is loaded lazily via __getattr__
 app: Typer | None = None
 
 
-def __getattr__(name: str) -> Typer:
+def __getattr__(name: str) -> Any:
     """
-    Lazily load and return the package's Typer application when accessed as an attribute.
+    Lazily load the package's public API.
+
+    ``WorkflowRunner`` and the display helpers import the workflow stack (DSPy,
+    agent-framework, litellm), so they are only loaded when accessed.
 
     Parameters:
-        name (str): Attribute name being accessed; only the value "app" is supported.
+        name (str): Attribute name being accessed.
 
     Returns:
-        Typer: The Typer application provided by agentic_fleet.cli.console.app.
+        The Typer application (``app``), ``WorkflowRunner`` or a display helper.
 
     Raises:
-        AttributeError: If `name` is not "app".
+        AttributeError: If `name` is not part of the public API.
     """
     if name == "app":
         from agentic_fleet.cli import console as _console
 
         return _console.app
+    if name == "WorkflowRunner":
+        from agentic_fleet.cli.runner import WorkflowRunner
+
+        return WorkflowRunner
+    if name in ("display_result", "show_help", "show_status"):
+        from agentic_fleet.cli import display
+
+        return getattr(display, name)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,4 +1,4 @@
-"""Eval commands: benchmark, evaluate.
+"""Eval commands: benchmark, evaluate, score-history, replay-routing.
 
 Consolidated from benchmark.py, evaluate.py
 """
@@ -15,9 +15,7 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
-from ...evaluation import Evaluator
 from ...utils.cfg import load_config
-from ..runner import WorkflowRunner
 from ..utils import init_tracing, resolve_resource_path
 
 console = Console()
@@ -37,6 +35,7 @@ def benchmark(
     """
     Benchmark workflow performance with and without DSPy compilation.
     """
+    from ..runner import WorkflowRunner
 
     async def run_benchmark() -> None:
         init_tracing()
@@ -136,8 +135,22 @@ def evaluate(
     stop_on_failure: Annotated[
         bool, typer.Option("--stop-on-failure", help="Stop when a *success* metric returns 0/None")
     ] = False,
+    concurrency: Annotated[
+        int, typer.Option("--concurrency", "-j", help="Tasks run in parallel (0 = config)")
+    ] = 0,
+    task_timeout: Annotated[
+        float | None,
+        typer.Option("--task-timeout", help="Seconds allowed per task (defaults to config)"),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Skip tasks already completed in the existing report"),
+    ] = False,
 ) -> None:
     """Run batch evaluation over a dataset using configured metrics."""
+    from ...evaluation import Evaluator
+    from ..runner import WorkflowRunner
+
     init_tracing()
     cfg = load_config()
     eval_cfg = cfg.get("evaluation", {})
@@ -160,6 +173,8 @@ def evaluate(
     out_dir = eval_cfg.get("output_dir", ".var/logs/evaluation")
     max_tasks_effective = max_tasks if max_tasks else int(eval_cfg.get("max_tasks", 0))
     stop = stop_on_failure or bool(eval_cfg.get("stop_on_failure", False))
+    workers = concurrency if concurrency else int(eval_cfg.get("concurrency", 1))
+    timeout = task_timeout if task_timeout else eval_cfg.get("task_timeout_seconds")
 
     async def wf_factory():
         runner = WorkflowRunner(verbose=False)
@@ -177,6 +192,9 @@ def evaluate(
         metrics=metric_list,
         max_tasks=max_tasks_effective,
         stop_on_failure=stop,
+        concurrency=workers,
+        task_timeout=float(timeout) if timeout else None,
+        resume=resume,
     )
 
     console.print(
@@ -193,7 +211,9 @@ def evaluate(
         summary = await evaluator.run()
         console.print(
             Panel(
-                f"Total Tasks: {summary['total_tasks']}\nMetric Means: "
+                f"Total Tasks: {summary['total_tasks']} "
+                f"(resumed {summary['resumed_tasks']}, failed {summary['failed_tasks']})"
+                "\nMetric Means: "
                 + ", ".join(
                     f"{k}={v['mean']:.2f}"
                     for k, v in summary.get("metrics", {}).items()
@@ -208,3 +228,170 @@ def evaluate(
         )
 
     asyncio.run(run_eval())
+
+
+# -----------------------------------------------------------------------------
+# score-history
+# -----------------------------------------------------------------------------
+
+
+def score_history(
+    limit: Annotated[
+        int, typer.Option("--limit", "-n", help="Only the most recent N executions (0 = all)")
+    ] = 0,
+    concurrency: Annotated[
+        int, typer.Option("--concurrency", "-j", help="Scoring calls in flight at once")
+    ] = 4,
+    scorer: Annotated[
+        str,
+        typer.Option(
+            "--scorer",
+            help="answer-quality (compiled AnswerQualityModule) or reasoner (assess_quality)",
+        ),
+    ] = "answer-quality",
+    model: Annotated[
+        str | None, typer.Option("--model", help="Model for DSPy scoring calls")
+    ] = None,
+    flush_every: Annotated[
+        int, typer.Option("--flush-every", help="Scored pairs per batched history write")
+    ] = 100,
+    rescore: Annotated[
+        bool, typer.Option("--rescore", help="Score every execution, not only unscored ones")
+    ] = False,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume/--restart", help="Reuse scores from an interrupted run"),
+    ] = True,
+) -> None:
+    """Backfill quality scores in execution history with batched DSPy scoring."""
+    from rich.progress import Progress
+
+    from ...dspy_modules.lifecycle import configure_dspy_settings
+    from ...evaluation.batch_scoring import (
+        BatchQualityScorer,
+        answer_quality_scorer,
+        reasoner_scorer,
+    )
+    from ...utils.storage import HistoryManager
+
+    if scorer not in ("answer-quality", "reasoner"):
+        console.print(f"[red]Unknown scorer '{scorer}' (answer-quality, reasoner)[/red]")
+        raise typer.Exit(1)
+
+    cfg = load_config()
+    effective_model = model or cfg.get("dspy", {}).get("model", "gpt-5-mini")
+    configure_dspy_settings(model=effective_model, enable_cache=True)
+    if scorer == "reasoner":
+        from ...dspy_modules.reasoner import DSPyReasoner
+
+        score_fn = reasoner_scorer(DSPyReasoner())
+    else:
+        score_fn = answer_quality_scorer()
+
+    batch = BatchQualityScorer(
+        score_fn,
+        HistoryManager(),
+        concurrency=concurrency,
+        flush_every=flush_every,
+        rescore=rescore,
+    )
+
+    with Progress(console=console) as progress:
+        task_id = progress.add_task("[cyan]Scoring history...", total=None)
+
+        def on_progress(stats) -> None:
+            progress.update(task_id, total=stats.unique, completed=stats.done)
+
+        stats = asyncio.run(batch.run(limit=limit or None, resume=resume, on_progress=on_progress))
+
+    console.print(
+        Panel(
+            f"Executions selected: {stats.selected} ({stats.unique} unique task/answer pairs)\n"
+            f"Scored: {stats.scored} | Reused from marker: {stats.resumed} | "
+            f"Failed: {stats.failed} | Rate-limit pauses: {stats.rate_limited}\n"
+            f"History entries updated: {stats.updated}",
+            title="Quality Backfill",
+            border_style="green" if not stats.failed else "yellow",
+        )
+    )
+
+
+# -----------------------------------------------------------------------------
+# replay-routing
+# -----------------------------------------------------------------------------
+
+
+def replay_routing(
+    store: Annotated[
+        Path | None,
+        typer.Option("--store", "-s", help="Replay store (defaults to dspy.routing_replay_path)"),
+    ] = None,
+    live: Annotated[
+        bool,
+        typer.Option("--live/--offline", help="Call the LM for unrecorded prompts and record them"),
+    ] = False,
+    limit: Annotated[
+        int, typer.Option("--limit", "-n", help="Only the oldest N cases (0 = all)")
+    ] = 0,
+    show: Annotated[int, typer.Option("--show", help="Changed decisions to list")] = 20,
+    output: Annotated[
+        Path | None, typer.Option("--output", "-o", help="Write the full report as JSON")
+    ] = None,
+) -> None:
+    """Replay recorded routing decisions against the current routing code."""
+    import json
+
+    from ...dspy_modules.lifecycle import configure_dspy_settings
+    from ...dspy_modules.reasoner import DSPyReasoner
+    from ...evaluation.routing_replay import RoutingReplayStore
+    from ...evaluation.routing_replay import replay_routing as run_replay
+
+    cfg = load_config()
+    dspy_cfg = cfg.get("dspy", {})
+    store_path = store or dspy_cfg.get("routing_replay_path")
+    if not store_path or not Path(store_path).exists():
+        console.print(
+            "[red]No replay store. Set dspy.routing_replay_path to record one, "
+            "or pass --store.[/red]"
+        )
+        raise typer.Exit(1)
+
+    # Offline runs never call the LM; it is configured for its model name and settings.
+    configure_dspy_settings(model=dspy_cfg.get("model", "gpt-5-mini"), enable_cache=False)
+    replay_store = RoutingReplayStore(store_path)
+    reasoner = DSPyReasoner(use_enhanced_signatures=True, enable_routing_cache=False)
+    try:
+        report = run_replay(
+            reasoner, replay_store, mode="replay" if live else "offline", limit=limit or None
+        )
+    finally:
+        replay_store.close()
+
+    table = Table(title=f"Changed decisions ({len(report.changed)})")
+    table.add_column("Case", style="dim")
+    table.add_column("Task")
+    table.add_column("Changes")
+    for change in report.changed[:show]:
+        diff = "; ".join(
+            f"{name}: {values['recorded']} -> {values['replayed']}"
+            for name, values in change["diff"].items()
+        )
+        table.add_row(change["case_id"], change["task"][:60], diff)
+    if report.changed:
+        console.print(table)
+    console.print(
+        Panel(
+            f"Cases: {report.cases} | Replayed: {report.replayed} | "
+            f"Missing (unrecorded prompts): {report.missing} | Errors: {report.errors}\n"
+            f"Changed decisions: {len(report.changed)} | "
+            f"Assertion failures: {report.assertion_failures}\n"
+            f"LM calls from store: {report.lm_hits} | Live LM calls: "
+            f"{report.lm_misses if live else 0}\n"
+            f"Elapsed: {report.elapsed_seconds:.2f}s ({report.cases_per_second:.0f} cases/s)",
+            title="Routing Replay",
+            border_style="green" if not report.changed and not report.errors else "yellow",
+        )
+    )
+    if output:
+        output.parent.mkdir(parents=True, exist_ok=True)
+        output.write_text(json.dumps(report.to_dict(), indent=2))
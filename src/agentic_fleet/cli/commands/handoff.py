@@ -10,7 +10,6 @@ from rich.panel import Panel
 
 from agentic_fleet.utils.infra.logging import setup_logger
 
-from ..runner import WorkflowRunner
 from ..utils import init_tracing
 
 console = Console()
@@ -33,6 +32,8 @@ def handoff(
     init_tracing()
 
     async def start_session() -> None:
+        from ..runner import WorkflowRunner
+
         runner = WorkflowRunner(verbose=False)
         await runner.initialize_workflow(
             compile_dspy=compile_dspy, model=model, enable_handoffs=True
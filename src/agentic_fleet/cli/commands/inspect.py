@@ -15,9 +15,7 @@ import typer
 from rich.console import Console
 from rich.table import Table
 
-from agentic_fleet.cli.runner import WorkflowRunner
 from agentic_fleet.cli.utils import init_tracing
-from agentic_fleet.dspy_modules.optimization.self_improvement import SelfImprovementEngine
 from agentic_fleet.utils.cfg import env_config
 
 console = Console()
@@ -96,6 +94,8 @@ def export_history(
     """Export workflow execution history to a file."""
 
     async def export() -> None:
+        from agentic_fleet.cli.runner import WorkflowRunner
+
         init_tracing()
         runner = WorkflowRunner()
         await runner.initialize_workflow(model=model)
@@ -146,6 +146,8 @@ def analyze(
     """
 
     async def analyze_task() -> None:
+        from agentic_fleet.cli.runner import WorkflowRunner
+
         init_tracing()
         runner = WorkflowRunner()
         await runner.initialize_workflow(compile_dspy=compile_dspy)
@@ -216,6 +218,8 @@ def self_improve(
     ),
 ) -> None:
     """Automatically improve routing from high-quality execution history."""
+    from agentic_fleet.dspy_modules.optimization.self_improvement import SelfImprovementEngine
+
     engine = SelfImprovementEngine(
         min_quality_score=min_quality,
         max_examples_to_add=max_examples,
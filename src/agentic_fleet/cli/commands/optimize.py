@@ -10,15 +10,14 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.progress import Progress
 
-from ...dspy_modules.reasoner import DSPyReasoner
 from ...utils.cfg import (
     DEFAULT_ANSWER_QUALITY_CACHE_PATH,
     DEFAULT_CACHE_PATH,
+    DEFAULT_GEPA_EVAL_CACHE_PATH,
     DEFAULT_GEPA_LOG_DIR,
     DEFAULT_NLU_CACHE_PATH,
     load_config,
 )
-from ...utils.compiler import compile_answer_quality, compile_nlu, compile_reasoner
 from ..utils import init_tracing, resolve_resource_path
 
 console = Console()
@@ -85,12 +84,33 @@ def gepa_optimize(
         DEFAULT_GEPA_LOG_DIR
     ),
     seed: Annotated[int, typer.Option("--seed", help="Random seed for dataset shuffle")] = 13,
+    coreset: Annotated[
+        bool,
+        typer.Option(
+            "--coreset/--full-set",
+            help=(
+                "Optimize on a representative subset sized for --max-metric-calls "
+                "(or --coreset-size) instead of every example"
+            ),
+        ),
+    ] = False,
+    coreset_size: Annotated[
+        int | None,
+        typer.Option("--coreset-size", help="Examples to keep in the coreset (implies --coreset)"),
+    ] = None,
     no_cache: Annotated[
         bool,
         typer.Option(
             "--no-cache", help="Do not read/write compiled module cache (always recompile)"
         ),
     ] = False,
+    no_eval_cache: Annotated[
+        bool,
+        typer.Option(
+            "--no-eval-cache",
+            help="Re-run every GEPA evaluation instead of reusing results from earlier runs",
+        ),
+    ] = False,
 ) -> None:
     """
     Compile the DSPy supervisor using dspy.GEPA for prompt evolution.
@@ -118,6 +138,8 @@ def gepa_optimize(
         raise typer.BadParameter("--val-split must be between 0.0 and 0.5")
     if not 0.0 <= history_min_quality <= 10.0:
         raise typer.BadParameter("--history-min-quality must be between 0 and 10")
+    if coreset_size is not None and coreset_size < 2:
+        raise typer.BadParameter("--coreset-size must be at least 2")
 
     # Enforce exclusivity: exactly ONE of auto_choice, max_full_evals, max_metric_calls
     chosen = [c for c in [auto_choice, max_full_evals, max_metric_calls] if c is not None]
@@ -140,24 +162,36 @@ def gepa_optimize(
 
     # Use centralized DSPy manager (aligns with agent-framework patterns)
     from ...dspy_modules.lifecycle import configure_dspy_settings
+    from ...dspy_modules.reasoner import DSPyReasoner
+    from ...utils.compiler import compile_answer_quality, compile_nlu, compile_reasoner
 
     configure_dspy_settings(model=effective_model, enable_cache=True)
 
     supervisor = DSPyReasoner()
 
     reflection_model_value = reflection_model or effective_model
+    eval_cache_path = (
+        None
+        if no_eval_cache
+        else yaml_config.get("dspy", {})
+        .get("optimization", {})
+        .get("gepa_eval_cache_path", DEFAULT_GEPA_EVAL_CACHE_PATH)
+    )
     gepa_options = {
         "auto": auto_choice,
         "max_full_evals": max_full_evals,
         "max_metric_calls": max_metric_calls,
         "reflection_model": reflection_model_value,
         "log_dir": str(log_dir),
+        "eval_cache_path": eval_cache_path,
         "perfect_score": 1.0,
         "use_history_examples": use_history,
         "history_min_quality": history_min_quality,
         "history_limit": history_limit,
         "val_split": val_split,
         "seed": seed,
+        "coreset": coreset or coreset_size is not None,
+        "coreset_size": coreset_size,
     }
 
     with Progress() as progress:
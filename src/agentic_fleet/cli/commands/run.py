@@ -7,6 +7,7 @@ import json
 import logging
 import os
 import sys
+from typing import TYPE_CHECKING
 
 import typer
 from dotenv import load_dotenv
@@ -17,9 +18,11 @@ from agentic_fleet.utils.infra.logging import setup_logger
 
 from ...utils.error_utils import sanitize_error_message
 from ..display import display_result, show_help, show_status
-from ..runner import WorkflowRunner
 from ..utils import init_tracing
 
+if TYPE_CHECKING:
+    from ..runner import WorkflowRunner
+
 load_dotenv(dotenv_path=".env")  # Load .env file if present
 console = Console()
 logger = logging.getLogger(__name__)
@@ -141,6 +144,8 @@ def run(
         console.print("Please set OPENAI_API_KEY, AZURE_OPENAI_API_KEY, or GEMINI_API_KEY")
         raise typer.Exit(1)
 
+    from ..runner import WorkflowRunner
+
     runner = WorkflowRunner(verbose=verbose if not output_json else False)
 
     # Pick message from option or positional argument (option takes precedence)
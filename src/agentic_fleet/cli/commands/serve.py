@@ -0,0 +1,50 @@
+"""Production server command - runs the API, optionally with pre-forked workers."""
+
+from __future__ import annotations
+
+import os
+
+import typer
+from rich.console import Console
+
+console = Console()
+
+
+def serve(
+    host: str = typer.Option("127.0.0.1", "--host", help="Interface to bind"),
+    port: int = typer.Option(8000, "--port", "-p", help="Port to bind"),
+    workers: int = typer.Option(1, "--workers", "-w", min=1, help="Number of worker processes"),
+    prefork: bool = typer.Option(
+        True,
+        "--prefork/--no-prefork",
+        help="Preload config and DSPy artifacts once and fork workers that share them",
+    ),
+    log_level: str = typer.Option("info", "--log-level", help="Uvicorn log level"),
+) -> None:
+    """Serve the API without auto-reload (use `dev` during development).
+
+    With several workers, the default pre-fork mode loads the config, prompt
+    templates and compiled DSPy artifacts once in a parent process and forks
+    workers that share them copy-on-write. Send SIGUSR1 to the parent to log
+    per-worker memory. `--no-prefork` uses uvicorn's own worker processes,
+    which each load everything themselves.
+
+    Examples:
+        agentic-fleet serve                       # Single process
+        agentic-fleet serve --workers 4           # Pre-forked workers
+        agentic-fleet serve -w 4 --no-prefork     # Independent uvicorn workers
+    """
+    if workers > 1 and prefork:
+        if not hasattr(os, "fork"):
+            console.print("[red]Pre-fork mode requires os.fork; use --no-prefork.[/red]")
+            raise typer.Exit(2)
+        from agentic_fleet.api.prefork import serve_prefork
+
+        console.print(f"[cyan]Starting {workers} pre-forked workers on http://{host}:{port}[/cyan]")
+        raise typer.Exit(serve_prefork(host=host, port=port, workers=workers, log_level=log_level))
+
+    import uvicorn
+
+    uvicorn.run(
+        "agentic_fleet.main:app", host=host, port=port, workers=workers, log_level=log_level
+    )
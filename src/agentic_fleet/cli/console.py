@@ -24,7 +24,7 @@ from .commands import eval as eval_module
 from .commands import handoff as handoff_module
 from .commands import inspect as inspect_module
 from .commands import optimize, run
-from .runner import WorkflowRunner  # noqa: F401
+from .commands import serve as serve_module
 
 # Suppress OpenTelemetry OTLP log export errors early (before any imports trigger setup)
 logging.getLogger("opentelemetry.exporter.otlp.proto.grpc.exporter").setLevel(logging.CRITICAL)
@@ -49,6 +49,7 @@ app = typer.Typer(
 
 app.command(name="run")(run.run)
 app.command(name="dev")(dev_module.dev)
+app.command(name="serve")(serve_module.serve)
 
 # Backward-compatible alias so tests and external callers can use
 # `console.handoff` directly as a Typer command function rather than
@@ -62,6 +63,8 @@ app.command(name="export-history")(inspect_module.export_history)
 app.command(name="gepa-optimize")(optimize.gepa_optimize)
 app.command(name="self-improve")(inspect_module.self_improve)
 app.command(name="evaluate")(eval_module.evaluate)
+app.command(name="score-history")(eval_module.score_history)
+app.command(name="replay-routing")(eval_module.replay_routing)
 
 
 if __name__ == "__main__":
@@ -6,14 +6,15 @@ workflow results, tables, and status information.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.table import Table
 
-from ..cli.runner import WorkflowRunner
+if TYPE_CHECKING:
+    from ..cli.runner import WorkflowRunner
 
 
 def display_result(result: dict[str, Any], console: Console | None = None) -> None:
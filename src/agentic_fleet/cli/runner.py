@@ -179,6 +179,9 @@ class WorkflowRunner:
             enable_streaming=supervisor_cfg.get("enable_streaming", True),
             pipeline_profile=effective_profile,
             simple_task_max_words=simple_task_max_words,
+            enable_speculative_execution=bool(supervisor_cfg.get("speculative_execution", False)),
+            adaptive_min_confidence=float(supervisor_cfg.get("adaptive_min_confidence", 0.8)),
+            adaptive_history_window=int(supervisor_cfg.get("adaptive_history_window", 200)),
             conversation_context_max_messages=int(conversation_context_max_messages),
             conversation_context_max_chars=int(conversation_context_max_chars),
             parallel_threshold=yaml_config.get("workflow", {})
@@ -191,6 +194,10 @@ class WorkflowRunner:
             require_compiled=yaml_config.get("dspy", {}).get("require_compiled", False),
             refinement_threshold=quality_cfg.get("refinement_threshold", 8.0),
             enable_refinement=quality_cfg.get("enable_refinement", True),
+            refinement_strategy=quality_cfg.get("refinement_strategy", "none"),
+            refinement_candidates=int(quality_cfg.get("refinement_candidates", 3)),
+            refinement_max_concurrency=int(quality_cfg.get("refinement_max_concurrency", 3)),
+            refinement_time_budget_seconds=quality_cfg.get("refinement_time_budget_seconds", 30.0),
             enable_progress_eval=quality_cfg.get("enable_progress_eval", True),
             enable_quality_eval=quality_cfg.get("enable_quality_eval", True),
             judge_threshold=quality_cfg.get("judge_threshold", 7.0),
@@ -144,7 +144,9 @@ def clear_module_cache() -> None:
     logger.debug("AnswerQualityModule cache cleared")
 
 
-def score_answer_with_dspy(question: str, answer: str) -> dict[str, Any]:
+def score_answer_with_dspy(
+    question: str, answer: str, *, raise_rate_limits: bool = False
+) -> dict[str, Any]:
     """Score answer quality using precompiled DSPy module; fallback to heuristic.
 
     This function loads the precompiled AnswerQualityModule from cache. If the
@@ -154,6 +156,8 @@ def score_answer_with_dspy(question: str, answer: str) -> dict[str, Any]:
     Args:
         question: Original user question/task
         answer: Assistant's final answer
+        raise_rate_limits: Re-raise provider rate-limit errors instead of falling
+            back, so batch callers can back off and retry
 
     Returns:
         Dictionary with quality_score, quality_flag, and dimension scores
@@ -181,6 +185,11 @@ def score_answer_with_dspy(question: str, answer: str) -> dict[str, Any]:
             "quality_coherence": c,
         }
     except Exception as e:
+        if raise_rate_limits:
+            from ..utils.infra.resilience import is_rate_limit_error
+
+            if is_rate_limit_error(e):
+                raise
         logger.debug("DSPy scoring failed, using heuristic: %s", e)
         return _heuristic_score(question, answer)
 
@@ -14,14 +14,28 @@ Phase 3 Goals:
 - Add artifact metadata and compatibility checks
 - Validate schema version, DSPy version compatibility
 - Provide actionable error messages with resolution steps
+
+Startup:
+- Artifacts are independent, so they are loaded concurrently in a thread pool.
+- Deserialized modules are kept in a process-wide ``ArtifactCache`` keyed by
+  module type and the SHA-256 of the artifact file, so reloading an unchanged
+  JSON/pickle artifact (lifespan restarts, per-session workflows, a pre-fork
+  parent) does not re-parse it.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
-from dataclasses import dataclass
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
+from time import perf_counter
 from typing import Any
 
 logger = logging.getLogger(__name__)
@@ -76,12 +90,100 @@ class ArtifactRegistry:
     tool_planning: Any | None = None
     quality: Any | None = None
     reasoner: Any | None = None
+    timings: dict[str, float] = field(default_factory=dict)
+    """Seconds spent loading each artifact (near zero on a cache hit)"""
 
     def get_module(self, name: str) -> Any | None:
         """Get a loaded module by name."""
         return getattr(self, name, None)
 
 
+class ArtifactCache:
+    """Deserialized compiled modules keyed by module type and content hash.
+
+    File digests are memoised by ``(size, mtime_ns)`` so an unchanged artifact is
+    not even re-hashed. Cached modules are shared between registries and must be
+    treated as read-only; optimizers compile copies.
+    """
+
+    def __init__(self, max_entries: int = 16) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._modules: OrderedDict[tuple[str, str], Any] = OrderedDict()
+        self._digests: dict[str, tuple[int, int, str]] = {}
+        self._lock = threading.Lock()
+
+    def digest(self, path: Path) -> str | None:
+        """Return the SHA-256 of ``path``, or ``None`` if it cannot be read."""
+        try:
+            stat = path.stat()
+            signature = (int(stat.st_size), int(stat.st_mtime_ns))
+        except (OSError, TypeError, ValueError):
+            return None
+        key = str(path)
+        with self._lock:
+            known = self._digests.get(key)
+        if known is not None and known[:2] == signature:
+            return known[2]
+        try:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        except (OSError, TypeError, ValueError):
+            return None
+        with self._lock:
+            self._digests[key] = (signature[0], signature[1], digest)
+        return digest
+
+    def load(
+        self,
+        path: Path,
+        module_type: str,
+        loader: Callable[..., Any | None],
+    ) -> tuple[Any | None, bool]:
+        """Return ``(module, cache_hit)``, deserializing with ``loader`` on a miss."""
+        digest = self.digest(path)
+        key = (module_type, digest) if digest else None
+        if key is not None:
+            with self._lock:
+                module = self._modules.get(key)
+                if module is not None:
+                    self._modules.move_to_end(key)
+                    self.hits += 1
+                    return module, True
+
+        module = loader(str(path), module_type=module_type)
+        if key is not None and module is not None:
+            with self._lock:
+                self.misses += 1
+                self._modules[key] = module
+                while len(self._modules) > self.max_entries:
+                    self._modules.popitem(last=False)
+        return module, False
+
+    def _reset_lock(self) -> None:
+        # Called in forked children: the parent's lock may have been held by
+        # another thread at fork time and would then never be released.
+        self._lock = threading.Lock()
+
+    def clear(self) -> None:
+        """Drop all cached modules and digests."""
+        with self._lock:
+            self._modules.clear()
+            self._digests.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_artifact_cache = ArtifactCache()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_artifact_cache._reset_lock)
+
+
+def get_artifact_cache() -> ArtifactCache:
+    """Return the process-wide compiled artifact cache."""
+    return _artifact_cache
+
+
 def _search_bases() -> list[Path]:
     """Search for candidate base directories to resolve relative paths."""
     resolved = Path(__file__).resolve()
@@ -227,9 +329,116 @@ def _validate_dspy_version_compatibility(metadata: ArtifactMetadata) -> tuple[bo
         return True, ""  # Allow to proceed on validation failure
 
 
+def _load_artifact(
+    artifact: CompiledArtifact,
+    require_compiled: bool,
+    load_compiled_module: Callable[..., Any | None],
+    cache: ArtifactCache | None,
+) -> tuple[str, str]:
+    """Load one artifact into ``artifact.module``.
+
+    Returns:
+        ``(outcome, message)`` where outcome is ``"loaded"``, ``"missing"`` (a
+        required artifact could not be loaded), ``"incompatible"`` or
+        ``"skipped"`` (an optional artifact could not be loaded).
+    """
+    logger.info(
+        "Loading compiled artifact: %s from %s (required=%s)",
+        artifact.name,
+        artifact.path,
+        artifact.required,
+    )
+
+    if not artifact.path.exists():
+        if artifact.required:
+            logger.error(
+                "Required compiled artifact not found: %s at %s",
+                artifact.name,
+                artifact.path,
+            )
+            return "missing", ""
+        logger.warning(
+            "Optional compiled artifact not found: %s at %s (will use fallback)",
+            artifact.name,
+            artifact.path,
+        )
+        return "skipped", ""
+
+    # Phase 3: Load and validate metadata
+    metadata = _load_artifact_metadata(artifact.path)
+    if metadata:
+        artifact.metadata = metadata
+
+        # Validate DSPy version compatibility
+        is_compatible, error_msg = _validate_dspy_version_compatibility(metadata)
+        if not is_compatible:
+            if artifact.required and require_compiled:
+                logger.error(
+                    "Incompatible artifact %s: %s",
+                    artifact.name,
+                    error_msg,
+                )
+                return "incompatible", error_msg
+            logger.warning(
+                "Artifact %s has compatibility issue (proceeding): %s",
+                artifact.name,
+                error_msg,
+            )
+
+    try:
+        if cache is not None:
+            module, cache_hit = cache.load(artifact.path, artifact.name, load_compiled_module)
+        else:
+            module = load_compiled_module(str(artifact.path), module_type=artifact.name)
+            cache_hit = False
+    except Exception as e:
+        if artifact.required:
+            logger.error(
+                "Error loading required artifact %s: %s",
+                artifact.name,
+                e,
+                exc_info=True,
+            )
+            return "missing", str(e)
+        logger.warning(
+            "Error loading optional artifact %s: %s (will use fallback)",
+            artifact.name,
+            e,
+        )
+        return "skipped", str(e)
+
+    if module is None:
+        if artifact.required:
+            logger.error(
+                "Failed to deserialize required artifact: %s from %s",
+                artifact.name,
+                artifact.path,
+            )
+            return "missing", ""
+        logger.warning(
+            "Failed to deserialize optional artifact: %s from %s",
+            artifact.name,
+            artifact.path,
+        )
+        return "skipped", ""
+
+    artifact.module = module
+    logger.info(
+        "Successfully loaded compiled artifact: %s (schema_version=%s, dspy_version=%s%s)",
+        artifact.name,
+        metadata.schema_version if metadata else "unknown",
+        metadata.dspy_version if metadata else "unknown",
+        ", cached" if cache_hit else "",
+    )
+    return "loaded", ""
+
+
 def load_required_compiled_modules(
     dspy_config: dict[str, Any],
     require_compiled: bool = True,
+    *,
+    cache: ArtifactCache | None = _artifact_cache,
+    max_workers: int | None = None,
 ) -> ArtifactRegistry:
     """Load required compiled DSPy modules with fail-fast enforcement.
 
@@ -240,9 +449,11 @@ def load_required_compiled_modules(
     Args:
         dspy_config: DSPy configuration dictionary from workflow_config.yaml
         require_compiled: If True, raise error on missing artifacts (production mode)
+        cache: Content-hash cache of deserialized modules (``None`` disables it)
+        max_workers: Threads used to load artifacts concurrently (default: one each)
 
     Returns:
-        ArtifactRegistry with loaded modules
+        ArtifactRegistry with loaded modules and per-artifact load timings
 
     Raises:
         RuntimeError: If required artifacts are missing and require_compiled=True
@@ -312,93 +523,25 @@ def load_required_compiled_modules(
         )
     logger.info("=" * 40)
 
-    for artifact in artifacts:
-        logger.info(
-            "Loading compiled artifact: %s from %s (required=%s)",
-            artifact.name,
-            artifact.path,
-            artifact.required,
-        )
-
-        if not artifact.path.exists():
-            if artifact.required:
-                missing_required.append(artifact)
-                logger.error(
-                    "Required compiled artifact not found: %s at %s",
-                    artifact.name,
-                    artifact.path,
-                )
-            else:
-                logger.warning(
-                    "Optional compiled artifact not found: %s at %s (will use fallback)",
-                    artifact.name,
-                    artifact.path,
-                )
-            continue
-
-        # Phase 3: Load and validate metadata
-        metadata = _load_artifact_metadata(artifact.path)
-        if metadata:
-            artifact.metadata = metadata
-
-            # Validate DSPy version compatibility
-            is_compatible, error_msg = _validate_dspy_version_compatibility(metadata)
-            if not is_compatible:
-                if artifact.required and require_compiled:
-                    incompatible_artifacts.append((artifact, error_msg))
-                    logger.error(
-                        "Incompatible artifact %s: %s",
-                        artifact.name,
-                        error_msg,
-                    )
-                    continue
-                else:
-                    logger.warning(
-                        "Artifact %s has compatibility issue (proceeding): %s",
-                        artifact.name,
-                        error_msg,
-                    )
-
+    def load_one(artifact: CompiledArtifact) -> tuple[str, str]:
+        started = perf_counter()
         try:
-            module = load_compiled_module(str(artifact.path), module_type=artifact.name)
-            if module is not None:
-                artifact.module = module
-                setattr(registry, artifact.name, module)
-                logger.info(
-                    "Successfully loaded compiled artifact: %s (schema_version=%s, dspy_version=%s)",
-                    artifact.name,
-                    metadata.schema_version if metadata else "unknown",
-                    metadata.dspy_version if metadata else "unknown",
-                )
-            else:
-                if artifact.required:
-                    missing_required.append(artifact)
-                    logger.error(
-                        "Failed to deserialize required artifact: %s from %s",
-                        artifact.name,
-                        artifact.path,
-                    )
-                else:
-                    logger.warning(
-                        "Failed to deserialize optional artifact: %s from %s",
-                        artifact.name,
-                        artifact.path,
-                    )
-        except Exception as e:
-            if artifact.required:
-                missing_required.append(artifact)
-                logger.error(
-                    "Error loading required artifact %s: %s",
-                    artifact.name,
-                    e,
-                    exc_info=True,
-                )
-            else:
-                logger.warning(
-                    "Error loading optional artifact %s: %s (will use fallback)",
-                    artifact.name,
-                    e,
-                )
+            return _load_artifact(artifact, require_compiled, load_compiled_module, cache)
+        finally:
+            registry.timings[artifact.name] = perf_counter() - started
+
+    # Artifacts are independent: deserialize them concurrently.
+    workers = max(1, min(max_workers or len(artifacts), len(artifacts)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dspy-artifact") as pool:
+        outcomes = list(pool.map(load_one, artifacts))
+
+    for artifact, (outcome, message) in zip(artifacts, outcomes, strict=True):
+        if outcome == "loaded":
+            setattr(registry, artifact.name, artifact.module)
+        elif outcome == "missing":
+            missing_required.append(artifact)
+        elif outcome == "incompatible":
+            incompatible_artifacts.append((artifact, message))
 
     # Phase 3: Fail-fast if required artifacts are missing or incompatible
     if missing_required or incompatible_artifacts:
@@ -450,9 +593,11 @@ def validate_artifact_registry(registry: ArtifactRegistry) -> dict[str, bool]:
 
 
 __all__ = [
+    "ArtifactCache",
     "ArtifactMetadata",
     "ArtifactRegistry",
     "CompiledArtifact",
+    "get_artifact_cache",
     "load_required_compiled_modules",
     "validate_artifact_registry",
 ]
@@ -20,6 +20,7 @@ from typing import Any
 import dspy
 
 from agentic_fleet.utils.cfg import env_config
+from agentic_fleet.utils.infra.telemetry import configure_span_policy, get_span_policy
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +99,9 @@ class DSPyManager:
                     self._setup_opentelemetry()
                     DSPyInstrumentor().instrument()  # type: ignore[possibly-undefined]
                     self._dspy_instrumented = True
+                    # The Langfuse client installs a tracer provider; let
+                    # optional_span pick it up.
+                    configure_span_policy(get_span_policy())
                     logger.info("DSPy instrumentation enabled for Langfuse tracing")
 
             except Exception as e:
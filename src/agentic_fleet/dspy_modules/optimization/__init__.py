@@ -5,6 +5,9 @@ Provides GEPA (Generalized Evolutionary Prompt Adaptation) optimization utilitie
 
 from __future__ import annotations
 
+from .coreset import CoresetSelection, coreset_size_for_budget, select_coreset
+from .eval_cache import GEPAEvaluationCache
+from .example_store import ExampleStore
 from .gepa import (
     DEFAULT_HEURISTICS,
     GEPAHeuristics,
@@ -25,11 +28,15 @@ from .self_improvement import SelfImprovementEngine
 
 __all__ = [
     "DEFAULT_HEURISTICS",
+    "CoresetSelection",
+    "ExampleStore",
+    "GEPAEvaluationCache",
     "GEPAHeuristics",
     "RoutingDecision",
     "RoutingFeedbackMetric",
     "SelfImprovementEngine",
     "convert_to_dspy_examples",
+    "coreset_size_for_budget",
     "dedupe_examples",
     "harvest_history_examples",
     "jaccard_similarity",
@@ -39,4 +46,5 @@ __all__ = [
     "normalize_tools",
     "optimize_with_gepa",
     "prepare_gepa_datasets",
+    "select_coreset",
 ]
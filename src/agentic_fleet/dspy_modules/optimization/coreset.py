@@ -0,0 +1,245 @@
+"""Budget-aware selection of a representative GEPA training subset.
+
+GEPA's metric calls grow with the number of examples, yet a routing corpus is
+dominated by a few patterns (the same agents, mode and tools for many
+phrasings). ``select_coreset`` keeps a fixed number of examples that still
+cover the corpus:
+
+1. Examples are grouped into strata by routing pattern (assigned agents,
+   execution mode, required tools). Every pattern keeps at least one example
+   while the size allows; the rest of the size is shared in proportion to
+   stratum size.
+2. Inside a stratum, greedy k-center selection over hashed TF-IDF vectors of
+   the task text picks the examples farthest from those already chosen, so
+   near-identical phrasings are dropped first.
+3. The selection is split into train and validation per stratum. Singleton
+   patterns stay in the training set.
+
+The result depends only on the examples and the seed (input order does not
+matter). The returned report lists the chosen examples, per-stratum counts
+and the coverage radius, so runs on a coreset can be compared against
+full-set runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import random
+from collections import defaultdict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from .example_store import example_fingerprint, task_shingles
+from .gepa import normalize_agents, normalize_mode, normalize_tools
+
+Stratum = tuple[str, str, str]
+"""Routing pattern of an example: (agents, mode, tools), each normalized."""
+
+VECTOR_DIM = 1024
+
+
+@dataclass(slots=True)
+class CoresetSelection:
+    """Train/validation records chosen by ``select_coreset`` and a JSON-ready report."""
+
+    train: list[dict[str, Any]]
+    val: list[dict[str, Any]]
+    report: dict[str, Any]
+
+
+def routing_stratum(record: dict[str, Any]) -> Stratum:
+    """Stratum key of a routing example."""
+    agents = sorted(agent.lower() for agent in normalize_agents(record.get("assigned_to")))
+    mode = normalize_mode(record.get("mode", record.get("execution_mode")))
+    tools = sorted(normalize_tools(record.get("tool_requirements")))
+    return ",".join(agents), mode, ",".join(tools)
+
+
+def coreset_size_for_budget(
+    max_metric_calls: int, *, val_split: float = 0.2, full_val_evals: int = 10
+) -> int:
+    """Number of examples whose validation share fits ``full_val_evals`` evaluations.
+
+    GEPA spends most of its metric calls scoring candidates on the full
+    validation set, so the validation set is sized to allow ``full_val_evals``
+    of those within ``max_metric_calls``, and the total follows from
+    ``val_split``.
+    """
+    val_size = max(1, max_metric_calls // max(1, full_val_evals))
+    if val_split <= 0:
+        return val_size
+    return max(val_size + 1, math.ceil(val_size / val_split))
+
+
+def _bucket(token: str) -> int:
+    digest = hashlib.blake2b(token.encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "big") % VECTOR_DIM
+
+
+def _task_vectors(records: Sequence[dict[str, Any]]) -> list[dict[int, float]]:
+    """L2-normalized, hashed TF-IDF vectors of the task texts (sparse)."""
+    shingles = [task_shingles(str(record.get("task", ""))) for record in records]
+    document_frequency: dict[str, int] = defaultdict(int)
+    for tokens in shingles:
+        for token in tokens:
+            document_frequency[token] += 1
+    n = len(records)
+    vectors = []
+    for tokens in shingles:
+        vector: defaultdict[int, float] = defaultdict(float)
+        for token in tokens:
+            vector[_bucket(token)] += math.log((1 + n) / (1 + document_frequency[token])) + 1
+        norm = math.sqrt(sum(w * w for w in vector.values())) or 1.0
+        vectors.append({i: w / norm for i, w in vector.items()})
+    return vectors
+
+
+def _distance(a: dict[int, float], b: dict[int, float]) -> float:
+    if len(a) > len(b):
+        a, b = b, a
+    return 1.0 - sum(w * b.get(i, 0.0) for i, w in a.items())
+
+
+def _k_center(
+    vectors: Sequence[dict[int, float]], k: int, rng: random.Random
+) -> tuple[list[int], list[float]]:
+    """Greedy farthest-point selection; returns chosen indices and each point's distance to them."""
+    if k >= len(vectors):
+        return list(range(len(vectors))), [0.0] * len(vectors)
+    first = rng.randrange(len(vectors))
+    chosen = [first]
+    distances = [_distance(v, vectors[first]) for v in vectors]
+    while len(chosen) < k:
+        far = max(range(len(vectors)), key=lambda i: distances[i])
+        chosen.append(far)
+        distances = [
+            min(d, _distance(v, vectors[far])) for d, v in zip(distances, vectors, strict=True)
+        ]
+    return chosen, distances
+
+
+def _apportion(
+    capacity: dict[Stratum, int], total: int, *, at_least_one: bool
+) -> dict[Stratum, int]:
+    """Split ``total`` over strata in proportion to capacity (largest remainder)."""
+    strata = sorted(capacity, key=lambda s: (-capacity[s], s))
+    total = min(total, sum(capacity.values()))
+    quota = dict.fromkeys(strata, 0)
+    if at_least_one:
+        # With more strata than slots, the largest patterns are kept.
+        for stratum in strata[:total]:
+            quota[stratum] = 1 if capacity[stratum] else 0
+    spare = {s: capacity[s] - quota[s] for s in strata}
+    remaining = total - sum(quota.values())
+    pool = sum(spare.values())
+    if remaining > 0 and pool:
+        shares = {s: remaining * spare[s] / pool for s in strata}
+        for stratum in strata:
+            quota[stratum] += int(shares[stratum])
+        leftover = total - sum(quota.values())
+        by_remainder = sorted(strata, key=lambda s: (int(shares[s]) - shares[s], -capacity[s], s))
+        for stratum in by_remainder:
+            if leftover <= 0:
+                break
+            if quota[stratum] < capacity[stratum]:
+                quota[stratum] += 1
+                leftover -= 1
+    return quota
+
+
+def select_coreset(
+    records: Sequence[dict[str, Any]],
+    size: int,
+    *,
+    val_split: float = 0.2,
+    seed: int = 13,
+) -> CoresetSelection:
+    """Pick ``size`` representative examples and split them into train and validation.
+
+    Args:
+        records: Deduplicated routing examples.
+        size: Examples to keep (train + validation); capped at ``len(records)``.
+        val_split: Fraction of the selection reserved for validation.
+        seed: RNG seed for the k-center starting points and the split.
+
+    Returns:
+        The chosen train and validation records, and a report of the selection.
+    """
+    rng = random.Random(seed)
+    ordered = sorted(
+        records, key=lambda r: (example_fingerprint(r), json.dumps(r, sort_keys=True, default=str))
+    )
+    groups: dict[Stratum, list[int]] = defaultdict(list)
+    for index, record in enumerate(ordered):
+        groups[routing_stratum(record)].append(index)
+    vectors = _task_vectors(ordered)
+
+    quota = _apportion({s: len(ix) for s, ix in groups.items()}, size, at_least_one=True)
+    chosen: dict[Stratum, list[int]] = {}
+    all_distances: list[float] = []
+    for stratum in sorted(groups):
+        members = groups[stratum]
+        if not quota[stratum]:
+            continue
+        picks, distances = _k_center([vectors[i] for i in members], quota[stratum], rng)
+        chosen[stratum] = [members[p] for p in picks]
+        all_distances.extend(distances)
+
+    selected = sum(len(ix) for ix in chosen.values())
+    val_total = int(selected * val_split) if val_split > 0 else 0
+    if val_total == 0 and val_split > 0 and selected > 4:
+        val_total = 1
+    val_quota = _apportion(
+        {s: len(ix) - 1 for s, ix in chosen.items()}, val_total, at_least_one=False
+    )
+
+    train: list[dict[str, Any]] = []
+    val: list[dict[str, Any]] = []
+    by_stratum = []
+    for stratum, indices in chosen.items():
+        val_indices = set(rng.sample(indices, val_quota[stratum]))
+        for index in indices:
+            (val if index in val_indices else train).append(ordered[index])
+        by_stratum.append(
+            {
+                "agents": stratum[0],
+                "mode": stratum[1],
+                "tools": stratum[2],
+                "available": len(groups[stratum]),
+                "train": len(indices) - len(val_indices),
+                "val": len(val_indices),
+            }
+        )
+
+    # Examples of uncovered strata are infinitely far from the selection.
+    uncovered = sum(len(ix) for s, ix in groups.items() if s not in chosen)
+    report = {
+        "seed": seed,
+        "requested_size": size,
+        "total_records": len(records),
+        "selected": selected,
+        "val_split": val_split,
+        "strata": {"total": len(groups), "covered": len(chosen)},
+        "coverage": {
+            "mean_distance": round(sum(all_distances) / len(all_distances), 4)
+            if all_distances
+            else 0.0,
+            "max_distance": round(max(all_distances, default=0.0), 4),
+            "uncovered_records": uncovered,
+        },
+        "by_stratum": by_stratum,
+        "train": [example_fingerprint(r) for r in train],
+        "val": [example_fingerprint(r) for r in val],
+    }
+    return CoresetSelection(train=train, val=val, report=report)
+
+
+__all__ = [
+    "CoresetSelection",
+    "coreset_size_for_budget",
+    "routing_stratum",
+    "select_coreset",
+]
@@ -0,0 +1,323 @@
+"""Persistent memoization of GEPA evaluations across optimization runs.
+
+GEPA scores every (candidate program, example) pair by running the program and
+then the feedback metric. Between runs most of those pairs repeat: the seed
+program is the same, a re-run after a small dataset change sees mostly the same
+examples, and GEPA's seeded proposals recreate the same candidate instructions.
+``GEPAEvaluationCache`` stores both halves in one SQLite file so that repeats
+cost a lookup instead of an LM call:
+
+* **Predictor outputs**, keyed by the predictor's instructions and field
+  layout, its demos, the call inputs (the example) and the LM model and
+  settings. The cache sits in front of the DSPy adapter, so ``Predict`` still
+  records a trace entry for a cached call and GEPA's reflective dataset is
+  built exactly as for a live call.
+* **Metric results**, keyed by the metric version, the gold example, the
+  prediction and the predictor being scored. Only metrics that declare a
+  ``version`` attribute are cached, since an unversioned metric cannot signal
+  that its scoring changed.
+
+Entries do not depend on the GEPA budget, so light, medium and heavy runs
+share them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import dspy
+from dspy.teleprompt.gepa.gepa_utils import ScoreWithFeedback
+
+from agentic_fleet.utils.infra.logging import setup_logger
+from agentic_fleet.utils.storage.sqlite import open_sqlite
+
+logger = setup_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS predictions (
+    key TEXT PRIMARY KEY,
+    completions BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS metric_results (
+    key TEXT PRIMARY KEY,
+    score REAL NOT NULL,
+    feedback TEXT,
+    created_at REAL NOT NULL
+);
+"""
+
+# LM settings that identify a connection rather than what the model returns.
+_LM_KWARGS_IGNORED = frozenset({"api_key", "api_base", "base_url", "num_retries"})
+
+
+def _jsonable(value: Any) -> Any:
+    if isinstance(value, dspy.Example):
+        return value.toDict()
+    if hasattr(value, "model_dump"):
+        return value.model_dump()
+    return str(value)
+
+
+def stable_hash(value: Any) -> str:
+    """SHA-256 of a JSON rendering of ``value`` with sorted keys."""
+    payload = json.dumps(value, sort_keys=True, default=_jsonable, ensure_ascii=False)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def metric_version(metric: Any) -> str | None:
+    """Fingerprint of a metric's version and configuration, or ``None`` if unversioned."""
+    version = getattr(metric, "version", None)
+    if version is None:
+        return None
+    config = {k: v for k, v in vars(metric).items() if not k.startswith("_")}
+    return stable_hash([type(metric).__qualname__, version, config])
+
+
+@dataclass(slots=True)
+class EvaluationCacheStats:
+    """Hit and miss counters of a ``GEPAEvaluationCache``."""
+
+    prediction_hits: int = 0
+    prediction_misses: int = 0
+    metric_hits: int = 0
+    metric_misses: int = 0
+
+    def summary(self) -> str:
+        """One-line description for progress messages."""
+        return (
+            f"eval cache: {self.prediction_hits}/{self.prediction_hits + self.prediction_misses}"
+            f" LM calls and {self.metric_hits}/{self.metric_hits + self.metric_misses}"
+            " metric calls reused"
+        )
+
+    def to_dict(self) -> dict[str, int]:
+        """Counters as a plain dict (for run metadata)."""
+        return {
+            "predictionHits": self.prediction_hits,
+            "predictionMisses": self.prediction_misses,
+            "metricHits": self.metric_hits,
+            "metricMisses": self.metric_misses,
+        }
+
+
+class GEPAEvaluationCache:
+    """SQLite-backed cache of predictor outputs and metric results.
+
+    Safe to share between GEPA's evaluation threads and between processes.
+
+    Args:
+        path: Database file, opened with ``open_sqlite``.
+        busy_timeout: Seconds to wait for another process's write lock.
+    """
+
+    def __init__(self, path: str | Path, busy_timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self._conn, self._lock = open_sqlite(self.path, _SCHEMA, busy_timeout)
+        self.stats = EvaluationCacheStats()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    # -- predictor outputs -------------------------------------------------
+
+    @staticmethod
+    def prediction_key(
+        lm: Any,
+        lm_kwargs: dict[str, Any],
+        signature: Any,
+        demos: list[Any],
+        inputs: dict[str, Any],
+    ) -> str:
+        """Key of one predictor call; changes whenever the prompt or LM could."""
+        lm_settings = {
+            k: v
+            for k, v in (getattr(lm, "kwargs", None) or {}).items()
+            if k not in _LM_KWARGS_IGNORED
+        }
+        return stable_hash(
+            {
+                "instructions": stable_hash(signature.instructions),
+                "fields": stable_hash(
+                    {
+                        name: [field.json_schema_extra, str(field.annotation)]
+                        for name, field in signature.fields.items()
+                    }
+                ),
+                "demos": stable_hash(list(demos)),
+                "inputs": stable_hash(inputs),
+                "lm": [getattr(lm, "model", type(lm).__name__), lm_settings, lm_kwargs],
+            }
+        )
+
+    def get_completions(self, key: str) -> list[dict[str, Any]] | None:
+        """Cached adapter completions for ``key``, counting the hit or miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT completions FROM predictions WHERE key = ?", (key,)
+            ).fetchone()
+            completions = None
+            if row is not None:
+                try:
+                    completions = pickle.loads(row[0])  # written by this cache only
+                except Exception:
+                    logger.debug("Discarding unreadable cached prediction %s", key[:12])
+            if completions is None:
+                self.stats.prediction_misses += 1
+            else:
+                self.stats.prediction_hits += 1
+            return completions
+
+    def put_completions(self, key: str, completions: list[dict[str, Any]]) -> None:
+        """Store adapter completions; values that cannot be pickled are skipped."""
+        try:
+            blob = pickle.dumps(completions)
+        except Exception as exc:
+            logger.debug("Not caching prediction %s: %s", key[:12], exc)
+            return
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO predictions (key, completions, created_at) VALUES (?, ?, ?)",
+                (key, blob, time.time()),
+            )
+
+    # -- metric results ----------------------------------------------------
+
+    def get_metric(self, key: str) -> tuple[float, str | None] | None:
+        """Cached (score, feedback) for ``key``, counting the hit or miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT score, feedback FROM metric_results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self.stats.metric_misses += 1
+                return None
+            self.stats.metric_hits += 1
+            return row[0], row[1]
+
+    def put_metric(self, key: str, score: float, feedback: str | None) -> None:
+        """Store a metric result."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO metric_results (key, score, feedback, created_at)"
+                " VALUES (?, ?, ?, ?)",
+                (key, score, feedback, time.time()),
+            )
+
+    # -- integration -------------------------------------------------------
+
+    def wrap_metric(self, metric: Any) -> Any:
+        """Return ``metric`` memoized through this cache (unchanged if unversioned)."""
+        version = metric_version(metric)
+        if version is None:
+            logger.info(
+                "Metric %s has no 'version' attribute; metric results will not be cached",
+                type(metric).__name__,
+            )
+            return metric
+        return CachedFeedbackMetric(metric, self, version)
+
+    @contextmanager
+    def activate(self) -> Iterator[None]:
+        """Route predictor calls in this context (and its DSPy worker threads) through the cache."""
+        inner = dspy.settings.adapter or dspy.ChatAdapter()
+        with dspy.context(adapter=CachingAdapter(inner, self)):
+            yield
+
+
+class CachingAdapter:
+    """DSPy adapter wrapper that serves completions from a ``GEPAEvaluationCache``.
+
+    Anything other than a call is delegated to the wrapped adapter.
+    """
+
+    def __init__(self, adapter: Any, cache: GEPAEvaluationCache) -> None:
+        self.adapter = adapter
+        self.cache = cache
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.adapter, name)
+
+    def __call__(
+        self,
+        lm: Any,
+        lm_kwargs: dict[str, Any],
+        signature: Any,
+        demos: list[Any],
+        inputs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Return cached completions, or call the wrapped adapter and cache its output."""
+        key = self.cache.prediction_key(lm, lm_kwargs, signature, demos, inputs)
+        completions = self.cache.get_completions(key)
+        if completions is None:
+            completions = self.adapter(lm, lm_kwargs, signature, demos, inputs)
+            self.cache.put_completions(key, completions)
+        return completions
+
+    async def acall(
+        self,
+        lm: Any,
+        lm_kwargs: dict[str, Any],
+        signature: Any,
+        demos: list[Any],
+        inputs: dict[str, Any],
+    ) -> list[dict[str, Any]]:
+        """Async variant of ``__call__``."""
+        key = self.cache.prediction_key(lm, lm_kwargs, signature, demos, inputs)
+        completions = self.cache.get_completions(key)
+        if completions is None:
+            completions = await self.adapter.acall(lm, lm_kwargs, signature, demos, inputs)
+            self.cache.put_completions(key, completions)
+        return completions
+
+
+class CachedFeedbackMetric:
+    """GEPA feedback metric memoized in a ``GEPAEvaluationCache``.
+
+    Args:
+        metric: Metric with the GEPA signature ``(gold, pred, trace, pred_name, pred_trace)``.
+        cache: Cache to read and write results.
+        version: ``metric_version(metric)``; part of every key.
+    """
+
+    def __init__(self, metric: Any, cache: GEPAEvaluationCache, version: str) -> None:
+        self.metric = metric
+        self.cache = cache
+        self.version = version
+
+    def __call__(
+        self, gold: Any, pred: Any, trace=None, pred_name=None, pred_trace=None
+    ) -> ScoreWithFeedback | float:
+        """Return the cached result for (gold, pred, pred_name), computing it on a miss."""
+        key = stable_hash([self.version, stable_hash(gold), stable_hash(pred), pred_name])
+        cached = self.cache.get_metric(key)
+        if cached is not None:
+            score, feedback = cached
+            return score if feedback is None else ScoreWithFeedback(score=score, feedback=feedback)
+
+        result = self.metric(gold, pred, trace, pred_name, pred_trace)
+        if isinstance(result, int | float):
+            self.cache.put_metric(key, float(result), None)
+        elif isinstance(getattr(result, "score", None), int | float):
+            self.cache.put_metric(key, float(result.score), str(getattr(result, "feedback", "")))
+        return result
+
+
+__all__ = [
+    "CachedFeedbackMetric",
+    "CachingAdapter",
+    "EvaluationCacheStats",
+    "GEPAEvaluationCache",
+    "metric_version",
+    "stable_hash",
+]
@@ -0,0 +1,385 @@
+"""Append-only store of routing training examples with duplicate detection.
+
+Records live in a JSONL file that is only ever appended to. A companion
+``<name>.index.jsonl`` keeps, per record, its exact fingerprint (task +
+agents + mode, as in ``dedupe_examples``), a MinHash signature of the task
+text and the byte offset where the record ends. Opening a store reads only
+the index; records added since the index was last written (for example after
+a crash) are indexed from the data file's tail.
+
+Near-duplicates are found with MinHash/LSH: signatures are split into bands,
+records sharing a band bucket are candidates, and a candidate whose
+estimated Jaccard similarity of task word shingles reaches
+``near_duplicate_threshold`` counts as a duplicate. Lightly reworded tasks
+are therefore rejected after looking at a few bucket candidates instead of
+comparing against every stored example.
+
+A store opened for a legacy ``.json`` examples file (``ExampleStore.open``)
+lives under ``DEFAULT_EXAMPLE_STORE_DIR`` rather than next to the tracked seed.
+The JSON list is authoritative for the examples it contributes: whenever its
+content hash changes the store is rewritten with the current seed records
+(exact-fingerprint dedupe only, so curated examples are kept as written)
+followed by the records that did not come from the previous seed, so
+corrected or removed seed examples do not linger.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from itertools import chain, pairwise
+from pathlib import Path
+from typing import Any
+
+from agentic_fleet.utils.cfg import DEFAULT_EXAMPLE_STORE_DIR
+from agentic_fleet.utils.serialization import read_complete_jsonl
+
+logger = logging.getLogger(__name__)
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_WORD = re.compile(r"\w+")
+
+
+def example_fingerprint(record: dict[str, Any]) -> str:
+    """Exact-duplicate key of a routing example: task, sorted agents and mode."""
+    assigned = record.get("assigned_to") or []
+    parts = assigned.split(",") if isinstance(assigned, str) else list(assigned)
+    agents = sorted(str(part).strip() for part in parts if part and str(part).strip())
+    mode = str(record.get("mode", record.get("execution_mode", "")) or "").strip().lower()
+    return "|".join([str(record.get("task", "")).strip().lower(), str(agents), mode])
+
+
+def task_shingles(task: str) -> set[str]:
+    """Word unigrams and bigrams of the lower-cased task text."""
+    words = _WORD.findall(task.lower())
+    return set(words) | {f"{a} {b}" for a, b in pairwise(words)}
+
+
+class MinHasher:
+    """MinHash signatures with ``num_perm`` universal hash permutations."""
+
+    __slots__ = ("_a", "_b", "num_perm")
+
+    def __init__(self, num_perm: int = 64, seed: int = 1) -> None:
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._a = [rng.randrange(1, _MERSENNE_PRIME) for _ in range(num_perm)]
+        self._b = [rng.randrange(0, _MERSENNE_PRIME) for _ in range(num_perm)]
+
+    def signature(self, shingles: Iterable[str]) -> list[int]:
+        """Signature of a shingle set (empty for an empty set)."""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(s.encode(), digest_size=4).digest(), "big")
+            for s in shingles
+        ]
+        if not hashes:
+            return []
+        return [
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in zip(self._a, self._b, strict=True)
+        ]
+
+
+def estimated_jaccard(sig_a: list[int], sig_b: list[int]) -> float:
+    """Fraction of matching MinHash slots (0 when either signature is empty)."""
+    if not sig_a or not sig_b:
+        return 0.0
+    return sum(x == y for x, y in zip(sig_a, sig_b, strict=True)) / len(sig_a)
+
+
+class ExampleStore:
+    """Append-only JSONL example store with exact and near-duplicate detection.
+
+    Args:
+        path: JSONL file holding the records.
+        seed_path: Legacy JSON list imported into the store (and reconciled
+            with it when its content changes).
+        near_duplicate_threshold: Estimated task-text Jaccard similarity at or
+            above which an added example counts as a duplicate (1.0 disables).
+        num_perm: MinHash signature length.
+        bands: LSH bands; ``num_perm`` must be divisible by it.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        seed_path: str | Path | None = None,
+        near_duplicate_threshold: float = 0.8,
+        num_perm: int = 64,
+        bands: int = 16,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+        self.path = Path(path)
+        self.index_path = self.path.with_name(self.path.stem + ".index.jsonl")
+        self.seed_path = Path(seed_path) if seed_path else None
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.bands = bands
+        self._rows = num_perm // bands
+        self._hasher = MinHasher(num_perm)
+        self._lock = threading.Lock()
+        self._fingerprints: set[str] = set()
+        self._signatures: list[list[int]] = []
+        self._buckets: dict[tuple[int, int], list[int]] = {}
+        self._end = 0
+        self._seed_state: dict[str, Any] | None = None
+        self._load_index()
+        if self.seed_path is not None:
+            self._sync_seed()
+
+    @classmethod
+    def open(cls, examples_path: str | Path, **kwargs: Any) -> ExampleStore:
+        """Store for an examples path; a ``.json`` path becomes the seed of a derived store."""
+        path = Path(examples_path)
+        if path.suffix == ".jsonl":
+            return cls(path, **kwargs)
+        return cls(_derived_store_path(path), seed_path=path, **kwargs)
+
+    @staticmethod
+    def existing(examples_path: str | Path) -> ExampleStore | None:
+        """The store for ``examples_path`` if one has been created, else None."""
+        path = Path(examples_path)
+        store_path = path if path.suffix == ".jsonl" else _derived_store_path(path)
+        return ExampleStore.open(path) if store_path.exists() else None
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    # -- reading ---------------------------------------------------------------
+
+    def iter_records(self) -> Iterator[dict[str, Any]]:
+        """Stream stored records in insertion order."""
+        if not self.path.exists():
+            return
+        with self.path.open(encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict):
+                    yield record
+
+    def is_duplicate(self, record: dict[str, Any]) -> bool:
+        """Whether ``record`` matches a stored example exactly or by near-duplicate task."""
+        with self._lock:
+            return self._is_duplicate(example_fingerprint(record), self._signature(record))
+
+    # -- writing ---------------------------------------------------------------
+
+    def add(self, record: dict[str, Any]) -> bool:
+        """Append ``record`` unless it duplicates a stored example; returns whether it was added."""
+        return bool(self.add_many([record]))
+
+    def add_many(
+        self, records: Iterable[dict[str, Any]], *, near_duplicates: bool = True
+    ) -> list[dict[str, Any]]:
+        """Append the records that are not duplicates (of the store or of each other).
+
+        Args:
+            records: Candidate examples.
+            near_duplicates: Also reject near-duplicate tasks, not only exact ones.
+
+        Returns:
+            The records that were appended.
+        """
+        added: list[dict[str, Any]] = []
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("ab") as data, self.index_path.open("a") as index:
+                for record in records:
+                    fingerprint = example_fingerprint(record)
+                    signature = self._signature(record)
+                    if self._is_duplicate(fingerprint, signature if near_duplicates else []):
+                        continue
+                    data.write(json.dumps(record).encode("utf-8") + b"\n")
+                    data.flush()
+                    self._remember(fingerprint, signature)
+                    self._end = data.tell()
+                    index.write(json.dumps({"fp": fingerprint, "sig": signature, "end": self._end}))
+                    index.write("\n")
+                    added.append(record)
+        return added
+
+    def stats(self) -> dict[str, Any]:
+        """Record count, index bucket count and duplicate-detection settings."""
+        return {
+            "records": len(self),
+            "buckets": len(self._buckets),
+            "bands": self.bands,
+            "near_duplicate_threshold": self.near_duplicate_threshold,
+            "path": str(self.path),
+        }
+
+    # -- internals -------------------------------------------------------------
+
+    def _signature(self, record: dict[str, Any]) -> list[int]:
+        return self._hasher.signature(task_shingles(str(record.get("task", ""))))
+
+    def _band_keys(self, signature: list[int]) -> Iterator[tuple[int, int]]:
+        for band in range(self.bands):
+            chunk = tuple(signature[band * self._rows : (band + 1) * self._rows])
+            yield band, hash(chunk)
+
+    def _is_duplicate(self, fingerprint: str, signature: list[int]) -> bool:
+        if fingerprint in self._fingerprints:
+            return True
+        if not signature or self.near_duplicate_threshold >= 1.0:
+            return False
+        seen: set[int] = set()
+        for key in self._band_keys(signature):
+            for position in self._buckets.get(key, ()):
+                if position in seen:
+                    continue
+                seen.add(position)
+                similarity = estimated_jaccard(signature, self._signatures[position])
+                if similarity >= self.near_duplicate_threshold:
+                    return True
+        return False
+
+    def _remember(self, fingerprint: str, signature: list[int]) -> None:
+        position = len(self._signatures)
+        self._fingerprints.add(fingerprint)
+        self._signatures.append(signature)
+        if signature:
+            for key in self._band_keys(signature):
+                self._buckets.setdefault(key, []).append(position)
+
+    def _load_index(self) -> None:
+        size = self.path.stat().st_size if self.path.exists() else 0
+        entries: list[dict[str, Any]] = []
+        if self.index_path.exists():
+            for line in self.index_path.read_text(encoding="utf-8").splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # torn final line; the data tail is re-indexed below
+                if "seed" in entry:
+                    seed = entry["seed"]
+                    # Entries written before seeds were reconciled carry no hash.
+                    self._seed_state = seed if isinstance(seed, dict) else None
+                elif "fp" in entry:
+                    entries.append(entry)
+        if entries and entries[-1]["end"] > size:
+            logger.warning("Example index %s is ahead of its data; rebuilding", self.index_path)
+            entries, self._seed_state = [], None
+            self.index_path.unlink(missing_ok=True)
+        for entry in entries:
+            self._remember(entry["fp"], entry["sig"])
+        self._end = entries[-1]["end"] if entries else 0
+        if self._end < size:
+            self._index_tail()
+
+    def _index_tail(self) -> None:
+        """Index records appended after the last index entry (or rebuild from scratch)."""
+        tail = read_complete_jsonl(self.path, self._end)
+        offset = self._end
+        with self.index_path.open("a") as index:
+            for raw in tail.splitlines(keepends=True):
+                offset += len(raw)
+                try:
+                    record = json.loads(raw)
+                except json.JSONDecodeError:
+                    continue
+                if not isinstance(record, dict):
+                    continue
+                fingerprint, signature = example_fingerprint(record), self._signature(record)
+                self._remember(fingerprint, signature)
+                index.write(json.dumps({"fp": fingerprint, "sig": signature, "end": offset}))
+                index.write("\n")
+        self._end = offset
+
+    def _sync_seed(self) -> None:
+        """Reconcile the store with the legacy JSON seed when its content has changed."""
+        assert self.seed_path is not None
+        if not self.seed_path.exists():
+            return
+        try:
+            raw = self.seed_path.read_bytes()
+            data = json.loads(raw)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning("Could not read seed examples %s: %s", self.seed_path, exc)
+            return
+        digest = hashlib.sha256(raw).hexdigest()
+        previous = self._seed_state
+        if previous is not None and previous.get("hash") == digest:
+            return
+        records = [r for r in data if isinstance(r, dict)] if isinstance(data, list) else []
+        fingerprints = [example_fingerprint(record) for record in records]
+        if previous is None:
+            # First import (or an index from before seeds were hashed): nothing to retract.
+            added = len(self.add_many(records, near_duplicates=False))
+        else:
+            self._rewrite(records, retracted=set(previous.get("fps", ())))
+            added = len(records)
+        state = {"hash": digest, "fps": sorted(set(fingerprints))}
+        with self._lock, self.index_path.open("a") as index:
+            index.write(json.dumps({"seed": state}) + "\n")
+        self._seed_state = state
+        if added:
+            logger.info("Synced %d examples from %s into %s", added, self.seed_path, self.path)
+
+    def _rewrite(self, seed_records: list[dict[str, Any]], *, retracted: set[str]) -> None:
+        """Replace the data file with the seed records plus stored records not from the old seed."""
+        with self._lock:
+            seen: set[str] = set()
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=self.path.parent, prefix=f".{self.path.name}.", delete=False
+            ) as tmp:
+                kept = (r for r in self.iter_records() if example_fingerprint(r) not in retracted)
+                for record in chain(seed_records, kept):
+                    fingerprint = example_fingerprint(record)
+                    if fingerprint in seen:
+                        continue
+                    seen.add(fingerprint)
+                    tmp.write(json.dumps(record).encode("utf-8") + b"\n")
+            os.replace(tmp.name, self.path)
+            self.index_path.unlink(missing_ok=True)
+            self._fingerprints.clear()
+            self._signatures.clear()
+            self._buckets.clear()
+            self._end = 0
+            self._load_index()
+
+
+def _derived_store_path(seed_path: Path) -> Path:
+    """Store location for a JSON seed: under the store dir, keyed by the seed's resolved path."""
+    key = hashlib.sha1(str(seed_path.resolve()).encode("utf-8")).hexdigest()[:8]
+    return Path(DEFAULT_EXAMPLE_STORE_DIR) / f"{seed_path.stem}-{key}.jsonl"
+
+
+def iter_example_records(examples_path: str | Path) -> Iterator[dict[str, Any]]:
+    """Stream the records of an examples file, preferring its store when one exists."""
+    store = ExampleStore.existing(examples_path)
+    if store is not None:
+        yield from store.iter_records()
+        return
+    path = Path(examples_path)
+    if path.suffix == ".jsonl" or not os.path.exists(path):
+        return
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, list):
+        raise ValueError(f"Unexpected training data format at {path} (expected list)")
+    yield from (record for record in data if isinstance(record, dict))
+
+
+__all__ = [
+    "ExampleStore",
+    "MinHasher",
+    "estimated_jaccard",
+    "example_fingerprint",
+    "iter_example_records",
+    "task_shingles",
+]
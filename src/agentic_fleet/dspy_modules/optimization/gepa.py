@@ -27,10 +27,13 @@ from dspy.teleprompt.gepa.gepa import GEPAFeedbackMetric
 from dspy.teleprompt.gepa.gepa_utils import ScoreWithFeedback
 
 from agentic_fleet.dspy_modules.lifecycle import get_reflection_lm
+from agentic_fleet.utils.cfg import DEFAULT_GEPA_EVAL_CACHE_PATH
 from agentic_fleet.utils.progress import NullProgressCallback, ProgressCallback
 from agentic_fleet.utils.storage import HistoryManager
 from agentic_fleet.utils.storage.cosmos import get_default_user_id, record_dspy_optimization_run
 
+from .eval_cache import GEPAEvaluationCache
+from .example_store import ExampleStore, example_fingerprint, iter_example_records
 from .self_improvement import SelfImprovementEngine
 
 logger = logging.getLogger(__name__)
@@ -138,6 +141,9 @@ class RoutingFeedbackMetric:
     Callable metric class for GEPA that provides both scoring and rich, actionable feedback.
     """
 
+    # Part of the GEPA evaluation cache key; bump when scoring or feedback changes.
+    version = 1
+
     def __init__(self, perfect_score: float = 1.0, heuristics: GEPAHeuristics = DEFAULT_HEURISTICS):
         self.perfect_score = perfect_score
         self.heuristics = heuristics
@@ -451,28 +457,21 @@ def warning_filter_context(target_logger: logging.Logger, filter_instance: loggi
 
 def load_example_dicts(examples_path: str) -> list[dict[str, Any]]:
     """
-    Load supervisor training examples from JSON file.
+    Load supervisor training examples from JSON file (or its example store).
 
     Args:
-        examples_path: Path to JSON list of training records.
+        examples_path: Path to JSON list of training records, or to a JSONL
+            example store. A JSON path whose store exists reads the store.
 
     Returns:
         List of example dictionaries (possibly empty).
     """
-    path = Path(examples_path)
-    if not path.exists():
+    if ExampleStore.existing(examples_path) is None and not Path(examples_path).exists():
         logger.warning("Training examples file not found: %s", examples_path)
         return []
 
     try:
-        with open(path) as f:
-            data = json.load(f)
-
-        if not isinstance(data, list):
-            logger.warning("Unexpected training data format at %s (expected list)", examples_path)
-            return []
-
-        return [record for record in data if isinstance(record, dict)]
+        return list(iter_example_records(examples_path))
     except Exception as exc:
         logger.error("Failed to load training examples from %s: %s", examples_path, exc)
         return []
@@ -482,6 +481,7 @@ def harvest_history_examples(
     *,
     min_quality: float = 8.0,
     limit: int = 200,
+    store: ExampleStore | None = None,
 ) -> list[dict[str, Any]]:
     """
     Convert recent high-quality executions into routing examples.
@@ -489,6 +489,7 @@ def harvest_history_examples(
     Args:
         min_quality: Minimum quality score (0-10) required.
         limit: Max number of history entries to scan.
+        store: Example store whose (near-)duplicates are skipped.
 
     Returns:
         List of example dictionaries derived from history.
@@ -507,7 +508,7 @@ def harvest_history_examples(
             continue
 
         example = engine.execution_to_example(execution)
-        if example:
+        if example and not (store is not None and store.is_duplicate(example)):
             harvested.append(example)
 
     return harvested
@@ -519,15 +520,7 @@ def dedupe_examples(records: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
     unique: list[dict[str, Any]] = []
 
     for record in records:
-        assigned_to = record.get("assigned_to", [])
-        normalized_agents = sorted(normalize_agents(assigned_to))
-        fingerprint = "|".join(
-            [
-                record.get("task", "").strip().lower(),
-                str(normalized_agents),
-                record.get("mode", record.get("execution_mode", "")),
-            ]
-        )
+        fingerprint = example_fingerprint(record)
         if fingerprint in seen:
             continue
         seen.add(fingerprint)
@@ -568,6 +561,9 @@ def prepare_gepa_datasets(
     extra_examples: Iterable[dict[str, Any]] | None = None,
     val_split: float = 0.2,
     seed: int = 13,
+    store: ExampleStore | None = None,
+    coreset_size: int | None = None,
+    report_path: str | Path | None = None,
 ) -> tuple[list[dspy.Example], list[dspy.Example]]:
     """
     Load, merge, dedupe, and split routing examples for GEPA.
@@ -577,22 +573,53 @@ def prepare_gepa_datasets(
         extra_examples: Optional iterable (e.g., harvested history) to append.
         val_split: Fraction of records reserved for validation.
         seed: RNG seed for deterministic shuffles.
+        store: Example store to stream base records from. Its records are
+            already deduplicated, so only the extras are checked (against the
+            store and each other).
+        coreset_size: Keep only this many representative examples (see
+            ``select_coreset``) instead of the whole corpus.
+        report_path: Where to write the coreset selection report (JSON).
 
     Returns:
         (trainset, valset) of DSPy Example objects.
     """
     records: list[dict[str, Any]]
-    if base_records is not None:
-        records = list(base_records)
+    if store is not None:
+        records = list(store.iter_records())
+        if extra_examples:
+            records.extend(
+                dedupe_examples([r for r in extra_examples if not store.is_duplicate(r)])
+            )
     else:
-        records = load_example_dicts(base_examples_path)
-    if extra_examples:
-        records.extend(extra_examples)
-
-    records = dedupe_examples(records)
+        if base_records is not None:
+            records = list(base_records)
+        else:
+            records = load_example_dicts(base_examples_path)
+        if extra_examples:
+            records.extend(extra_examples)
+        records = dedupe_examples(records)
     if not records:
         return [], []
 
+    if coreset_size is not None and coreset_size < len(records):
+        from .coreset import select_coreset
+
+        selection = select_coreset(records, coreset_size, val_split=val_split, seed=seed)
+        report = selection.report
+        logger.info(
+            "Coreset: %d of %d examples (%d/%d routing patterns covered, mean distance %.3f)",
+            report["selected"],
+            report["total_records"],
+            report["strata"]["covered"],
+            report["strata"]["total"],
+            report["coverage"]["mean_distance"],
+        )
+        if report_path:
+            path = Path(report_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(report, indent=2))
+        return convert_to_dspy_examples(selection.train), convert_to_dspy_examples(selection.val)
+
     rng = random.Random(seed)
     rng.shuffle(records)
 
@@ -649,6 +676,13 @@ def _resolve_optimization_budget(
     return auto, max_full_evals, max_metric_calls
 
 
+def _best_val_score(compiled: Any) -> float | None:
+    """Best aggregate validation score from GEPA's ``detailed_results`` (if tracked)."""
+    results = getattr(compiled, "detailed_results", None)
+    scores = getattr(results, "val_aggregate_scores", None)
+    return max(scores) if scores else None
+
+
 def optimize_with_gepa(
     module: Any,
     trainset: Sequence[dspy.Example],
@@ -663,6 +697,7 @@ def optimize_with_gepa(
     log_dir: str = ".var/logs/gepa",
     metric: Any | None = None,  # type: ignore[type-arg]
     progress_callback: ProgressCallback | None = None,
+    eval_cache_path: str | None = DEFAULT_GEPA_EVAL_CACHE_PATH,
     **gepa_kwargs: Any,
 ) -> Any:
     """
@@ -695,6 +730,8 @@ def optimize_with_gepa(
         log_dir: Directory for GEPA logs
         metric: Custom metric (optional, uses RoutingFeedbackMetric by default)
         progress_callback: Optional callback for progress reporting
+        eval_cache_path: SQLite file memoizing predictor outputs and metric results
+                         across runs (see ``GEPAEvaluationCache``); ``None`` disables it.
         **gepa_kwargs: Additional GEPA options (e.g., enable_tool_optimization, num_threads)
 
     Returns:
@@ -811,6 +848,17 @@ def optimize_with_gepa(
         progress_callback.on_error(error_msg)
         raise ValueError(error_msg)
 
+    # Memoize program and metric evaluations across runs and budgets
+    eval_cache: GEPAEvaluationCache | None = None
+    if eval_cache_path:
+        try:
+            eval_cache = GEPAEvaluationCache(eval_cache_path)
+            metric = eval_cache.wrap_metric(metric)
+            logger.info(f"GEPA evaluation cache: {eval_cache.path}")
+        except Exception as exc:
+            logger.warning(f"GEPA evaluation cache unavailable ({exc}); evaluating uncached")
+            eval_cache = None
+
     # Get reflection LM (uses main LM if not specified)
     reflection_lm = None
     if reflection_model:
@@ -925,8 +973,9 @@ def optimize_with_gepa(
                 elapsed = time.time() - compilation_start
                 minutes = int(elapsed // 60)
                 seconds = int(elapsed % 60)
+                cache_note = f", {eval_cache.stats.summary()}" if eval_cache else ""
                 progress_callback.on_progress(
-                    f"GEPA optimization in progress... ({minutes}m {seconds}s elapsed, "
+                    f"GEPA optimization in progress... ({minutes}m {seconds}s elapsed{cache_note}, "
                     f"check {log_path} for detailed logs)"
                 )
 
@@ -938,7 +987,10 @@ def optimize_with_gepa(
     dspy_logger = logging.getLogger("dspy")
 
     try:
-        with warning_filter_context(dspy_logger, warning_filter):
+        with (
+            warning_filter_context(dspy_logger, warning_filter),
+            eval_cache.activate() if eval_cache else contextlib.nullcontext(),
+        ):
             # GEPA.compile() accepts module as first positional arg or as 'student' keyword
             # The "No valid predictions found" messages are INFO logs from GEPA's reflection
             # mechanism and are expected when reflection can't find suitable predictions.
@@ -961,9 +1013,13 @@ def optimize_with_gepa(
         minutes = int(elapsed // 60)
         seconds = int(elapsed % 60)
         logger.info(f"GEPA compilation completed in {minutes}m {seconds}s")
+        if eval_cache:
+            logger.info("GEPA %s", eval_cache.stats.summary())
+            eval_cache.close()
 
+    cache_note = f"; {eval_cache.stats.summary()}" if eval_cache else ""
     progress_callback.on_complete(
-        f"GEPA optimization complete (train={len(trainset)}, val={len(valset or [])})"
+        f"GEPA optimization complete (train={len(trainset)}, val={len(valset or [])}{cache_note})"
     )
     logger.info(
         "GEPA optimization complete (train=%d, val=%d, log_dir=%s)",
@@ -984,6 +1040,11 @@ def optimize_with_gepa(
                 "maxMetricCalls": max_metric_calls,
                 "reflectionModel": reflection_model,
                 "logDir": str(log_path),
+                "evalCache": eval_cache.stats.to_dict() if eval_cache else None,
+                "bestValScore": _best_val_score(compiled),
+                "totalMetricCalls": getattr(
+                    getattr(compiled, "detailed_results", None), "total_metric_calls", None
+                ),
                 "completedAt": datetime.now(UTC).isoformat(),
             },
             user_id=get_default_user_id(),
@@ -7,16 +7,16 @@ new DSPy training examples from high-quality executions.
 
 from __future__ import annotations
 
-import json
 import logging
 import re
-from pathlib import Path
 from typing import Any
 
 from agentic_fleet.utils.cfg import DEFAULT_EXAMPLES_PATH
 from agentic_fleet.utils.storage import HistoryManager
 from agentic_fleet.utils.storage.cosmos import get_default_user_id, mirror_dspy_examples
 
+from .example_store import ExampleStore
+
 logger = logging.getLogger(__name__)
 
 
@@ -107,11 +107,8 @@ class SelfImprovementEngine:
         # Convert to training examples
         new_examples = self._convert_to_training_examples(high_quality)
 
-        # Load existing examples
-        existing_examples = self._load_existing_examples(examples_file)
-
-        # Deduplicate and add new examples
-        added_examples = self._add_new_examples(existing_examples, new_examples, examples_file)
+        # Deduplicate against the example store and append the new ones
+        added_examples = self._add_new_examples(new_examples, examples_file)
 
         logger.info(f"Added {len(added_examples)} new training examples")
 
@@ -387,83 +384,43 @@ class SelfImprovementEngine:
 
         return "\n".join(tools_desc) if tools_desc else "No tools available"
 
-    def _load_existing_examples(self, examples_file: str) -> list[dict[str, Any]]:
-        """Load existing training examples."""
-        from agentic_fleet.utils.serialization import load_json
-
-        examples_path = Path(examples_file)
-        return load_json(examples_path, default=[], validate_list=True)
-
     def _add_new_examples(
         self,
-        existing: list[dict[str, Any]],
         new: list[dict[str, Any]],
         examples_file: str,
     ) -> list[dict[str, Any]]:
         """
-        Add new examples to existing set, avoiding duplicates.
+        Append new examples to the example store, skipping duplicates.
+
+        A ``.json`` examples file seeds a sibling ``.jsonl`` store on first use;
+        exact and near-duplicate tasks are rejected by the store's index.
 
         Args:
-            existing: Existing training examples
             new: New examples to add
             examples_file: Path to examples file
 
         Returns:
             List of added examples
         """
-        # Create set of existing task fingerprints for deduplication
-        existing_fingerprints = {self._create_fingerprint(ex) for ex in existing}
-
-        # Filter out duplicates
-        unique_new = []
-        for example in new:
-            fingerprint = self._create_fingerprint(example)
-            if fingerprint not in existing_fingerprints:
-                unique_new.append(example)
-                existing_fingerprints.add(fingerprint)
-
-        if not unique_new:
-            logger.info("No new unique examples to add")
-            return []
-
-        # Add to existing
-        updated = existing + unique_new
-
-        # Save updated examples
         try:
-            examples_path = Path(examples_file)
-            examples_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(examples_path, "w") as f:
-                json.dump(updated, f, indent=2)
-
-            logger.info(
-                "Saved %d total examples to %s (%d new)",
-                len(updated),
-                _sanitize_for_log(examples_file),
-                len(unique_new),
-            )
-
-            if unique_new:
-                mirror_dspy_examples(unique_new, user_id=self.user_id)
-
-            return unique_new
-
+            store = ExampleStore.open(examples_file)
+            unique_new = store.add_many(new)
         except Exception as e:
             logger.error("Failed to save updated examples: %s", _sanitize_for_log(str(e)))
             return []
 
-    def _create_fingerprint(self, example: dict[str, Any]) -> str:
-        """
-        Create unique fingerprint for deduplication.
-
-        Uses task + assigned_to + mode to identify duplicates.
-        """
-        task = example.get("task", "").lower().strip()
-        assigned_to = example.get("assigned_to", "")
-        mode = example.get("mode", "")
+        if not unique_new:
+            logger.info("No new unique examples to add")
+            return []
 
-        return f"{task}|{assigned_to}|{mode}"
+        logger.info(
+            "Saved %d total examples to %s (%d new)",
+            len(store),
+            _sanitize_for_log(str(store.path)),
+            len(unique_new),
+        )
+        mirror_dspy_examples(unique_new, user_id=self.user_id)
+        return unique_new
 
     def get_improvement_stats(self) -> dict[str, Any]:
         """
@@ -472,29 +429,28 @@ class SelfImprovementEngine:
         Returns:
             Dictionary with statistics
         """
-        executions = self.history_manager.load_history()
+        import numpy as np
 
-        if not executions:
+        columns = self.history_manager.load_columns()
+
+        if not len(columns):
             return {"potential_examples": 0, "total_executions": 0}
 
-        high_quality = self._filter_high_quality_executions(executions)
-        quality_scores = [
-            ex.get("quality", {}).get("score", 0) for ex in executions if "quality" in ex
-        ]
+        scores = columns["quality_score"]
+        scores = scores[~np.isnan(scores)]
+        high_quality = int(np.count_nonzero(scores >= self.min_quality_score))
 
         return {
-            "total_executions": len(executions),
-            "high_quality_executions": len(high_quality),
-            "potential_new_examples": len(high_quality),
+            "total_executions": len(columns),
+            "high_quality_executions": high_quality,
+            "potential_new_examples": high_quality,
             "min_quality_threshold": self.min_quality_score,
-            "average_quality_score": (
-                sum(quality_scores) / len(quality_scores) if quality_scores else 0
-            ),
+            "average_quality_score": float(scores.mean()) if len(scores) else 0,
             "quality_score_distribution": {
-                "excellent (9-10)": len([s for s in quality_scores if s >= 9]),
-                "good (8-9)": len([s for s in quality_scores if 8 <= s < 9]),
-                "acceptable (7-8)": len([s for s in quality_scores if 7 <= s < 8]),
-                "needs_improvement (<7)": len([s for s in quality_scores if s < 7]),
+                "excellent (9-10)": int(np.count_nonzero(scores >= 9)),
+                "good (8-9)": int(np.count_nonzero((scores >= 8) & (scores < 9))),
+                "acceptable (7-8)": int(np.count_nonzero((scores >= 7) & (scores < 8))),
+                "needs_improvement (<7)": int(np.count_nonzero(scores < 7)),
             },
         }
 
@@ -30,6 +30,7 @@ from .reasoner_predictions import PredictionMethods
 from .reasoner_utils import (
     _format_team_description,
     _generate_cache_key,
+    _routing_confidence,
     get_configured_compiled_reasoner_path,
     get_reasoner_source_hash,
     is_simple_task,
@@ -74,6 +75,8 @@ class DSPyReasoner(dspy.Module):
 
         self._execution_history: list[dict[str, Any]] = []
         self.tool_registry: Any | None = None
+        # Optional evaluation.routing_replay.RoutingRecorder for production routing calls
+        self.routing_recorder: Any | None = None
 
         # Initialize ModuleManager for module initialization and caching
         self._module_manager = ModuleManager(
@@ -241,6 +244,17 @@ class DSPyReasoner(dspy.Module):
         """Allow setting simple responder (for compiled module loading)."""
         self._module_manager.simple_responder = value
 
+    @property
+    def response_refiner(self) -> dspy.Module:
+        """Lazily initialized refiner for low-scoring answers."""
+        self._ensure_modules_initialized()
+        return self._module_manager.response_refiner
+
+    @response_refiner.setter
+    def response_refiner(self, value: dspy.Module) -> None:
+        """Allow setting the response refiner."""
+        self._module_manager.response_refiner = value
+
     @property
     def group_chat_selector(self) -> dspy.Module:
         """Lazily initialized group chat selector."""
@@ -433,12 +447,68 @@ class DSPyReasoner(dspy.Module):
                 - "handoff_strategy": handoff guidance when present.
                 - "workflow_gates": workflow gate information when present.
                 - "reasoning": textual reasoning for the decision.
+                - "confidence": 0-1 confidence reported by the router, lowered for agents
+                  not on the team and for rewritten plans; None if none was reported.
 
         Notes:
             - Simple/heartbeat tasks are routed directly to the "Writer" agent when present.
             - Time-sensitive tasks prefer the configured web-search tool (e.g., Tavily); when used, the "Researcher" role is prioritized and the tool is inserted into the tool plan.
             - When routing cache is enabled, results may be returned from or stored in the cache unless `skip_cache` is true.
+            - When a ``routing_recorder`` is set, the LM calls and the decision are recorded for offline replay (see ``evaluation.routing_replay``).
         """
+        recorder = self.routing_recorder
+        if recorder is None:
+            return self._route_task(
+                task,
+                team,
+                context,
+                handoff_history,
+                current_date,
+                required_capabilities,
+                max_backtracks,
+                skip_cache,
+            )
+
+        from datetime import datetime
+
+        # Pin the date so a replay sends the same prompt.
+        current_date = current_date or datetime.now().strftime("%Y-%m-%d")
+        inputs = {
+            "task": task,
+            "team": team,
+            "context": context,
+            "handoff_history": handoff_history,
+            "current_date": current_date,
+            "required_capabilities": required_capabilities,
+            "max_backtracks": max_backtracks,
+        }
+        with recorder.record(inputs) as recording:
+            decision = self._route_task(
+                task,
+                team,
+                context,
+                handoff_history,
+                current_date,
+                required_capabilities,
+                max_backtracks,
+                skip_cache,
+            )
+            if recording is not None:
+                recording.decision = decision
+        return decision
+
+    def _route_task(
+        self,
+        task: str,
+        team: dict[str, str],
+        context: str = "",
+        handoff_history: list[dict[str, Any]] | None = None,
+        current_date: str | None = None,
+        required_capabilities: list[str] | None = None,
+        max_backtracks: int = 2,
+        skip_cache: bool = False,
+    ) -> dict[str, Any]:
+        """Route a task; see ``route_task``."""
         with (
             create_dspy_span("route_task", module_name="router"),
             optional_span("DSPyReasoner.route_task", attributes={"task": task}),
@@ -472,6 +542,7 @@ class DSPyReasoner(dspy.Module):
                         "handoff_strategy": "",
                         "workflow_gates": "",
                         "reasoning": "Simple/heartbeat task → route to Writer only",
+                        "confidence": 1.0,
                     }
                 else:
                     logger.warning(
@@ -576,6 +647,12 @@ class DSPyReasoner(dspy.Module):
                     "handoff_strategy": decision_data.get("handoff_strategy", ""),
                     "workflow_gates": decision_data.get("workflow_gates", ""),
                     "reasoning": reasoning_text,
+                    "confidence": _routing_confidence(
+                        decision_data.get("confidence"),
+                        assigned_to,
+                        team,
+                        overridden=bool(time_sensitive and preferred_web_tool),
+                    ),
                 }
 
                 # Cache the result
@@ -624,6 +701,12 @@ class DSPyReasoner(dspy.Module):
                     "subtasks": subtasks,
                     "tool_requirements": tool_requirements,
                     "reasoning": reasoning_text,
+                    "confidence": _routing_confidence(
+                        getattr(prediction, "confidence", None),
+                        assigned_to,
+                        team,
+                        overridden=bool(time_sensitive and preferred_web_tool),
+                    ),
                 }
 
     def select_next_speaker(
@@ -813,6 +896,7 @@ class DSPyReasoner(dspy.Module):
                 - handoff_strategy: handoff strategy string
                 - workflow_gates: workflow gate information
                 - reasoning: human-readable reasoning or explanation
+                - confidence: router-reported confidence, if any
         """
 
         def _extract_from_decision(decision_obj: Any) -> dict[str, Any]:
@@ -833,6 +917,7 @@ class DSPyReasoner(dspy.Module):
                 "handoff_strategy": getattr(decision_obj, "handoff_strategy", ""),
                 "workflow_gates": getattr(decision_obj, "workflow_gates", ""),
                 "reasoning": getattr(decision_obj, "reasoning", ""),
+                "confidence": getattr(decision_obj, "confidence", None),
             }
 
         if self.use_typed_signatures:
@@ -851,6 +936,7 @@ class DSPyReasoner(dspy.Module):
             "handoff_strategy": getattr(prediction, "handoff_strategy", ""),
             "workflow_gates": getattr(prediction, "workflow_gates", ""),
             "reasoning": getattr(prediction, "reasoning", ""),
+            "confidence": getattr(prediction, "confidence", None),
         }
 
     # --- Internal helpers ---
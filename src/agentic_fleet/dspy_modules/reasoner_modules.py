@@ -18,6 +18,7 @@ from .signatures import (
     GroupChatSpeakerSelection,
     ProgressEvaluation,
     QualityAssessment,
+    ResponseRefinement,
     SimpleResponse,
     TaskAnalysis,
     TaskRouting,
@@ -105,6 +106,7 @@ class ModuleManager:
         self._progress_evaluator: dspy.Module | None = None
         self._tool_planner: dspy.Module | None = None
         self._simple_responder: dspy.Module | None = None
+        self._response_refiner: dspy.Module | None = None
         self._group_chat_selector: dspy.Module | None = None
         self._nlu: DSPyNLU | None = None
         self._event_narrator: dspy.Module | None = None
@@ -201,6 +203,13 @@ class ModuleManager:
                 _MODULE_CACHE[sr_key] = dspy.Predict(SimpleResponse)
             self._simple_responder = _MODULE_CACHE[sr_key]
 
+        # Initialize response refiner (quality-phase Best-of-N rewrites)
+        if self._response_refiner is None:
+            rr_key = "response_refiner"
+            if rr_key not in _MODULE_CACHE:
+                _MODULE_CACHE[rr_key] = dspy.Predict(ResponseRefinement)
+            self._response_refiner = _MODULE_CACHE[rr_key]
+
         # Initialize group chat selector
         if self._group_chat_selector is None:
             gc_key = "group_chat_selector"
@@ -317,6 +326,7 @@ class ModuleManager:
         self._progress_evaluator = None
         self._tool_planner = None
         self._simple_responder = None
+        self._response_refiner = None
         self._group_chat_selector = None
         self._nlu = None
         self._event_narrator = None
@@ -394,6 +404,16 @@ class ModuleManager:
     def simple_responder(self, value: dspy.Module) -> None:
         self._simple_responder = value
 
+    @property
+    def response_refiner(self) -> dspy.Module:
+        """Return the response refiner module."""
+        self.ensure_modules_initialized()
+        return self._response_refiner  # type: ignore[return-value]
+
+    @response_refiner.setter
+    def response_refiner(self, value: dspy.Module) -> None:
+        self._response_refiner = value
+
     @property
     def group_chat_selector(self) -> dspy.Module:
         """Return the group chat selector module."""
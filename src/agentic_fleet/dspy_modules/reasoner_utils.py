@@ -248,6 +248,27 @@ def _format_team_description(agents: dict[str, Any]) -> str:
     return "\n".join(descriptions)
 
 
+def _routing_confidence(
+    reported: Any, assigned_to: list[str], team: dict[str, Any], *, overridden: bool = False
+) -> float | None:
+    """Derive a 0-1 confidence for a routing decision.
+
+    Starts from the confidence the router LM reported and lowers it by the
+    share of assigned agents that are not on the team, and when routing rules
+    had to rewrite the predicted plan (e.g. time-sensitive tasks forced onto
+    web search). Returns None when the LM reported no usable confidence, so
+    callers never trust a decision on a number that carries no signal.
+    """
+    try:
+        confidence = max(0.0, min(1.0, float(reported)))
+    except (TypeError, ValueError):
+        return None
+    if not assigned_to:
+        return 0.0
+    known = sum(agent in team for agent in assigned_to) / len(assigned_to)
+    return round(confidence * known * (0.6 if overridden else 1.0), 2)
+
+
 # Module-level cache for DSPy module instances (stateless, can be shared)
 _MODULE_CACHE: dict[str, dspy.Module] = {}
 
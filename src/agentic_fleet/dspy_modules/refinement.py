@@ -9,9 +9,11 @@ Provides mechanisms for refining agent outputs:
 from __future__ import annotations
 
 import asyncio
+import inspect
 import logging
+import time
 from dataclasses import dataclass
-from typing import Any, Protocol
+from typing import Any, Protocol, SupportsFloat
 
 import dspy
 
@@ -49,6 +51,19 @@ class RefinementStrategy:
 class BestOfN(RefinementStrategy):
     """
     Best-of-N strategy: Generate N candidates and select the highest scoring one.
+
+    Candidates are generated and scored concurrently, at most ``max_concurrency``
+    at a time; each one is scored as soon as it is generated. Generation stops
+    early once a candidate scores at least ``stop_threshold``, or when
+    ``time_budget_seconds`` have passed, and the unfinished candidates are
+    abandoned (their worker threads finish in the background, but nobody
+    waits for them).
+
+    ``dspy.Predict`` and ``dspy.ChainOfThought`` generators get a distinct
+    ``rollout_id`` per candidate at ``temperature``, so the candidates differ
+    even with the DSPy cache enabled. Other generators are called with
+    ``task`` (plus any ``inputs`` passed to ``refine``) only and must produce
+    varied outputs themselves.
     """
 
     def __init__(
@@ -57,57 +72,134 @@ class BestOfN(RefinementStrategy):
         scorer: ScorerProtocol,
         n: int = 3,
         temperature: float = 0.7,
+        *,
+        max_concurrency: int | None = None,
+        stop_threshold: float | None = None,
+        time_budget_seconds: float | None = None,
     ):
         self.generator = generator_module
         self.scorer = scorer
         self.n = n
         self.temperature = temperature
+        self.max_concurrency = max(1, max_concurrency or n)
+        self.stop_threshold = stop_threshold
+        self.time_budget_seconds = time_budget_seconds
+
+    def _generate(self, task: str, index: int, inputs: dict[str, Any]) -> str:
+        if isinstance(self.generator, dspy.Predict | dspy.ChainOfThought):
+            pred = self.generator(
+                task=task,
+                **inputs,
+                config={"rollout_id": index, "temperature": self.temperature},
+            )
+        else:
+            pred = self.generator(task=task, **inputs)
+        # Extract answer - assumes generator returns Prediction with 'answer' or 'reasoning'
+        return getattr(pred, "answer", getattr(pred, "reasoning", str(pred)))
+
+    async def _score(self, task: str, candidate: str) -> float:
+        try:
+            score = await asyncio.to_thread(self.scorer, task, candidate)
+            if inspect.isawaitable(score):  # async scorers
+                score = await score
+            if not isinstance(score, SupportsFloat | str):
+                raise TypeError(f"scorer returned {type(score).__name__}, not a number")
+            return float(score)
+        except Exception as e:
+            logger.warning(f"Scoring failed: {e}")
+            return 0.0
+
+    async def _candidate(
+        self, task: str, index: int, slots: asyncio.Semaphore, inputs: dict[str, Any]
+    ) -> tuple[int, str, float, float] | None:
+        """Generate and score one candidate; returns (index, answer, score, seconds)."""
+        async with slots:
+            started = time.perf_counter()
+            try:
+                answer = await asyncio.to_thread(self._generate, task, index, inputs)
+            except Exception as e:
+                logger.warning(f"Generation failed: {e}")
+                return None
+            score = await self._score(task, answer)
+            return index, answer, score, time.perf_counter() - started
 
-    async def refine(self, task: str, initial_answer: str | None = None) -> RefinementResult:
+    async def refine(
+        self,
+        task: str,
+        initial_answer: str | None = None,
+        *,
+        inputs: dict[str, Any] | None = None,
+    ) -> RefinementResult:
         """
         Generate N candidates (in parallel) and pick the winner.
+
+        ``inputs`` are passed to the generator next to ``task`` (e.g. the draft
+        and feedback of a refinement signature); the scorer sees ``task`` only.
+        ``metadata`` reports how many candidates were generated, why generation
+        stopped (``"threshold"``, ``"budget"`` or ``None``) and the time saved
+        compared with generating and scoring all N candidates one at a time
+        (estimated from the mean time per finished candidate).
         """
-        # In a real implementation, we'd adjust the generator's temperature here
-        # or assume it's already configured/clonable.
-        # For this implementation, we'll assume the generator ensures diversity via its own config.
-
-        candidates = []
-        for _ in range(self.n):
-            # This would likely be an async call in a real scenario
-            # wrapping synchronous dspy call in thread
-            try:
-                # Assuming generator takes 'task' or similar input
-                pred = await asyncio.to_thread(self.generator, task=task)
-                # Extract answer - assumes generator returns Prediction with 'answer' or 'reasoning'
-                answer = getattr(pred, "answer", getattr(pred, "reasoning", str(pred)))
-                candidates.append(answer)
-            except Exception as e:
-                logger.warning(f"Generation failed: {e}")
+        started = time.perf_counter()
+        deadline = started + self.time_budget_seconds if self.time_budget_seconds else None
+        slots = asyncio.Semaphore(self.max_concurrency)
+        pending = {
+            asyncio.create_task(self._candidate(task, index, slots, inputs or {}))
+            for index in range(self.n)
+        }
+        finished: list[tuple[int, str, float, float]] = []
+        stopped: str | None = None
+        try:
+            while pending:
+                timeout = None if deadline is None else max(0.0, deadline - time.perf_counter())
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    stopped = "budget"
+                    break
+                finished.extend(result for t in done if (result := t.result()) is not None)
+                if self.stop_threshold is not None and any(
+                    score >= self.stop_threshold for _, _, score, _ in finished
+                ):
+                    stopped = "threshold" if pending else None
+                    break
+        finally:
+            for t in pending:
+                t.cancel()
+
+        elapsed = time.perf_counter() - started
+        finished.sort()
+        candidates = [answer for _, answer, _, _ in finished]
+        scores = [score for _, _, score, _ in finished]
+        sequential = (
+            sum(seconds for *_, seconds in finished) / len(finished) * self.n if finished else 0.0
+        )
+        metadata = {
+            "strategy": "best_of_n",
+            "n": self.n,
+            "max_concurrency": self.max_concurrency,
+            "candidates_generated": len(finished),
+            "stopped": stopped,
+            "elapsed_seconds": round(elapsed, 3),
+            "sequential_estimate_seconds": round(sequential, 3),
+            "time_saved_seconds": round(max(0.0, sequential - elapsed), 3),
+        }
 
         if not candidates:
             return RefinementResult(
-                best_answer=initial_answer or "Generation failed", candidates=[]
+                best_answer=initial_answer or "Generation failed",
+                candidates=[],
+                metadata=metadata,
             )
 
-        # Score candidates
-        scores = []
-        for cand in candidates:
-            try:
-                score = self.scorer(task, cand)
-                scores.append(score)
-            except Exception as e:
-                logger.warning(f"Scoring failed: {e}")
-                scores.append(0.0)
-
-        # Pick best
+        # Pick best (the earliest candidate wins ties)
         best_idx = scores.index(max(scores))
-        best_answer = candidates[best_idx]
-
         return RefinementResult(
-            best_answer=best_answer,
+            best_answer=candidates[best_idx],
             candidates=candidates,
             scores=scores,
-            metadata={"strategy": "best_of_n", "n": self.n},
+            metadata=metadata,
         )
 
 
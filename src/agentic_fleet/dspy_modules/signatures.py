@@ -50,7 +50,7 @@ class TaskRouting(dspy.Signature):
     current_date: str = dspy.InputField(desc="Current date for time-sensitive decisions")
 
     decision: RoutingDecisionOutput = dspy.OutputField(
-        desc="Structured routing decision with agents, mode, subtasks, and tools"
+        desc="Structured routing decision with agents, mode, subtasks, tools, and confidence"
     )
 
 
@@ -71,7 +71,7 @@ class EnhancedTaskRouting(dspy.Signature):
     workflow_state: str = dspy.InputField(desc="Current state of the workflow")
 
     decision: RoutingDecisionOutput = dspy.OutputField(
-        desc="Complete routing decision with agents, mode, tools, and strategy"
+        desc="Complete routing decision with agents, mode, tools, strategy, and confidence"
     )
 
 
@@ -143,6 +143,19 @@ class SimpleResponse(dspy.Signature):
     answer: str = dspy.OutputField(desc="Concise and accurate answer")
 
 
+class ResponseRefinement(dspy.Signature):
+    """Revise a draft answer so it fully addresses the task and the review feedback."""
+
+    task: str = dspy.InputField(desc="The user's original task")
+    draft: str = dspy.InputField(desc="The current answer to improve")
+    feedback: str = dspy.InputField(
+        desc="Missing elements and required improvements from the quality review"
+    )
+    answer: str = dspy.OutputField(
+        desc="Complete revised answer to the task, keeping what the draft got right"
+    )
+
+
 class GroupChatSpeakerSelection(dspy.Signature):
     """Select the next speaker in a group chat."""
 
@@ -339,6 +352,7 @@ __all__ = [
     "ProgressEvaluation",
     "ProgressEvaluationWithHandoff",
     "QualityAssessment",
+    "ResponseRefinement",
     "SimpleResponse",
     "TaskAnalysis",
     "TaskRouting",
@@ -57,6 +57,10 @@ class RoutingDecisionOutput(BaseModel):
     reasoning: str = Field(
         description="Reasoning for the routing decision",
     )
+    confidence: float | None = Field(
+        default=None,
+        description="Confidence 0.0-1.0 that these agents and this mode fit the task",
+    )
 
     @field_validator("assigned_to", mode="before")
     @classmethod
@@ -104,6 +108,25 @@ class RoutingDecisionOutput(BaseModel):
             return mode_mapping.get(v, v)
         return v
 
+    @field_validator("confidence", mode="before")
+    @classmethod
+    def clamp_routing_confidence(cls, v: float | str | None) -> float | None:
+        """
+        Normalize a reported confidence to the range 0.0-1.0.
+
+        Parameters:
+            v (float | str | None): Confidence as a float or numeric string.
+
+        Returns:
+            float | None: The value clamped to [0.0, 1.0], or None if it is missing or not numeric.
+        """
+        if v is None:
+            return None
+        try:
+            return max(0.0, min(1.0, float(v)))
+        except (TypeError, ValueError):
+            return None
+
 
 class TaskAnalysisOutput(BaseModel):
     """Structured output for task analysis."""
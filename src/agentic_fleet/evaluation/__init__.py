@@ -1,7 +1,14 @@
 """Evaluation framework package."""
 
 from .background import schedule_quality_evaluation
+from .batch_scoring import BatchQualityScorer, BatchScoringStats
 from .evaluator import Evaluator
 from .metrics import compute_metrics
 
-__all__ = ["Evaluator", "compute_metrics", "schedule_quality_evaluation"]
+__all__ = [
+    "BatchQualityScorer",
+    "BatchScoringStats",
+    "Evaluator",
+    "compute_metrics",
+    "schedule_quality_evaluation",
+]
@@ -37,6 +37,28 @@ def _score_0_to_10(metrics: dict[str, Any]) -> float:
     return max(0.0, min(10.0, round(score_0_to_1 * 10.0, 1)))
 
 
+def _answer_quality_details(metrics: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "answer_quality": {
+            "groundness": metrics.get("quality_groundness"),
+            "relevance": metrics.get("quality_relevance"),
+            "coherence": metrics.get("quality_coherence"),
+            "scale": "0-1",
+        }
+    }
+
+
+def history_quality_patch(metrics: dict[str, Any]) -> dict[str, Any]:
+    """History ``quality`` entry for ``score_answer_with_dspy`` metrics."""
+    flag = metrics.get("quality_flag") if isinstance(metrics, dict) else None
+    return {
+        "score": _score_0_to_10(metrics),
+        "flag": flag,
+        "final_evaluation": _answer_quality_details(metrics),
+        "pending": False,
+    }
+
+
 def schedule_quality_evaluation(
     *,
     workflow_id: str,
@@ -76,24 +98,10 @@ def schedule_quality_evaluation(
                 flag or "none",
             )
 
-            details = {
-                "answer_quality": {
-                    "groundness": metrics.get("quality_groundness"),
-                    "relevance": metrics.get("quality_relevance"),
-                    "coherence": metrics.get("quality_coherence"),
-                    "scale": "0-1",
-                }
-            }
+            details = _answer_quality_details(metrics)
 
             if history_manager is not None:
-                patch = {
-                    "quality": {
-                        "score": score,
-                        "flag": flag,
-                        "final_evaluation": details,
-                        "pending": False,
-                    }
-                }
+                patch = {"quality": history_quality_patch(metrics)}
                 try:
                     await asyncio.to_thread(history_manager.update_execution, workflow_id, patch)
                 except Exception as exc:
@@ -132,4 +140,4 @@ def schedule_quality_evaluation(
     task_obj.add_done_callback(_background_tasks.discard)
 
 
-__all__ = ["schedule_quality_evaluation"]
+__all__ = ["history_quality_patch", "schedule_quality_evaluation"]
@@ -0,0 +1,265 @@
+"""Batched, resumable quality scoring for execution history.
+
+``BatchQualityScorer`` backfills ``quality`` for history entries that have no
+score. Identical (task, answer) pairs are scored once, up to ``concurrency``
+scoring calls run at a time, and a provider rate-limit error pauses every
+worker for an exponentially growing cooldown before the pair is retried.
+
+Scores are appended to a resume marker (a JSONL file of pair hash and
+quality) as they arrive, and written to history in batches through
+``HistoryManager.update_executions``, one patch-log append per ``flush_every``
+scored pairs. The run ends with one ``HistoryManager.compact_history``, which
+folds the patches into the history file. If a run is interrupted, the next
+run reuses the scores in the marker instead of calling the model again. The
+marker is removed once the final batch is written.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from time import monotonic
+from typing import Any
+
+from agentic_fleet.utils.serialization import read_complete_jsonl
+
+from .background import history_quality_patch
+
+logger = logging.getLogger(__name__)
+
+ScoreFn = Callable[[str, str], dict[str, Any]]
+"""Scores one (task, answer) pair and returns the history ``quality`` entry."""
+
+MARKER_FILENAME = "quality_backfill.jsonl"
+
+
+@dataclass(slots=True)
+class BatchScoringStats:
+    """Counters of one ``BatchQualityScorer.run``."""
+
+    selected: int = 0
+    unique: int = 0
+    resumed: int = 0
+    scored: int = 0
+    failed: int = 0
+    rate_limited: int = 0
+    updated: int = 0
+
+    @property
+    def done(self) -> int:
+        """Unique pairs finished so far (scored, resumed or failed)."""
+        return self.resumed + self.scored + self.failed
+
+
+def pair_key(task: str, answer: str) -> str:
+    """Stable hash of a (task, answer) pair, used for dedupe and the resume marker."""
+    return hashlib.sha256(f"{task}\0{answer}".encode()).hexdigest()
+
+
+def needs_quality_score(execution: dict[str, Any]) -> bool:
+    """Whether an execution has a task and result but no (or a zero) quality score."""
+    if not execution.get("task") or not execution.get("result"):
+        return False
+    quality = execution.get("quality") or {}
+    return not quality.get("score")
+
+
+def answer_quality_scorer() -> ScoreFn:
+    """Score with the compiled ``AnswerQualityModule`` (heuristic fallback)."""
+    from agentic_fleet.dspy_modules.answer_quality import score_answer_with_dspy
+
+    def score(task: str, answer: str) -> dict[str, Any]:
+        metrics = score_answer_with_dspy(task, answer, raise_rate_limits=True)
+        return history_quality_patch(metrics)
+
+    return score
+
+
+def reasoner_scorer(reasoner: Any) -> ScoreFn:
+    """Score with ``DSPyReasoner.assess_quality`` (0-10 with missing/improvements)."""
+
+    def score(task: str, answer: str) -> dict[str, Any]:
+        assessment = reasoner.assess_quality(task=task, result=answer)
+        return {
+            "score": assessment.get("score", 0.0),
+            "missing": assessment.get("missing", ""),
+            "improvements": assessment.get("improvements", ""),
+            "reasoning": assessment.get("reasoning", ""),
+            "evaluated_at": "retroactive",
+            "pending": False,
+        }
+
+    return score
+
+
+class BatchQualityScorer:
+    """Concurrent, deduplicated, resumable quality backfill for history.
+
+    Args:
+        score_fn: Synchronous scorer, run in worker threads.
+        history_manager: ``HistoryManager`` to read executions from and write to.
+        concurrency: Scoring calls in flight at once.
+        flush_every: Scored pairs per batched history write.
+        max_retries: Retries of a pair after rate-limit errors.
+        backoff_seconds: First rate-limit cooldown; doubles on each retry.
+        marker_path: Resume marker (defaults next to the history file).
+        rescore: Score every execution, not only those without a score.
+    """
+
+    def __init__(
+        self,
+        score_fn: ScoreFn,
+        history_manager: Any,
+        *,
+        concurrency: int = 4,
+        flush_every: int = 100,
+        max_retries: int = 4,
+        backoff_seconds: float = 5.0,
+        marker_path: str | Path | None = None,
+        rescore: bool = False,
+    ) -> None:
+        self.score_fn = score_fn
+        self.history_manager = history_manager
+        self.concurrency = max(1, concurrency)
+        self.flush_every = max(1, flush_every)
+        self.max_retries = max(0, max_retries)
+        self.backoff_seconds = backoff_seconds
+        self.marker_path = (
+            Path(marker_path) if marker_path else history_manager.history_dir / MARKER_FILENAME
+        )
+        self.rescore = rescore
+        self.stats = BatchScoringStats()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._flush_lock = asyncio.Lock()
+        self._cooldown_until = 0.0
+
+    def _load_marker(self) -> dict[str, dict[str, Any]]:
+        data = read_complete_jsonl(self.marker_path)
+        scored: dict[str, dict[str, Any]] = {}
+        for line in data.decode("utf-8").splitlines():
+            try:
+                row = json.loads(line)
+                scored[row["key"]] = row["quality"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                continue
+        return scored
+
+    async def run(
+        self,
+        *,
+        limit: int | None = None,
+        resume: bool = True,
+        on_progress: Callable[[BatchScoringStats], None] | None = None,
+    ) -> BatchScoringStats:
+        """Score the selected executions and write their quality back to history.
+
+        Args:
+            limit: Only consider the most recent ``limit`` executions.
+            resume: Reuse scores from an earlier interrupted run's marker.
+            on_progress: Called with the stats after each unique pair finishes.
+        """
+        self.stats = stats = BatchScoringStats()
+        executions = await asyncio.to_thread(self.history_manager.load_history, limit)
+
+        pairs: dict[str, tuple[str, str]] = {}
+        workflow_ids: dict[str, list[str]] = {}
+        for execution in executions:
+            if not self.rescore and not needs_quality_score(execution):
+                continue
+            task, answer = str(execution.get("task", "")), str(execution.get("result", ""))
+            workflow_id = execution.get("workflowId")
+            if not workflow_id or not task or not answer:
+                continue
+            key = pair_key(task, answer)
+            pairs.setdefault(key, (task, answer))
+            workflow_ids.setdefault(key, []).append(workflow_id)
+            stats.selected += 1
+        stats.unique = len(pairs)
+
+        if not resume:
+            self.marker_path.unlink(missing_ok=True)
+        previous = self._load_marker()
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for key in pairs:
+            if key in previous:
+                self._add_patches(workflow_ids[key], previous[key])
+                stats.resumed += 1
+            else:
+                queue.put_nowait(key)
+        if stats.resumed:
+            logger.info("Reusing %d scores from %s", stats.resumed, self.marker_path)
+            if on_progress:
+                on_progress(stats)
+
+        self.marker_path.parent.mkdir(parents=True, exist_ok=True)
+        with self.marker_path.open("a") as marker:
+
+            async def worker() -> None:
+                while not queue.empty():
+                    key = queue.get_nowait()
+                    quality = await self._score(key, *pairs[key])
+                    if quality is None:
+                        stats.failed += 1
+                    else:
+                        marker.write(json.dumps({"key": key, "quality": quality}) + "\n")
+                        marker.flush()
+                        self._add_patches(workflow_ids[key], quality)
+                        stats.scored += 1
+                        if len(self._pending) >= self.flush_every:
+                            await self._flush()
+                    if on_progress:
+                        on_progress(stats)
+
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+        await self._flush()
+        self.marker_path.unlink(missing_ok=True)
+        await asyncio.to_thread(self.history_manager.compact_history)
+        return stats
+
+    async def _score(self, key: str, task: str, answer: str) -> dict[str, Any] | None:
+        from agentic_fleet.utils.infra.resilience import is_rate_limit_error
+
+        for attempt in range(self.max_retries + 1):
+            delay = self._cooldown_until - monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            try:
+                return await asyncio.to_thread(self.score_fn, task, answer)
+            except Exception as exc:
+                if not is_rate_limit_error(exc) or attempt == self.max_retries:
+                    logger.warning("Quality scoring failed for pair %s: %s", key[:12], exc)
+                    return None
+                self.stats.rate_limited += 1
+                cooldown = self.backoff_seconds * 2**attempt
+                # One rate limit pauses every worker, not just the one that hit it.
+                self._cooldown_until = max(self._cooldown_until, monotonic() + cooldown)
+                logger.info("Rate limited; pausing scoring for %.1fs", cooldown)
+        return None
+
+    def _add_patches(self, workflow_ids: list[str], quality: dict[str, Any]) -> None:
+        for workflow_id in workflow_ids:
+            self._pending[workflow_id] = {"quality": quality}
+
+    async def _flush(self) -> None:
+        async with self._flush_lock:
+            batch, self._pending = self._pending, {}
+            if batch:
+                self.stats.updated += await asyncio.to_thread(
+                    self.history_manager.update_executions, batch
+                )
+
+
+__all__ = [
+    "BatchQualityScorer",
+    "BatchScoringStats",
+    "answer_quality_scorer",
+    "needs_quality_score",
+    "pair_key",
+    "reasoner_scorer",
+]
@@ -2,16 +2,24 @@
 
 The Evaluator loads tasks from a dataset file, executes workflow runs, and computes
 configured metrics, writing a structured JSONL report.
+
+Tasks run on ``concurrency`` workers, each under an optional ``task_timeout``.
+Report lines are written as tasks finish and the summary is aggregated as
+they arrive. With ``resume=True`` the existing report doubles as the
+checkpoint: tasks it already records as ``ok`` are skipped, and their
+metrics are folded into the new summary.
 """
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import json
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from time import perf_counter
+from typing import IO, Any
 
 from .metrics import compute_metrics
 
@@ -25,6 +33,49 @@ class EvaluationResult:
     task_id: str
     metrics: dict[str, Any]
     raw: dict[str, Any]
+    output_hash: str = ""
+
+
+@dataclass(slots=True)
+class _MetricStats:
+    count: int = 0
+    total: float = 0.0
+    min: float | None = None
+    max: float | None = None
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else None,
+            "min": self.min,
+            "max": self.max,
+        }
+
+
+@dataclass(slots=True)
+class _SummaryAggregate:
+    """Running per-metric count/mean/min/max, updated one result at a time."""
+
+    total_tasks: int = 0
+    metrics: dict[str, _MetricStats] = field(default_factory=dict)
+
+    def add(self, metrics: dict[str, Any]) -> None:
+        self.total_tasks += 1
+        for name, value in metrics.items():
+            if isinstance(value, int | float):
+                self.metrics.setdefault(name, _MetricStats()).add(float(value))
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "total_tasks": self.total_tasks,
+            "metrics": {name: stats.to_dict() for name, stats in self.metrics.items()},
+        }
 
 
 class Evaluator:
@@ -43,17 +94,24 @@ class Evaluator:
         metrics: list[str],
         max_tasks: int = 0,
         stop_on_failure: bool = False,
+        concurrency: int = 1,
+        task_timeout: float | None = None,
+        resume: bool = False,
     ) -> None:
         """
         Initialize the evaluator.
 
         Args:
-            workflow_factory: Async callable returning an initialized workflow
+            workflow_factory: Async callable returning a new initialized workflow
+                (called once per concurrent worker)
             dataset_path: Path to input dataset (JSON or JSONL)
             output_dir: Directory for output reports
             metrics: List of metric names to compute
             max_tasks: Maximum number of tasks to process (0 for all)
             stop_on_failure: Whether to stop on first metric failure
+            concurrency: Number of tasks run at the same time
+            task_timeout: Seconds allowed per task (None for no limit)
+            resume: Skip tasks already recorded as completed in the existing report
         """
         self.workflow_factory = workflow_factory  # callable returning initialized workflow
         self.dataset_path = Path(dataset_path)
@@ -61,6 +119,9 @@ class Evaluator:
         self.metrics = metrics
         self.max_tasks = max_tasks
         self.stop_on_failure = stop_on_failure
+        self.concurrency = max(1, concurrency)
+        self.task_timeout = task_timeout
+        self.resume = resume
         self.output_dir.mkdir(parents=True, exist_ok=True)
 
     def _load_tasks(self) -> list[dict[str, Any]]:
@@ -76,6 +137,10 @@ class Evaluator:
             tasks = tasks[: self.max_tasks]
         return tasks
 
+    def _report_path(self) -> Path:
+        """Get path to the JSONL report (also the resume checkpoint)."""
+        return self.output_dir / "evaluation_report.jsonl"
+
     def _baseline_path(self) -> Path:
         """Get path to baseline snapshot file."""
         return self.output_dir / "baseline_snapshot.json"
@@ -91,6 +156,21 @@ class Evaluator:
         """Compute SHA256 hash of output text for drift detection."""
         return hashlib.sha256(text.encode("utf-8")).hexdigest()
 
+    def _load_completed(self) -> dict[str, dict[str, Any]]:
+        """Read completed report lines (by task id) and drop a torn final line."""
+        from agentic_fleet.utils.serialization import read_complete_jsonl
+
+        data = read_complete_jsonl(self._report_path())
+        completed: dict[str, dict[str, Any]] = {}
+        for line in data.decode("utf-8").splitlines():
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if row.get("status", "ok") == "ok" and "task_id" in row:
+                completed[str(row["task_id"])] = row
+        return completed
+
     async def run(self) -> dict[str, Any]:
         """
         Execute the evaluation run.
@@ -99,87 +179,159 @@ class Evaluator:
             Summary dictionary containing aggregate metrics
         """
         tasks = self._load_tasks()
-        results: list[EvaluationResult] = []
-        workflow = await self.workflow_factory()
-
         baseline = self._load_baseline()
         baseline_hashes = baseline.get("hashes", {}) if baseline else {}
         first_run = not baseline_hashes
+        # Drift metric: 0 if identical to baseline hash for task id, 1 if
+        # different, None if baseline missing
+        if "output_drift" not in self.metrics:
+            # allow on-the-fly use even if not configured
+            self.metrics.append("output_drift")
 
-        report_path = self.output_dir / "evaluation_report.jsonl"
-        with report_path.open("w") as report_file:
-            for idx, task in enumerate(tasks, start=1):
-                message = task.get("message") or task.get("task") or ""
-                if not message:
-                    continue
-                result = await workflow.run(message)
-                metadata = result.get("metadata", {})
-                # Provide result text for keyword metric
-                task["_result_text"] = str(result.get("result", ""))
-                output_text = task["_result_text"]
-                output_hash = self._compute_output_hash(output_text)
-                # Drift metric: 0 if identical to baseline hash for task id, 1 if
-                # different, None if baseline missing
-                if "output_drift" not in self.metrics:
-                    # allow on-the-fly use even if not configured
-                    self.metrics.append("output_drift")
-                drift_value = None
-                task_id_effective = str(task.get("id", idx))
-                if task_id_effective in baseline_hashes:
-                    drift_value = 0 if baseline_hashes[task_id_effective] == output_hash else 1
-                elif not first_run:
-                    drift_value = None
-                metric_values = compute_metrics(task, metadata, self.metrics)
-                if "output_drift" in self.metrics:
-                    metric_values["output_drift"] = drift_value
-                eval_result = EvaluationResult(
-                    task_id=str(task.get("id", idx)), metrics=metric_values, raw=result
-                )
-                results.append(eval_result)
-                report_line = {
-                    "task_id": eval_result.task_id,
-                    "message": message,
-                    "metrics": eval_result.metrics,
-                    "hash": output_hash,
-                }
-                report_file.write(json.dumps(report_line) + "\n")
-
-                if self.stop_on_failure and any(
-                    v in (0, None) for k, v in eval_result.metrics.items() if k.endswith("success")
-                ):
-                    break
-
-        summary = self._summarize(results)
+        completed = self._load_completed() if self.resume else {}
+        aggregate = _SummaryAggregate()
+        hashes: dict[str, str] = {}
+        for task_id, row in completed.items():
+            aggregate.add(row.get("metrics") or {})
+            hashes[task_id] = row.get("hash", "")
+
+        pending: asyncio.Queue[tuple[str, dict[str, Any], str]] = asyncio.Queue()
+        for idx, task in enumerate(tasks, start=1):
+            message = task.get("message") or task.get("task") or ""
+            task_id = str(task.get("id", idx))
+            if message and task_id not in completed:
+                pending.put_nowait((task_id, task, message))
+        if completed:
+            logger.info(
+                "Resuming evaluation: %d completed, %d to run", len(completed), pending.qsize()
+            )
+
+        failed = 0
+        stop = asyncio.Event()
+
+        with self._report_path().open("a" if self.resume else "w") as report_file:
+
+            async def worker() -> None:
+                nonlocal failed
+                # Workflows keep per-run state and reject concurrent runs, so each
+                # worker runs its tasks one at a time on a workflow of its own.
+                workflow = await self.workflow_factory()
+                while not stop.is_set():
+                    try:
+                        task_id, task, message = pending.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    row, result = await self._evaluate_task(
+                        workflow, task_id, task, message, baseline_hashes, first_run
+                    )
+                    self._write_row(report_file, row)
+                    if result is None:
+                        failed += 1
+                        if self.stop_on_failure:
+                            stop.set()
+                        continue
+                    aggregate.add(result.metrics)
+                    hashes[task_id] = result.output_hash
+                    if self.stop_on_failure and any(
+                        v in (0, None) for k, v in result.metrics.items() if k.endswith("success")
+                    ):
+                        stop.set()
+
+            workers = min(self.concurrency, pending.qsize())
+            await asyncio.gather(*(worker() for _ in range(workers)))
+
+        summary = aggregate.to_dict()
+        summary["failed_tasks"] = failed
+        summary["resumed_tasks"] = len(completed)
         summary_path = self.output_dir / "evaluation_summary.json"
         summary_path.write_text(json.dumps(summary, indent=2))
 
         # Write baseline snapshot if first run (hashes only)
         if first_run:
-            snapshot = {
-                "total_tasks": len(results),
-                "hashes": {
-                    r.task_id: self._compute_output_hash(r.raw.get("result", "")) for r in results
-                },
-            }
+            snapshot = {"total_tasks": len(hashes), "hashes": hashes}
             self._baseline_path().write_text(json.dumps(snapshot, indent=2))
         return summary
 
+    async def _evaluate_task(
+        self,
+        workflow: Any,
+        task_id: str,
+        task: dict[str, Any],
+        message: str,
+        baseline_hashes: dict[str, str],
+        first_run: bool,
+    ) -> tuple[dict[str, Any], EvaluationResult | None]:
+        """Run one task and return its report line and result (None on failure)."""
+        started = perf_counter()
+        try:
+            async with asyncio.timeout(self.task_timeout):
+                result = await workflow.run(message)
+        except TimeoutError:
+            logger.warning("Evaluation task %s timed out after %ss", task_id, self.task_timeout)
+            return self._failure_row(task_id, message, "timeout", started), None
+        except Exception as exc:
+            logger.warning("Evaluation task %s failed: %s", task_id, exc)
+            return self._failure_row(task_id, message, "error", started, str(exc)), None
+        latency = perf_counter() - started
+
+        metadata = self._run_metadata(result, latency)
+        task = dict(task)
+        # Provide result text for keyword metric
+        task["_result_text"] = str(result.get("result", ""))
+        output_hash = self._compute_output_hash(task["_result_text"])
+        drift_value = None
+        if task_id in baseline_hashes:
+            drift_value = 0 if baseline_hashes[task_id] == output_hash else 1
+        elif not first_run:
+            drift_value = None
+        metric_values = compute_metrics(task, metadata, self.metrics)
+        if "output_drift" in self.metrics:
+            metric_values["output_drift"] = drift_value
+
+        eval_result = EvaluationResult(
+            task_id=task_id, metrics=metric_values, raw=result, output_hash=output_hash
+        )
+        row = {
+            "task_id": task_id,
+            "message": message,
+            "status": "ok",
+            "metrics": metric_values,
+            "hash": output_hash,
+            "latency_seconds": round(latency, 3),
+            "usage": metadata.get("usage"),
+        }
+        return row, eval_result
+
+    @staticmethod
+    def _run_metadata(result: dict[str, Any], latency: float) -> dict[str, Any]:
+        """Metadata for metrics: the run's metadata plus its quality, routing and latency."""
+        metadata = dict(result.get("metadata") or {})
+        for key in ("quality", "routing", "phase_timings", "usage"):
+            if key in result:
+                metadata.setdefault(key, result[key])
+        metadata.setdefault("execution_time", latency)
+        return metadata
+
+    @staticmethod
+    def _failure_row(
+        task_id: str, message: str, status: str, started: float, error: str = ""
+    ) -> dict[str, Any]:
+        return {
+            "task_id": task_id,
+            "message": message,
+            "status": status,
+            "error": error,
+            "latency_seconds": round(perf_counter() - started, 3),
+        }
+
+    @staticmethod
+    def _write_row(report_file: IO[str], row: dict[str, Any]) -> None:
+        report_file.write(json.dumps(row, default=str) + "\n")
+        report_file.flush()
+
     def _summarize(self, results: list[EvaluationResult]) -> dict[str, Any]:
         """Compute aggregate statistics from individual results."""
-        if not results:
-            return {"total_tasks": 0, "metrics": {}}
-        aggregate: dict[str, list[float]] = {}
+        aggregate = _SummaryAggregate()
         for r in results:
-            for k, v in r.metrics.items():
-                if isinstance(v, int | float):
-                    aggregate.setdefault(k, []).append(float(v))
-        metrics_summary = {
-            k: {
-                "count": len(vals),
-                "mean": (sum(vals) / len(vals)) if vals else None,
-                "min": min(vals) if vals else None,
-                "max": max(vals) if vals else None,
-            }
-            for k, vals in aggregate.items()
-        }
-        return {"total_tasks": len(results), "metrics": metrics_summary}
+            aggregate.add(r.metrics)
+        return aggregate.to_dict()
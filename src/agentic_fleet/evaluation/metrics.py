@@ -138,12 +138,31 @@ def metric_estimated_cost_usd(task: dict[str, Any], metadata: dict[str, Any]) ->
     return round((count / 1000.0) * cost_per_1k, 8)
 
 
+def metric_total_tokens(_task: dict[str, Any], metadata: dict[str, Any]) -> int | None:
+    """Model tokens reported in ``metadata["usage"]``, if the run recorded usage.
+
+    Accepts ``total_tokens`` or the sum of prompt/completion (input/output) counts.
+    """
+    usage = metadata.get("usage")
+    if not isinstance(usage, dict):
+        return None
+    if usage.get("total_tokens") is not None:
+        return int(usage["total_tokens"])
+    parts = [
+        usage.get(key)
+        for key in ("prompt_tokens", "completion_tokens", "input_tokens", "output_tokens")
+    ]
+    counted = [int(p) for p in parts if p is not None]
+    return sum(counted) if counted else None
+
+
 # Register new metrics
 METRIC_FUNCS.update(
     {
         "relevance_score": metric_relevance_score,
         "token_count": metric_token_count,
         "estimated_cost_usd": metric_estimated_cost_usd,
+        "total_tokens": metric_total_tokens,
     }
 )
 
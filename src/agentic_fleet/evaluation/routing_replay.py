@@ -0,0 +1,399 @@
+"""Offline replay of recorded routing decisions.
+
+Measuring a routing change against live traffic costs one LM call per task.
+Most changes, though, touch only post-processing (output parsing,
+``validate_full_routing``, the normalization in ``route_task`` and the
+routing executor) and leave the router prompts alone. Replay separates the
+two:
+
+* ``RoutingRecorder`` runs ``DSPyReasoner.route_task`` with a ``ReplayLM`` in
+  record mode. Every LM call (formatted messages and LM settings → raw
+  outputs) and the routing inputs and decision are written to a
+  ``RoutingReplayStore``, a single SQLite file of zlib-compressed JSON rows.
+* ``replay_routing`` re-runs ``route_task`` over the recorded cases with a
+  ``ReplayLM`` that answers from the store. The current adapter parsing,
+  assertions and post-processing run on every case. An LM call is needed
+  only when the messages differ from the recorded ones, e.g. after an
+  instruction change; in ``offline`` mode such cases are reported as
+  missing instead.
+
+The report lists decisions that differ from the recorded ones, assertion
+failures and how many LM calls were answered from the store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import random
+import sqlite3
+import threading
+import time
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Literal
+
+import dspy
+
+from agentic_fleet.utils.infra.logging import setup_logger
+from agentic_fleet.utils.storage.sqlite import open_sqlite
+
+logger = setup_logger(__name__)
+
+ReplayMode = Literal["record", "replay", "offline"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lm_calls (
+    key TEXT PRIMARY KEY,
+    model TEXT,
+    request BLOB NOT NULL,
+    outputs BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS routing_cases (
+    case_id TEXT PRIMARY KEY,
+    inputs BLOB NOT NULL,
+    decision BLOB NOT NULL,
+    lm_calls INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+# LM settings that identify a connection rather than what the model returns.
+_LM_KWARGS_IGNORED = frozenset({"api_key", "api_base", "base_url", "num_retries"})
+
+# Decision fields compared between the recorded and the replayed decision.
+_COMPARED_FIELDS = ("assigned_to", "mode", "tool_requirements", "subtasks")
+
+
+def _pack(value: Any) -> bytes:
+    return zlib.compress(json.dumps(value, sort_keys=True, default=str).encode())
+
+
+def _unpack(blob: bytes) -> Any:
+    return json.loads(zlib.decompress(blob))
+
+
+def lm_call_key(model: str, prompt: str | None, messages: Any, kwargs: dict[str, Any]) -> str:
+    """Hash of what determines an LM response: model, prompt or messages, and settings."""
+    settings = {k: v for k, v in kwargs.items() if k not in _LM_KWARGS_IGNORED}
+    payload = json.dumps(
+        [model, prompt, messages, settings], sort_keys=True, default=str, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class ReplayMissError(RuntimeError):
+    """Raised by an offline ``ReplayLM`` for an LM call that was never recorded."""
+
+
+class RoutingReplayStore:
+    """SQLite file of recorded LM calls and routing cases.
+
+    Safe to share between threads and processes.
+
+    Args:
+        path: Database file, opened with ``open_sqlite``.
+        busy_timeout: Seconds to wait for another process's write lock.
+    """
+
+    def __init__(self, path: str | Path, busy_timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self._conn, self._lock = open_sqlite(self.path, _SCHEMA, busy_timeout)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get_outputs(self, key: str) -> list[Any] | None:
+        """Recorded outputs of an LM call, or ``None``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT outputs FROM lm_calls WHERE key = ?", (key,)
+            ).fetchone()
+        return _unpack(row[0]) if row else None
+
+    def put_outputs(
+        self, key: str, model: str, request: dict[str, Any], outputs: list[Any]
+    ) -> None:
+        """Record the outputs of an LM call (replacing an earlier recording)."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO lm_calls (key, model, request, outputs, created_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, model, _pack(request), _pack(outputs), time.time()),
+            )
+
+    def latest_lm(self) -> tuple[str, dict[str, Any]] | None:
+        """Model and LM settings of the most recently recorded LM call."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT model, request FROM lm_calls ORDER BY created_at DESC LIMIT 1"
+            ).fetchone()
+        return (row[0], _unpack(row[1]).get("lm_kwargs", {})) if row else None
+
+    def put_case(self, inputs: dict[str, Any], decision: dict[str, Any], lm_calls: int) -> str:
+        """Record a routing case; returns its ID (a hash of the inputs)."""
+        case_id = hashlib.sha256(
+            json.dumps(inputs, sort_keys=True, default=str).encode()
+        ).hexdigest()[:16]
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO routing_cases "
+                "(case_id, inputs, decision, lm_calls, created_at) VALUES (?, ?, ?, ?, ?)",
+                (case_id, _pack(inputs), _pack(decision), lm_calls, time.time()),
+            )
+        return case_id
+
+    def iter_cases(self, limit: int | None = None) -> Iterator[tuple[str, dict[str, Any], dict]]:
+        """Yield (case_id, route_task inputs, recorded decision), oldest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT case_id, inputs, decision FROM routing_cases ORDER BY created_at LIMIT ?",
+                (-1 if limit is None else limit,),
+            ).fetchall()
+        for case_id, inputs, decision in rows:
+            yield case_id, _unpack(inputs), _unpack(decision)
+
+    def counts(self) -> dict[str, int]:
+        """Number of recorded LM calls and routing cases."""
+        with self._lock:
+            lm_calls = self._conn.execute("SELECT COUNT(*) FROM lm_calls").fetchone()[0]
+            cases = self._conn.execute("SELECT COUNT(*) FROM routing_cases").fetchone()[0]
+        return {"lm_calls": lm_calls, "cases": cases}
+
+
+class ReplayLM(dspy.BaseLM):
+    """DSPy LM stand-in that records LM calls to, or answers them from, a store.
+
+    Modes:
+        ``record``: call ``lm`` and record every response.
+        ``replay``: answer from the store; call ``lm`` (and record) on a miss.
+        ``offline``: answer from the store; raise ``ReplayMissError`` on a miss.
+
+    Args:
+        lm: The real LM (optional in ``offline`` mode).
+        store: Where calls are recorded.
+        mode: See above.
+
+    Without ``lm``, the model and LM settings of the most recent recording
+    are used to build keys.
+    """
+
+    def __init__(
+        self,
+        lm: dspy.BaseLM | None,
+        store: RoutingReplayStore,
+        mode: ReplayMode = "replay",
+    ) -> None:
+        if lm is None and mode != "offline":
+            raise ValueError(f"ReplayLM needs an LM in {mode!r} mode")
+        if lm is not None:
+            model, lm_kwargs = lm.model, dict(lm.kwargs)
+        else:
+            model, lm_kwargs = store.latest_lm() or ("", {})
+        super().__init__(model=model, cache=False)
+        self.kwargs = lm_kwargs
+        self.model_type = getattr(lm, "model_type", "chat")
+        self.lm = lm
+        self.store = store
+        self.mode = mode
+        self.hits = 0
+        self.misses = 0
+        self._counter_lock = threading.Lock()
+
+    def _count(self, hit: bool) -> None:
+        with self._counter_lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def __call__(
+        self, prompt: str | None = None, messages: list[dict[str, Any]] | None = None, **kwargs: Any
+    ) -> list[Any]:
+        """Return the recorded outputs for this call, or call the wrapped LM."""
+        settings = {**self.kwargs, **kwargs}
+        key = lm_call_key(self.model, prompt, messages, settings)
+        if self.mode != "record":
+            outputs = self.store.get_outputs(key)
+            if outputs is not None:
+                self._count(hit=True)
+                return outputs
+        self._count(hit=False)
+        if self.lm is None or self.mode == "offline":
+            raise ReplayMissError(f"No recorded LM response for call {key[:12]}")
+        outputs = self.lm(prompt=prompt, messages=messages, **kwargs)
+        request = {
+            "prompt": prompt,
+            "messages": messages,
+            "lm_kwargs": self.kwargs,
+            "call_kwargs": kwargs,
+        }
+        self.store.put_outputs(key, self.model, request, list(outputs))
+        return outputs
+
+
+@dataclass(slots=True)
+class _Recording:
+    inputs: dict[str, Any]
+    lm: ReplayLM
+    decision: dict[str, Any] | None = None
+
+
+class RoutingRecorder:
+    """Records production ``route_task`` calls into a ``RoutingReplayStore``.
+
+    Args:
+        store: Where calls are recorded.
+        sample_rate: Fraction of routing calls recorded.
+    """
+
+    def __init__(self, store: RoutingReplayStore, sample_rate: float = 1.0) -> None:
+        self.store = store
+        self.sample_rate = sample_rate
+
+    @contextmanager
+    def record(self, inputs: dict[str, Any]) -> Iterator[_Recording | None]:
+        """Record the LM calls made inside the block and the decision set on the recording.
+
+        Yields ``None`` (and records nothing) for calls left out by sampling or
+        when no LM is configured. Cases without LM calls, such as routing
+        cache hits, are not stored.
+        """
+        lm = dspy.settings.lm
+        if lm is None or isinstance(lm, ReplayLM) or random.random() >= self.sample_rate:
+            yield None
+            return
+        recording = _Recording(inputs=inputs, lm=ReplayLM(lm, self.store, mode="record"))
+        with dspy.context(lm=recording.lm):
+            yield recording
+        if recording.decision is not None and recording.lm.misses:
+            try:
+                self.store.put_case(inputs, recording.decision, recording.lm.misses)
+            except sqlite3.Error as exc:
+                logger.warning("Could not record routing case: %s", exc)
+
+
+@dataclass(slots=True)
+class RoutingReplayReport:
+    """Outcome of ``replay_routing``."""
+
+    cases: int = 0
+    replayed: int = 0
+    missing: int = 0
+    errors: int = 0
+    assertion_failures: int = 0
+    lm_hits: int = 0
+    lm_misses: int = 0
+    elapsed_seconds: float = 0.0
+    changed: list[dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def cases_per_second(self) -> float:
+        """Replayed cases per second of wall time."""
+        return self.replayed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Report as a JSON-ready dict."""
+        return {
+            "cases": self.cases,
+            "replayed": self.replayed,
+            "missing": self.missing,
+            "errors": self.errors,
+            "assertionFailures": self.assertion_failures,
+            "lmHits": self.lm_hits,
+            "lmMisses": self.lm_misses,
+            "elapsedSeconds": round(self.elapsed_seconds, 3),
+            "casesPerSecond": round(self.cases_per_second, 1),
+            "changed": self.changed,
+        }
+
+
+def _comparable(decision: Any) -> dict[str, Any]:
+    from agentic_fleet.utils.models import ensure_routing_decision
+
+    routing = ensure_routing_decision(decision)
+    return {
+        "assigned_to": sorted(routing.assigned_to),
+        "mode": routing.mode.value,
+        "tool_requirements": sorted(routing.tool_requirements),
+        "subtasks": list(routing.subtasks),
+    }
+
+
+def replay_routing(
+    reasoner: Any,
+    store: RoutingReplayStore,
+    *,
+    mode: ReplayMode = "offline",
+    lm: dspy.BaseLM | None = None,
+    limit: int | None = None,
+) -> RoutingReplayReport:
+    """Re-run recorded routing cases against the current routing code.
+
+    Each case runs ``reasoner.route_task`` (routing cache bypassed) with a
+    ``ReplayLM``. Its decision is compared with the recorded one on agents,
+    mode, tools and subtasks, then passed through the routing executor's
+    ``normalize_routing_decision`` and ``validate_full_routing``.
+
+    Args:
+        reasoner: ``DSPyReasoner`` (or compatible) to evaluate.
+        store: Recorded cases and LM calls.
+        mode: ``offline`` (unrecorded calls make a case "missing") or
+            ``replay`` (unrecorded calls go to ``lm`` and are recorded).
+        lm: Real LM (defaults to ``dspy.settings.lm``). In ``offline`` mode
+            only its model and settings are used, or the recorded ones when
+            no LM is configured.
+        limit: Only the oldest ``limit`` cases.
+    """
+    from agentic_fleet.dspy_modules.assertions import validate_full_routing
+    from agentic_fleet.utils.models import ensure_routing_decision
+    from agentic_fleet.workflows.helpers.routing import normalize_routing_decision
+
+    replay_lm = ReplayLM(lm or dspy.settings.lm, store, mode=mode)
+    report = RoutingReplayReport()
+    started = time.perf_counter()
+    with dspy.context(lm=replay_lm):
+        for case_id, inputs, recorded in store.iter_cases(limit):
+            report.cases += 1
+            try:
+                raw = reasoner.route_task(**inputs, skip_cache=True)
+                decision = normalize_routing_decision(ensure_routing_decision(raw), inputs["task"])
+            except ReplayMissError:
+                report.missing += 1
+                continue
+            except Exception as exc:
+                logger.warning("Replay of routing case %s failed: %s", case_id, exc)
+                report.errors += 1
+                continue
+            report.replayed += 1
+            try:
+                validate_full_routing(
+                    decision, inputs["task"], available_agents=list(inputs.get("team") or {})
+                )
+            except Exception:
+                report.assertion_failures += 1
+            before, after = _comparable(recorded), _comparable(raw)
+            diff = {k: {"recorded": before[k], "replayed": after[k]} for k in _COMPARED_FIELDS}
+            diff = {k: v for k, v in diff.items() if v["recorded"] != v["replayed"]}
+            if diff:
+                report.changed.append({"case_id": case_id, "task": inputs["task"], "diff": diff})
+    report.elapsed_seconds = time.perf_counter() - started
+    report.lm_hits, report.lm_misses = replay_lm.hits, replay_lm.misses
+    return report
+
+
+__all__ = [
+    "ReplayLM",
+    "ReplayMissError",
+    "RoutingRecorder",
+    "RoutingReplayReport",
+    "RoutingReplayStore",
+    "lm_call_key",
+    "replay_routing",
+]
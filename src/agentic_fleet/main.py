@@ -13,6 +13,7 @@ import sys
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from pythonjsonlogger import jsonlogger
 
 from agentic_fleet.api.lifespan import lifespan
@@ -20,13 +21,16 @@ from agentic_fleet.api.main import api_router
 from agentic_fleet.api.middleware import RequestIDMiddleware
 from agentic_fleet.api.routes import chat as chat_routes
 from agentic_fleet.utils.cfg.settings import get_settings
+from agentic_fleet.utils.infra.logging import enable_queue_logging
 from agentic_fleet.utils.infra.tracing import initialize_tracing
 
 
 def _configure_logging() -> None:
     """Configure application console logging.
 
-    Uses JSON logs by default (LOG_JSON=1) for easier ingestion.
+    Uses JSON logs by default (LOG_JSON=1) for easier ingestion. With
+    LOG_QUEUE=1 records are written by a background thread (see
+    ``enable_queue_logging``).
     """
     settings = get_settings()
     log_level = settings.log_level
@@ -61,6 +65,10 @@ def _configure_logging() -> None:
     uvicorn_access = logging.getLogger("uvicorn.access")
     uvicorn_access.handlers = [handler]
 
+    if settings.log_queue:
+        enable_queue_logging(root_logger, maxsize=settings.log_queue_size)
+        enable_queue_logging(uvicorn_access, maxsize=settings.log_queue_size)
+
     # Reduce noise from verbose libraries
     logging.getLogger("httpcore").setLevel(logging.WARNING)
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -109,7 +117,7 @@ app.include_router(chat_routes.router, prefix="/api", tags=["chat"])
 
 @app.get("/health", tags=["health"])
 async def health_check() -> dict[str, object]:
-    """Health check with basic dependency verification."""
+    """Liveness check with basic dependency verification (always 200 once serving)."""
     checks = {
         "api": "ok",
         "workflow": "ok" if getattr(app.state, "workflow", None) else "error",
@@ -123,10 +131,23 @@ async def health_check() -> dict[str, object]:
 
 
 @app.get("/ready", tags=["health"])
-async def readiness_check() -> dict[str, object]:
-    """Readiness check indicating whether the workflow is initialized."""
+async def readiness_check() -> JSONResponse:
+    """Readiness check: 200 once startup finished with a workflow, 503 otherwise.
+
+    Also 503 while shutting down, so rolling deploys drain this instance first.
+    The body includes per-step startup timings.
+    """
     workflow_ready = getattr(app.state, "workflow", None) is not None
-    return {"status": "ready" if workflow_ready else "initializing", "workflow": workflow_ready}
+    startup = getattr(app.state, "startup", None)
+    startup_ready = bool(getattr(startup, "ready", False))
+    ready = workflow_ready and startup_ready
+    body: dict[str, object] = {
+        "status": "ready" if ready else "initializing",
+        "workflow": workflow_ready,
+    }
+    if startup is not None:
+        body["startup"] = startup.to_dict()
+    return JSONResponse(body, status_code=200 if ready else 503)
 
 
 logger.info("AgenticFleet API initialized (version=%s)", get_settings().app_version)
@@ -47,6 +47,7 @@ class StreamEventType(StrEnum):
     CONNECTED = "connected"
     CANCELLED = "cancelled"
     HEARTBEAT = "heartbeat"
+    QUEUED = "queued"
 
     # Control events
     ERROR = "error"
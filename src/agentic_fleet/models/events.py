@@ -70,6 +70,10 @@ class StreamEvent(BaseModel):
     def to_sse_dict(self) -> dict[str, Any]:
         """Convert to SSE-compatible dictionary with non-None fields only.
 
+        Streaming transports encode events with
+        ``agentic_fleet.api.events.encoding.StreamEventEncoder`` instead; this dict
+        form is kept for callers that need a mapping.
+
         Returns:
             Dictionary suitable for JSON serialization in SSE data field.
         """
@@ -2,66 +2,74 @@
 """
 Utility script to analyze execution history from logs/execution_history.jsonl or .json
 
-Supports both JSONL (default/preferred) and legacy JSON formats.
+Supports both JSONL (default/preferred) and legacy JSON formats. Statistics are
+computed over the columnar history cache (``utils.storage.history_columns``),
+which only parses executions appended since the previous run. Both are read
+through ``HistoryManager``, so patches not yet compacted into the history file
+(e.g. background quality scores) are included.
 """
 
 from __future__ import annotations
 
-import statistics
-from pathlib import Path
+from datetime import datetime
 from typing import Any
 
-from agentic_fleet.utils.cfg import DEFAULT_HISTORY_PATH
+import numpy as np
 
+from agentic_fleet.utils.storage import HistoryManager
+from agentic_fleet.utils.storage.history_columns import HistoryColumns, extract_row
 
-def load_history() -> list[dict[str, Any]]:
-    """Load execution history from JSON or JSONL file."""
-    from agentic_fleet.utils.serialization import load_json, load_jsonl
 
-    # Try JSONL first (new format)
-    jsonl_file = Path(DEFAULT_HISTORY_PATH)
-    if jsonl_file.exists():
-        executions = load_jsonl(jsonl_file)
-        if executions:
-            print(f"✓ Loaded {len(executions)} executions from {jsonl_file}")
-            return executions
+def load_history(limit: int | None = None) -> list[dict[str, Any]]:
+    """Load execution history (the last ``limit`` entries, if given) from JSON or JSONL file.
+
+    Reads through ``HistoryManager``, so quality scores and other patches that
+    are still in the patch log are applied.
+    """
+    manager = HistoryManager()
+    executions = manager.load_history(limit)
+    if executions:
+        print(f"✓ Loaded {len(executions)} executions from {manager.history_dir}")
+    else:
+        print(f"❌ No execution history found in {manager.history_dir}")
+    return executions
+
+
+def load_columns(since: datetime | None = None) -> HistoryColumns:
+    """Load the columnar view of execution history, optionally from ``since`` on."""
+    manager = HistoryManager()
+    columns = manager.load_columns(since)
+    if len(columns):
+        print(f"✓ Loaded {len(columns)} executions from {manager.history_dir}")
+    else:
+        print(f"❌ No execution history found in {manager.history_dir}")
+    return columns
 
-    # Fall back to legacy JSON format
-    json_file = jsonl_file.with_suffix(".json")
-    if json_file.exists():
-        executions = load_json(json_file, default=[], validate_list=True)
-        if executions:
-            print(f"✓ Loaded {len(executions)} executions from {json_file}")
-            return executions
 
-    print(f"❌ No execution history found at {jsonl_file} or {json_file}")
-    return []
+def _present(values: np.ndarray) -> np.ndarray:
+    return values[~np.isnan(values)]
 
 
-def print_summary(executions: list[dict[str, Any]]):
+def print_summary(columns: HistoryColumns):
     """Print overall statistics."""
-    if not executions:
+    if not len(columns):
         return
 
-    total = len(executions)
-    times = [e.get("total_time_seconds", 0) for e in executions if "total_time_seconds" in e]
-    scores = [
-        e.get("quality", {}).get("score", 0)
-        for e in executions
-        if "quality" in e and "score" in e.get("quality", {})
-    ]
+    total = len(columns)
+    times = _present(columns["total_time_seconds"])
+    scores = _present(columns["quality_score"])
 
-    if not times or not scores:
+    if not len(times) or not len(scores):
         print("\n⚠️  Incomplete data in history - skipping summary")
         return
 
     print("\n📊 Execution Summary")
     print("=" * 80)
     print(f"Total Executions: {total}")
-    print(f"Average Time: {statistics.mean(times):.2f}s")
-    print(f"Min/Max Time: {min(times):.2f}s / {max(times):.2f}s")
-    print(f"Average Quality Score: {statistics.mean(scores):.1f}/10")
-    print(f"Min/Max Score: {min(scores):.1f}/10 / {max(scores):.1f}/10")
+    print(f"Average Time: {times.mean():.2f}s")
+    print(f"Min/Max Time: {times.min():.2f}s / {times.max():.2f}s")
+    print(f"Average Quality Score: {scores.mean():.1f}/10")
+    print(f"Min/Max Score: {scores.min():.1f}/10 / {scores.max():.1f}/10")
 
 
 def print_executions(executions: list[dict[str, Any]], limit: int | None = None):
@@ -94,16 +102,12 @@ def print_executions(executions: list[dict[str, Any]], limit: int | None = None)
             print(f"   🎯 Complexity: {execution['dspy_analysis']['complexity']}")
 
 
-def print_routing_stats(executions: list[dict[str, Any]]):
+def print_routing_stats(columns: HistoryColumns):
     """Print routing mode statistics."""
-    if not executions:
+    if not len(columns):
         return
 
-    modes: dict[str, int] = {}
-    for execution in executions:
-        if "routing" in execution and "mode" in execution["routing"]:
-            mode = execution["routing"]["mode"]
-            modes[mode] = modes.get(mode, 0) + 1
+    modes = columns.mode_counts()
 
     if not modes:
         print("\n⚠️  No routing data available")
@@ -112,20 +116,16 @@ def print_routing_stats(executions: list[dict[str, Any]]):
     print("\n🔀 Routing Mode Distribution")
     print("=" * 80)
     for mode, count in sorted(modes.items(), key=lambda x: x[1], reverse=True):
-        pct = (count / len(executions)) * 100
+        pct = (count / len(columns)) * 100
         print(f"{mode.upper():12} : {count:3} executions ({pct:5.1f}%)")
 
 
-def print_agent_usage(executions: list[dict[str, Any]]):
+def print_agent_usage(columns: HistoryColumns):
     """Print agent usage statistics."""
-    if not executions:
+    if not len(columns):
         return
 
-    agents: dict[str, int] = {}
-    for execution in executions:
-        if "routing" in execution and "assigned_to" in execution["routing"]:
-            for agent in execution["routing"]["assigned_to"]:
-                agents[agent] = agents.get(agent, 0) + 1
+    agents = columns.agent_counts()
 
     if not agents:
         print("\n⚠️  No agent usage data available")
@@ -134,41 +134,28 @@ def print_agent_usage(executions: list[dict[str, Any]]):
     print("\n👥 Agent Usage Statistics")
     print("=" * 80)
     for agent, count in sorted(agents.items(), key=lambda x: x[1], reverse=True):
-        pct = (count / len(executions)) * 100
+        pct = (count / len(columns)) * 100
         print(f"{agent:12} : {count:3} tasks ({pct:5.1f}%)")
 
 
-def print_timing_breakdown(executions: list[dict[str, Any]]):
+def print_timing_breakdown(columns: HistoryColumns):
     """Print average time breakdown by phase."""
-    if not executions:
+    if not len(columns):
         return
 
-    # Safely extract timing data with defaults
-    analysis_times = [
-        e.get("dspy_analysis", {}).get("analysis_time_seconds", 0)
-        for e in executions
-        if "dspy_analysis" in e and "analysis_time_seconds" in e.get("dspy_analysis", {})
-    ]
-    routing_times = [
-        e.get("routing", {}).get("routing_time_seconds", 0)
-        for e in executions
-        if "routing" in e and "routing_time_seconds" in e.get("routing", {})
-    ]
-    quality_times = [
-        e.get("quality", {}).get("quality_time_seconds", 0)
-        for e in executions
-        if "quality" in e and "quality_time_seconds" in e.get("quality", {})
-    ]
-    total_times = [e.get("total_time_seconds", 0) for e in executions if "total_time_seconds" in e]
-
-    if not (analysis_times and routing_times and quality_times and total_times):
+    analysis_times = _present(columns["analysis_seconds"])
+    routing_times = _present(columns["routing_seconds"])
+    quality_times = _present(columns["quality_seconds"])
+    total_times = _present(columns["total_time_seconds"])
+
+    if not (len(analysis_times) and len(routing_times) and len(quality_times) and len(total_times)):
         print("\n⚠️  Incomplete timing data - skipping breakdown")
         return
 
-    avg_analysis = statistics.mean(analysis_times)
-    avg_routing = statistics.mean(routing_times)
-    avg_quality = statistics.mean(quality_times)
-    avg_total = statistics.mean(total_times)
+    avg_analysis = analysis_times.mean()
+    avg_routing = routing_times.mean()
+    avg_quality = quality_times.mean()
+    avg_total = total_times.mean()
     avg_execution = avg_total - avg_analysis - avg_routing - avg_quality
 
     print("\n⏱️  Average Time Breakdown")
@@ -197,6 +184,7 @@ Examples:
   %(prog)s --agents               # Show agent usage statistics
   %(prog)s --timing               # Show time breakdown by phase
   %(prog)s --all                  # Show everything
+  %(prog)s --all --since 2025-06-01  # Only executions since a date
         """,
     )
 
@@ -207,15 +195,15 @@ Examples:
     parser.add_argument("--agents", action="store_true", help="Show agent usage statistics")
     parser.add_argument("--timing", action="store_true", help="Show timing breakdown")
     parser.add_argument("--all", action="store_true", help="Show all statistics")
+    parser.add_argument(
+        "--since",
+        type=datetime.fromisoformat,
+        metavar="DATE",
+        help="Only executions started at or after this ISO date/time",
+    )
 
     args = parser.parse_args()
 
-    # Load history
-    executions = load_history()
-
-    if not executions:
-        return
-
     # If no flags, show summary and last 10
     if not any(
         [
@@ -231,24 +219,36 @@ Examples:
         args.executions = True
         args.last = 10
 
+    columns = load_columns(args.since)
+    if not len(columns):
+        return
+
+    # Full records are only needed to list executions
+    executions: list[dict[str, Any]] = []
+    if args.all or args.executions:
+        executions = load_history(limit=None if args.all or args.since else args.last)
+        if args.since:
+            cutoff = args.since.timestamp()
+            executions = [e for e in executions if extract_row(e)["timestamp"] >= cutoff]
+
     # Show requested information
     if args.all:
-        print_summary(executions)
+        print_summary(columns)
         print_executions(executions)
-        print_routing_stats(executions)
-        print_agent_usage(executions)
-        print_timing_breakdown(executions)
+        print_routing_stats(columns)
+        print_agent_usage(columns)
+        print_timing_breakdown(columns)
     else:
         if args.summary:
-            print_summary(executions)
+            print_summary(columns)
         if args.executions:
             print_executions(executions, limit=args.last)
         if args.routing:
-            print_routing_stats(executions)
+            print_routing_stats(columns)
         if args.agents:
-            print_agent_usage(executions)
+            print_agent_usage(columns)
         if args.timing:
-            print_timing_breakdown(executions)
+            print_timing_breakdown(columns)
 
     print()
 
@@ -0,0 +1,361 @@
+"""Admission control for streaming workflows.
+
+Instead of rejecting a workflow with HTTP 429 the moment ``max_concurrent``
+slots are taken, the controller queues it for a bounded time:
+
+- Active workflows are tracked with O(1) counters; slots themselves are leases
+  in the ``SharedStateBackend``, so the limit is global when the backend is.
+- Waiters are grouped per user and admitted round-robin, so one client opening
+  many streams cannot starve the others. The queue is bounded overall and per
+  user, and every waiter has a deadline.
+- Fast-path tasks (greetings, short factual questions) get a separate lane with
+  its own small per-process capacity, so they never wait behind heavy
+  multi-agent runs.
+
+Callers pass ``on_queued`` to learn their 1-based queue position whenever it
+changes; the chat services forward it to clients as ``queued`` stream events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable, Collection
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
+
+from fastapi import HTTPException, status
+from starlette.authentication import BaseUser
+from starlette.requests import HTTPConnection
+
+from agentic_fleet.utils.infra.logging import setup_logger
+from agentic_fleet.utils.storage.shared_state import SharedStateBackend
+
+logger = setup_logger(__name__)
+
+ANONYMOUS_USER = "anonymous"
+USER_ID_HEADER = "x-user-id"
+
+QueueCallback = Callable[[int], Any]
+
+
+class AdmissionLane(StrEnum):
+    """Capacity pool a workflow was admitted into."""
+
+    DEFAULT = "default"
+    FAST = "fast"
+
+
+@dataclass(slots=True, eq=False)
+class _Waiter:
+    slot_id: str
+    user_id: str
+    deadline: float
+
+
+class AdmissionController:
+    """Bounded, per-user fair admission queue in front of the concurrency slots.
+
+    Args:
+        state: Backend holding the concurrency slot leases.
+        max_concurrent: Workflows allowed to run at once (default lane).
+        fast_path_max_concurrent: Extra per-process slots for fast-path tasks.
+            ``0`` disables the fast lane.
+        max_queue: Maximum number of waiting workflows. ``0`` disables queueing,
+            i.e. reject with 429 as soon as the limit is reached.
+        max_queue_per_user: Maximum waiting workflows per user (``None``: no cap).
+        queue_timeout_seconds: How long a workflow may wait before it is rejected.
+        lease_seconds: Slot lease length; a crashed worker's slots expire after it.
+            Held slots are renewed every third of a lease while their workflow runs.
+        poll_interval_seconds: How often the head of the queue re-checks for slots
+            freed by other workers (local releases wake it immediately).
+    """
+
+    def __init__(
+        self,
+        state: SharedStateBackend,
+        max_concurrent: int,
+        *,
+        fast_path_max_concurrent: int = 0,
+        max_queue: int = 0,
+        max_queue_per_user: int | None = None,
+        queue_timeout_seconds: float = 30.0,
+        lease_seconds: float = 3600.0,
+        poll_interval_seconds: float = 0.5,
+    ) -> None:
+        self._state = state
+        self._max_concurrent = max_concurrent
+        self._fast_path_max_concurrent = fast_path_max_concurrent
+        self._max_queue = max_queue
+        self._max_queue_per_user = max_queue_per_user
+        self._queue_timeout_seconds = queue_timeout_seconds
+        self._lease_seconds = lease_seconds
+        self._poll_interval_seconds = poll_interval_seconds
+
+        self._active = 0
+        self._fast_active = 0
+        self._queued = 0
+        self._lanes: dict[str, AdmissionLane] = {}
+        # user_id -> waiters, in round-robin order (served users move to the end)
+        self._waiters: OrderedDict[str, deque[_Waiter]] = OrderedDict()
+        self._changed = asyncio.Event()
+        self._renewer: asyncio.Task[None] | None = None
+
+    @property
+    def max_concurrent(self) -> int:
+        """Default-lane concurrency limit."""
+        return self._max_concurrent
+
+    def stats(self) -> dict[str, int]:
+        """Return this process's admission counters."""
+        return {
+            "active": self._active,
+            "fast_active": self._fast_active,
+            "queued": self._queued,
+            "max_concurrent": self._max_concurrent,
+            "fast_path_max_concurrent": self._fast_path_max_concurrent,
+            "max_queue": self._max_queue,
+        }
+
+    async def acquire(
+        self,
+        slot_id: str,
+        *,
+        user_id: str | None = None,
+        fast_path: bool = False,
+        on_queued: QueueCallback | None = None,
+    ) -> AdmissionLane:
+        """Wait for a slot for ``slot_id`` and return the lane it was admitted into.
+
+        Raises:
+            HTTPException: 429 when the queue is full or the deadline passes.
+        """
+        if fast_path and self._take_fast_slot(slot_id):
+            return AdmissionLane.FAST
+        if not self._queued and await self._take_slot(slot_id):
+            return AdmissionLane.DEFAULT
+
+        user = user_id or ANONYMOUS_USER
+        user_waiters = self._waiters.get(user)
+        if self._queued >= self._max_queue or (
+            self._max_queue_per_user is not None
+            and user_waiters is not None
+            and len(user_waiters) >= self._max_queue_per_user
+        ):
+            raise self._rejection()
+
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(slot_id, user, loop.time() + self._queue_timeout_seconds)
+        self._waiters.setdefault(user, deque()).append(waiter)
+        self._queued += 1
+        self._notify()  # waiters behind this one in the rotation move back
+        logger.info("Workflow queued for admission: slot_id=%s, queued=%s", slot_id, self._queued)
+
+        last_position: int | None = None
+        try:
+            while True:
+                changed = self._changed
+                position = self._position(waiter)
+                if fast_path and self._take_fast_slot(slot_id):
+                    self._dequeue(waiter, admitted=True)
+                    return AdmissionLane.FAST
+                if position == 0 and await self._take_slot(slot_id):
+                    self._dequeue(waiter, admitted=True)
+                    return AdmissionLane.DEFAULT
+
+                if position != last_position:
+                    last_position = position
+                    if on_queued is not None:
+                        on_queued(position + 1)
+
+                remaining = waiter.deadline - loop.time()
+                if remaining <= 0:
+                    raise self._rejection(timed_out=True)
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        changed.wait(), min(remaining, self._poll_interval_seconds)
+                    )
+        except BaseException:
+            if self._is_queued(waiter):
+                self._dequeue(waiter, admitted=False)
+            raise
+
+    async def release(self, slot_id: str) -> None:
+        """Release the slot held by ``slot_id`` and wake queued waiters."""
+        lane = self._lanes.pop(slot_id, None)
+        if lane is AdmissionLane.FAST:
+            self._fast_active -= 1
+        else:
+            if lane is AdmissionLane.DEFAULT:
+                self._active -= 1
+            # Also covers leases whose lane this process no longer tracks.
+            await self._state.release_slot(slot_id)
+        self._notify()
+
+    async def close(self) -> None:
+        """Stop renewing slot leases."""
+        if self._renewer is not None:
+            self._renewer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._renewer
+            self._renewer = None
+
+    def _take_fast_slot(self, slot_id: str) -> bool:
+        if self._fast_active >= self._fast_path_max_concurrent:
+            return False
+        self._fast_active += 1
+        self._lanes[slot_id] = AdmissionLane.FAST
+        return True
+
+    async def _take_slot(self, slot_id: str) -> bool:
+        acquired = await self._state.try_acquire_slot(
+            slot_id, self._max_concurrent, self._lease_seconds
+        )
+        if acquired:
+            self._active += 1
+            self._lanes[slot_id] = AdmissionLane.DEFAULT
+            if self._renewer is None or self._renewer.done():
+                self._renewer = asyncio.create_task(self._renew_leases())
+        return acquired
+
+    async def _renew_leases(self) -> None:
+        """Renew held slot leases until this process holds none."""
+        while True:
+            await asyncio.sleep(self._lease_seconds / 3)
+            held = [
+                slot_id for slot_id, lane in self._lanes.items() if lane is AdmissionLane.DEFAULT
+            ]
+            if not held:
+                return
+            for slot_id in held:
+                try:
+                    # Re-acquiring a held slot extends its lease.
+                    renewed = await self._state.try_acquire_slot(
+                        slot_id, self._max_concurrent, self._lease_seconds
+                    )
+                except Exception as exc:
+                    logger.warning("Failed to renew slot lease: slot_id=%s, error=%s", slot_id, exc)
+                    continue
+                if not renewed:
+                    logger.warning("Slot lease expired before renewal: slot_id=%s", slot_id)
+
+    def _notify(self) -> None:
+        changed, self._changed = self._changed, asyncio.Event()
+        changed.set()
+
+    def _is_queued(self, waiter: _Waiter) -> bool:
+        user_waiters = self._waiters.get(waiter.user_id)
+        return user_waiters is not None and waiter in user_waiters
+
+    def _dequeue(self, waiter: _Waiter, *, admitted: bool) -> None:
+        user_waiters = self._waiters[waiter.user_id]
+        user_waiters.remove(waiter)
+        self._queued -= 1
+        if not user_waiters:
+            del self._waiters[waiter.user_id]
+        elif admitted:
+            # Round-robin: the user just served goes to the back of the rotation.
+            self._waiters.move_to_end(waiter.user_id)
+        self._notify()
+
+    def _position(self, waiter: _Waiter) -> int:
+        """0-based position in round-robin order (one waiter per user per round)."""
+        index = self._waiters[waiter.user_id].index(waiter)
+        position = index  # this user's own earlier waiters
+        before = True
+        for user_id, user_waiters in self._waiters.items():
+            if user_id == waiter.user_id:
+                before = False
+                continue
+            # Earlier rounds, plus this round for users ahead in the rotation.
+            position += min(len(user_waiters), index)
+            if before and len(user_waiters) > index:
+                position += 1
+        return position
+
+    def _rejection(self, *, timed_out: bool = False) -> HTTPException:
+        detail = f"Maximum concurrent workflows ({self._max_concurrent}) reached. "
+        if timed_out:
+            detail += f"Timed out after {self._queue_timeout_seconds:g}s in the admission queue. "
+        detail += "Try again later."
+        logger.warning(
+            "Admission rejected: active=%s, queued=%s, max=%s, timed_out=%s",
+            self._active,
+            self._queued,
+            self._max_concurrent,
+            timed_out,
+        )
+        return HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=detail,
+            headers={"Retry-After": str(max(1, round(self._poll_interval_seconds)))},
+        )
+
+
+def admission_key(
+    connection: HTTPConnection, trusted_proxies: Collection[str] | None = None
+) -> str | None:
+    """Return the fairness key for a request or WebSocket.
+
+    Uses the authenticated principal when authentication middleware set one.
+    Otherwise the ``X-User-Id`` header is honoured only when the connection
+    comes from a trusted proxy (``ADMISSION_TRUSTED_PROXIES`` by default), so
+    clients cannot pick a fresh fairness key per request; everyone else is
+    keyed by client address.
+    """
+    principal = _authenticated_principal(connection)
+    if principal:
+        return principal
+    host = connection.client.host if connection.client else None
+    if trusted_proxies is None:
+        from agentic_fleet.utils.cfg import get_settings
+
+        trusted_proxies = get_settings().admission_trusted_proxies
+    user_id = connection.headers.get(USER_ID_HEADER)
+    if user_id and host is not None and host in trusted_proxies:
+        return user_id
+    return host
+
+
+def _authenticated_principal(connection: HTTPConnection) -> str | None:
+    user = connection.scope.get("user")
+    if not isinstance(user, BaseUser) or not user.is_authenticated:
+        return None
+    try:
+        identity = user.identity
+    except NotImplementedError:
+        identity = user.display_name
+    return str(identity) if identity else None
+
+
+async def iter_queue_positions(
+    admission: asyncio.Task[Any], positions: asyncio.Queue[int]
+) -> AsyncIterator[int]:
+    """Yield queue positions reported via ``positions`` until ``admission`` finishes.
+
+    The task is cancelled if the consumer stops early (e.g. client disconnect),
+    which removes it from the admission queue.
+    """
+    try:
+        while not admission.done():
+            getter = asyncio.ensure_future(positions.get())
+            done, _ = await asyncio.wait({admission, getter}, return_when=asyncio.FIRST_COMPLETED)
+            if getter in done:
+                yield getter.result()
+            else:
+                getter.cancel()
+    finally:
+        if not admission.done():
+            admission.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await admission
+
+
+__all__ = [
+    "AdmissionController",
+    "AdmissionLane",
+    "admission_key",
+    "iter_queue_positions",
+]
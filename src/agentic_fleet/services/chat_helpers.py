@@ -11,6 +11,7 @@ import contextlib
 import logging
 import re
 import time
+import uuid
 from collections import OrderedDict
 from collections.abc import Callable, Iterable
 from dataclasses import dataclass
@@ -18,6 +19,9 @@ from typing import TYPE_CHECKING, Any, cast
 
 if TYPE_CHECKING:
     from agent_framework._threads import AgentThread
+
+    from agentic_fleet.api.events.encoding import EventRecord
+    from agentic_fleet.utils.storage.shared_state import SharedStateBackend
 else:
     try:
         from agent_framework._threads import AgentThread
@@ -29,8 +33,9 @@ else:
             pass
 
 
-from agentic_fleet.api.events.mapping import classify_event
+from agentic_fleet.api.events.config import classify_event
 from agentic_fleet.models import StreamEvent, StreamEventType
+from agentic_fleet.utils.cfg import env_config
 from agentic_fleet.utils.infra.logging import setup_logger
 
 logger = setup_logger(__name__)
@@ -40,10 +45,81 @@ logger = setup_logger(__name__)
 _MAX_THREADS = 100  # Maximum number of conversation threads to keep.
 _TTL_SECONDS = 3600  # Time-to-live: expire threads after 1 hour of inactivity.
 
-# Maps conversation_id -> (AgentThread, last_access_timestamp)
-_conversation_threads: OrderedDict[str, tuple[AgentThread, float]] = OrderedDict()
+# Maps conversation_id -> (AgentThread, last_access_timestamp, shared_state_version)
+_conversation_threads: OrderedDict[str, tuple[AgentThread, float, str | None]] = OrderedDict()
 _threads_lock: asyncio.Lock = asyncio.Lock()
 
+# Optional cross-worker store for serialized thread state. When set, threads
+# are written back after each turn under a new version, and the local cache is
+# only used while it holds the latest version (a later turn may have run on
+# another worker).
+_thread_state: SharedStateBackend | None = None
+
+
+def configure_thread_state(backend: SharedStateBackend | None) -> None:
+    """Set the backend used to share conversation threads across workers.
+
+    Process-local backends are ignored: the in-memory cache already covers them.
+    """
+    global _thread_state
+    _thread_state = backend if backend is not None and backend.shared else None
+
+
+async def _load_shared_thread(conversation_id: str) -> tuple[str | None, dict[str, Any]] | None:
+    """Return ``(version, serialized thread)`` from shared state, or None if there is none."""
+    if _thread_state is None:
+        return None
+    try:
+        entry = await _thread_state.load_thread_state(conversation_id)
+    except Exception as exc:
+        logger.warning(
+            "Failed to load conversation thread %s from shared state: %s",
+            _sanitize_log_input(conversation_id),
+            exc,
+        )
+        return None
+    if entry is None:
+        return None
+    if isinstance(entry.get("thread"), dict):
+        return entry.get("version"), entry["thread"]
+    return None, entry  # written before versions were recorded
+
+
+async def _restore_thread(state: dict[str, Any], conversation_id: str) -> AgentThread | None:
+    """Rebuild a thread from its serialized state, or return None on failure."""
+    try:
+        return await AgentThread.deserialize(state)
+    except Exception as exc:
+        logger.warning(
+            "Failed to restore conversation thread %s from shared state: %s",
+            _sanitize_log_input(conversation_id),
+            exc,
+        )
+        return None
+
+
+async def persist_thread_state(conversation_id: str | None, thread: AgentThread | None) -> None:
+    """Write a conversation thread to shared state so any worker can resume it."""
+    if _thread_state is None or not conversation_id or thread is None:
+        return
+    try:
+        version = uuid.uuid4().hex
+        state = await thread.serialize()
+        await _thread_state.save_thread_state(
+            conversation_id, {"version": version, "thread": state}, _TTL_SECONDS
+        )
+    except Exception as exc:
+        logger.warning(
+            "Failed to persist conversation thread %s to shared state: %s",
+            _sanitize_log_input(conversation_id),
+            exc,
+        )
+        return
+    async with _threads_lock:
+        cached = _conversation_threads.get(conversation_id)
+        if cached is not None and cached[0] is thread:
+            _conversation_threads[conversation_id] = (thread, cached[1], version)
+
 
 def _prefer_service_thread_mode(thread: Any | None) -> None:
     """Best-effort: prefer service-managed thread storage over local message stores.
@@ -85,21 +161,44 @@ def _sanitize_log_input(value: str) -> str:
     return sanitized[:256]
 
 
+def _touch_current_thread(
+    conversation_id: str, shared: tuple[str | None, dict[str, Any]] | None, now: float
+) -> AgentThread | None:
+    """Return the cached thread if it is current, marking it recently used.
+
+    The local thread is current unless another worker saved a newer version.
+    Call with ``_threads_lock`` held.
+    """
+    cached = _conversation_threads.get(conversation_id)
+    if cached is None or (shared is not None and shared[0] != cached[2]):
+        return None
+    thread, _, version = cached
+    _conversation_threads[conversation_id] = (thread, now, version)
+    _conversation_threads.move_to_end(conversation_id)
+    return thread
+
+
 async def _get_or_create_thread(conversation_id: str | None) -> AgentThread | None:
-    """Get or create an AgentThread for a conversation."""
+    """Get or create an AgentThread for a conversation.
+
+    Shared-state reads and thread restores happen outside ``_threads_lock``,
+    so a slow backend only delays the conversation being looked up.
+    """
     if not conversation_id:
         return None
 
     # NOTE: We intentionally cache threads by conversation_id so that each
     # user-visible conversation maintains context across WebSocket connections.
 
+    shared = await _load_shared_thread(conversation_id)
+
     async with _threads_lock:
         now = time.monotonic()
 
         # Evict expired entries first (lazy cleanup on access).
         expired_ids = [
             cid
-            for cid, (_, last_access) in _conversation_threads.items()
+            for cid, (_, last_access, _) in _conversation_threads.items()
             if now - last_access > _TTL_SECONDS
         ]
         for cid in expired_ids:
@@ -113,24 +212,41 @@ async def _get_or_create_thread(conversation_id: str | None) -> AgentThread | No
                 _TTL_SECONDS,
             )
 
-        # Check if thread exists and update access time.
-        if conversation_id in _conversation_threads:
-            thread, _ = _conversation_threads[conversation_id]
-            _conversation_threads[conversation_id] = (thread, now)
-            _conversation_threads.move_to_end(conversation_id)
+        thread = _touch_current_thread(conversation_id, shared, now)
+        if thread is not None:
+            return thread
+
+    # Restore from shared state, else create a new thread.
+    restored = await _restore_thread(shared[1], conversation_id) if shared else None
+
+    async with _threads_lock:
+        now = time.monotonic()
+        # Another request may have cached a current thread while this one restored.
+        thread = _touch_current_thread(conversation_id, shared, now)
+        if thread is not None:
             return thread
 
-        # Create new thread.
-        new_thread = AgentThread()
-        _conversation_threads[conversation_id] = (new_thread, now)
+        cached = _conversation_threads.get(conversation_id)
+        new_thread = restored
+        version = shared[0] if shared and restored is not None else None
+        if new_thread is not None:
+            logger.debug(
+                "Restored conversation thread from shared state: %s",
+                _sanitize_log_input(conversation_id),
+            )
+        elif cached is not None:
+            new_thread, version = cached[0], cached[2]
+        else:
+            new_thread = AgentThread()
+            logger.debug(
+                "Created new conversation thread for: %s", _sanitize_log_input(conversation_id)
+            )
+        _conversation_threads[conversation_id] = (new_thread, now, version)
         _conversation_threads.move_to_end(conversation_id)
-        logger.debug(
-            "Created new conversation thread for: %s", _sanitize_log_input(conversation_id)
-        )
 
         # Evict oldest entries if capacity exceeded.
         while len(_conversation_threads) > _MAX_THREADS:
-            evicted_id, (_, evicted_ts) = _conversation_threads.popitem(last=False)
+            evicted_id, (_, evicted_ts, _) = _conversation_threads.popitem(last=False)
             age_seconds = int(now - evicted_ts)
             logger.info(
                 "Evicted oldest conversation thread to cap memory: conversation_id=%s, age=%ds",
@@ -309,45 +425,104 @@ def _format_connected(_event: StreamEvent, short_id: str) -> str:
     return f"[{short_id}] 🔌 WebSocket connected"
 
 
+def _format_queued(event: StreamEvent, short_id: str) -> str:
+    position = (event.data or {}).get("position")
+    return f"[{short_id}] ⏳ queued at position {position}"
+
+
 def _format_heartbeat(_event: StreamEvent, short_id: str) -> str:
     return f"[{short_id}] ♥ heartbeat"
 
 
+_LOG_SPECS: dict[StreamEventType, tuple[Callable[[StreamEvent, str], str | None], int]] = {
+    StreamEventType.ORCHESTRATOR_MESSAGE: (_format_orchestrator_message, logging.INFO),
+    StreamEventType.ORCHESTRATOR_THOUGHT: (_format_orchestrator_thought, logging.INFO),
+    StreamEventType.RESPONSE_DELTA: (_format_response_delta, logging.DEBUG),
+    StreamEventType.RESPONSE_COMPLETED: (_format_response_completed, logging.INFO),
+    StreamEventType.REASONING_DELTA: (_format_reasoning_delta, logging.DEBUG),
+    StreamEventType.REASONING_COMPLETED: (_format_reasoning_completed, logging.INFO),
+    StreamEventType.ERROR: (_format_error, logging.ERROR),
+    StreamEventType.AGENT_START: (_format_agent_start, logging.INFO),
+    StreamEventType.AGENT_COMPLETE: (_format_agent_complete, logging.INFO),
+    StreamEventType.CANCELLED: (_format_cancelled, logging.INFO),
+    StreamEventType.DONE: (_format_done, logging.INFO),
+    StreamEventType.CONNECTED: (_format_connected, logging.DEBUG),
+    StreamEventType.HEARTBEAT: (_format_heartbeat, logging.DEBUG),
+    StreamEventType.QUEUED: (_format_queued, logging.INFO),
+}
+
+# High-frequency events whose log output is sampled per workflow.
+_SAMPLED_EVENT_TYPES = frozenset(
+    {StreamEventType.RESPONSE_DELTA, StreamEventType.REASONING_DELTA, StreamEventType.HEARTBEAT}
+)
+_TERMINAL_EVENT_TYPES = frozenset(
+    {StreamEventType.DONE, StreamEventType.ERROR, StreamEventType.CANCELLED}
+)
+
+
+class StreamLogSampler:
+    """Per-workflow sampling of high-frequency stream event logs.
+
+    The first event of each sampled type in a workflow is logged, then one in
+    every ``every``. Counters are dropped when the workflow ends and bounded
+    (LRU) for workflows that never send a terminal event.
+    """
+
+    def __init__(self, every: int, max_entries: int = 3000) -> None:
+        self.every = max(1, every)
+        self.max_entries = max_entries
+        self._counts: OrderedDict[tuple[str, StreamEventType], int] = OrderedDict()
+
+    def admit(self, workflow_id: str, event_type: StreamEventType) -> int | None:
+        """Return how many events were skipped since the last logged one, or None to skip."""
+        key = (workflow_id, event_type)
+        seen = self._counts.pop(key, 0)
+        self._counts[key] = seen + 1
+        if len(self._counts) > self.max_entries:
+            self._counts.popitem(last=False)
+        if seen % self.every:
+            return None
+        return self.every - 1 if seen else 0
+
+    def forget(self, workflow_id: str) -> None:
+        """Drop the counters of a finished workflow."""
+        for event_type in _SAMPLED_EVENT_TYPES:
+            self._counts.pop((workflow_id, event_type), None)
+
+
+_stream_log_sampler = StreamLogSampler(env_config.log_stream_sample_every)
+
+
 def _log_stream_event(event: StreamEvent, workflow_id: str) -> str | None:
-    """Log a stream event to the console in real-time and return the log line."""
-    event_type = event.type.value
+    """Log a stream event to the console in real-time and return the log line.
+
+    The line is always returned because it travels in the event payload.
+    Deltas and heartbeats are logged through ``_stream_log_sampler``, and
+    nothing is handed to the logger when the event's level is disabled.
+    """
     short_id = workflow_id[-8:] if len(workflow_id) > 8 else workflow_id
 
-    log_specs: dict[
-        StreamEventType,
-        tuple[Callable[[StreamEvent, str], str | None], int],
-    ] = {
-        StreamEventType.ORCHESTRATOR_MESSAGE: (_format_orchestrator_message, logging.INFO),
-        StreamEventType.ORCHESTRATOR_THOUGHT: (_format_orchestrator_thought, logging.INFO),
-        StreamEventType.RESPONSE_DELTA: (_format_response_delta, logging.DEBUG),
-        StreamEventType.RESPONSE_COMPLETED: (_format_response_completed, logging.INFO),
-        StreamEventType.REASONING_DELTA: (_format_reasoning_delta, logging.DEBUG),
-        StreamEventType.REASONING_COMPLETED: (_format_reasoning_completed, logging.INFO),
-        StreamEventType.ERROR: (_format_error, logging.ERROR),
-        StreamEventType.AGENT_START: (_format_agent_start, logging.INFO),
-        StreamEventType.AGENT_COMPLETE: (_format_agent_complete, logging.INFO),
-        StreamEventType.CANCELLED: (_format_cancelled, logging.INFO),
-        StreamEventType.DONE: (_format_done, logging.INFO),
-        StreamEventType.CONNECTED: (_format_connected, logging.DEBUG),
-        StreamEventType.HEARTBEAT: (_format_heartbeat, logging.DEBUG),
-    }
-
-    log_line: str | None = None
-    log_spec = log_specs.get(event.type)
+    log_spec = _LOG_SPECS.get(event.type)
     if log_spec is None:
-        log_line = f"[{short_id}] {event_type}"
-        logger.debug(log_line)
+        log_line = f"[{short_id}] {event.type.value}"
+        logger.debug("%s", log_line)
         return log_line
 
     formatter, level = log_spec
     log_line = formatter(event, short_id)
-    if log_line:
-        logger.log(level, log_line)
+    if event.type in _TERMINAL_EVENT_TYPES:
+        _stream_log_sampler.forget(workflow_id)
+    if not log_line or not logger.isEnabledFor(level):
+        return log_line
+
+    if event.type in _SAMPLED_EVENT_TYPES:
+        skipped = _stream_log_sampler.admit(workflow_id, event.type)
+        if skipped is None:
+            return log_line
+        if skipped:
+            logger.log(level, "%s (+%d similar)", log_line, skipped)
+            return log_line
+    logger.log(level, "%s", log_line)
     return log_line
 
 
@@ -427,29 +602,52 @@ class ResponseState:
 
     def update_from_event(self, event_data: dict[str, Any]) -> None:
         """Update state from a stream event dictionary."""
-        event_type = event_data.get("type")
-        author = event_data.get("author") or event_data.get("agent_id")
-        if author:
-            self.last_author = event_data.get("author") or self.last_author or author
-            self.last_agent_id = event_data.get("agent_id") or self.last_agent_id
+        self._update(
+            event_data.get("type"),
+            author=event_data.get("author"),
+            agent_id=event_data.get("agent_id"),
+            delta=event_data.get("delta"),
+            message=event_data.get("message"),
+        )
+
+    def update_from_stream_event(self, event: StreamEvent | EventRecord) -> None:
+        """Update state directly from an event object, skipping ``to_sse_dict()``."""
+        self._update(
+            event.type.value,
+            author=event.author,
+            agent_id=event.agent_id,
+            delta=event.delta,
+            message=event.message,
+        )
+
+    def _update(
+        self,
+        event_type: str | None,
+        *,
+        author: str | None,
+        agent_id: str | None,
+        delta: str | None,
+        message: str | None,
+    ) -> None:
+        if author or agent_id:
+            self.last_author = author or self.last_author or agent_id
+            self.last_agent_id = agent_id or self.last_agent_id
 
         if event_type == StreamEventType.RESPONSE_DELTA.value:
             # Accumulate deltas in both fields for compatibility
-            self.response_delta_text += event_data.get("delta", "")
+            self.response_delta_text += delta or ""
             self.response_text = self.response_delta_text
         elif event_type == StreamEventType.RESPONSE_COMPLETED.value:
-            completed_msg = event_data.get("message", "")
-            if completed_msg:
-                self.response_text = completed_msg
-            self.last_author = event_data.get("author") or self.last_author
+            if message:
+                self.response_text = message
+            self.last_author = author or self.last_author
             self.response_completed_emitted = True
         elif event_type in (
             StreamEventType.AGENT_OUTPUT.value,
             StreamEventType.AGENT_MESSAGE.value,
         ):
-            agent_msg = event_data.get("message", "")
-            if agent_msg:
-                self.last_agent_text = agent_msg
+            if message:
+                self.last_agent_text = message
 
         if event_type == StreamEventType.DONE.value:
             self.saw_done = True
@@ -504,6 +702,7 @@ def create_checkpoint_storage(
 
 __all__ = [
     "ResponseState",
+    "StreamLogSampler",
     "_get_or_create_thread",
     "_hydrate_thread_from_conversation",
     "_log_stream_event",
@@ -511,6 +710,8 @@ __all__ = [
     "_prefer_service_thread_mode",
     "_sanitize_log_input",
     "_thread_has_any_messages",
+    "configure_thread_state",
     "create_checkpoint_storage",
     "create_stream_event",
+    "persist_thread_state",
 ]
@@ -15,11 +15,11 @@ Benefits of SSE over WebSocket:
 from __future__ import annotations
 
 import asyncio
-import json
 from collections.abc import AsyncIterator
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
+from agentic_fleet.api.events.encoding import StreamEventEncoder
 from agentic_fleet.api.events.mapping import map_workflow_event
 from agentic_fleet.dspy_modules.answer_quality import score_answer_with_dspy
 from agentic_fleet.evaluation.background import schedule_quality_evaluation
@@ -29,6 +29,7 @@ from agentic_fleet.models import (
     WorkflowSession,
     WorkflowStatus,
 )
+from agentic_fleet.services.admission import QueueCallback, iter_queue_positions
 from agentic_fleet.services.chat_helpers import (
     ResponseState,
     _get_or_create_thread,
@@ -39,8 +40,11 @@ from agentic_fleet.services.chat_helpers import (
     _thread_has_any_messages,
     create_checkpoint_storage,
     create_stream_event,
+    persist_thread_state,
 )
 from agentic_fleet.utils.infra.logging import setup_logger
+from agentic_fleet.utils.storage.shared_state import SharedStateBackend
+from agentic_fleet.workflows.helpers.fast_path import is_simple_task
 
 if TYPE_CHECKING:
     pass
@@ -56,6 +60,9 @@ class ChatSSEService:
         workflow: Any,
         session_manager: Any,
         conversation_manager: Any,
+        state: SharedStateBackend | None = None,
+        *,
+        signal_poll_interval: float = 0.25,
     ) -> None:
         """Initialize SSE service.
 
@@ -63,10 +70,19 @@ class ChatSSEService:
             workflow: SupervisorWorkflow instance
             session_manager: WorkflowSessionManager for session tracking
             conversation_manager: ConversationManager for message persistence
+            state: Shared state backend. When it is shared across workers, cancel
+                requests and HITL responses for streams owned by another worker
+                are relayed through it. Defaults to the session manager's backend.
+            signal_poll_interval: Seconds between checks for relayed signals.
         """
         self.workflow = workflow
         self.session_manager = session_manager
         self.conversation_manager = conversation_manager
+        if state is None:
+            candidate = getattr(session_manager, "state", None)
+            state = candidate if isinstance(candidate, SharedStateBackend) else None
+        self._state = state
+        self._signal_poll_interval = signal_poll_interval
         self._cancel_events: dict[str, asyncio.Event] = {}
         self._pending_responses: dict[str, asyncio.Queue[dict[str, Any]]] = {}
 
@@ -114,6 +130,9 @@ class ChatSSEService:
         message: str,
         reasoning_effort: str | None,
         cancel_event: asyncio.Event,
+        *,
+        user_id: str | None = None,
+        on_queued: QueueCallback | None = None,
     ) -> WorkflowSession:
         """Create session and register cancellation tracking.
 
@@ -122,10 +141,13 @@ class ChatSSEService:
         """
         # Persist user message happens before this in stream_chat
 
-        # Create session
+        # Create session (may wait in the admission queue)
         session = await self.session_manager.create_session(
             task=message,
             reasoning_effort=reasoning_effort,
+            user_id=user_id,
+            fast_path=is_simple_task(message),
+            on_queued=on_queued,
         )
 
         if session is None:
@@ -141,9 +163,49 @@ class ChatSSEService:
 
         return session
 
-    def _emit_sse_event(self, event: Any) -> str:
-        """Convert StreamEvent to SSE format string."""
-        return f"data: {json.dumps(event.to_sse_dict())}\n\n"
+    @property
+    def _relays_signals(self) -> bool:
+        return self._state is not None and self._state.shared
+
+    async def _relay_remote_signals(self, workflow_id: str, cancel_event: asyncio.Event) -> None:
+        """Apply cancel requests and HITL responses queued by other workers."""
+        assert self._state is not None
+        while not cancel_event.is_set():
+            try:
+                if await self._state.is_cancel_requested(workflow_id):
+                    logger.info("Relayed cancel request: workflow_id=%s", workflow_id)
+                    cancel_event.set()
+                    return
+                for payload in await self._state.pop_responses(workflow_id):
+                    await self._forward_response(
+                        workflow_id, payload["request_id"], payload.get("response")
+                    )
+            except Exception as exc:
+                logger.warning(
+                    "Shared state relay failed: workflow_id=%s, error=%s", workflow_id, exc
+                )
+            await asyncio.sleep(self._signal_poll_interval)
+
+    async def _is_remote_active(self, workflow_id: str) -> bool:
+        """Return True if another worker owns an active stream for ``workflow_id``."""
+        if not self._relays_signals:
+            return False
+        assert self._state is not None
+        session = await self._state.get_session(workflow_id)
+        return session is not None and session.status in (
+            WorkflowStatus.CREATED,
+            WorkflowStatus.RUNNING,
+        )
+
+    def _emit_sse_event(self, event: Any, encoder: StreamEventEncoder | None = None) -> bytes:
+        """Encode a StreamEvent as an SSE frame.
+
+        Args:
+            event: Event to encode.
+            encoder: Per-session encoder holding the pre-encoded workflow fragments.
+                A throwaway encoder is used when omitted.
+        """
+        return (encoder or StreamEventEncoder(event.workflow_id)).encode_sse(event)
 
     async def _finalize_stream(
         self,
@@ -202,20 +264,26 @@ class ChatSSEService:
         *,
         reasoning_effort: str | None = None,
         enable_checkpointing: bool = False,
-    ) -> AsyncIterator[str]:
+        user_id: str | None = None,
+    ) -> AsyncIterator[bytes]:
         """Stream chat response as SSE events.
 
+        While the request waits for admission, ``queued`` events report its
+        position in the queue.
+
         Args:
             conversation_id: Conversation identifier
             message: User message
             reasoning_effort: Optional reasoning effort level
             enable_checkpointing: Whether to enable checkpointing
+            user_id: Caller identity used for fair queueing
 
         Yields:
-            SSE-formatted event strings (data: {...}\\n\\n)
+            SSE-formatted event frames (data: {...}\\n\\n) as UTF-8 bytes
         """
         session: WorkflowSession | None = None
         cancel_event = asyncio.Event()
+        relay_task: asyncio.Task[None] | None = None
 
         try:
             # Setup phase: load history, create thread, setup checkpointing
@@ -233,9 +301,31 @@ class ChatSSEService:
                 author="User",
             )
 
-            # Create session and setup tracking
-            session = await self._create_and_setup_session(message, reasoning_effort, cancel_event)
+            # Create session and setup tracking, reporting queue position while waiting
+            positions: asyncio.Queue[int] = asyncio.Queue()
+            admission = asyncio.create_task(
+                self._create_and_setup_session(
+                    message,
+                    reasoning_effort,
+                    cancel_event,
+                    user_id=user_id,
+                    on_queued=positions.put_nowait,
+                )
+            )
+            async for position in iter_queue_positions(admission, positions):
+                queued_event = create_stream_event(
+                    StreamEventType.QUEUED,
+                    message=f"Waiting for a free slot (position {position})",
+                    data={"position": position, "conversation_id": conversation_id},
+                )
+                yield self._emit_sse_event(queued_event)
+            session = await admission
             workflow_id = session.workflow_id
+            encoder = StreamEventEncoder(workflow_id)
+            if self._relays_signals:
+                relay_task = asyncio.create_task(
+                    self._relay_remote_signals(workflow_id, cancel_event)
+                )
 
             # Emit connected event
             connected_event = create_stream_event(
@@ -247,7 +337,7 @@ class ChatSSEService:
                     "checkpointing_enabled": checkpoint_storage is not None,
                 },
             )
-            yield self._emit_sse_event(connected_event)
+            yield self._emit_sse_event(connected_event, encoder)
 
             # Streaming phase: process workflow events
             accumulated_reasoning = ""
@@ -265,6 +355,7 @@ class ChatSSEService:
                 "conversation_history": conversation_history,
                 "workflow_id": workflow_id,
                 "schedule_quality_eval": False,
+                "cancel_event": cancel_event,
             }
 
             if checkpoint_storage is not None:
@@ -297,9 +388,8 @@ class ChatSSEService:
                     if log_line:
                         se.log_line = log_line
 
-                    event_data = se.to_sse_dict()
-                    response_state.update_from_event(event_data)
-                    yield self._emit_sse_event(se)
+                    response_state.update_from_stream_event(se)
+                    yield self._emit_sse_event(se, encoder)
 
             # Emit final response if not already emitted
             final_text = response_state.get_final_text()
@@ -328,9 +418,10 @@ class ChatSSEService:
                     quality_flag=immediate_flag,
                     data={"quality_pending": True},  # Background evaluation will refine this
                 )
-                yield self._emit_sse_event(completed_event)
+                yield self._emit_sse_event(completed_event, encoder)
 
             # Finalization phase: persist message, schedule evaluation, update status
+            await persist_thread_state(conversation_id, conversation_thread)
             await self._finalize_stream(
                 workflow_id,
                 conversation_id,
@@ -344,7 +435,7 @@ class ChatSSEService:
                 StreamEventType.DONE,
                 workflow_id=workflow_id,
             )
-            yield self._emit_sse_event(done_event)
+            yield self._emit_sse_event(done_event, encoder)
 
         except Exception as exc:
             logger.error("SSE stream error: %s", exc, exc_info=True)
@@ -365,6 +456,8 @@ class ChatSSEService:
 
         finally:
             # Cleanup
+            if relay_task is not None:
+                relay_task.cancel()
             if session:
                 self._cancel_events.pop(session.workflow_id, None)
                 self._pending_responses.pop(session.workflow_id, None)
@@ -372,6 +465,9 @@ class ChatSSEService:
     async def cancel_stream(self, workflow_id: str) -> bool:
         """Cancel an active stream.
 
+        Streams owned by another worker are cancelled through the shared state
+        backend; the owning worker picks the request up on its next poll.
+
         Args:
             workflow_id: The workflow ID to cancel
 
@@ -383,6 +479,11 @@ class ChatSSEService:
             cancel_event.set()
             logger.info("Cancelled SSE stream: workflow_id=%s", workflow_id)
             return True
+        if await self._is_remote_active(workflow_id):
+            assert self._state is not None
+            await self._state.request_cancel(workflow_id)
+            logger.info("Relayed SSE cancel to owning worker: workflow_id=%s", workflow_id)
+            return True
         return False
 
     async def submit_response(
@@ -401,6 +502,21 @@ class ChatSSEService:
         Returns:
             True if submitted, False if workflow not found
         """
+        if workflow_id not in self._cancel_events and await self._is_remote_active(workflow_id):
+            assert self._state is not None
+            await self._state.push_response(
+                workflow_id, {"request_id": str(request_id), "response": response}
+            )
+            logger.info(
+                "Relayed HITL response to owning worker: workflow_id=%s, request_id=%s",
+                workflow_id,
+                request_id,
+            )
+            return True
+        return await self._forward_response(workflow_id, request_id, response)
+
+    async def _forward_response(self, workflow_id: str, request_id: str, response: Any) -> bool:
+        """Deliver a HITL response to the local workflow."""
         try:
             await self.workflow.send_workflow_responses({str(request_id): response})
             logger.info(
@@ -32,6 +32,7 @@ else:
 
 from fastapi import HTTPException, WebSocket, WebSocketDisconnect, status
 
+from agentic_fleet.api.events.encoding import EncodableEvent, EventRecord, StreamEventEncoder
 from agentic_fleet.api.events.mapping import classify_event, map_workflow_event
 from agentic_fleet.evaluation.background import schedule_quality_evaluation
 from agentic_fleet.models import (
@@ -43,6 +44,7 @@ from agentic_fleet.models import (
     WorkflowSession,
     WorkflowStatus,
 )
+from agentic_fleet.services.admission import admission_key, iter_queue_positions
 from agentic_fleet.services.chat_helpers import (
     _get_or_create_thread,
     _hydrate_thread_from_conversation,
@@ -51,11 +53,13 @@ from agentic_fleet.services.chat_helpers import (
     _prefer_service_thread_mode,
     _sanitize_log_input,
     _thread_has_any_messages,
+    persist_thread_state,
 )
 from agentic_fleet.utils.cfg import load_config
 from agentic_fleet.utils.cfg.settings import get_settings
 from agentic_fleet.utils.infra.logging import setup_logger
 from agentic_fleet.workflows.config import build_workflow_config_from_yaml
+from agentic_fleet.workflows.helpers.fast_path import is_simple_task
 from agentic_fleet.workflows.supervisor import create_supervisor_workflow
 
 logger = setup_logger(__name__)
@@ -77,8 +81,11 @@ async def _event_generator(
     conversation_history: list[Any] | None = None,
     checkpoint_id: str | None = None,
     checkpoint_storage: Any | None = None,
-) -> AsyncIterator[dict[str, Any]]:
-    """Generate streaming events from workflow execution."""
+) -> AsyncIterator[StreamEvent]:
+    """Generate streaming events from workflow execution.
+
+    Events are yielded as objects; encoding happens once, at the transport.
+    """
     accumulated_reasoning = ""
     has_error = False
     error_message = ""
@@ -106,7 +113,7 @@ async def _event_generator(
             workflow_id=session.workflow_id,
         )
         init_event.log_line = _log_stream_event(init_event, session.workflow_id)
-        yield init_event.to_sse_dict()
+        yield init_event
 
         stream_kwargs: dict[str, Any] = {
             "reasoning_effort": reasoning_effort,
@@ -116,6 +123,8 @@ async def _event_generator(
             "workflow_id": session.workflow_id,
             # We'll evaluate quality after sending the final answer so users don't wait.
             "schedule_quality_eval": False,
+            # Lets long-running strategies (discussion rounds) stop on a cancel.
+            "cancel_event": cancel_event,
         }
 
         run_task: str | None
@@ -160,7 +169,7 @@ async def _event_generator(
                 log_line = _log_stream_event(se, session.workflow_id)
                 if log_line:
                     se.log_line = log_line
-                yield se.to_sse_dict()
+                yield se
 
     except Exception as exc:
         has_error = True
@@ -183,7 +192,7 @@ async def _event_generator(
             workflow_id=session.workflow_id,
         )
         error_event.log_line = _log_stream_event(error_event, session.workflow_id)
-        yield error_event.to_sse_dict()
+        yield error_event
 
     finally:
         final_status = WorkflowStatus.FAILED if has_error else WorkflowStatus.COMPLETED
@@ -209,7 +218,7 @@ async def _event_generator(
             workflow_id=session.workflow_id,
         )
         done_event.log_line = _log_stream_event(done_event, session.workflow_id)
-        yield done_event.to_sse_dict()
+        yield done_event
 
         logger.info(
             "Workflow stream completed: workflow_id=%s, status=%s, had_error=%s",
@@ -253,6 +262,17 @@ def _validate_websocket_origin(websocket: WebSocket) -> bool:
 class ChatWebSocketService:
     """Service implementing the WebSocket chat protocol at `/api/ws/chat`."""
 
+    def __init__(self) -> None:
+        """Initialize per-connection state."""
+        self._encoder: StreamEventEncoder | None = None
+
+    async def _send_event(self, websocket: WebSocket, event: EncodableEvent) -> None:
+        """Encode an event with the session encoder and send it as a text frame."""
+        encoder = self._encoder
+        if encoder is None or encoder.workflow_id != event.workflow_id:
+            encoder = self._encoder = StreamEventEncoder(event.workflow_id)
+        await websocket.send_text(encoder.encode_text(event))
+
     async def _send_error_and_close(
         self, websocket: WebSocket, error_message: str, workflow_id: str | None = None
     ) -> None:
@@ -266,7 +286,7 @@ class ChatWebSocketService:
             ui_hint=error_ui_hint,
             workflow_id=workflow_id,
         )
-        await websocket.send_json(error_event.to_sse_dict())
+        await self._send_event(websocket, error_event)
         await websocket.close()
 
     async def _initialize_managers(self, websocket: WebSocket) -> tuple[Any, Any] | None:
@@ -485,13 +505,32 @@ class ChatWebSocketService:
         effective_checkpoint_id: str | None,
         reasoning_effort: str | None,
     ) -> WorkflowSession | None:
-        """Create workflow session."""
-        try:
-            session = await session_manager.create_session(
+        """Create workflow session, reporting queue position while it waits."""
+        positions: asyncio.Queue[int] = asyncio.Queue()
+        admission = asyncio.create_task(
+            session_manager.create_session(
                 task=message or f"[resume:{effective_checkpoint_id}]",
                 reasoning_effort=reasoning_effort,
+                user_id=admission_key(websocket),
+                fast_path=bool(message) and is_simple_task(message or ""),
+                on_queued=positions.put_nowait,
             )
-            return session
+        )
+        try:
+            async for position in iter_queue_positions(admission, positions):
+                queued_type = StreamEventType.QUEUED
+                queued_category, queued_ui_hint = classify_event(queued_type)
+                await self._send_event(
+                    websocket,
+                    StreamEvent(
+                        type=queued_type,
+                        message=f"Waiting for a free slot (position {position})",
+                        data={"position": position},
+                        category=queued_category,
+                        ui_hint=queued_ui_hint,
+                    ),
+                )
+            return await admission
         except HTTPException as exc:
             await self._send_error_and_close(websocket, exc.detail)
             return None
@@ -522,7 +561,7 @@ class ChatWebSocketService:
             workflow_id=session.workflow_id,
         )
         connected_event.log_line = _log_stream_event(connected_event, session.workflow_id)
-        await websocket.send_json(connected_event.to_sse_dict())
+        await self._send_event(websocket, connected_event)
 
     async def _heartbeat_loop(
         self, websocket: WebSocket, session: WorkflowSession, last_event_ts_holder: list[datetime]
@@ -531,13 +570,13 @@ class ChatWebSocketService:
         try:
             while True:
                 await asyncio.sleep(5)
-                heartbeat_event = StreamEvent(
+                heartbeat_event = EventRecord(
                     type=StreamEventType.HEARTBEAT,
                     message="heartbeat",
                     workflow_id=session.workflow_id,
                     timestamp=datetime.now(),
                 )
-                await websocket.send_json(heartbeat_event.to_sse_dict())
+                await self._send_event(websocket, heartbeat_event)
                 last_event_ts_holder[0] = datetime.now()
         except Exception:
             return
@@ -613,7 +652,7 @@ class ChatWebSocketService:
                 ui_hint=timeout_ui_hint,
                 workflow_id=session.workflow_id,
             )
-            await websocket.send_json(timeout_event.to_sse_dict())
+            await self._send_event(websocket, timeout_event)
             cancel_event.set()
             return True
 
@@ -627,7 +666,7 @@ class ChatWebSocketService:
                 ui_hint=timeout_ui_hint,
                 workflow_id=session.workflow_id,
             )
-            await websocket.send_json(timeout_event.to_sse_dict())
+            await self._send_event(websocket, timeout_event)
             cancel_event.set()
             return True
 
@@ -644,7 +683,7 @@ class ChatWebSocketService:
             ui_hint=cancelled_ui_hint,
             workflow_id=session.workflow_id,
         )
-        await websocket.send_json(cancelled_event.to_sse_dict())
+        await self._send_event(websocket, cancelled_event)
 
         done_type = StreamEventType.DONE
         done_category, done_ui_hint = classify_event(done_type)
@@ -654,11 +693,11 @@ class ChatWebSocketService:
             ui_hint=done_ui_hint,
             workflow_id=session.workflow_id,
         )
-        await websocket.send_json(done_event.to_sse_dict())
+        await self._send_event(websocket, done_event)
 
     def _accumulate_event_data(
         self,
-        event_data: dict[str, Any],
+        event: StreamEvent,
         response_text: str,
         response_delta_text: str,
         last_agent_text: str,
@@ -668,31 +707,31 @@ class ChatWebSocketService:
         saw_done: bool,
     ) -> tuple[str, str, str, str | None, str | None, bool, bool]:
         """Accumulate response data from event. Returns updated state."""
-        event_type = event_data.get("type")
+        event_type = event.type
 
-        author = event_data.get("author") or event_data.get("agent_id")
+        author = event.author or event.agent_id
         if author:
-            last_author = event_data.get("author") or last_author or author
-            last_agent_id = event_data.get("agent_id") or last_agent_id
+            last_author = event.author or last_author or author
+            last_agent_id = event.agent_id or last_agent_id
 
-        if event_type == StreamEventType.RESPONSE_DELTA.value:
-            response_delta_text += event_data.get("delta", "")
+        if event_type == StreamEventType.RESPONSE_DELTA:
+            response_delta_text += event.delta or ""
             response_text = response_delta_text
-        elif event_type == StreamEventType.RESPONSE_COMPLETED.value:
-            completed_msg = event_data.get("message", "")
+        elif event_type == StreamEventType.RESPONSE_COMPLETED:
+            completed_msg = event.message or ""
             if completed_msg:
                 response_text = completed_msg
-            last_author = event_data.get("author") or last_author
+            last_author = event.author or last_author
             response_completed_emitted = True
         elif event_type in (
-            StreamEventType.AGENT_OUTPUT.value,
-            StreamEventType.AGENT_MESSAGE.value,
+            StreamEventType.AGENT_OUTPUT,
+            StreamEventType.AGENT_MESSAGE,
         ):
-            agent_msg = event_data.get("message", "")
+            agent_msg = event.message or ""
             if agent_msg:
                 last_agent_text = agent_msg
 
-        if event_type == StreamEventType.DONE.value:
+        if event_type == StreamEventType.DONE:
             saw_done = True
 
         return (
@@ -738,7 +777,7 @@ class ChatWebSocketService:
         response_completed_emitted = False
 
         try:
-            async for event_data in _event_generator(
+            async for event in _event_generator(
                 workflow,
                 session,
                 session_manager,
@@ -776,7 +815,7 @@ class ChatWebSocketService:
                     response_completed_emitted,
                     saw_done,
                 ) = self._accumulate_event_data(
-                    event_data,
+                    event,
                     response_text,
                     response_delta_text,
                     last_agent_text,
@@ -787,11 +826,11 @@ class ChatWebSocketService:
                 )
 
                 # Send event to client
-                await websocket.send_json(event_data)
+                await self._send_event(websocket, event)
                 last_event_ts_holder[0] = datetime.now()
 
                 # Break on DONE
-                if event_data.get("type") == StreamEventType.DONE.value:
+                if event.type == StreamEventType.DONE:
                     break
 
         except Exception:
@@ -838,7 +877,7 @@ class ChatWebSocketService:
                 workflow_id=session.workflow_id,
             )
             completed_event.log_line = _log_stream_event(completed_event, session.workflow_id)
-            await websocket.send_json(completed_event.to_sse_dict())
+            await self._send_event(websocket, completed_event)
 
         if not saw_done:
             done_type = StreamEventType.DONE
@@ -849,7 +888,7 @@ class ChatWebSocketService:
                 ui_hint=done_ui_hint,
                 workflow_id=session.workflow_id,
             )
-            await websocket.send_json(done_event.to_sse_dict())
+            await self._send_event(websocket, done_event)
 
         return final_text
 
@@ -998,6 +1037,7 @@ class ChatWebSocketService:
                 response_completed_emitted,
             )
 
+            await persist_thread_state(conversation_id, conversation_thread)
             await self._persist_and_evaluate(
                 workflow,
                 session,
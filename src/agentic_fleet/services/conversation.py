@@ -12,8 +12,6 @@ import logging
 from datetime import datetime
 from uuid import uuid4
 
-from fastapi import HTTPException, status
-
 from agentic_fleet.models import (
     Conversation,
     Message,
@@ -21,7 +19,9 @@ from agentic_fleet.models import (
     WorkflowSession,
     WorkflowStatus,
 )
+from agentic_fleet.services.admission import AdmissionController, QueueCallback
 from agentic_fleet.utils.storage.conversation import ConversationStore
+from agentic_fleet.utils.storage.shared_state import InMemorySharedState, SharedStateBackend
 
 logger = logging.getLogger(__name__)
 
@@ -151,37 +151,72 @@ class ConversationManager:
         return True
 
 
+_ACTIVE_STATUSES = (WorkflowStatus.CREATED, WorkflowStatus.RUNNING)
+
+
 class WorkflowSessionManager:
-    """Manages active workflow sessions for streaming endpoints."""
+    """Manages active workflow sessions for streaming endpoints.
+
+    Sessions and concurrency slots are kept in a ``SharedStateBackend``. The
+    default in-memory backend keeps the limit per process; a shared backend
+    (SQLite or Redis) makes ``max_concurrent`` a global limit across workers.
 
-    def __init__(self, max_concurrent: int = 10) -> None:
-        self._sessions: dict[str, WorkflowSession] = {}
+    New sessions go through an ``AdmissionController``. The default one rejects
+    with 429 as soon as the limit is reached; pass a configured controller to
+    queue bursts fairly and give fast-path tasks their own lane.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 10,
+        state: SharedStateBackend | None = None,
+        *,
+        slot_lease_seconds: float = 3600.0,
+        admission: AdmissionController | None = None,
+    ) -> None:
+        self._state = state or InMemorySharedState()
         self._max_concurrent = max_concurrent
+        self._admission = admission or AdmissionController(
+            self._state, max_concurrent, lease_seconds=slot_lease_seconds
+        )
         self._lock = asyncio.Lock()
 
+    @property
+    def state(self) -> SharedStateBackend:
+        """Backend holding sessions and admission slots."""
+        return self._state
+
+    @property
+    def admission(self) -> AdmissionController:
+        """Admission controller deciding when new sessions may start."""
+        return self._admission
+
     async def create_session(
         self,
         task: str,
         reasoning_effort: str | None = None,
+        *,
+        user_id: str | None = None,
+        fast_path: bool = False,
+        on_queued: QueueCallback | None = None,
     ) -> WorkflowSession:
-        """Create a new workflow session."""
-        async with self._lock:
-            active_count = self._count_active_locked()
-            if active_count >= self._max_concurrent:
-                logger.warning(
-                    "Concurrent workflow limit reached: active=%s, max=%s",
-                    active_count,
-                    self._max_concurrent,
-                )
-                raise HTTPException(
-                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                    detail=(
-                        "Maximum concurrent workflows "
-                        f"({self._max_concurrent}) reached. Try again later."
-                    ),
-                )
-
-            workflow_id = f"wf-{uuid4().hex[:12]}"
+        """Create a new workflow session, waiting in the admission queue if needed.
+
+        Args:
+            task: Task text for the workflow.
+            reasoning_effort: Optional reasoning effort level.
+            user_id: Key for per-user queue fairness.
+            fast_path: Whether the task qualifies for the fast-path lane.
+            on_queued: Called with the 1-based queue position whenever it changes.
+
+        Raises:
+            HTTPException: 429 when the admission queue is full or times out.
+        """
+        workflow_id = f"wf-{uuid4().hex[:12]}"
+        lane = await self._admission.acquire(
+            workflow_id, user_id=user_id, fast_path=fast_path, on_queued=on_queued
+        )
+        try:
             session = WorkflowSession(
                 workflow_id=workflow_id,
                 task=task,
@@ -189,12 +224,17 @@ class WorkflowSessionManager:
                 created_at=datetime.now(),
                 reasoning_effort=reasoning_effort,
             )
-            self._sessions[workflow_id] = session
+            async with self._lock:
+                await self._state.save_session(session)
+        except BaseException:
+            await self._admission.release(workflow_id)
+            raise
 
         task_preview = task[:50] if len(task) > 50 else task
         logger.info(
-            "Created workflow session: workflow_id=%s, task_preview=%s",
+            "Created workflow session: workflow_id=%s, lane=%s, task_preview=%s",
             workflow_id,
+            lane,
             task_preview,
         )
         return session
@@ -202,7 +242,7 @@ class WorkflowSessionManager:
     async def get_session(self, workflow_id: str) -> WorkflowSession | None:
         """Get a workflow session by ID."""
         async with self._lock:
-            return self._sessions.get(workflow_id)
+            return await self._state.get_session(workflow_id)
 
     async def update_status(
         self,
@@ -212,49 +252,50 @@ class WorkflowSessionManager:
         started_at: datetime | None = None,
         completed_at: datetime | None = None,
     ) -> None:
-        """Update a workflow session's status."""
+        """Update a workflow session's status.
+
+        Leaving CREATED/RUNNING releases the session's concurrency slot.
+        """
         async with self._lock:
-            session = self._sessions.get(workflow_id)
+            session = await self._state.get_session(workflow_id)
             if session:
                 session.status = status
                 if started_at:
                     session.started_at = started_at
                 if completed_at:
                     session.completed_at = completed_at
+                await self._state.save_session(session)
+            if status not in _ACTIVE_STATUSES:
+                await self._admission.release(workflow_id)
+                await self._state.clear_signals(workflow_id)
 
     async def count_active(self) -> int:
-        """Count active workflows."""
+        """Count active workflows (across workers when the backend is shared).
+
+        Fast-lane workflows hold no shared slot and are counted per process.
+        """
         async with self._lock:
-            return self._count_active_locked()
+            slots = await self._state.count_slots()
+        return slots + self._admission.stats()["fast_active"]
 
     async def cleanup_completed(self, max_age_seconds: int = 3600) -> int:
         """Remove old completed/failed sessions."""
         async with self._lock:
             now = datetime.now()
-            to_remove: list[str] = []
-
-            for workflow_id, session in self._sessions.items():
-                if session.status in (WorkflowStatus.COMPLETED, WorkflowStatus.FAILED):
-                    age = (now - session.created_at).total_seconds()
-                    if age > max_age_seconds:
-                        to_remove.append(workflow_id)
-
-            for workflow_id in to_remove:
-                del self._sessions[workflow_id]
+            to_remove = [
+                session.workflow_id
+                for session in await self._state.list_sessions()
+                if session.status in (WorkflowStatus.COMPLETED, WorkflowStatus.FAILED)
+                and (now - session.created_at).total_seconds() > max_age_seconds
+            ]
+            await self._state.delete_sessions(to_remove)
 
         return len(to_remove)
 
     async def list_sessions(self) -> list[WorkflowSession]:
         """List all sessions."""
         async with self._lock:
-            return list(self._sessions.values())
-
-    def _count_active_locked(self) -> int:
-        return sum(
-            1
-            for s in self._sessions.values()
-            if s.status in (WorkflowStatus.CREATED, WorkflowStatus.RUNNING)
-        )
+            return await self._state.list_sessions()
 
 
 __all__ = [
@@ -1,30 +1,77 @@
 """Optimization Service.
 
-Manages running GEPA optimization jobs in the background.
+Manages GEPA optimization jobs: records them in a job store and runs them
+through a job runner, by default one worker process per job (see
+``services.optimization_worker``). Because jobs are persisted, a restarted API
+process finds jobs that were interrupted and requeues them.
+
+A running job is leased to the service that claimed it, which renews the lease
+while the job runs. Recovery only requeues jobs whose lease has expired, so
+jobs running in a sibling worker process are left alone, and the owner stops
+its worker once it sees that the job was cancelled or taken over.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import logging
+import os
+import socket
 import uuid
 from datetime import UTC, datetime
 from typing import Any, Literal
 
-from agentic_fleet.utils.compiler import compile_reasoner
-from agentic_fleet.utils.storage.job_store import InMemoryJobStore, JobStore
+from agentic_fleet.services.optimization_worker import (
+    InProcessJobRunner,
+    JobRunner,
+    ProcessJobRunner,
+    WorkerLimits,
+)
+from agentic_fleet.utils.storage.job_store import InMemoryJobStore, JobStore, SQLiteJobStore
 
 logger = logging.getLogger(__name__)
 
 OptimizationMode = Literal["light", "medium", "heavy"]
 
+ACTIVE_STATUSES = ("pending", "running")
+
+
+def compile_reasoner(*args: Any, **kwargs: Any) -> Any:
+    """Run ``utils.compiler.compile_reasoner``, importing DSPy only when a job runs."""
+    from agentic_fleet.utils.compiler import compile_reasoner as _compile_reasoner
+
+    return _compile_reasoner(*args, **kwargs)
 
-class OptimizationService:
-    """Service for managing DSPy optimization jobs."""
 
-    def __init__(self, job_store: JobStore | None = None) -> None:
+class OptimizationService:
+    """Service for managing DSPy optimization jobs.
+
+    Args:
+        job_store: Where jobs are recorded (in memory by default).
+        runner: Runs a job (``ProcessJobRunner`` by default).
+        max_concurrent_jobs: Jobs running at once; the others stay ``pending``.
+        max_attempts: Times a job is started before recovery gives up on it.
+        lease_seconds: How long a claimed job stays leased to this service
+            without a renewal; renewed every third of it.
+    """
+
+    def __init__(
+        self,
+        job_store: JobStore | None = None,
+        runner: JobRunner | None = None,
+        *,
+        max_concurrent_jobs: int = 1,
+        max_attempts: int = 2,
+        lease_seconds: float = 60.0,
+    ) -> None:
         self.job_store = job_store or InMemoryJobStore()
-        self._background_tasks: set[asyncio.Task[Any]] = set()
+        self.runner = runner or ProcessJobRunner()
+        self.max_attempts = max_attempts
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._slots = asyncio.Semaphore(max(1, max_concurrent_jobs))
+        self._tasks: dict[str, asyncio.Task[Any]] = {}
 
     async def submit_job(
         self,
@@ -39,8 +86,9 @@ class OptimizationService:
         Submit a new optimization job.
 
         Args:
-            module: The DSPy module to optimize (must be picklable or reconstructible).
-                    For now, passing the actual object instance.
+            module: Name of a registered module (e.g. ``"DSPyReasoner"``), which
+                    the worker process instantiates, or a module instance for
+                    runners that stay in this process.
             base_examples_path: Path to training data.
             user_id: ID of the user triggering the job.
             auto_mode: GEPA auto mode ("light", "medium", "heavy").
@@ -50,11 +98,14 @@ class OptimizationService:
             Job ID.
         """
         job_id = str(uuid.uuid4())
+        module_name = module if isinstance(module, str) else type(module).__name__
         job_data = {
             "status": "pending",
             "user_id": user_id,
             "created_at": datetime.now(UTC).isoformat(),
+            "attempts": 0,
             "config": {
+                "module_name": module_name,
                 "auto_mode": auto_mode,
                 "base_examples_path": base_examples_path,
                 "gepa_options": gepa_options or {},
@@ -62,16 +113,7 @@ class OptimizationService:
             },
         }
         await self.job_store.save_job(job_id, job_data)
-
-        # Start background task
-        task = asyncio.create_task(
-            self._run_optimization(
-                job_id, module, base_examples_path, auto_mode, gepa_options=gepa_options, **kwargs
-            )
-        )
-        self._background_tasks.add(task)
-        task.add_done_callback(self._background_tasks.discard)
-
+        self._start(job_id, None if isinstance(module, str) else module)
         return job_id
 
     async def get_job_status(self, job_id: str) -> dict[str, Any] | None:
@@ -83,192 +125,146 @@ class OptimizationService:
             job["job_id"] = job.get("id", job_id)
         return job
 
-    async def _run_optimization(
-        self,
-        job_id: str,
-        module: Any,
-        base_examples_path: str,
-        auto_mode: OptimizationMode,
-        gepa_options: dict[str, Any] | None = None,
-        **kwargs: Any,
-    ) -> None:
+    async def cancel_job(self, job_id: str) -> dict[str, Any] | None:
+        """Cancel a pending or running job, stopping its worker.
+
+        A job running in another process is stopped by its owner when it next
+        renews the lease. Returns the job (unchanged if it had already finished), or ``None`` if
+        it does not exist.
+        """
+        job = await self.job_store.get_job(job_id)
+        if job is None or job.get("status") not in ACTIVE_STATUSES:
+            return job
+        job = await self.job_store.update_job(
+            job_id, {"status": "cancelled", "cancelled_at": datetime.now(UTC).isoformat()}
+        )
+        task = self._tasks.get(job_id)
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        return await self.get_job_status(job_id)
+
+    async def recover_jobs(self) -> list[str]:
+        """Requeue pending or running jobs that no live process holds a lease on.
+
+        Jobs that were already started ``max_attempts`` times are marked
+        failed instead. Returns the IDs of the requeued jobs.
+        """
+        requeued = []
+        interrupted = await self.job_store.list_jobs(ACTIVE_STATUSES)
+        for job_id, job in interrupted.items():
+            if job_id in self._tasks:
+                continue
+            if job.get("attempts", 0) >= self.max_attempts:
+                await self.job_store.release_job(
+                    job_id,
+                    {
+                        "status": "failed",
+                        "error": "Interrupted by a restart too many times",
+                        "failed_at": datetime.now(UTC).isoformat(),
+                    },
+                )
+                continue
+            if await self.job_store.release_job(job_id, {"status": "pending"}) is None:
+                continue  # still leased to a running worker
+            self._start(job_id, None)
+            requeued.append(job_id)
+        if requeued:
+            logger.info("Requeued %d interrupted optimization job(s)", len(requeued))
+        return requeued
+
+    async def shutdown(self) -> None:
+        """Stop running jobs and hand them back to the queue for ``recover_jobs``."""
+        tasks = dict(self._tasks)
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for job_id in tasks:
+            await self.job_store.release_job(job_id, {"status": "pending"}, owner=self.owner)
+
+    def _start(self, job_id: str, module: Any | None) -> None:
+        task = asyncio.create_task(self._run_optimization(job_id, module))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job_id, None))
+
+    async def _run_optimization(self, job_id: str, module: Any | None = None) -> None:
         """
-        Execute a GEPA optimization job in the background while updating and persisting job state.
+        Execute an optimization job once a slot is free, while updating its record.
 
-        Prepares training and validation datasets, runs the optimization using the provided module and mode, and updates the job record with status transitions ("running", "completed", "failed"), timestamps, result artifact path, and any error message.
+        Claims the job and moves it through "running" to "completed" or
+        "failed", with timestamps, progress fields reported by the runner, the
+        result artifact path and any error message. The lease is renewed while
+        the runner works; if the job is cancelled or claimed by another process
+        meanwhile, the runner is stopped and the record is left alone, as it is
+        when the task itself is cancelled.
 
         Parameters:
-            job_id (str): Identifier of the job to update and persist.
-            module (Any): The model/module to optimize.
-            base_examples_path (str): Filesystem path containing example data used to build datasets.
-            auto_mode (OptimizationMode): Optimization mode to apply ("light", "medium", or "heavy").
-            **kwargs: Additional options passed to dataset preparation or the optimizer (commonly includes `seed` and optimizer-specific flags).
-
-        Returns:
-            None
+            job_id (str): Identifier of the job to run; its settings are read from the store.
+            module (Any | None): Live module instance, if the submitter passed one.
         """
-        try:
-            # Update status to running
-            job = await self.job_store.get_job(job_id)
-            if job:
-                job["status"] = "running"
-                job["started_at"] = datetime.now(UTC).isoformat()
-                await self.job_store.save_job(job_id, job)
-
-            # Build gepa_options from kwargs and provided options
-            effective_gepa_options = {
-                "auto": auto_mode,
-                **(gepa_options or {}),
-                **kwargs,  # Allow kwargs to override gepa_options
+        async with self._slots:
+            job = await self.job_store.claim_job(job_id, self.owner, self.lease_seconds)
+            if job is None:
+                return
+            config = dict(job["config"])
+
+            # Remaining config keys are GEPA overrides passed to submit_job
+            spec = {
+                "module_name": config.pop("module_name"),
+                "base_examples_path": config.pop("base_examples_path"),
+                "gepa_options": {
+                    "auto": config.pop("auto_mode"),
+                    **config.pop("gepa_options"),
+                    **config,
+                },
+                "artifact_path": f".var/logs/gepa/{job_id}/compiled.json",
             }
 
-            # Create progress callback that updates job status
-            # Note: This callback runs in a thread, so we use asyncio.run_coroutine_threadsafe
-            # to safely update the async job store from the thread
-            class JobProgressCallback:
-                """Progress callback that updates job status in the store."""
-
-                def __init__(
-                    self, job_store: JobStore, job_id: str, loop: asyncio.AbstractEventLoop
-                ):
-                    self.job_store = job_store
-                    self.job_id = job_id
-                    self.loop = loop
-                    self.last_update_time = datetime.now(UTC)
-                    self._update_lock = asyncio.Lock()
-
-                def _schedule_update(self, status_update: dict[str, Any]) -> None:
-                    """Schedule an async job update from the thread."""
-
-                    async def _update_job() -> None:
-                        async with self._update_lock:
-                            job = await self.job_store.get_job(self.job_id)
-                            if job:
-                                job.update(status_update)
-                                await self.job_store.save_job(self.job_id, job)
-
-                    # Schedule the coroutine in the event loop
-                    try:
-                        asyncio.run_coroutine_threadsafe(_update_job(), self.loop)
-                    except RuntimeError:
-                        # Event loop may have stopped or been closed; cannot update (shutdown path)
-                        logger.warning("Event loop not running, cannot update job progress")
-
-                def on_start(self, message: str) -> None:
-                    """Called when optimization starts."""
-                    self._schedule_update(
-                        {
-                            "progress_message": message,
-                            "progress_updated_at": datetime.now(UTC).isoformat(),
-                        }
-                    )
-
-                def on_progress(
-                    self, message: str, current: int | None = None, total: int | None = None
-                ) -> None:
-                    """Called to report progress during optimization."""
-                    # Throttle updates to avoid too frequent writes (max once per 5 seconds)
-                    now = datetime.now(UTC)
-                    if (now - self.last_update_time).total_seconds() < 5:
-                        return
-                    self.last_update_time = now
-
-                    progress_data: dict[str, Any] = {
-                        "progress_message": message,
-                        "progress_updated_at": now.isoformat(),
-                    }
-                    if current is not None and total is not None:
-                        progress_data["progress_current"] = current
-                        progress_data["progress_total"] = total
-                        progress_data["progress_percent"] = (
-                            int((current / total) * 100) if total > 0 else 0
-                        )
-
-                    self._schedule_update(progress_data)
-
-                def on_complete(self, message: str, duration: float | None = None) -> None:
-                    """Called when optimization completes."""
-                    progress_data: dict[str, Any] = {
-                        "progress_message": message,
-                        "progress_updated_at": datetime.now(UTC).isoformat(),
-                        "progress_completed": True,
-                    }
-                    if duration is not None:
-                        progress_data["progress_duration"] = duration
-                    self._schedule_update(progress_data)
-
-                def on_error(self, message: str, error: Exception | None = None) -> None:
-                    """Called when optimization encounters an error."""
-                    self._schedule_update(
-                        {
-                            "progress_message": message,
-                            "progress_updated_at": datetime.now(UTC).isoformat(),
-                            "progress_error": str(error) if error else message,
-                        }
-                    )
-
-            # Get the current event loop to pass to the callback
+            async def on_event(progress: dict[str, Any]) -> None:
+                await self.job_store.update_job(job_id, progress)
+
+            run = asyncio.create_task(self.runner.run(job_id, spec, module, on_event))
+            lease = asyncio.create_task(self._hold_lease(job_id))
+            try:
+                await asyncio.wait((run, lease), return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                run.cancel()
+                lease.cancel()
+                await asyncio.gather(run, lease, return_exceptions=True)
+
+            if run.cancelled():
+                logger.warning(f"Optimization job {job_id} is no longer leased here; stopped it.")
+                return
             try:
-                loop = asyncio.get_running_loop()
-            except RuntimeError as e:
-                # _run_optimization is async and must have a running loop
-                raise RuntimeError(
-                    "No running event loop found. _run_optimization requires an active async context."
-                ) from e
-
-            progress_callback = JobProgressCallback(self.job_store, job_id, loop)
-
-            # Run optimization using compile_reasoner which handles history harvesting
-            # ⚠️ PERFORMANCE WARNING: CPU-intensive GEPA optimization
-            #
-            # Current implementation uses asyncio.to_thread() which runs in the default
-            # thread pool executor. This has limitations:
-            #
-            # 1. Thread pool has a default size limit (typically 32 threads on most systems)
-            # 2. CPU-bound work in threads still competes for GIL, degrading performance
-            # 3. Multiple concurrent optimizations will starve other async operations
-            # 4. No built-in rate limiting or resource control
-            #
-            # PRODUCTION RECOMMENDATION: Use a proper task queue system:
-            # - Celery with Redis/RabbitMQ for distributed task execution
-            # - Ray for Python-native distributed computing
-            # - Azure Container Jobs for serverless batch processing
-            #
-            # For now, consider adding:
-            # - Semaphore to limit concurrent optimizations (e.g., max 2-3)
-            # - ProcessPoolExecutor instead of ThreadPoolExecutor
-            # - Job queue with priority levels
-            await asyncio.to_thread(
-                compile_reasoner,
-                module=module,
-                examples_path=base_examples_path,
-                use_cache=False,  # Don't use cache for API-triggered optimizations
-                optimizer="gepa",
-                gepa_options=effective_gepa_options,
-                progress_callback=progress_callback,
-                allow_gepa_optimization=True,
+                result = run.result()
+            except Exception as e:
+                logger.error(f"Optimization job {job_id} failed: {e}", exc_info=True)
+                await self.job_store.release_job(
+                    job_id,
+                    {
+                        "status": "failed",
+                        "error": str(e),
+                        "failed_at": datetime.now(UTC).isoformat(),
+                    },
+                    owner=self.owner,
+                )
+                return
+
+            await self.job_store.release_job(
+                job_id,
+                {"status": "completed", "completed_at": datetime.now(UTC).isoformat(), **result},
+                owner=self.owner,
             )
-
-            # Save result (in a real app, we'd save the weights/artifact path)
-            # For now just marking complete
-            job = await self.job_store.get_job(job_id)
-            if job:
-                job["status"] = "completed"
-                job["completed_at"] = datetime.now(UTC).isoformat()
-                job["result_artifact_path"] = f".var/logs/gepa/{job_id}/compiled.json"
-                # job["metrics"] = ... (could extract from logs)
-                await self.job_store.save_job(job_id, job)
-
             logger.info(f"Optimization job {job_id} completed successfully.")
 
-        except Exception as e:
-            logger.error(f"Optimization job {job_id} failed: {e}", exc_info=True)
-            job = await self.job_store.get_job(job_id)
-            if job:
-                job["status"] = "failed"
-                job["error"] = str(e)
-                job["failed_at"] = datetime.now(UTC).isoformat()
-                await self.job_store.save_job(job_id, job)
+    async def _hold_lease(self, job_id: str) -> None:
+        """Renew the lease on a running job; return once it is no longer ours."""
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            job = await self.job_store.renew_lease(job_id, self.owner, self.lease_seconds)
+            if job is None or job.get("status") != "running" or job.get("owner") != self.owner:
+                return
 
 
 # Singleton instance
@@ -276,8 +272,30 @@ _service: OptimizationService | None = None
 
 
 def get_optimization_service() -> OptimizationService:
-    """Get the singleton optimization service."""
+    """Get the singleton optimization service (SQLite job store, worker processes)."""
     global _service
     if _service is None:
-        _service = OptimizationService()
+        from agentic_fleet.utils.cfg.settings import get_settings
+
+        settings = get_settings()
+        _service = OptimizationService(
+            job_store=SQLiteJobStore(settings.optimization_jobs_path),
+            runner=ProcessJobRunner(
+                WorkerLimits(
+                    threads_per_job=settings.optimization_threads_per_job,
+                    nice=settings.optimization_worker_nice,
+                )
+            ),
+            max_concurrent_jobs=settings.optimization_max_concurrent_jobs,
+            max_attempts=settings.optimization_max_attempts,
+            lease_seconds=settings.optimization_job_lease_seconds,
+        )
     return _service
+
+
+__all__ = [
+    "InProcessJobRunner",
+    "OptimizationService",
+    "compile_reasoner",
+    "get_optimization_service",
+]
@@ -0,0 +1,327 @@
+"""Out-of-process execution of DSPy optimization jobs.
+
+GEPA is CPU-heavy and runs for minutes. Inside the API process it competes
+with live chat streams for the GIL, so ``ProcessJobRunner`` runs each job in
+its own spawned worker process instead:
+
+- Each worker caps its native thread pools and GEPA evaluation threads at
+  ``threads_per_job`` and lowers its own scheduling priority (``nice``).
+  How many workers run at once is up to the caller (``OptimizationService``
+  holds a slot per running job).
+- The worker rebuilds the module from its registered name, configures DSPy
+  from the workflow config and runs ``compile_reasoner``. Progress callbacks
+  are sent back over a pipe, followed by a final ``result`` or ``error``
+  message.
+- Cancelling the awaiting task terminates the worker process.
+
+``InProcessJobRunner`` has the same interface but runs the job in a thread of
+the current process. It is meant for tests and development.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any, Protocol
+
+logger = logging.getLogger(__name__)
+
+JobSpec = dict[str, Any]
+"""Picklable job description: module_name, base_examples_path, gepa_options, artifact_path."""
+
+EventSink = Callable[[dict[str, Any]], Coroutine[Any, Any, None]]
+"""Receives progress fields to merge into the job record."""
+
+OPTIMIZABLE_MODULES: dict[str, str] = {
+    "DSPyReasoner": "agentic_fleet.dspy_modules.reasoner:DSPyReasoner",
+}
+"""Modules that optimization jobs can target, by name (``module:attribute``)."""
+
+# Native thread pools that would otherwise size themselves to every core.
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")
+
+
+@dataclass(slots=True)
+class WorkerLimits:
+    """Resource caps of optimization worker processes."""
+
+    threads_per_job: int = 2
+    nice: int = 10
+
+
+def build_module(module_name: str) -> Any:
+    """Instantiate a registered optimizable module with its predictors initialized."""
+    try:
+        target = OPTIMIZABLE_MODULES[module_name]
+    except KeyError:
+        raise ValueError(f"Unknown optimization module: {module_name}") from None
+    module_path, _, attribute = target.partition(":")
+    module = getattr(importlib.import_module(module_path), attribute)()
+    if hasattr(module, "_ensure_modules_initialized"):
+        module._ensure_modules_initialized()
+    return module
+
+
+class JobProgressCallback:
+    """``ProgressCallback`` that turns events into job-record fields for ``send``.
+
+    ``on_progress`` updates are throttled to one per ``min_interval`` seconds.
+    """
+
+    def __init__(self, send: Callable[[dict[str, Any]], None], min_interval: float = 5.0) -> None:
+        self.send = send
+        self.min_interval = min_interval
+        self._last_progress: datetime | None = None
+
+    def on_start(self, message: str) -> None:
+        """Called when optimization starts."""
+        self.send(
+            {"progress_message": message, "progress_updated_at": datetime.now(UTC).isoformat()}
+        )
+
+    def on_progress(
+        self, message: str, current: int | None = None, total: int | None = None
+    ) -> None:
+        """Called to report progress during optimization."""
+        now = datetime.now(UTC)
+        if self._last_progress and (now - self._last_progress).total_seconds() < self.min_interval:
+            return
+        self._last_progress = now
+        progress_data: dict[str, Any] = {
+            "progress_message": message,
+            "progress_updated_at": now.isoformat(),
+        }
+        if current is not None and total is not None:
+            progress_data["progress_current"] = current
+            progress_data["progress_total"] = total
+            progress_data["progress_percent"] = int((current / total) * 100) if total > 0 else 0
+        self.send(progress_data)
+
+    def on_complete(self, message: str, duration: float | None = None) -> None:
+        """Called when optimization completes."""
+        progress_data: dict[str, Any] = {
+            "progress_message": message,
+            "progress_updated_at": datetime.now(UTC).isoformat(),
+            "progress_completed": True,
+        }
+        if duration is not None:
+            progress_data["progress_duration"] = duration
+        self.send(progress_data)
+
+    def on_error(self, message: str, error: Exception | None = None) -> None:
+        """Called when optimization encounters an error."""
+        self.send(
+            {
+                "progress_message": message,
+                "progress_updated_at": datetime.now(UTC).isoformat(),
+                "progress_error": str(error) if error else message,
+            }
+        )
+
+
+def _run_compile(
+    spec: JobSpec, module: Any, progress: JobProgressCallback, compile_fn: Callable[..., Any]
+) -> dict[str, Any]:
+    """Run one optimization and save the compiled module; returns the result fields."""
+    compiled = compile_fn(
+        module=module,
+        examples_path=spec["base_examples_path"],
+        use_cache=False,  # API-triggered optimizations always recompile
+        optimizer="gepa",
+        gepa_options=spec["gepa_options"],
+        progress_callback=progress,
+        allow_gepa_optimization=True,
+    )
+    artifact_path = spec["artifact_path"]
+    if hasattr(compiled, "save"):
+        try:
+            os.makedirs(os.path.dirname(artifact_path), exist_ok=True)
+            compiled.save(artifact_path)
+        except Exception as exc:
+            logger.warning("Could not save compiled module to %s: %s", artifact_path, exc)
+    return {"result_artifact_path": artifact_path}
+
+
+def _apply_limits(limits: WorkerLimits) -> None:
+    threads = str(max(1, limits.threads_per_job))
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = threads
+    os.environ["TOKENIZERS_PARALLELISM"] = "false"
+    if limits.nice and hasattr(os, "nice"):
+        with contextlib.suppress(OSError):
+            os.nice(limits.nice)
+
+
+def run_optimization_job(job_id: str, spec: JobSpec, conn: Any, limits: WorkerLimits) -> None:
+    """Worker process entry point: run the job and report over ``conn``."""
+    _apply_limits(limits)
+    logger.info("Optimization worker %d running job %s", os.getpid(), job_id)
+    try:
+        from agentic_fleet.dspy_modules.lifecycle import configure_dspy_settings
+        from agentic_fleet.utils.cfg import DEFAULT_DSPY_MODEL, load_config
+        from agentic_fleet.utils.compiler import compile_reasoner
+
+        model = load_config().get("dspy", {}).get("model", DEFAULT_DSPY_MODEL)
+        configure_dspy_settings(model=model, enable_cache=True)
+        spec["gepa_options"].setdefault("num_threads", max(1, limits.threads_per_job))
+        progress = JobProgressCallback(lambda data: conn.send({"type": "progress", "data": data}))
+        result = _run_compile(spec, build_module(spec["module_name"]), progress, compile_reasoner)
+        conn.send({"type": "result", "data": result})
+    except BaseException as exc:
+        with contextlib.suppress(Exception):
+            conn.send({"type": "error", "error": str(exc) or type(exc).__name__})
+        raise
+    finally:
+        conn.close()
+
+
+class JobRunner(Protocol):
+    """Runs one optimization job to completion."""
+
+    async def run(
+        self, job_id: str, spec: JobSpec, module: Any | None, on_event: EventSink
+    ) -> dict[str, Any]:
+        """Run the job and return fields to merge into the job record.
+
+        ``module`` is the submitter's live module instance, if there is one
+        (runners that cross a process boundary rebuild it from
+        ``spec["module_name"]`` instead). Raises on failure, and stops the
+        job when the awaiting task is cancelled.
+        """
+        ...
+
+
+class ProcessJobRunner:
+    """Runs each job in its own worker process (see module docstring).
+
+    Args:
+        limits: Thread and priority caps of the worker.
+        target: Worker entry point; must be importable by the spawned process.
+        start_method: ``multiprocessing`` start method. ``spawn`` avoids
+            forking a process that holds event-loop and thread state.
+        poll_interval: Seconds between checks of the pipe and the process.
+    """
+
+    def __init__(
+        self,
+        limits: WorkerLimits | None = None,
+        *,
+        target: Callable[..., None] = run_optimization_job,
+        start_method: str = "spawn",
+        poll_interval: float = 0.5,
+    ) -> None:
+        self.limits = limits or WorkerLimits()
+        self.target = target
+        self.poll_interval = poll_interval
+        # BaseContext does not declare Process; each concrete context does.
+        self._context: Any = multiprocessing.get_context(start_method)
+
+    async def run(
+        self,
+        job_id: str,
+        spec: JobSpec,
+        module: Any | None,  # noqa: ARG002 - rebuilt in the worker
+        on_event: EventSink,
+    ) -> dict[str, Any]:
+        """Run the job in a worker process, forwarding its progress to ``on_event``."""
+        receiver, sender = self._context.Pipe(duplex=False)
+        process = self._context.Process(
+            target=self.target,
+            args=(job_id, spec, sender, self.limits),
+            name=f"optimization-{job_id[:8]}",
+            daemon=True,
+        )
+        process.start()
+        sender.close()
+        outcome: dict[str, Any] | None = None
+        try:
+            while True:
+                if not await asyncio.to_thread(receiver.poll, self.poll_interval):
+                    if process.is_alive():
+                        continue
+                    if not receiver.poll():
+                        break
+                try:
+                    message = receiver.recv()
+                except EOFError:
+                    break
+                if message["type"] == "progress":
+                    await on_event(message["data"])
+                else:
+                    outcome = message
+            await asyncio.to_thread(process.join)
+        except asyncio.CancelledError:
+            await asyncio.shield(asyncio.to_thread(self._stop, process))
+            raise
+        finally:
+            receiver.close()
+
+        if outcome is None:
+            raise RuntimeError(f"Optimization worker exited with code {process.exitcode}")
+        if outcome["type"] == "error":
+            raise RuntimeError(outcome["error"])
+        return outcome["data"]
+
+    @staticmethod
+    def _stop(process: Any, grace_seconds: float = 5.0) -> None:
+        process.terminate()
+        process.join(grace_seconds)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+
+class InProcessJobRunner:
+    """Runs jobs in a thread of the current process (tests and development).
+
+    Args:
+        compile_fn: Callable with ``compile_reasoner``'s keyword interface;
+            resolved lazily so it can be patched.
+    """
+
+    def __init__(self, compile_fn: Callable[..., Any] | None = None) -> None:
+        self.compile_fn = compile_fn
+
+    async def run(
+        self,
+        job_id: str,  # noqa: ARG002
+        spec: JobSpec,
+        module: Any | None,
+        on_event: EventSink,
+    ) -> dict[str, Any]:
+        """Run the job in a worker thread, forwarding its progress to ``on_event``."""
+        loop = asyncio.get_running_loop()
+
+        def send(data: dict[str, Any]) -> None:
+            with contextlib.suppress(RuntimeError):  # loop closed during shutdown
+                asyncio.run_coroutine_threadsafe(on_event(data), loop)
+
+        compile_fn = self.compile_fn
+        if compile_fn is None:
+            from agentic_fleet.services.optimization_service import compile_reasoner
+
+            compile_fn = compile_reasoner
+        if module is None:
+            module = await asyncio.to_thread(build_module, spec["module_name"])
+        return await asyncio.to_thread(
+            _run_compile, spec, module, JobProgressCallback(send), compile_fn
+        )
+
+
+__all__ = [
+    "OPTIMIZABLE_MODULES",
+    "InProcessJobRunner",
+    "JobProgressCallback",
+    "JobRunner",
+    "ProcessJobRunner",
+    "WorkerLimits",
+    "build_module",
+    "run_optimization_job",
+]
@@ -5,6 +5,7 @@ from .base import SchemaToolMixin
 from .base_mcp_tool import BaseMCPTool
 from .browser_tool import BrowserTool
 from .hosted_code_adapter import HostedCodeInterpreterAdapter
+from .mcp_pool import MCPPoolConfig, MCPSessionPool, close_mcp_pools, get_mcp_session_pool
 from .mcp_tools import Context7DeepWikiTool, PackageSearchMCPTool, TavilyMCPTool
 from .tavily_tool import TavilySearchTool
 
@@ -14,8 +15,12 @@ __all__ = [
     "BrowserTool",
     "Context7DeepWikiTool",
     "HostedCodeInterpreterAdapter",
+    "MCPPoolConfig",
+    "MCPSessionPool",
     "PackageSearchMCPTool",
     "SchemaToolMixin",
     "TavilyMCPTool",
     "TavilySearchTool",
+    "close_mcp_pools",
+    "get_mcp_session_pool",
 ]
@@ -3,6 +3,11 @@
 Provides common functionality for MCP-based tools including connection management,
 tool resolution, and content formatting. Subclasses should override specific
 behavior as needed while benefiting from shared infrastructure.
+
+Tool calls go through the per-endpoint ``MCPSessionPool`` (see ``mcp_pool.py``)
+rather than a session owned by the tool instance, so concurrent calls from
+parallel agents do not share one session and a dropped connection is replaced
+on the next call.
 """
 
 from __future__ import annotations
@@ -12,10 +17,14 @@ import json
 import logging
 from abc import abstractmethod
 from collections.abc import Sequence
+from functools import partial
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from agent_framework._mcp import MCPStreamableHTTPTool
+    from mcp.types import Tool
+
+    from agentic_fleet.tools.mcp_pool import MCPPoolConfig, MCPSessionPool
 else:
     try:
         from agent_framework._mcp import MCPStreamableHTTPTool
@@ -58,6 +67,7 @@ class BaseMCPTool(MCPStreamableHTTPTool):
 
     Provides common infrastructure for:
     - Connection management with async-safe locking (concurrency control for async operations)
+    - Pooled MCP sessions shared per endpoint, with per-call timeouts and reconnects
     - Remote tool name resolution
     - Safe disconnection handling
     - Content formatting from MCP responses
@@ -74,6 +84,7 @@ class BaseMCPTool(MCPStreamableHTTPTool):
         load_tools: bool = True,
         load_prompts: bool = False,
         headers: dict[str, str] | None = None,
+        pool_config: MCPPoolConfig | None = None,
     ):
         """Initialize the base MCP tool.
 
@@ -84,6 +95,9 @@ class BaseMCPTool(MCPStreamableHTTPTool):
             load_tools: Whether to load tools from the MCP server
             load_prompts: Whether to load prompts from the MCP server
             headers: Optional HTTP headers to send with MCP requests (e.g., auth)
+            pool_config: Session pool policy for this endpoint (defaults to the
+                MCP_POOL_* environment settings); only used by the first tool
+                that creates the endpoint's pool
         """
         super().__init__(
             name=name,
@@ -97,7 +111,9 @@ class BaseMCPTool(MCPStreamableHTTPTool):
         # Ensure downstream consumers can rely on explicit attributes
         self.name = name
         self.description = description
+        self.url = url
         self.headers = headers or {}
+        self._pool_config = pool_config
 
         # Internal helpers for ensuring one-time connection + cached tool name
         self._connect_lock: asyncio.Lock = asyncio.Lock()
@@ -125,15 +141,84 @@ class BaseMCPTool(MCPStreamableHTTPTool):
         Note: This does not provide thread safety; it only synchronizes coroutines
         within the same event loop.
         """
-        if getattr(self, "session", None) and getattr(self, "is_connected", False):
+        if getattr(self, "is_connected", False):
             return
 
         async with self._connect_lock:
             # Double-check after acquiring lock
-            if getattr(self, "session", None) and getattr(self, "is_connected", False):
+            if getattr(self, "is_connected", False):
                 return
             await self.connect()
 
+    def _get_pool(self) -> MCPSessionPool:
+        """Return the shared session pool for this tool's endpoint."""
+        from agentic_fleet.tools.mcp_pool import get_mcp_session_pool
+
+        return get_mcp_session_pool(self.url, self.headers, config=self._pool_config)
+
+    async def connect(self) -> None:
+        """Load the remote tool list through the session pool and mark the tool connected.
+
+        Unlike ``MCPStreamableHTTPTool.connect`` this does not open a session
+        owned by the tool: sessions belong to the endpoint's pool and are
+        leased per call.
+        """
+        if self.load_tools_flag and not self._tools_loaded:
+            tool_list = await self._get_pool().list_tools()
+            self._register_remote_tools(tool_list.tools)
+            self._tools_loaded = True
+        self.is_connected = True
+
+    async def close(self) -> None:
+        """Detach from the pool; its sessions stay open for other tools and calls."""
+        self.is_connected = False
+
+    def _register_remote_tools(self, tools: Sequence[Tool]) -> None:
+        """Expose remote tools as functions that call back into ``call_tool``."""
+        from agent_framework._mcp import _get_input_model_from_mcp_tool, _normalize_mcp_name
+        from agent_framework._tools import AIFunction
+
+        existing_names = {func.name for func in self._functions}
+        for tool in tools:
+            local_name = _normalize_mcp_name(tool.name)
+            if local_name in existing_names:
+                continue
+            self._functions.append(
+                AIFunction(
+                    func=partial(self.call_tool, tool.name),
+                    name=local_name,
+                    description=tool.description or "",
+                    approval_mode=self._determine_approval_mode(local_name),
+                    input_model=_get_input_model_from_mcp_tool(tool),
+                )
+            )
+            existing_names.add(local_name)
+
+    async def call_tool(self, tool_name: str, **kwargs: Any) -> list[Any]:
+        """Call a remote tool on a pooled session.
+
+        Raises:
+            ToolExecutionException: If the call times out (``MCP_CALL_TIMEOUT``),
+                the server reports an error, or no session could be established.
+        """
+        from agent_framework._mcp import _mcp_call_tool_result_to_ai_contents
+        from agent_framework.exceptions import ToolExecutionException
+        from mcp.shared.exceptions import McpError
+
+        try:
+            result = await self._get_pool().call_tool(tool_name, kwargs)
+        except McpError as exc:
+            raise ToolExecutionException(exc.error.message, inner_exception=exc) from exc
+        except TimeoutError as exc:
+            raise ToolExecutionException(
+                f"MCP tool '{tool_name}' timed out.", inner_exception=exc
+            ) from exc
+        except Exception as exc:
+            raise ToolExecutionException(
+                f"Failed to call tool '{tool_name}'.", inner_exception=exc
+            ) from exc
+        return _mcp_call_tool_result_to_ai_contents(result)
+
     def _resolve_remote_tool_name(self, preferred_keywords: Sequence[str] | None = None) -> str:
         """Pick the actual tool name exposed by the MCP server.
 
@@ -0,0 +1,347 @@
+"""Shared Playwright browser contexts and a page-content cache for ``BrowserTool``.
+
+``BrowserPool`` launches Chromium once and pre-creates a few browser contexts.
+Pages are opened on the least-busy context, and at most ``max_pages`` are
+open at a time across the pool, so parallel research runs queue for a page
+instead of opening dozens of tabs. Each page can block heavy resource types
+(images, media and fonts by default) through request interception. When it
+closes, its ``PageMetrics`` are recorded: wall time, Chromium main-thread CPU
+time and JS heap size (via the DevTools ``Performance`` domain), and request
+counts.
+
+``PageContentCache`` keeps extracted text and links per URL. Fresh entries are
+served directly; stale entries that carry an ``ETag`` or ``Last-Modified``
+validator are revalidated with a conditional GET, and renewed on
+``304 Not Modified``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass, field
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from agentic_fleet.utils.cfg import (
+    DEFAULT_BROWSER_BLOCKED_RESOURCE_TYPES,
+    DEFAULT_BROWSER_CACHE_TTL_SECONDS,
+    DEFAULT_BROWSER_CONTEXTS,
+    DEFAULT_BROWSER_MAX_PAGES,
+)
+
+if TYPE_CHECKING:
+    from playwright.async_api import Browser, BrowserContext, Page, Route  # type: ignore[import]
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class BrowserPoolConfig:
+    """Sizing and page policy of a ``BrowserPool``."""
+
+    contexts: int = DEFAULT_BROWSER_CONTEXTS
+    max_pages: int = DEFAULT_BROWSER_MAX_PAGES
+    blocked_resource_types: frozenset[str] = field(
+        default_factory=lambda: frozenset(DEFAULT_BROWSER_BLOCKED_RESOURCE_TYPES)
+    )
+    headless: bool = True
+    collect_metrics: bool = True
+    metrics_history: int = 100
+
+
+@dataclass(slots=True)
+class PageMetrics:
+    """Resource usage of one pooled page, recorded when it closes."""
+
+    url: str
+    seconds: float
+    cpu_seconds: float | None = None
+    js_heap_bytes: int | None = None
+    requests: int = 0
+    blocked_requests: int = 0
+
+
+class _RequestTracker:
+    """Counts a page's requests and aborts blocked resource types."""
+
+    __slots__ = ("blocked_requests", "blocked_types", "requests")
+
+    def __init__(self, blocked_types: Iterable[str]) -> None:
+        self.blocked_types = frozenset(blocked_types)
+        self.requests = 0
+        self.blocked_requests = 0
+
+    async def route(self, route: Route) -> None:
+        self.requests += 1
+        if route.request.resource_type in self.blocked_types:
+            self.blocked_requests += 1
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def count(self, _request: Any) -> None:
+        self.requests += 1
+
+
+class BrowserPool:
+    """Pre-created browser contexts with a cap on concurrently open pages.
+
+    Args:
+        config: Pool policy.
+        browser: An already launched browser to use (not closed by the pool);
+            by default the pool launches Chromium on first use.
+    """
+
+    def __init__(self, config: BrowserPoolConfig | None = None, *, browser: Any = None) -> None:
+        self.config = config or BrowserPoolConfig()
+        self._browser: Browser | None = browser
+        self._owns_browser = browser is None
+        self._playwright: Any | None = None
+        self._contexts: list[BrowserContext] = []
+        self._open_pages: list[int] = []
+        self._pages = asyncio.Semaphore(max(1, self.config.max_pages))
+        self._start_lock = asyncio.Lock()
+        self.metrics: deque[PageMetrics] = deque(maxlen=self.config.metrics_history)
+        self.active_pages = 0
+        self.peak_pages = 0
+        self.pages_opened = 0
+        self.waits = 0
+
+    async def start(self) -> None:
+        """Launch the browser (unless one was given) and create the contexts."""
+        if self._contexts:
+            return
+        async with self._start_lock:
+            if self._contexts:
+                return
+            if self._browser is None:
+                from playwright.async_api import async_playwright  # type: ignore[import]
+
+                self._playwright = await async_playwright().start()
+                try:
+                    self._browser = await self._playwright.chromium.launch(
+                        headless=self.config.headless
+                    )
+                except BaseException:
+                    await self._playwright.stop()
+                    self._playwright = None
+                    raise
+            contexts = [
+                await self._browser.new_context() for _ in range(max(1, self.config.contexts))
+            ]
+            self._open_pages = [0] * len(contexts)
+            self._contexts = contexts
+
+    @contextlib.asynccontextmanager
+    async def page(self, *, block_resources: bool = True) -> AsyncIterator[Page]:
+        """Open a page on the least-busy context, waiting while ``max_pages`` are open.
+
+        With ``block_resources`` the configured resource types are aborted.
+        The page is closed, and its metrics recorded, on exit.
+        """
+        await self.start()
+        if self._pages.locked():
+            self.waits += 1
+        async with self._pages:
+            index = min(range(len(self._contexts)), key=lambda i: self._open_pages[i])
+            context = self._contexts[index]
+            self._open_pages[index] += 1
+            self.active_pages += 1
+            self.peak_pages = max(self.peak_pages, self.active_pages)
+            tracker = _RequestTracker(self.config.blocked_resource_types if block_resources else ())
+            started = perf_counter()
+            page: Page | None = None
+            cdp: Any = None
+            try:
+                page = await context.new_page()
+                self.pages_opened += 1
+                if tracker.blocked_types:
+                    await page.route("**/*", tracker.route)
+                else:
+                    page.on("request", tracker.count)
+                if self.config.collect_metrics:
+                    cdp = await self._enable_performance_metrics(context, page)
+                yield page
+            finally:
+                if page is not None:
+                    self.metrics.append(await self._page_metrics(page, cdp, tracker, started))
+                    with contextlib.suppress(Exception):
+                        await page.close()
+                self._open_pages[index] -= 1
+                self.active_pages -= 1
+
+    @staticmethod
+    async def _enable_performance_metrics(context: BrowserContext, page: Page) -> Any:
+        try:
+            cdp = await context.new_cdp_session(page)
+            await cdp.send("Performance.enable")
+        except Exception as exc:  # Not Chromium, or the page is already gone
+            logger.debug("Page performance metrics unavailable: %s", exc)
+            return None
+        return cdp
+
+    @staticmethod
+    async def _page_metrics(
+        page: Page, cdp: Any, tracker: _RequestTracker, started: float
+    ) -> PageMetrics:
+        metrics = PageMetrics(
+            url=getattr(page, "url", ""),
+            seconds=perf_counter() - started,
+            requests=tracker.requests,
+            blocked_requests=tracker.blocked_requests,
+        )
+        if cdp is not None:
+            try:
+                response = await cdp.send("Performance.getMetrics")
+                values = {item["name"]: item["value"] for item in response["metrics"]}
+                metrics.cpu_seconds = values.get("TaskDuration")
+                if "JSHeapUsedSize" in values:
+                    metrics.js_heap_bytes = int(values["JSHeapUsedSize"])
+                await cdp.detach()
+            except Exception as exc:
+                logger.debug("Could not read page performance metrics: %s", exc)
+        logger.debug("Browser page metrics: %s", metrics)
+        return metrics
+
+    def stats(self) -> dict[str, Any]:
+        """Page counters plus averages over the recent ``metrics``."""
+        recent = list(self.metrics)
+        cpu = [m.cpu_seconds for m in recent if m.cpu_seconds is not None]
+        heap = [m.js_heap_bytes for m in recent if m.js_heap_bytes is not None]
+        return {
+            "contexts": len(self._contexts),
+            "max_pages": self.config.max_pages,
+            "active_pages": self.active_pages,
+            "peak_pages": self.peak_pages,
+            "pages_opened": self.pages_opened,
+            "waits": self.waits,
+            "blocked_requests": sum(m.blocked_requests for m in recent),
+            "avg_page_seconds": sum(m.seconds for m in recent) / len(recent) if recent else None,
+            "avg_cpu_seconds": sum(cpu) / len(cpu) if cpu else None,
+            "max_js_heap_bytes": max(heap) if heap else None,
+        }
+
+    async def close(self) -> None:
+        """Close the contexts, and the browser if the pool launched it."""
+        contexts, self._contexts = self._contexts, []
+        for context in contexts:
+            with contextlib.suppress(Exception):
+                await context.close()
+        if self._owns_browser and self._browser is not None:
+            with contextlib.suppress(Exception):
+                await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            with contextlib.suppress(Exception):
+                await self._playwright.stop()
+            self._playwright = None
+
+
+@dataclass(slots=True)
+class _CacheEntry:
+    value: Any
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class PageContentCache:
+    """Per-URL cache of extracted page content with TTL and HTTP revalidation.
+
+    Args:
+        ttl: Seconds an entry is served without revalidation.
+        max_entries: LRU bound on cached pages.
+        revalidate: Revalidate stale entries that have validators instead of
+            dropping them.
+        timeout: Seconds allowed for a revalidation request.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_BROWSER_CACHE_TTL_SECONDS,
+        max_entries: int = 256,
+        *,
+        revalidate: bool = True,
+        timeout: float = 5.0,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.revalidate = revalidate
+        self.timeout = timeout
+        self._entries: OrderedDict[tuple[str, ...], _CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.revalidated = 0
+
+    async def get(self, key: tuple[str, ...], url: str) -> Any | None:
+        """Return the cached value for ``key`` (fetched from ``url``), or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if monotonic() - entry.fetched_at > self.ttl:
+            if not (
+                self.revalidate
+                and (entry.etag or entry.last_modified)
+                and await self._not_modified(url, entry)
+            ):
+                self._entries.pop(key, None)
+                self.misses += 1
+                return None
+            entry.fetched_at = monotonic()
+            self.revalidated += 1
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def put(
+        self,
+        key: tuple[str, ...],
+        value: Any,
+        *,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        """Cache ``value`` with the validators of the response it came from."""
+        if self.ttl <= 0:
+            return
+        self._entries[key] = _CacheEntry(value, monotonic(), etag, last_modified)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Entry count and hit/miss/revalidation counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidated": self.revalidated,
+        }
+
+    async def _not_modified(self, url: str, entry: _CacheEntry) -> bool:
+        headers: dict[str, str] = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        try:
+            async with httpx.AsyncClient(timeout=self.timeout, follow_redirects=True) as client:
+                response = await client.get(url, headers=headers)
+        except httpx.HTTPError as exc:
+            logger.debug("Revalidation of %s failed: %s", url, exc)
+            return False
+        return response.status_code == 304
+
+
+__all__ = ["BrowserPool", "BrowserPoolConfig", "PageContentCache", "PageMetrics"]
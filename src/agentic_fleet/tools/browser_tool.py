@@ -2,11 +2,14 @@
 
 This tool allows agents to actually browse websites, extract content, and interact
 with web pages to get the most up-to-date information.
+
+Pages come from a shared ``BrowserPool`` (pre-created contexts, a cap on open
+pages, heavy resources blocked) and extracted text/links are cached per URL in
+a ``PageContentCache``; see ``browser_pool.py``.
 """
 
 from __future__ import annotations
 
-import contextlib
 import os
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
@@ -16,14 +19,17 @@ from agent_framework._serialization import SerializationMixin
 from agent_framework._tools import ToolProtocol
 
 from agentic_fleet.tools.base import SchemaToolMixin
+from agentic_fleet.tools.browser_pool import BrowserPool, BrowserPoolConfig, PageContentCache
 from agentic_fleet.utils.cfg import (
+    DEFAULT_BROWSER_CACHE_TTL_SECONDS,
+    DEFAULT_BROWSER_MAX_PAGES,
     DEFAULT_BROWSER_MAX_TEXT_LENGTH,
     DEFAULT_BROWSER_SELECTOR_TIMEOUT_MS,
     DEFAULT_BROWSER_TIMEOUT_MS,
 )
 
 if TYPE_CHECKING:
-    from playwright.async_api import Browser, Page  # type: ignore[import]
+    from playwright.async_api import Response  # type: ignore[import]
 
 async_playwright_factory: Callable[[], Any] | None = None
 PlaywrightTimeoutError: type[Exception]
@@ -37,6 +43,9 @@ except ImportError:
     PlaywrightTimeoutError = TimeoutError  # type: ignore[assignment]
     PLAYWRIGHT_AVAILABLE = False
 
+# Actions whose results depend only on the page content, and can be cached.
+_CACHEABLE_ACTIONS = frozenset({"extract_text", "extract_links"})
+
 
 class BrowserTool(SchemaToolMixin, SerializationMixin, ToolProtocol):
     """
@@ -47,16 +56,28 @@ class BrowserTool(SchemaToolMixin, SerializationMixin, ToolProtocol):
     """
 
     # Class-level shared instances
-    _shared_browser: Browser | None = None
-    _shared_playwright: Any | None = None
+    _shared_pool: BrowserPool | None = None
+    _shared_cache: PageContentCache | None = None
 
-    def __init__(self, headless: bool = True, timeout: int = DEFAULT_BROWSER_TIMEOUT_MS):
+    def __init__(
+        self,
+        headless: bool = True,
+        timeout: int = DEFAULT_BROWSER_TIMEOUT_MS,
+        max_pages: int = DEFAULT_BROWSER_MAX_PAGES,
+        block_resources: bool = True,
+        cache_ttl: float = DEFAULT_BROWSER_CACHE_TTL_SECONDS,
+    ):
         """
         Initialize browser tool.
 
         Args:
             headless: Run browser in headless mode (default: True)
             timeout: Page navigation timeout in milliseconds (default: DEFAULT_BROWSER_TIMEOUT_MS)
+            max_pages: Maximum pages open at once across all BrowserTool instances
+                (applies when the shared pool is created)
+            block_resources: Skip images, media and fonts (not for screenshots)
+            cache_ttl: Seconds extracted content is reused without revalidation
+                (applies when the shared cache is created; 0 disables caching)
         """
         if not PLAYWRIGHT_AVAILABLE:
             raise ImportError(
@@ -66,6 +87,9 @@ class BrowserTool(SchemaToolMixin, SerializationMixin, ToolProtocol):
 
         self.headless = headless
         self.timeout = timeout
+        self.max_pages = max_pages
+        self.block_resources = block_resources
+        self.cache_ttl = cache_ttl
         # Instance-level references are removed in favor of class-level shared ones
         self.name = "browser"
         self.description = (
@@ -75,31 +99,30 @@ class BrowserTool(SchemaToolMixin, SerializationMixin, ToolProtocol):
         )
         self.additional_properties: dict[str, Any] | None = None
 
-    @classmethod
-    async def _ensure_browser(cls, headless: bool = True) -> Browser:
-        """Ensure browser is initialized (shared instance)."""
-        if cls._shared_browser is None:
-            if async_playwright_factory is None:  # pragma: no cover - import guard
-                raise RuntimeError("Playwright is not available")
-
-            factory = async_playwright_factory
-            playwright_manager = factory()
-            cls._shared_playwright = await playwright_manager.start()
-            assert cls._shared_playwright is not None
-            cls._shared_browser = await cls._shared_playwright.chromium.launch(headless=headless)
+    def _ensure_pool(self) -> BrowserPool:
+        """Return the shared page pool, creating it on first use."""
+        cls = type(self)
+        if cls._shared_pool is None:
+            cls._shared_pool = BrowserPool(
+                BrowserPoolConfig(max_pages=self.max_pages, headless=self.headless)
+            )
+        return cls._shared_pool
 
-        assert cls._shared_browser is not None
-        return cls._shared_browser
+    def _ensure_cache(self) -> PageContentCache:
+        """Return the shared content cache, creating it on first use."""
+        cls = type(self)
+        if cls._shared_cache is None:
+            cls._shared_cache = PageContentCache(ttl=self.cache_ttl)
+        return cls._shared_cache
 
     @classmethod
     async def cleanup(cls) -> None:
         """Clean up shared browser resources."""
-        if cls._shared_browser:
-            await cls._shared_browser.close()
-            cls._shared_browser = None
-        if cls._shared_playwright:
-            await cls._shared_playwright.stop()
-            cls._shared_playwright = None
+        if cls._shared_pool:
+            await cls._shared_pool.close()
+            cls._shared_pool = None
+        if cls._shared_cache:
+            cls._shared_cache.clear()
 
     @property
     def schema(self) -> dict:
@@ -168,110 +191,124 @@ class BrowserTool(SchemaToolMixin, SerializationMixin, ToolProtocol):
                 parsed.scheme
             }"
 
-        page: Page | None = None
+        cache = self._ensure_cache()
+        cache_key = (url, action, wait_for or "")
+        if action in _CACHEABLE_ACTIONS:
+            cached = await cache.get(cache_key, url)
+            if cached is not None:
+                return self._format_result(action, url, cached, max_length)
+
         try:
-            browser = await self._ensure_browser(self.headless)
-            page = await browser.new_page()
-
-            # Set reasonable timeouts
-            page.set_default_timeout(self.timeout)
-            page.set_default_navigation_timeout(self.timeout)
-
-            # Navigate to URL
-            try:
-                await page.goto(url, wait_until="networkidle", timeout=self.timeout)
-            except PlaywrightTimeoutError:
-                # Try with domcontentloaded if networkidle times out
-                await page.goto(url, wait_until="domcontentloaded", timeout=self.timeout)
-
-            # Wait for specific element if requested
-            if wait_for:
+            pool = self._ensure_pool()
+            async with pool.page(
+                block_resources=self.block_resources and action != "screenshot"
+            ) as page:
+                # Set reasonable timeouts
+                page.set_default_timeout(self.timeout)
+                page.set_default_navigation_timeout(self.timeout)
+
+                # Navigate to URL
+                response: Response | None
                 try:
-                    # Try as CSS selector first
-                    await page.wait_for_selector(
-                        wait_for, timeout=DEFAULT_BROWSER_SELECTOR_TIMEOUT_MS
-                    )
+                    response = await page.goto(url, wait_until="networkidle", timeout=self.timeout)
                 except PlaywrightTimeoutError:
-                    # Try as text content
-                    try:  # noqa: SIM105
-                        await page.wait_for_function(
-                            f"document.body.innerText.includes('{wait_for}')",
-                            timeout=DEFAULT_BROWSER_SELECTOR_TIMEOUT_MS,
+                    # Try with domcontentloaded if networkidle times out
+                    response = await page.goto(
+                        url, wait_until="domcontentloaded", timeout=self.timeout
+                    )
+
+                # Wait for specific element if requested
+                if wait_for:
+                    try:
+                        # Try as CSS selector first
+                        await page.wait_for_selector(
+                            wait_for, timeout=DEFAULT_BROWSER_SELECTOR_TIMEOUT_MS
                         )
                     except PlaywrightTimeoutError:
-                        pass  # Continue anyway
-
-            # Perform requested action
-            if action == "navigate":
-                result = f"Successfully navigated to {url}"
-            elif action == "extract_text":
-                # Extract main content
-                content = await page.evaluate(
+                        # Try as text content
+                        try:  # noqa: SIM105
+                            await page.wait_for_function(
+                                f"document.body.innerText.includes('{wait_for}')",
+                                timeout=DEFAULT_BROWSER_SELECTOR_TIMEOUT_MS,
+                            )
+                        except PlaywrightTimeoutError:
+                            pass  # Continue anyway
+
+                # Perform requested action
+                if action == "navigate":
+                    return f"Successfully navigated to {url}"
+                if action == "screenshot":
+                    import tempfile
+                    import time
+
+                    screenshot_path = os.path.join(
+                        tempfile.gettempdir(), f"browser_screenshot_{int(time.time())}.png"
+                    )
+                    await page.screenshot(path=screenshot_path, full_page=True)
+                    return f"Screenshot saved to {screenshot_path} for {url}"
+                if action == "extract_text":
+                    # Extract main content
+                    value: Any = await page.evaluate(
+                        """
+                        () => {
+                            // Remove script and style elements
+                            const scripts = document.querySelectorAll('script, style, nav, header, footer, aside');
+                            scripts.forEach(el => el.remove());
+
+                            // Get main content
+                            const main = document.querySelector('main, article, [role="main"]') || document.body;
+                            return main.innerText || main.textContent || '';
+                        }
                     """
-                    () => {
-                        // Remove script and style elements
-                        const scripts = document.querySelectorAll('script, style, nav, header, footer, aside');
-                        scripts.forEach(el => el.remove());
-
-                        // Get main content
-                        const main = document.querySelector('main, article, [role="main"]') || document.body;
-                        return main.innerText || main.textContent || '';
-                    }
-                """
-                )
-
-                # Truncate if needed
-                if len(content) > max_length:
-                    content = (
-                        content[:max_length] + f"\n\n[Content truncated at {max_length} characters]"
                     )
-
-                result = f"Content from {url}:\n\n{content}"
-
-            elif action == "extract_links":
-                links = await page.evaluate(
+                elif action == "extract_links":
+                    value = await page.evaluate(
+                        """
+                        () => {
+                            const links = Array.from(document.querySelectorAll('a[href]'));
+                            return links.map(a => ({
+                                text: a.innerText.trim(),
+                                url: a.href
+                            })).filter(link => link.url && link.url.startsWith('http'));
+                        }
                     """
-                    () => {
-                        const links = Array.from(document.querySelectorAll('a[href]'));
-                        return links.map(a => ({
-                            text: a.innerText.trim(),
-                            url: a.href
-                        })).filter(link => link.url && link.url.startsWith('http'));
-                    }
-                """
-                )
-
-                if links:
-                    link_list = "\n".join(
-                        [f"- {link['text']}: {link['url']}" for link in links[:50]]
                     )
-                    result = f"Links found on {url}:\n\n{link_list}"
-                    if len(links) > 50:
-                        result += f"\n\n[Showing first 50 of {len(links)} links]"
                 else:
-                    result = f"No links found on {url}"
-
-            elif action == "screenshot":
-                import tempfile
-                import time
-
-                screenshot_path = os.path.join(
-                    tempfile.gettempdir(), f"browser_screenshot_{int(time.time())}.png"
+                    return f"Error: Unknown action '{action}'. Valid actions: navigate, extract_text, extract_links, screenshot"
+
+            if response is not None and response.ok:
+                headers = response.headers
+                cache.put(
+                    cache_key,
+                    value,
+                    etag=headers.get("etag"),
+                    last_modified=headers.get("last-modified"),
                 )
-                await page.screenshot(path=screenshot_path, full_page=True)
-                result = f"Screenshot saved to {screenshot_path} for {url}"
-            else:
-                result = f"Error: Unknown action '{action}'. Valid actions: navigate, extract_text, extract_links, screenshot"
-
-            return result
+            return self._format_result(action, url, value, max_length)
 
         except Exception as e:
             return f"Error browsing {url}: {e!s}"
-        finally:
-            # Always close the page
-            if page is not None:
-                with contextlib.suppress(Exception):
-                    await page.close()
+
+    @staticmethod
+    def _format_result(action: str, url: str, value: Any, max_length: int) -> str:
+        """Render extracted text or links (fresh or cached) for the agent."""
+        if action == "extract_text":
+            content = value
+            # Truncate if needed
+            if len(content) > max_length:
+                content = (
+                    content[:max_length] + f"\n\n[Content truncated at {max_length} characters]"
+                )
+            return f"Content from {url}:\n\n{content}"
+
+        links = value
+        if not links:
+            return f"No links found on {url}"
+        link_list = "\n".join([f"- {link['text']}: {link['url']}" for link in links[:50]])
+        result = f"Links found on {url}:\n\n{link_list}"
+        if len(links) > 50:
+            result += f"\n\n[Showing first 50 of {len(links)} links]"
+        return result
 
     def __str__(self) -> str:
         return self.name
@@ -0,0 +1,448 @@
+"""Per-endpoint pool of MCP client sessions.
+
+``MCPSessionPool`` lets concurrent tool calls from parallel agents use up to
+``size`` sessions to the same MCP server instead of funnelling through one:
+
+- each call leases an idle session (most recently used first) or opens a new
+  one, under a per-call timeout that also covers waiting for a session;
+- a call that fails for a transport reason discards its session and is
+  retried once on a fresh one, so a dropped connection heals on the next call;
+  errors reported by the server (``McpError``) are raised as-is;
+- failed connection attempts back off exponentially (with jitter) before the
+  next attempt;
+- a background task pings idle sessions every ``health_interval`` seconds and
+  closes those that fail or have been unused for ``idle_timeout`` seconds,
+  keeping ``min_idle`` sessions warm.
+
+Sessions come from a factory returning an async context manager that yields
+an initialized ``mcp.ClientSession``: ``streamable_http_session_factory`` for
+HTTP servers, or ``mcp.shared.memory.create_connected_server_and_client_session``
+for an in-process server in tests. Each session is entered and exited by its
+own task, since anyio transports must be closed by the task that opened them.
+
+Pools are shared per endpoint (URL and headers) via ``get_mcp_session_pool``
+and closed at shutdown with ``close_mcp_pools``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import enum
+import logging
+import random
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from agentic_fleet.utils.cfg import env_config
+
+if TYPE_CHECKING:
+    from mcp import ClientSession
+    from mcp.types import CallToolResult, ListToolsResult
+
+logger = logging.getLogger(__name__)
+
+SessionFactory = Callable[[], AbstractAsyncContextManager["ClientSession"]]
+
+
+class _Default(enum.Enum):
+    """Sentinel for "use the configured timeout" (``None`` means no timeout)."""
+
+    TOKEN = enum.auto()
+
+
+_DEFAULT = _Default.TOKEN
+
+
+@dataclass(slots=True)
+class MCPPoolConfig:
+    """Sizing, timeouts and reconnect policy of an ``MCPSessionPool``."""
+
+    size: int = 4
+    min_idle: int = 1
+    idle_timeout: float = 300.0
+    health_interval: float = 30.0
+    ping_timeout: float = 5.0
+    connect_timeout: float = 15.0
+    call_timeout: float | None = 60.0
+    backoff_initial: float = 0.5
+    backoff_max: float = 30.0
+
+    @classmethod
+    def from_env(cls) -> MCPPoolConfig:
+        """Build from ``MCP_POOL_SIZE``, ``MCP_CALL_TIMEOUT``, ``MCP_IDLE_TIMEOUT`` and ``MCP_HEALTH_INTERVAL``."""
+        return cls(
+            size=env_config.mcp_pool_size,
+            call_timeout=env_config.mcp_call_timeout or None,
+            idle_timeout=env_config.mcp_idle_timeout,
+            health_interval=env_config.mcp_health_interval,
+        )
+
+
+def streamable_http_session_factory(
+    url: str, headers: dict[str, str] | None = None
+) -> SessionFactory:
+    """Session factory for an MCP server over streamable HTTP."""
+
+    @asynccontextmanager
+    async def factory() -> AsyncIterator[ClientSession]:
+        from mcp import ClientSession
+        from mcp.client.streamable_http import streamablehttp_client
+
+        async with (
+            streamablehttp_client(url, headers=headers or None) as (read, write, _),
+            ClientSession(read, write) as session,
+        ):
+            await session.initialize()
+            yield session
+
+    return factory
+
+
+class _PooledSession:
+    """One pooled session, kept open by a dedicated owner task until ``close()``."""
+
+    __slots__ = ("_closing", "_task", "broken", "last_used", "session")
+
+    def __init__(self) -> None:
+        self.session: ClientSession | None = None
+        self.last_used = monotonic()
+        self.broken = False
+        self._closing = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def alive(self) -> bool:
+        return (
+            not self.broken
+            and self.session is not None
+            and self._task is not None
+            and not self._task.done()
+        )
+
+    async def open(self, factory: SessionFactory, timeout: float, name: str) -> None:
+        ready: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._task = asyncio.create_task(self._run(factory, ready), name=f"mcp-session:{name}")
+        try:
+            async with asyncio.timeout(timeout):
+                await asyncio.shield(ready)
+        except BaseException:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            raise
+
+    async def _run(self, factory: SessionFactory, ready: asyncio.Future[None]) -> None:
+        try:
+            async with factory() as session:
+                self.session = session
+                ready.set_result(None)
+                await self._closing.wait()
+        except asyncio.CancelledError:
+            if not ready.done():
+                ready.cancel()
+            raise
+        except Exception as exc:
+            if not ready.done():
+                ready.set_exception(exc)
+            else:
+                logger.debug("MCP session closed with error: %s", exc)
+        finally:
+            self.session = None
+
+    async def close(self, timeout: float = 5.0) -> None:
+        self.broken = True
+        self._closing.set()
+        if self._task is None or self._task.done():
+            return
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), timeout)
+        except BaseException:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+class MCPSessionPool:
+    """Bounded pool of sessions to one MCP endpoint.
+
+    Args:
+        factory: Returns an async context manager yielding an initialized session.
+        name: Label used in logs and task names (e.g. the endpoint URL).
+        config: Pool policy; defaults to ``MCPPoolConfig.from_env()``.
+    """
+
+    def __init__(
+        self,
+        factory: SessionFactory,
+        *,
+        name: str = "mcp",
+        config: MCPPoolConfig | None = None,
+    ) -> None:
+        self.factory = factory
+        self.name = name
+        self.config = config or MCPPoolConfig.from_env()
+        self._permits = asyncio.Semaphore(max(1, self.config.size))
+        self._idle: deque[_PooledSession] = deque()
+        self._in_use = 0
+        self._closed = False
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._maintenance: asyncio.Task[None] | None = None
+        self._failures = 0
+        self._next_attempt = 0.0
+        self._closing: set[asyncio.Task[None]] = set()
+        self.opened = 0
+        self.reconnects = 0
+        self.last_error: str | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether ``close()`` has been called."""
+        return self._closed
+
+    def bound_to_other_loop(self) -> bool:
+        """Whether the pool was first used on an event loop that is not the running one."""
+        if self._loop is None:
+            return False
+        try:
+            return self._loop is not asyncio.get_running_loop()
+        except RuntimeError:
+            return self._loop.is_closed()
+
+    def stats(self) -> dict[str, Any]:
+        """Current pool occupancy and lifetime counters."""
+        return {
+            "size": self.config.size,
+            "idle": len(self._idle),
+            "in_use": self._in_use,
+            "opened": self.opened,
+            "reconnects": self.reconnects,
+            "consecutive_failures": self._failures,
+            "last_error": self.last_error,
+        }
+
+    async def call_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any] | None = None,
+        *,
+        timeout: float | _Default | None = _DEFAULT,
+    ) -> CallToolResult:
+        """Call ``tool_name`` on a pooled session.
+
+        Raises:
+            TimeoutError: If no result arrived within ``timeout`` (default
+                ``config.call_timeout``; ``None`` waits indefinitely).
+            McpError: If the server reported an error.
+        """
+        return await self.run(
+            lambda session: session.call_tool(tool_name, arguments=arguments), timeout=timeout
+        )
+
+    async def list_tools(self, *, timeout: float | _Default | None = _DEFAULT) -> ListToolsResult:
+        """List the tools exposed by the endpoint."""
+        return await self.run(lambda session: session.list_tools(), timeout=timeout)
+
+    async def run[T](
+        self,
+        operation: Callable[[ClientSession], Awaitable[T]],
+        *,
+        timeout: float | _Default | None = _DEFAULT,
+    ) -> T:
+        """Run ``operation`` on a leased session, retrying once on a fresh session
+        if the first one fails for a reason other than a server-reported error.
+        """
+        from mcp.shared.exceptions import McpError
+
+        if timeout is _Default.TOKEN:
+            timeout = self.config.call_timeout
+        async with asyncio.timeout(timeout):
+            for attempt in range(2):
+                async with self._lease() as pooled:
+                    assert pooled.session is not None
+                    try:
+                        return await operation(pooled.session)
+                    except McpError:
+                        raise
+                    except Exception as exc:
+                        pooled.broken = True
+                        self.last_error = f"{type(exc).__name__}: {exc}"
+                        if attempt:
+                            raise
+                        self.reconnects += 1
+                        logger.info(
+                            "MCP session to %s failed (%s); retrying on a new session",
+                            self.name,
+                            self.last_error,
+                        )
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    @asynccontextmanager
+    async def _lease(self) -> AsyncIterator[_PooledSession]:
+        if self._closed:
+            raise RuntimeError(f"MCP session pool for {self.name} is closed")
+        self._start_maintenance()
+        await self._permits.acquire()
+        pooled: _PooledSession | None = None
+        try:
+            pooled = self._take_idle() or await self._open()
+            self._in_use += 1
+            try:
+                yield pooled
+            finally:
+                self._in_use -= 1
+        finally:
+            if pooled is not None:
+                if pooled.alive and not self._closed:
+                    pooled.last_used = monotonic()
+                    self._idle.append(pooled)
+                else:
+                    self._close_in_background(pooled)
+            self._permits.release()
+
+    def _take_idle(self) -> _PooledSession | None:
+        while self._idle:
+            pooled = self._idle.pop()
+            if pooled.alive:
+                return pooled
+            self._close_in_background(pooled)
+        return None
+
+    async def _open(self) -> _PooledSession:
+        delay = self._next_attempt - monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        pooled = _PooledSession()
+        try:
+            await pooled.open(self.factory, self.config.connect_timeout, self.name)
+        except Exception as exc:
+            self._failures += 1
+            backoff = min(
+                self.config.backoff_max,
+                self.config.backoff_initial * 2 ** (self._failures - 1),
+            )
+            self._next_attempt = monotonic() + backoff * random.uniform(0.5, 1.0)
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            logger.warning(
+                "Could not connect to MCP server %s (attempt %d, next in <=%.1fs): %s",
+                self.name,
+                self._failures,
+                backoff,
+                self.last_error,
+            )
+            raise ConnectionError(f"Could not connect to MCP server {self.name}: {exc}") from exc
+        self._failures = 0
+        self._next_attempt = 0.0
+        self.opened += 1
+        return pooled
+
+    def _close_in_background(self, pooled: _PooledSession) -> None:
+        task = asyncio.create_task(pooled.close())
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    def _start_maintenance(self) -> None:
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        if self.config.health_interval > 0 and (
+            self._maintenance is None or self._maintenance.done()
+        ):
+            self._maintenance = asyncio.create_task(
+                self._maintain(), name=f"mcp-pool-health:{self.name}"
+            )
+
+    async def _maintain(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.config.health_interval)
+            try:
+                await self.check_health()
+            except Exception as exc:  # pragma: no cover - defensive
+                logger.debug("MCP pool health check for %s failed: %s", self.name, exc)
+
+    async def check_health(self) -> None:
+        """Ping idle sessions; close failed ones and those idle past ``idle_timeout``.
+
+        Runs in the background every ``health_interval`` seconds. Sessions are
+        checked one at a time under a pool permit, so the pool never exceeds
+        ``size`` sessions; busy pools skip the check.
+        """
+        for pooled in list(self._idle):
+            if self._closed or self._permits.locked():
+                return
+            await self._permits.acquire()
+            try:
+                if pooled not in self._idle:
+                    continue
+                self._idle.remove(pooled)
+                expired = (
+                    monotonic() - pooled.last_used > self.config.idle_timeout
+                    and len(self._idle) >= self.config.min_idle
+                )
+                if not expired and await self._ping(pooled):
+                    self._idle.appendleft(pooled)
+                else:
+                    await pooled.close()
+            finally:
+                self._permits.release()
+
+    async def _ping(self, pooled: _PooledSession) -> bool:
+        if not pooled.alive or pooled.session is None:
+            return False
+        try:
+            async with asyncio.timeout(self.config.ping_timeout):
+                await pooled.session.send_ping()
+        except Exception as exc:
+            self.last_error = f"{type(exc).__name__}: {exc}"
+            logger.info("MCP session to %s failed its health check: %s", self.name, exc)
+            return False
+        return True
+
+    async def close(self) -> None:
+        """Close idle sessions now and in-use sessions when their calls finish."""
+        self._closed = True
+        if self._maintenance is not None:
+            self._maintenance.cancel()
+            await asyncio.gather(self._maintenance, return_exceptions=True)
+        idle, self._idle = list(self._idle), deque()
+        await asyncio.gather(*(pooled.close() for pooled in idle), *self._closing)
+
+
+_pools: dict[tuple[str, tuple[tuple[str, str], ...]], MCPSessionPool] = {}
+
+
+def get_mcp_session_pool(
+    url: str,
+    headers: dict[str, str] | None = None,
+    *,
+    config: MCPPoolConfig | None = None,
+) -> MCPSessionPool:
+    """Return the shared pool for an HTTP endpoint, creating it on first use.
+
+    Tools with the same URL and headers share one pool. ``config`` only
+    applies when the pool is created.
+    """
+    key = (url, tuple(sorted((headers or {}).items())))
+    pool = _pools.get(key)
+    if pool is None or pool.closed or pool.bound_to_other_loop():
+        pool = _pools[key] = MCPSessionPool(
+            streamable_http_session_factory(url, headers), name=url, config=config
+        )
+    return pool
+
+
+async def close_mcp_pools() -> None:
+    """Close every shared pool (called on application shutdown)."""
+    pools = list(_pools.values())
+    _pools.clear()
+    await asyncio.gather(*(pool.close() for pool in pools if not pool.bound_to_other_loop()))
+
+
+__all__ = [
+    "MCPPoolConfig",
+    "MCPSessionPool",
+    "SessionFactory",
+    "close_mcp_pools",
+    "get_mcp_session_pool",
+    "streamable_http_session_factory",
+]
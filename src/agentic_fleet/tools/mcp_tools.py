@@ -102,18 +102,15 @@ class TavilyMCPTool(BaseMCPTool):
             tool_name = self._resolve_remote_tool_name()
             contents = await self.call_tool(tool_name, query=query, search_depth=normalized_depth)
             result = self._format_contents(contents) or "Tavily returned an empty response."
-            await self._safe_disconnect()
             return result
         except (ToolExecutionException, ToolException) as exc:
             logger.warning("Tavily MCP tool call failed: %s", exc)
-            await self._safe_disconnect()
             return (
                 "Error: Tavily MCP search failed to execute. "
                 "Verify your TAVILY_API_KEY and network connectivity."
             )
         except Exception as exc:  # pragma: no cover - unexpected
             logger.exception("Unexpected Tavily MCP failure", exc_info=exc)
-            await self._safe_disconnect()
             return f"Unexpected Tavily MCP error: {exc}"
 
 
@@ -172,11 +169,9 @@ class Context7DeepWikiTool(BaseMCPTool):
                 tool_name = self._resolve_remote_tool_name()
                 contents = await self.call_tool(tool_name, query=query)
                 result = self._format_contents(contents) or "DeepWiki returned empty response."
-                await self._safe_disconnect()
                 return result
             except Exception as exc:
                 logger.warning("Context7 DeepWiki MCP tool call failed: %s", exc)
-                await self._safe_disconnect()
                 return f"Error: DeepWiki search failed. {exc}"
 
 
@@ -237,9 +232,7 @@ class PackageSearchMCPTool(BaseMCPTool):
                 result = (
                     self._format_contents(contents) or "Package search returned empty response."
                 )
-                await self._safe_disconnect()
                 return result
             except Exception as exc:
                 logger.warning("Package Search MCP tool call failed: %s", exc)
-                await self._safe_disconnect()
                 return f"Error: Package Search failed. {exc}"
@@ -44,6 +44,10 @@ from .constants import (
     DEFAULT_ANALYST_TEMPERATURE,
     DEFAULT_ANSWER_QUALITY_CACHE_PATH,
     # Browser
+    DEFAULT_BROWSER_BLOCKED_RESOURCE_TYPES,
+    DEFAULT_BROWSER_CACHE_TTL_SECONDS,
+    DEFAULT_BROWSER_CONTEXTS,
+    DEFAULT_BROWSER_MAX_PAGES,
     DEFAULT_BROWSER_MAX_TEXT_LENGTH,
     DEFAULT_BROWSER_SELECTOR_TIMEOUT_MS,
     DEFAULT_BROWSER_TIMEOUT_MS,
@@ -60,8 +64,10 @@ from .constants import (
     DEFAULT_DSPY_MODEL,
     DEFAULT_DSPY_TEMPERATURE,
     DEFAULT_EVALUATION_DIR,
+    DEFAULT_EXAMPLE_STORE_DIR,
     DEFAULT_EXAMPLES_PATH,
     # GEPA
+    DEFAULT_GEPA_EVAL_CACHE_PATH,
     DEFAULT_GEPA_HISTORY_LIMIT,
     DEFAULT_GEPA_HISTORY_MIN_QUALITY,
     # Paths continued
@@ -214,6 +220,10 @@ __all__ = [
     "DEFAULT_AGENT_TIMEOUT",
     "DEFAULT_ANALYST_TEMPERATURE",
     "DEFAULT_ANSWER_QUALITY_CACHE_PATH",
+    "DEFAULT_BROWSER_BLOCKED_RESOURCE_TYPES",
+    "DEFAULT_BROWSER_CACHE_TTL_SECONDS",
+    "DEFAULT_BROWSER_CONTEXTS",
+    "DEFAULT_BROWSER_MAX_PAGES",
     "DEFAULT_BROWSER_MAX_TEXT_LENGTH",
     "DEFAULT_BROWSER_SELECTOR_TIMEOUT_MS",
     # Constants - Browser
@@ -233,6 +243,8 @@ __all__ = [
     "DEFAULT_DSPY_TEMPERATURE",
     "DEFAULT_EVALUATION_DIR",
     "DEFAULT_EXAMPLES_PATH",
+    "DEFAULT_EXAMPLE_STORE_DIR",
+    "DEFAULT_GEPA_EVAL_CACHE_PATH",
     "DEFAULT_GEPA_HISTORY_LIMIT",
     "DEFAULT_GEPA_HISTORY_MIN_QUALITY",
     "DEFAULT_GEPA_LOG_DIR",
@@ -101,6 +101,7 @@ DEFAULT_VAR_DIR = ".var"
 DEFAULT_CACHE_DIR = ".var/cache"
 DEFAULT_LOGS_DIR = ".var/logs"
 DEFAULT_DATA_DIR = ".var/data"
+DEFAULT_EXAMPLE_STORE_DIR = ".var/data/example_stores"
 DEFAULT_CACHE_PATH = ".var/logs/compiled_supervisor.pkl"
 DEFAULT_ANSWER_QUALITY_CACHE_PATH = ".var/logs/compiled_answer_quality.pkl"
 DEFAULT_NLU_CACHE_PATH = ".var/logs/compiled_nlu.pkl"
@@ -108,6 +109,7 @@ DEFAULT_HISTORY_PATH = ".var/logs/execution_history.jsonl"
 DEFAULT_LOG_PATH = ".var/logs/workflow.log"
 DEFAULT_GEPA_LOG_DIR = ".var/logs/gepa"
 DEFAULT_DSPY_CACHE_DIR = ".var/cache/dspy"
+DEFAULT_GEPA_EVAL_CACHE_PATH = ".var/cache/dspy/gepa_eval_cache.sqlite"
 DEFAULT_DSPY_EXAMPLES_PATH = ".var/logs/dspy_examples.jsonl"
 DEFAULT_EVALUATION_DIR = ".var/logs/evaluation"
 
@@ -134,6 +136,10 @@ MAX_ERROR_MESSAGE_LENGTH = 500
 DEFAULT_BROWSER_TIMEOUT_MS = 30000
 DEFAULT_BROWSER_SELECTOR_TIMEOUT_MS = 5000
 DEFAULT_BROWSER_MAX_TEXT_LENGTH = 10000
+DEFAULT_BROWSER_CONTEXTS = 2
+DEFAULT_BROWSER_MAX_PAGES = 4
+DEFAULT_BROWSER_CACHE_TTL_SECONDS = 300
+DEFAULT_BROWSER_BLOCKED_RESOURCE_TYPES = ("image", "media", "font")
 
 # =============================================================================
 # GEPA Optimizer
@@ -170,6 +170,34 @@ class EnvConfig:
     def tavily_api_key(self) -> str:
         return self._get_cached("tavily_api_key", lambda: get_env_var("TAVILY_API_KEY", ""))
 
+    # -------------------------------------------------------------------------
+    # MCP Session Pool
+    # -------------------------------------------------------------------------
+
+    @property
+    def mcp_pool_size(self) -> int:
+        """Maximum open MCP sessions per endpoint (MCP_POOL_SIZE)."""
+        return self._get_cached("mcp_pool_size", lambda: get_env_int("MCP_POOL_SIZE", 4))
+
+    @property
+    def mcp_call_timeout(self) -> float:
+        """Seconds allowed for one MCP call, including waiting for a session (MCP_CALL_TIMEOUT)."""
+        return self._get_cached("mcp_call_timeout", lambda: get_env_float("MCP_CALL_TIMEOUT", 60.0))
+
+    @property
+    def mcp_idle_timeout(self) -> float:
+        """Seconds before an unused pooled MCP session is closed (MCP_IDLE_TIMEOUT)."""
+        return self._get_cached(
+            "mcp_idle_timeout", lambda: get_env_float("MCP_IDLE_TIMEOUT", 300.0)
+        )
+
+    @property
+    def mcp_health_interval(self) -> float:
+        """Seconds between health pings of idle MCP sessions (MCP_HEALTH_INTERVAL)."""
+        return self._get_cached(
+            "mcp_health_interval", lambda: get_env_float("MCP_HEALTH_INTERVAL", 30.0)
+        )
+
     # -------------------------------------------------------------------------
     # Logging Configuration
     # -------------------------------------------------------------------------
@@ -178,6 +206,23 @@ class EnvConfig:
     def log_format(self) -> str:
         return self._get_cached("log_format", lambda: get_env_var("LOG_FORMAT", "text").lower())
 
+    @property
+    def log_queue(self) -> bool:
+        """Write log records from a background thread (LOG_QUEUE)."""
+        return self._get_cached("log_queue", lambda: get_env_bool("LOG_QUEUE", default=False))
+
+    @property
+    def log_queue_size(self) -> int:
+        """Records buffered for the log thread before new ones are dropped (LOG_QUEUE_SIZE)."""
+        return self._get_cached("log_queue_size", lambda: get_env_int("LOG_QUEUE_SIZE", 10000))
+
+    @property
+    def log_stream_sample_every(self) -> int:
+        """Log one in N delta/heartbeat stream events per workflow (LOG_STREAM_SAMPLE_EVERY)."""
+        return self._get_cached(
+            "log_stream_sample_every", lambda: get_env_int("LOG_STREAM_SAMPLE_EVERY", 20)
+        )
+
     # -------------------------------------------------------------------------
     # Feature Flags
     # -------------------------------------------------------------------------
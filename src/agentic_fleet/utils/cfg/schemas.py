@@ -63,12 +63,15 @@ class DSPyOptimizationConfig(BaseModel):
     gepa_max_metric_calls: int = Field(default=150, ge=1)
     gepa_reflection_model: str | None = None
     gepa_log_dir: str = ".var/logs/gepa"
+    gepa_eval_cache_path: str | None = ".var/cache/dspy/gepa_eval_cache.sqlite"
     gepa_perfect_score: float = Field(default=1.0, ge=0.0, le=10.0)
     gepa_use_history_examples: bool = False
     gepa_history_min_quality: float = Field(default=8.0, ge=0.0, le=10.0)
     gepa_history_limit: int = Field(default=200, ge=1)
     gepa_val_split: float = Field(default=0.2, ge=0.0, le=0.5)
     gepa_seed: int = Field(default=13, ge=0)
+    gepa_coreset: bool = False
+    gepa_coreset_size: int | None = Field(default=None, ge=2)
 
     @field_validator("gepa_reflection_model")
     @classmethod
@@ -90,6 +93,9 @@ class DSPyConfig(BaseModel):
     # Routing/cache configuration for DSPy-based supervisors and agents
     enable_routing_cache: bool = True  # Cache routing decisions
     routing_cache_ttl_seconds: int = Field(default=300, ge=0)  # Cache TTL in seconds
+    # Offline routing replay: record routing LM calls and decisions to this store
+    routing_replay_path: str | None = None
+    routing_replay_sample_rate: float = Field(default=1.0, ge=0.0, le=1.0)
     optimization: DSPyOptimizationConfig = DSPyOptimizationConfig()
 
     @field_validator("model")
@@ -117,8 +123,13 @@ class SupervisorConfig(BaseModel):
     max_stalls: int = Field(default=3, ge=1, le=20)
     max_resets: int = Field(default=2, ge=0, le=10)
     enable_streaming: bool = True
-    pipeline_profile: Literal["full", "light"] = "full"
+    pipeline_profile: Literal["full", "light", "adaptive"] = "full"
     simple_task_max_words: int = Field(default=40, ge=1, le=2000)
+    # Overlap routing/web search with analysis (see workflows/executors/speculation.py).
+    speculative_execution: bool = False
+    # "adaptive" profile thresholds (see workflows/helpers/phase_policy.py).
+    adaptive_min_confidence: float = Field(default=0.8, ge=0.0, le=1.0)
+    adaptive_history_window: int = Field(default=200, ge=0, le=10000)
     # Include a small recent message window in analysis/routing to resolve
     # short follow-up inputs (e.g., quick replies).
     conversation_context_max_messages: int = Field(default=8, ge=0, le=50)
@@ -131,6 +142,8 @@ class ExecutionConfig(BaseModel):
     parallel_threshold: int = Field(default=3, ge=1)
     timeout_seconds: int = Field(default=300, ge=1)
     retry_attempts: int = Field(default=2, ge=0)
+    discussion_speaker_selection: Literal["dspy", "auto", "round_robin"] = "auto"
+    discussion_transcript_window: int = Field(default=20, ge=1)
 
 
 class QualityConfig(BaseModel):
@@ -143,6 +156,10 @@ class QualityConfig(BaseModel):
     judge_threshold: float = Field(default=7.0, ge=0.0, le=10.0)
     enable_judge: bool = True
     max_refinement_rounds: int = Field(default=2, ge=1, le=5)
+    refinement_strategy: Literal["none", "best_of_n"] = "none"
+    refinement_candidates: int = Field(default=3, ge=1, le=10)
+    refinement_max_concurrency: int = Field(default=3, ge=1)
+    refinement_time_budget_seconds: float | None = Field(default=30.0, gt=0)
     judge_model: str | None = None
     judge_reasoning_effort: Literal["minimal", "medium", "maximal"] = "medium"
 
@@ -158,6 +175,8 @@ class HandoffConfig(BaseModel):
     """Handoff workflow configuration."""
 
     enabled: bool = True
+    history_limit: int = Field(default=500, ge=1)
+    history_path: str | None = None
 
 
 class WorkflowConfig(BaseModel):
@@ -270,6 +289,10 @@ class TracingConfig(BaseModel):
         otlp_endpoint: OpenTelemetry collector endpoint. Defaults to http://localhost:4317.
         capture_sensitive: Whether to capture sensitive data (API keys, user inputs, etc.)
             in trace spans. Defaults to False for security.
+        sample_rates: Head-based sampling rate per span family (e.g. ``DSPyReasoner``,
+            ``RoutingExecutor``); the ``default`` key applies to other families.
+        max_attribute_length: Longer string span attributes are truncated and hashed.
+        hash_attributes: Span attribute keys (e.g. ``task``) replaced by their hash.
 
     Security Note:
         The `capture_sensitive` field defaults to False following the principle of
@@ -300,6 +323,9 @@ class TracingConfig(BaseModel):
     enabled: bool = False
     otlp_endpoint: str = "http://localhost:4317"
     capture_sensitive: bool = False
+    sample_rates: dict[str, float] = Field(default_factory=dict)
+    max_attribute_length: int = Field(default=512, ge=16)
+    hash_attributes: list[str] = Field(default_factory=list)
 
 
 # =============================================================================
@@ -324,6 +350,8 @@ class EvaluationConfig(BaseModel):
     )
     max_tasks: int = Field(default=0, ge=0)
     stop_on_failure: bool = False
+    concurrency: int = Field(default=1, ge=1)
+    task_timeout_seconds: float | None = Field(default=None, gt=0)
 
 
 # =============================================================================
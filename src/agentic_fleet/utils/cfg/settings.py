@@ -19,8 +19,30 @@ class AppSettings(BaseSettings):
     app_name: str = "agentic-fleet"
     app_version: str = "0.7.1"
 
-    # Concurrency
+    # Concurrency and admission queue
     max_concurrent_workflows: int = 10
+    fast_path_max_concurrent: int = 4
+    admission_queue_size: int = 32
+    admission_queue_per_user: int = 4
+    admission_queue_timeout_seconds: float = 20.0
+    # Proxy addresses whose X-User-Id header is used as the fairness key
+    admission_trusted_proxies: list[str] = []
+
+    # Shared state across workers: memory (single process) | sqlite | redis
+    state_backend: str = "memory"
+    state_sqlite_path: str = ".var/data/shared_state.db"
+    state_redis_url: str = "redis://localhost:6379/0"
+    state_key_prefix: str = "agentic_fleet:"
+    state_slot_lease_seconds: float = 3600.0
+    state_poll_interval_seconds: float = 0.25
+
+    # Optimization jobs: persisted in SQLite, each run in its own worker process
+    optimization_jobs_path: str = ".var/data/optimization_jobs.db"
+    optimization_max_concurrent_jobs: int = 1
+    optimization_threads_per_job: int = 2
+    optimization_worker_nice: int = 10
+    optimization_max_attempts: int = 2
+    optimization_job_lease_seconds: float = 60.0
 
     # CORS
     cors_allowed_origins: list[str] = [
@@ -50,6 +72,8 @@ class AppSettings(BaseSettings):
     log_level: str = "INFO"
     log_json: bool = True
     log_format: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    log_queue: bool = False
+    log_queue_size: int = 10000
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -5,20 +5,23 @@ Simplified to rely on native DSPy persistence.
 
 from __future__ import annotations
 
-import json
 import logging
 import os
 from typing import Any
 
 from dspy.teleprompt import BootstrapFewShot
 
+from agentic_fleet.dspy_modules.optimization.coreset import coreset_size_for_budget
+from agentic_fleet.dspy_modules.optimization.example_store import ExampleStore
 from agentic_fleet.dspy_modules.optimization.gepa import (
     convert_to_dspy_examples,
     harvest_history_examples,
+    load_example_dicts,
     optimize_with_gepa,
     prepare_gepa_datasets,
 )
 
+from .cfg import DEFAULT_GEPA_EVAL_CACHE_PATH
 from .progress import NullProgressCallback, ProgressCallback
 
 logger = logging.getLogger(__name__)
@@ -56,19 +59,12 @@ def compile_reasoner(
             # Note: on_complete was already called in try block if load succeeded,
             # so we don't call on_error here - we'll continue with compilation below
 
-    # Load initial training data (if available)
+    # Load initial training data (if available), from the example store once one exists
     data: list[dict[str, Any]] = []
-    if os.path.exists(examples_path):
+    store = ExampleStore.existing(examples_path)
+    if store is not None or os.path.exists(examples_path):
         progress_callback.on_progress(f"Loading training examples from {examples_path}...")
-        try:
-            with open(examples_path) as f:
-                data = json.load(f)
-            if not isinstance(data, list):
-                logger.warning(f"Training data at {examples_path} is not a list, ignoring")
-                data = []
-        except Exception as exc:
-            logger.warning(f"Failed to load training data from {examples_path}: {exc}")
-            data = []
+        data = load_example_dicts(examples_path)
     else:
         logger.info(
             f"No initial training data at {examples_path}. "
@@ -91,6 +87,7 @@ def compile_reasoner(
             history_examples = harvest_history_examples(
                 min_quality=gepa_options.get("history_min_quality", 8.0),
                 limit=gepa_options.get("history_limit", 200),
+                store=store,
             )
             if history_examples:
                 extra_examples.extend(history_examples)
@@ -107,6 +104,19 @@ def compile_reasoner(
                 else:
                     progress_callback.on_progress("No high-quality history examples found")
 
+        # Optionally keep only a representative subset sized for the metric-call budget
+        coreset_size = gepa_options.get("coreset_size")
+        if coreset_size is None and gepa_options.get("coreset", False):
+            if gepa_options.get("max_metric_calls"):
+                coreset_size = coreset_size_for_budget(
+                    gepa_options["max_metric_calls"], val_split=gepa_options.get("val_split", 0.2)
+                )
+            else:
+                logger.warning(
+                    "Coreset selection needs coreset_size or max_metric_calls; using all examples"
+                )
+        log_dir = gepa_options.get("log_dir", ".var/logs/gepa")
+
         # Prepare datasets with proper validation
         progress_callback.on_progress("Preparing GEPA datasets...")
         trainset, valset = prepare_gepa_datasets(
@@ -115,7 +125,14 @@ def compile_reasoner(
             extra_examples=extra_examples if extra_examples else None,
             val_split=gepa_options.get("val_split", 0.2),
             seed=gepa_options.get("seed", 13),
+            coreset_size=coreset_size,
+            report_path=os.path.join(log_dir, "coreset.json"),
         )
+        if coreset_size is not None:
+            progress_callback.on_progress(
+                f"GEPA datasets (coreset size {coreset_size}): {len(trainset)} training, "
+                f"{len(valset)} validation examples"
+            )
 
         # Bootstrap mode: if no initial data but history exists, use history as training data
         if not trainset:
@@ -176,8 +193,9 @@ def compile_reasoner(
                 max_iterations=max_iterations,
                 reflection_model=gepa_options.get("reflection_model"),
                 perfect_score=gepa_options.get("perfect_score", 1.0),
-                log_dir=gepa_options.get("log_dir", ".var/logs/gepa"),
+                log_dir=log_dir,
                 progress_callback=progress_callback,
+                eval_cache_path=gepa_options.get("eval_cache_path", DEFAULT_GEPA_EVAL_CACHE_PATH),
                 enable_tool_optimization=gepa_options.get("enable_tool_optimization", False),
                 num_threads=gepa_options.get("num_threads"),
             )
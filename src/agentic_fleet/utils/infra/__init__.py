@@ -19,35 +19,67 @@ Usage:
 
 from __future__ import annotations
 
-# Re-export everything from core.logging to maintain backward compatibility
-from .logging import setup_logger
-from .resilience import (
-    RATE_LIMIT_EXCEPTIONS,
-    async_call_with_retry,
-    create_circuit_breaker,
-    create_rate_limit_retry,
-    external_api_retry,
-    llm_api_retry,
-    log_retry_attempt,
-)
-from .telemetry import (
-    ExecutionMetrics,
-    PerformanceTracker,
-    configure_telemetry,
-    optional_span,
-)
-from .tracing import (
-    get_meter,
-    get_tracer,
-    initialize_tracing,
-    reset_tracing,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .logging import setup_logger
+    from .resilience import (
+        RATE_LIMIT_EXCEPTIONS,
+        async_call_with_retry,
+        create_circuit_breaker,
+        create_rate_limit_retry,
+        external_api_retry,
+        is_rate_limit_error,
+        llm_api_retry,
+        log_retry_attempt,
+    )
+    from .telemetry import (
+        ExecutionMetrics,
+        PerformanceTracker,
+        SpanPolicy,
+        configure_span_policy,
+        configure_telemetry,
+        optional_span,
+    )
+    from .tracing import (
+        get_meter,
+        get_tracer,
+        initialize_tracing,
+        reset_tracing,
+    )
+
+# Exports are resolved lazily: importing ``utils.infra.logging`` (which nearly every
+# module does) must not pull in ``resilience`` -> litellm or the OpenTelemetry SDK.
+_EXPORTS = {
+    "setup_logger": "logging",
+    "RATE_LIMIT_EXCEPTIONS": "resilience",
+    "async_call_with_retry": "resilience",
+    "create_circuit_breaker": "resilience",
+    "create_rate_limit_retry": "resilience",
+    "external_api_retry": "resilience",
+    "is_rate_limit_error": "resilience",
+    "llm_api_retry": "resilience",
+    "log_retry_attempt": "resilience",
+    "ExecutionMetrics": "telemetry",
+    "PerformanceTracker": "telemetry",
+    "SpanPolicy": "telemetry",
+    "configure_span_policy": "telemetry",
+    "configure_telemetry": "telemetry",
+    "optional_span": "telemetry",
+    "get_meter": "tracing",
+    "get_tracer": "tracing",
+    "initialize_tracing": "tracing",
+    "reset_tracing": "tracing",
+}
 
 __all__ = [
     "RATE_LIMIT_EXCEPTIONS",
     "ExecutionMetrics",
     "PerformanceTracker",
+    "SpanPolicy",
     "async_call_with_retry",
+    "configure_span_policy",
     "configure_telemetry",
     "create_circuit_breaker",
     "create_rate_limit_retry",
@@ -55,9 +87,18 @@ __all__ = [
     "get_meter",
     "get_tracer",
     "initialize_tracing",
+    "is_rate_limit_error",
     "llm_api_retry",
     "log_retry_attempt",
     "optional_span",
     "reset_tracing",
     "setup_logger",
 ]
+
+
+def __getattr__(name: str) -> object:
+    """Lazy import for public API."""
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f"{__name__}.{module_name}"), name)
@@ -11,10 +11,16 @@ from __future__ import annotations
 
 import contextvars
 import logging
+from contextlib import nullcontext
 from typing import Any
 
+from agentic_fleet.utils.infra.telemetry import tracing_active
+
 logger = logging.getLogger(__name__)
 
+# Returned by the span helpers while tracing is off (nullcontext is reusable).
+_NULL_SPAN = nullcontext()
+
 # Context variables for request-scoped Langfuse attributes
 _langfuse_trace_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
     "langfuse_trace_id", default=None
@@ -59,7 +65,8 @@ try:
             _langfuse_metadata.set(new_metadata)
         if tags is not None:
             current_tags = _langfuse_tags.get() or []
-            new_tags = [*current_tags, *tags]
+            # Span helpers run once per decision; keep each tag once.
+            new_tags = [*current_tags, *(tag for tag in tags if tag not in current_tags)]
             _langfuse_tags.set(new_tags)
 
     def get_langfuse_context() -> dict[str, Any]:
@@ -140,6 +147,8 @@ try:
         Returns:
             Langfuse span context manager
         """
+        if not tracing_active():
+            return _NULL_SPAN
         span_metadata = {
             "framework": "DSPy",
             "dspy_module": module_name or name.lower(),
@@ -152,9 +161,7 @@ try:
         set_langfuse_context(metadata=span_metadata, tags=["dspy", "reasoning"])
         # Use nullcontext since observe() is a decorator, not a context manager
         # The context is set above and will be picked up by @observe decorators
-        from contextlib import nullcontext
-
-        return nullcontext()
+        return _NULL_SPAN
 
     def create_agent_framework_span(
         name: str,
@@ -174,6 +181,8 @@ try:
         Returns:
             Langfuse span context manager
         """
+        if not tracing_active():
+            return _NULL_SPAN
         span_metadata = {
             "framework": "Microsoft Agent Framework",
             "agent_framework": True,
@@ -194,9 +203,7 @@ try:
         set_langfuse_context(metadata=span_metadata, tags=span_tags)
         # Use nullcontext since observe() is a decorator, not a context manager
         # The context is set above and will be picked up by @observe decorators
-        from contextlib import nullcontext
-
-        return nullcontext()
+        return _NULL_SPAN
 
     def score_trace(
         trace_id: str,
@@ -312,15 +319,11 @@ except ImportError:
 
     def create_dspy_span(*args: Any, **kwargs: Any) -> Any:
         """Placeholder for create_dspy_span when Langfuse is unavailable."""
-        from contextlib import nullcontext
-
-        return nullcontext()
+        return _NULL_SPAN
 
     def create_agent_framework_span(*args: Any, **kwargs: Any) -> Any:
         """Placeholder for create_agent_framework_span when Langfuse is unavailable."""
-        from contextlib import nullcontext
-
-        return nullcontext()
+        return _NULL_SPAN
 
     def score_trace(*args: Any, **kwargs: Any) -> None:
         """Placeholder for score_trace when Langfuse is unavailable."""
@@ -1,11 +1,22 @@
 """
 Logging utilities for the workflow system.
+
+With ``LOG_QUEUE=1`` loggers enqueue records on a bounded queue and a single
+background thread formats and writes them, so slow stdout or file I/O never
+blocks the event loop; records are dropped (and counted) when the queue is full.
 """
 
 from __future__ import annotations
 
+import atexit
+import copy
 import logging
+import os
+import queue
 import sys
+import threading
+from collections.abc import Iterable
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 from pythonjsonlogger import jsonlogger  # type: ignore[import]
@@ -40,7 +51,7 @@ def setup_logger(
         json_format (bool): If True, use JSON-formatted logs. If the environment config `env_config.log_format` equals "json", JSON formatting is forced regardless of this argument.
 
     Returns:
-        logging.Logger: A logger configured with a console handler (and optional file handler), an appropriate formatter (JSON or text), an added request_id filter to ensure `request_id` exists on records, cleared duplicate handlers, and propagation disabled.
+        logging.Logger: A logger configured with a console handler (and optional file handler), an appropriate formatter (JSON or text), an added request_id filter to ensure `request_id` exists on records, cleared duplicate handlers, and propagation disabled. With `env_config.log_queue` set, the handlers sit behind the shared log queue (see `enable_queue_logging`).
     """
     # Check env var for global JSON logging override
     if env_config.log_format == "json":
@@ -86,4 +97,171 @@ def setup_logger(
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
 
+    if env_config.log_queue:
+        enable_queue_logging(logger)
+
     return logger
+
+
+# -----------------------------------------------------------------------------
+# Queue mode
+# -----------------------------------------------------------------------------
+
+
+class _LogQueue:
+    """Bounded record queue drained by one ``QueueListener`` thread.
+
+    Every queued logger gets a ``_DroppingQueueHandler`` tagged with a route
+    (the logger's name); the listener hands each record to the handlers that
+    were registered for its route, so formatting and I/O happen off the
+    request path.
+    """
+
+    def __init__(self) -> None:
+        self.maxsize = 0
+        self.queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        self.routes: dict[str, list[logging.Handler]] = {}
+        self.listener: QueueListener | None = None
+        self.dropped = 0
+        self.reported_dropped = 0
+        self.lock = threading.Lock()
+
+    def configure(self, maxsize: int) -> None:
+        """Size the queue; only takes effect before the listener starts."""
+        if self.listener is None and maxsize != self.maxsize:
+            self.maxsize = max(0, maxsize)
+            self.queue = queue.Queue(self.maxsize)
+
+    def start(self) -> None:
+        with self.lock:
+            if self.listener is None:
+                self.listener = QueueListener(self.queue, _RouteHandler(self))
+                self.listener.start()
+
+    def put(self, record: logging.LogRecord) -> None:
+        if self.listener is None:
+            self.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            with self.lock:
+                self.dropped += 1
+
+    def stop(self) -> None:
+        """Drain the queue and stop the listener thread."""
+        with self.lock:
+            listener, self.listener = self.listener, None
+        if listener is None or listener._thread is None:
+            return
+        # QueueListener.stop() enqueues its sentinel with put_nowait, which
+        # fails on a full queue; wait for the listener to make room instead.
+        self.queue.put(listener._sentinel)  # type: ignore[attr-defined]
+        listener._thread.join()
+        listener._thread = None
+
+    def reset_after_fork(self) -> None:
+        """Give a forked child its own queue; its listener starts on first use."""
+        self.queue = queue.Queue(self.maxsize)
+        self.listener = None
+        self.dropped = 0
+        self.reported_dropped = 0
+        self.lock = threading.Lock()
+
+
+class _RouteHandler(logging.Handler):
+    """Listener-side handler that dispatches records to their route's handlers."""
+
+    def __init__(self, log_queue: _LogQueue) -> None:
+        super().__init__()
+        self._log_queue = log_queue
+
+    def handle(self, record: logging.LogRecord) -> bool:  # type: ignore[override]
+        handlers = self._log_queue.routes.get(getattr(record, "log_route", ""), ())
+        self._report_drops(record, handlers)
+        for handler in handlers:
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def _report_drops(self, record: logging.LogRecord, handlers: Iterable[logging.Handler]) -> None:
+        dropped = self._log_queue.dropped
+        if dropped == self._log_queue.reported_dropped:
+            return
+        skipped = dropped - self._log_queue.reported_dropped
+        self._log_queue.reported_dropped = dropped
+        warning = logging.makeLogRecord(
+            {
+                "name": record.name,
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+                "msg": f"Log queue full: dropped {skipped} record(s) ({dropped} total)",
+                "request_id": None,
+            }
+        )
+        for handler in handlers:
+            handler.handle(warning)
+
+    def emit(self, record: logging.LogRecord) -> None:  # pragma: no cover - handle() overrides
+        self.handle(record)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """Non-blocking ``QueueHandler``: counts and drops records when the queue is full."""
+
+    def __init__(self, log_queue: _LogQueue, route: str) -> None:
+        super().__init__(log_queue.queue)
+        self._log_queue = log_queue
+        self.route = route
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge args now (they may be mutated after the call returns) but leave
+        # formatting (asctime, JSON, tracebacks) to the route's handlers.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.log_route = self.route
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self._log_queue.put(record)
+
+
+_log_queue = _LogQueue()
+atexit.register(_log_queue.stop)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_log_queue.reset_after_fork)
+
+
+def enable_queue_logging(logger: logging.Logger, maxsize: int | None = None) -> None:
+    """Move ``logger``'s handlers behind the shared non-blocking log queue.
+
+    Records are enqueued on the calling thread and written by a background
+    listener; when ``maxsize`` records are already waiting, new ones are
+    dropped and counted (see ``get_log_queue_stats``) instead of blocking.
+    ``maxsize`` defaults to ``LOG_QUEUE_SIZE`` and is fixed once the listener
+    has started. Calling this again for the same logger is a no-op.
+    """
+    _log_queue.configure(env_config.log_queue_size if maxsize is None else maxsize)
+    handlers = [h for h in logger.handlers if not isinstance(h, _DroppingQueueHandler)]
+    if not handlers:
+        return
+    route = logger.name
+    _log_queue.routes[route] = handlers
+    queue_handler = _DroppingQueueHandler(_log_queue, route)
+    queue_handler.addFilter(_EnsureRequestIdFilter())
+    logger.handlers = [queue_handler]
+    _log_queue.start()
+
+
+def get_log_queue_stats() -> dict[str, int]:
+    """Records waiting, dropped since startup, and capacity of the log queue."""
+    return {
+        "queued": _log_queue.queue.qsize(),
+        "dropped": _log_queue.dropped,
+        "capacity": _log_queue.maxsize,
+    }
+
+
+def stop_queue_logging() -> None:
+    """Flush queued records and stop the listener (also runs at exit)."""
+    _log_queue.stop()
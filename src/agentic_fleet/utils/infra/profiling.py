@@ -277,3 +277,29 @@ def get_process_rss_mb(pid: int | None = None) -> float:
         >>> print(f"Memory usage: {mem_mb:.2f} MB")
     """
     return get_process_rss_bytes(pid) / (1024 * 1024)
+
+
+def get_process_memory_breakdown_mb(pid: int | None = None) -> dict[str, float]:
+    """Return RSS, PSS, USS and shared memory in MB for the given PID (or current process).
+
+    RSS counts shared pages in full for every process mapping them. PSS splits
+    them evenly between those processes and USS counts only private pages, so
+    these are the numbers to compare for workers that share memory
+    copy-on-write. PSS and USS are only available on Linux; elsewhere they are
+    reported as 0.0.
+
+    Args:
+        pid: Optional process ID. If None, uses current process.
+
+    Returns:
+        Dictionary with ``rss``, ``pss``, ``uss`` and ``shared`` in megabytes
+    """
+    process = psutil.Process(pid or os.getpid())
+    try:
+        info = process.memory_full_info()
+    except (psutil.AccessDenied, NotImplementedError):
+        info = process.memory_info()
+    return {
+        name: float(getattr(info, name, 0)) / (1024 * 1024)
+        for name in ("rss", "pss", "uss", "shared")
+    }
@@ -50,6 +50,14 @@ def _get_rate_limit_exceptions() -> tuple[type[Exception], ...]:
 RATE_LIMIT_EXCEPTIONS = _get_rate_limit_exceptions()
 
 
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Whether ``exc`` is a provider rate-limit error (or carries HTTP status 429)."""
+    if getattr(exc, "status_code", None) == 429:
+        return True
+    # Without a provider SDK the fallback tuple is (Exception,), which matches everything.
+    return Exception not in RATE_LIMIT_EXCEPTIONS and isinstance(exc, RATE_LIMIT_EXCEPTIONS)
+
+
 def log_retry_attempt(retry_state: RetryCallState) -> None:
     """Log retry attempts."""
     if retry_state.outcome and retry_state.outcome.failed:
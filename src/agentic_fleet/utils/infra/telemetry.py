@@ -1,20 +1,25 @@
 """Telemetry utilities for performance tracking and tracing.
 
 Provides:
-- optional_span: Lightweight span context manager for tracing
+- optional_span: Span context manager that is a shared no-op while tracing is
+  off, with cached tracers, per-family head sampling and attribute truncation
+  (configured through ``SpanPolicy``) when it is on
 - PerformanceTracker: Track and analyze agent execution metrics
-- MLflow integration utilities for DSPy + agent-framework observability
+- configure_telemetry: Minimal OpenTelemetry provider setup
 
-Replace with real OpenTelemetry integration when ENABLE_OTEL=true.
+Tracing is switched on by ``utils.infra.tracing.initialize_tracing``.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import random
+import sys
 import time
 from collections import defaultdict
-from collections.abc import Iterator
-from contextlib import contextmanager
+from collections.abc import Iterable
+from contextlib import AbstractContextManager
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -145,34 +150,210 @@ class PerformanceTracker:
         return sorted(bottlenecks, key=lambda x: x["duration"], reverse=True)
 
 
-@contextmanager
+class SpanPolicy:
+    """How ``optional_span`` records spans.
+
+    Args:
+        enabled: Force tracing on or off. ``None`` (default) means "on when a
+            real OpenTelemetry tracer provider is installed".
+        sample_rates: Head-based sampling rate (0.0-1.0) per span family. The
+            family is the ``family`` argument of ``optional_span`` or the span
+            name up to the first dot (``DSPyReasoner.route_task`` ->
+            ``DSPyReasoner``); ``"default"`` applies to unlisted families.
+        max_attribute_length: String attributes longer than this are truncated;
+            ``<key>.sha256`` and ``<key>.length`` are added so that spans for
+            the same value can still be correlated.
+        hash_attributes: Attribute keys whose values are always replaced by
+            their hash (e.g. ``task`` to keep user input out of traces).
+    """
+
+    __slots__ = ("enabled", "hash_attributes", "max_attribute_length", "sample_rates")
+
+    def __init__(
+        self,
+        *,
+        enabled: bool | None = None,
+        sample_rates: dict[str, float] | None = None,
+        max_attribute_length: int = 512,
+        hash_attributes: Iterable[str] = (),
+    ) -> None:
+        self.enabled = enabled
+        self.sample_rates = {
+            family: min(1.0, max(0.0, float(rate))) for family, rate in (sample_rates or {}).items()
+        }
+        self.max_attribute_length = max(16, int(max_attribute_length))
+        self.hash_attributes = frozenset(hash_attributes)
+
+    @classmethod
+    def from_config(cls, tracing_config: dict[str, Any]) -> SpanPolicy:
+        """Build from the ``tracing`` section of ``workflow_config.yaml``."""
+        return cls(
+            sample_rates=tracing_config.get("sample_rates") or {},
+            max_attribute_length=tracing_config.get("max_attribute_length") or 512,
+            hash_attributes=tracing_config.get("hash_attributes") or (),
+        )
+
+    def sample_rate(self, family: str) -> float:
+        """Sampling rate for a span family."""
+        return self.sample_rates.get(family, self.sample_rates.get("default", 1.0))
+
+
+class _NoopSpan:
+    """Context manager used when tracing is off; yields ``None`` like a missing span."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+_policy = SpanPolicy()
+_active: bool | None = None
+_tracers: dict[str, Any] = {}
+
+
+def configure_span_policy(policy: SpanPolicy | None = None) -> None:
+    """Install ``policy`` (default: a fresh ``SpanPolicy``) and re-detect tracing.
+
+    Call after installing or replacing a tracer provider; ``initialize_tracing``
+    does so itself.
+    """
+    global _policy, _active
+    _policy = policy or SpanPolicy()
+    _active = None
+    _tracers.clear()
+
+
+def get_span_policy() -> SpanPolicy:
+    """Return the active span policy."""
+    return _policy
+
+
+def tracing_active() -> bool:
+    """True when spans would be exported; cached until the policy is reconfigured."""
+    global _active
+    if _active is None:
+        _active = _detect_tracing()
+    return _active
+
+
+def _detect_tracing() -> bool:
+    if _policy.enabled is not None:
+        return _policy.enabled
+    # Only a module that imported OpenTelemetry can have installed a provider.
+    trace = sys.modules.get("opentelemetry.trace")
+    if trace is None:
+        return False
+    provider = trace.get_tracer_provider()
+    return not isinstance(provider, trace.ProxyTracerProvider | trace.NoOpTracerProvider)
+
+
+def _get_tracer(name: str) -> Any:
+    tracer = _tracers.get(name)
+    if tracer is None:
+        from opentelemetry import trace
+
+        tracer = _tracers[name] = trace.get_tracer(name)
+    return tracer
+
+
+def _attribute_digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8", "replace")).hexdigest()[:16]
+
+
+def prepare_span_attributes(
+    attributes: dict[str, Any], policy: SpanPolicy | None = None
+) -> dict[str, Any]:
+    """Apply the policy's truncation and hashing to span attributes.
+
+    Values that OpenTelemetry cannot store (dicts, objects) are converted to
+    strings first.
+    """
+    policy = policy or _policy
+    limit = policy.max_attribute_length
+    prepared: dict[str, Any] = {}
+    for key, value in attributes.items():
+        if value is None:
+            continue
+        if not isinstance(value, str | bool | int | float):
+            if isinstance(value, list | tuple) and all(
+                isinstance(item, str | bool | int | float) for item in value
+            ):
+                prepared[key] = list(value)
+                continue
+            value = str(value)
+        if isinstance(value, str):
+            if key in policy.hash_attributes:
+                prepared[f"{key}.sha256"] = _attribute_digest(value)
+                prepared[f"{key}.length"] = len(value)
+                continue
+            if len(value) > limit:
+                prepared[f"{key}.sha256"] = _attribute_digest(value)
+                prepared[f"{key}.length"] = len(value)
+                value = value[: limit - 1] + "\u2026"
+        prepared[key] = value
+    return prepared
+
+
+def _sampled_out_span() -> Any:
+    """Make a non-sampled current span so that child spans are dropped too."""
+    from opentelemetry import trace
+
+    parent = trace.get_current_span().get_span_context()
+    context = trace.SpanContext(
+        trace_id=parent.trace_id if parent.is_valid else random.getrandbits(128),
+        span_id=random.getrandbits(64),
+        is_remote=False,
+        trace_flags=trace.TraceFlags(trace.TraceFlags.DEFAULT),
+    )
+    return trace.use_span(trace.NonRecordingSpan(context), end_on_exit=False)
+
+
 def optional_span(
     name: str,
     tracer_name: str | None = None,
     attributes: dict[str, Any] | None = None,
-) -> Iterator[Any]:
-    """Yield a span if OpenTelemetry is available and configured.
+    *,
+    family: str | None = None,
+) -> AbstractContextManager[Any]:
+    """Return a span context manager if OpenTelemetry tracing is configured.
+
+    When tracing is off this returns a shared no-op context manager (yielding
+    ``None``) without importing OpenTelemetry or touching ``attributes``. When
+    it is on, tracers are cached per name, the span is head-sampled per
+    family (see ``SpanPolicy``), and attributes are truncated or hashed.
+    Inside a span that was sampled out, nested spans are dropped as well.
 
     Args:
         name: Logical name of the traced operation.
         tracer_name: Name of tracer (defaults to module name).
         attributes: Optional mapping of attributes.
+        family: Sampling family (defaults to ``name`` up to the first dot).
     """
-    span_cm = None
+    if not tracing_active():
+        return _NOOP_SPAN
     try:
         from opentelemetry import trace
 
-        tracer = trace.get_tracer(tracer_name or __name__)
-        span_cm = tracer.start_as_current_span(name, attributes=attributes)
+        parent = trace.get_current_span().get_span_context()
+        if parent.is_valid and not parent.trace_flags.sampled:
+            return _NOOP_SPAN
+
+        policy = _policy
+        rate = policy.sample_rate(family or name.partition(".")[0])
+        if rate < 1.0 and (rate <= 0.0 or random.random() >= rate):
+            return _sampled_out_span()
+
+        return _get_tracer(tracer_name or __name__).start_as_current_span(
+            name, attributes=prepare_span_attributes(attributes, policy) if attributes else None
+        )
     except (ImportError, AttributeError):
         # OpenTelemetry not installed or tracing failed to init
-        pass
-
-    if span_cm:
-        with span_cm as span:
-            yield span
-    else:
-        yield None
+        return _NOOP_SPAN
 
 
 def configure_telemetry(
@@ -206,6 +387,7 @@ def configure_telemetry(
             logger.info("Configuring Azure Monitor OpenTelemetry...")
             configure_azure_monitor(connection_string=connection_string)
             # The distro configures the global provider automatically
+            configure_span_policy(_policy)
             return
 
         # accessible fallback: generic OTel SDK
@@ -216,6 +398,7 @@ def configure_telemetry(
             provider.add_span_processor(processor)
 
         trace.set_tracer_provider(provider)
+        configure_span_policy(_policy)
 
         # Log successful init
         logger = logging.getLogger(__name__)
@@ -232,4 +415,14 @@ def configure_telemetry(
         logger.error(f"Failed to configure telemetry: {e}")
 
 
-__all__ = ["ExecutionMetrics", "PerformanceTracker", "configure_telemetry", "optional_span"]
+__all__ = [
+    "ExecutionMetrics",
+    "PerformanceTracker",
+    "SpanPolicy",
+    "configure_span_policy",
+    "configure_telemetry",
+    "get_span_policy",
+    "optional_span",
+    "prepare_span_attributes",
+    "tracing_active",
+]
@@ -36,6 +36,12 @@ import logging
 import os
 from typing import Any
 
+from agentic_fleet.utils.infra.telemetry import (
+    SpanPolicy,
+    configure_span_policy,
+    get_span_policy,
+)
+
 logger = logging.getLogger(__name__)
 
 _INITIALIZED = False
@@ -84,11 +90,14 @@ def initialize_tracing(config: dict[str, Any] | None = None) -> bool:
         bool indicating whether tracing was successfully initialized/enabled.
     """
     global _INITIALIZED
+    cfg_tracing = (config or {}).get("tracing", {}) if isinstance(config, dict) else {}
+    if isinstance(cfg_tracing, dict) and cfg_tracing:
+        # Sampling and attribute limits apply even when tracing was already set up.
+        configure_span_policy(SpanPolicy.from_config(cfg_tracing))
+
     if _INITIALIZED:
         return True
 
-    cfg_tracing = (config or {}).get("tracing", {}) if isinstance(config, dict) else {}
-
     # Explicit opt-out via env wins (even if other toggles are on)
     if "TRACING_ENABLED" in os.environ and not _env_bool("TRACING_ENABLED", False):
         logger.debug("Tracing explicitly disabled via TRACING_ENABLED env")
@@ -206,6 +215,8 @@ def initialize_tracing(config: dict[str, Any] | None = None) -> bool:
         if otlp_http_endpoint:
             _add_http_exporter(otlp_http_endpoint)
 
+        # Re-detect the tracer provider so optional_span stops being a no-op.
+        configure_span_policy(get_span_policy())
         return True
 
     except ImportError as e:
@@ -257,6 +268,7 @@ def initialize_tracing(config: dict[str, Any] | None = None) -> bool:
 
         if exporters_added:
             trace.set_tracer_provider(provider)
+            configure_span_policy(get_span_policy())
             logger.info(
                 "Tracing initialized with manual OpenTelemetry fallback → %s",
                 ", ".join(exporters_added),
@@ -306,6 +318,7 @@ def reset_tracing() -> None:
     """
     global _INITIALIZED
     _INITIALIZED = False
+    configure_span_policy()
 
 
 def get_tracer(name: str = "agentic_fleet") -> Any:
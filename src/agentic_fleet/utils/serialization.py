@@ -105,6 +105,30 @@ def load_jsonl(
     return list(executions)
 
 
+def read_complete_jsonl(file_path: Path, offset: int = 0) -> bytes:
+    """Read a JSONL file from ``offset`` up to its last newline, truncating a torn tail.
+
+    A line without its trailing newline was interrupted mid-write; it is cut
+    from the file so later appends start on a fresh line and stay valid JSONL.
+
+    Args:
+        file_path: Path to an append-only JSONL file
+        offset: Byte offset (at a line boundary) to start reading from
+
+    Returns:
+        The complete lines from ``offset`` on, as raw bytes
+    """
+    if not file_path.exists():
+        return b""
+    with file_path.open("r+b") as f:
+        f.seek(offset)
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            data = data[: data.rfind(b"\n") + 1]
+            f.truncate(offset + len(data))
+    return data
+
+
 def save_json(file_path: Path, data: Any, indent: int = 2) -> None:
     """Save data to JSON file with error handling.
 
@@ -1,4 +1,4 @@
-"""Storage submodule: Cosmos DB, persistence, history, and job stores.
+"""Storage submodule: Cosmos DB, persistence, history, job, shared state and SQLite helpers.
 
 This submodule provides an organized interface to storage-related
 utilities. All exports are backward-compatible with direct imports from
@@ -26,12 +26,21 @@ from .cosmos import (
     save_agent_memory_item,
 )
 from .history import HistoryManager
-from .job_store import InMemoryJobStore, JobStore
+from .job_store import InMemoryJobStore, JobStore, SQLiteJobStore
 from .persistence import (
     ConversationPersistenceService,
     DatabaseManager,
     PersistenceSettings,
 )
+from .shared_state import (
+    InMemorySharedState,
+    RedisSharedState,
+    SharedStateBackend,
+    SharedStateError,
+    SQLiteSharedState,
+    create_shared_state,
+)
+from .sqlite import open_sqlite
 
 __all__ = [
     "ConversationPersistenceService",
@@ -39,8 +48,15 @@ __all__ = [
     "DatabaseManager",
     "HistoryManager",
     "InMemoryJobStore",
+    "InMemorySharedState",
     "JobStore",
     "PersistenceSettings",
+    "RedisSharedState",
+    "SQLiteJobStore",
+    "SQLiteSharedState",
+    "SharedStateBackend",
+    "SharedStateError",
+    "create_shared_state",
     "get_default_user_id",
     "get_execution",
     "is_cosmos_enabled",
@@ -48,6 +64,7 @@ __all__ = [
     "mirror_cache_entry",
     "mirror_dspy_examples",
     "mirror_execution_history",
+    "open_sqlite",
     "query_agent_memory",
     "record_dspy_optimization_run",
     "save_agent_memory_item",
@@ -5,11 +5,16 @@ History management utilities for execution history.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import fcntl
 import json
 import logging
+import threading
 from collections import OrderedDict
+from collections.abc import Iterator
+from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import aiofiles
 
@@ -17,6 +22,9 @@ from agentic_fleet.utils.cfg import DEFAULT_HISTORY_PATH
 from agentic_fleet.utils.models import RoutingDecision
 from agentic_fleet.workflows.exceptions import HistoryError
 
+if TYPE_CHECKING:
+    from .history_columns import HistoryColumns, HistoryColumnStore
+
 logger = logging.getLogger(__name__)
 
 # Track background tasks to satisfy Ruff RUF006 and prevent premature GC of tasks.
@@ -40,7 +48,11 @@ class HistoryManager:
     """Manages execution history storage and retrieval."""
 
     def __init__(
-        self, history_format: str = "jsonl", max_entries: int | None = None, index_size: int = 1000
+        self,
+        history_format: str = "jsonl",
+        max_entries: int | None = None,
+        index_size: int = 1000,
+        compact_every: int = 1000,
     ):
         """
         Initialize history manager.
@@ -49,6 +61,7 @@ class HistoryManager:
             history_format: Format to use ("jsonl" or "json")
             max_entries: Maximum number of entries to keep (None for unlimited)
             index_size: Maximum number of recent executions to keep in memory index
+            compact_every: Pending logged patches that trigger a compaction
         """
         self.history_format = history_format
         self.max_entries = max_entries
@@ -59,6 +72,13 @@ class HistoryManager:
         # Using OrderedDict for true O(1) LRU operations (move_to_end is O(1))
         self._recent_executions_index: OrderedDict[str, dict[str, Any]] = OrderedDict()
         self._index_size_limit = index_size
+        self._column_store: HistoryColumnStore | None = None
+
+        # Write-behind patch log (see update_executions)
+        self.compact_every = max(1, compact_every)
+        self._patch_lock = threading.Lock()
+        self._pending_patch_lines: int | None = None
+        self._patch_cache: tuple[Any, dict[str, dict[str, Any]]] | None = None
 
         # Warn about JSON format performance implications
         if history_format == "json":
@@ -366,6 +386,7 @@ class HistoryManager:
                         try:
                             entry = json.loads(line)
                             if entry.get("workflowId") == workflow_id:
+                                self._apply_pending_patches([entry])
                                 # Add to index for future lookups
                                 self._update_index(entry)
                                 return entry
@@ -391,61 +412,73 @@ class HistoryManager:
         return None
 
     def update_execution(self, workflow_id: str, patch: dict[str, Any]) -> bool:
-        """Update a specific execution record in-place (best-effort).
+        """Update a specific execution record (best-effort).
 
-        For JSONL history, this rewrites the file to preserve ordering.
-        For JSON history, this rewrites the JSON list.
+        See ``update_executions``; for JSONL history this is one append to the
+        patch log.
 
         Returns:
-            True if an execution was updated, False if not found.
+            True if the patch was recorded (JSONL) or an execution was updated (JSON).
         """
         if not workflow_id:
             return False
+        return bool(self.update_executions({workflow_id: patch}))
+
+    def update_executions(self, patches: dict[str, dict[str, Any]]) -> int:
+        """Apply many per-workflow patches.
+
+        For JSONL history, patches are appended to a write-behind patch log
+        (``execution_history.patches.jsonl``) instead of rewriting the history
+        file. Reads apply pending patches, and ``compact_history`` folds them
+        into the history file once ``compact_every`` patches are pending.
+        JSON history is rewritten directly.
+
+        Args:
+            patches: Patch to merge into each execution, keyed by workflow ID
+
+        Returns:
+            Number of patches recorded (JSONL) or executions updated (JSON).
+        """
+        patches = {wid: patch for wid, patch in patches.items() if wid}
+        if not patches:
+            return 0
 
         # Update in-memory index if present
-        if workflow_id in self._recent_executions_index:
-            existing = self._recent_executions_index[workflow_id]
-            existing.update(patch)
-            self._recent_executions_index[workflow_id] = existing
-            self._recent_executions_index.move_to_end(workflow_id)
+        for workflow_id, patch in patches.items():
+            if workflow_id in self._recent_executions_index:
+                self._recent_executions_index[workflow_id].update(patch)
+                self._recent_executions_index.move_to_end(workflow_id)
 
         jsonl_file = self.history_dir / "execution_history.jsonl"
         if jsonl_file.exists():
             try:
-                updated = False
-                tmp_path = self.history_dir / "execution_history.jsonl.tmp"
-                with open(jsonl_file) as src, open(tmp_path, "w") as dst:
-                    for line in src:
-                        if not line.strip():
-                            dst.write(line)
-                            continue
-                        try:
-                            obj = json.loads(line)
-                        except json.JSONDecodeError:
-                            dst.write(line)
-                            continue
-                        if obj.get("workflowId") == workflow_id:
-                            obj.update(patch)
-                            updated = True
-                            dst.write(json.dumps(obj, cls=FleetJSONEncoder) + "\n")
-                        else:
-                            dst.write(json.dumps(obj, cls=FleetJSONEncoder) + "\n")
-                tmp_path.replace(jsonl_file)
-                return updated
+                lines = "".join(
+                    json.dumps({"workflowId": wid, "patch": patch}, cls=FleetJSONEncoder) + "\n"
+                    for wid, patch in patches.items()
+                )
+                with self._patch_log_locked():
+                    pending = self._count_pending_patches()
+                    patch_log, _ = self._patch_log_files()
+                    with open(patch_log, "a") as f:
+                        f.write(lines)
+                    self._pending_patch_lines = pending = pending + len(patches)
+                if pending >= self.compact_every:
+                    self.compact_history()
+                return len(patches)
             except Exception as e:
-                logger.warning("Failed to update JSONL history: %s", e)  # nosec B608
+                logger.warning("Failed to log JSONL history patches: %s", e)  # nosec B608
 
         json_file = self.history_dir / "execution_history.json"
         if json_file.exists():
             try:
                 with open(json_file) as f:
                     entries = json.load(f)
-                updated = False
+                updated = 0
                 for entry in entries if isinstance(entries, list) else []:
-                    if entry.get("workflowId") == workflow_id:
+                    patch = patches.get(entry.get("workflowId"))
+                    if patch is not None:
                         entry.update(patch)
-                        updated = True
-                        break
+                        updated += 1
                 if updated:
                     with open(json_file, "w") as f:
                         json.dump(entries, f, indent=2, cls=FleetJSONEncoder)
@@ -453,7 +486,140 @@ class HistoryManager:
             except Exception as e:
                 logger.warning("Failed to update JSON history: %s", e)  # nosec B608
 
-        return False
+        return 0
+
+    def compact_history(self) -> int:
+        """
+        Fold logged patches into the JSONL history file with a single rewrite.
+
+        The patch log is renamed before it is read, so patches logged during
+        compaction land in a fresh log. If compaction fails, the renamed log is
+        kept, still applied on read, and retried by the next compaction. Appends
+        and compactions hold the patch-log lock (see ``_patch_log_locked``), so
+        processes sharing the history directory do not interleave them.
+
+        Returns:
+            Number of executions updated.
+        """
+        jsonl_file = self.history_dir / "execution_history.jsonl"
+        with self._patch_log_locked():
+            patch_log, folding = self._patch_log_files()
+            try:
+                if patch_log.exists():
+                    if folding.exists():  # left over from a failed compaction
+                        with open(folding, "a") as dst, open(patch_log) as src:
+                            dst.write(src.read())
+                        patch_log.unlink()
+                    else:
+                        patch_log.replace(folding)
+                if not folding.exists():
+                    return 0
+
+                patches = self._read_patch_files(folding)
+                updated = 0
+                if patches and jsonl_file.exists():
+                    updated = self._rewrite_jsonl(jsonl_file, patches)
+                folding.unlink()
+                self._pending_patch_lines = 0
+            except Exception as e:
+                logger.warning("Failed to compact JSONL history: %s", e)  # nosec B608
+                return 0
+        logger.debug("Compacted %d patches into %s", len(patches), jsonl_file)
+        return updated
+
+    def _rewrite_jsonl(self, jsonl_file: Path, patches: dict[str, dict[str, Any]]) -> int:
+        """Rewrite the JSONL history through a temp file with ``patches`` merged in."""
+        updated = 0
+        tmp_path = self.history_dir / "execution_history.jsonl.tmp"
+        with open(jsonl_file) as src, open(tmp_path, "w") as dst:
+            for line in src:
+                if not line.strip():
+                    dst.write(line)
+                    continue
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError:
+                    dst.write(line)
+                    continue
+                patch = patches.get(obj.get("workflowId"))
+                if patch is not None:
+                    obj.update(patch)
+                    updated += 1
+                dst.write(json.dumps(obj, cls=FleetJSONEncoder) + "\n")
+        tmp_path.replace(jsonl_file)
+        return updated
+
+    @contextlib.contextmanager
+    def _patch_log_locked(self) -> Iterator[None]:
+        """Hold the patch lock and an exclusive ``flock`` shared with other processes.
+
+        The ``flock`` is on a separate lock file, as compaction renames the
+        patch log itself.
+        """
+        with (
+            self._patch_lock,
+            open(self.history_dir / "execution_history.patches.lock", "ab") as lock_file,
+        ):
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    def _patch_log_files(self) -> tuple[Path, Path]:
+        """The live patch log and the one being compacted."""
+        patch_log = self.history_dir / "execution_history.patches.jsonl"
+        return patch_log, patch_log.with_suffix(".compacting")
+
+    def _count_pending_patches(self) -> int:
+        if self._pending_patch_lines is None:
+            count = 0
+            for path in self._patch_log_files():
+                if path.exists():
+                    with open(path, "rb") as f:
+                        count += sum(1 for _ in f)
+            self._pending_patch_lines = count
+        return self._pending_patch_lines
+
+    @staticmethod
+    def _read_patch_files(*paths: Path) -> dict[str, dict[str, Any]]:
+        """Merge logged patches in order into one patch per workflow ID."""
+        merged: dict[str, dict[str, Any]] = {}
+        for path in paths:
+            if not path.exists():
+                continue
+            with open(path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                        workflow_id, patch = entry["workflowId"], entry["patch"]
+                    except (json.JSONDecodeError, KeyError, TypeError):
+                        continue  # torn write
+                    merged.setdefault(workflow_id, {}).update(patch)
+        return merged
+
+    def _pending_patches(self) -> dict[str, dict[str, Any]]:
+        """Logged patches not yet compacted, re-read only when the logs change."""
+        files = self._patch_log_files()
+        signature = []
+        for path in files:
+            try:
+                stat = path.stat()
+                signature.append((stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                signature.append(None)
+        if self._patch_cache is None or self._patch_cache[0] != signature:
+            patches = self._read_patch_files(*reversed(files)) if any(signature) else {}
+            self._patch_cache = (signature, patches)
+        return self._patch_cache[1]
+
+    def _apply_pending_patches(self, executions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Merge pending logged patches into executions read from the JSONL file."""
+        patches = self._pending_patches()
+        if patches:
+            for execution in executions:
+                workflow_id = execution.get("workflowId")
+                patch = patches.get(workflow_id) if isinstance(workflow_id, str) else None
+                if patch is not None:
+                    execution.update(patch)
+        return executions
 
     def delete_execution(self, workflow_id: str) -> bool:
         """
@@ -566,7 +732,7 @@ class HistoryManager:
                             except json.JSONDecodeError:
                                 continue
                 # Return newest first
-                result = list(executions)
+                result = self._apply_pending_patches(list(executions))
                 result.reverse()
                 return result
             except Exception as e:
@@ -612,7 +778,7 @@ class HistoryManager:
         jsonl_file = self.history_dir / "execution_history.jsonl"
         if jsonl_file.exists():
             try:
-                return self._load_jsonl(jsonl_file, limit)
+                return self._apply_pending_patches(self._load_jsonl(jsonl_file, limit))
             except Exception as e:
                 logger.warning(f"Failed to load JSONL history: {e}")
 
@@ -666,8 +832,49 @@ class HistoryManager:
                 jsonl_file.unlink()
             if json_file.exists():
                 json_file.unlink()
+            with self._patch_log_locked():
+                for path in self._patch_log_files():
+                    path.unlink(missing_ok=True)
+                self._pending_patch_lines = 0
             logger.info("Execution history cleared")
 
+    def load_columns(self, since: float | datetime | None = None) -> HistoryColumns:
+        """
+        Load the fields analytics need (timings, mode, agents, quality, tokens) as columns.
+
+        JSONL history is read through an incremental on-disk column cache
+        (see ``history_columns``), so only executions appended since the last
+        call are parsed. Other sources are converted in memory.
+
+        Args:
+            since: Only executions started at or after this time (epoch seconds or datetime)
+
+        Returns:
+            HistoryColumns with one row per execution, oldest first
+        """
+        from .history_columns import HistoryColumns, HistoryColumnStore
+
+        jsonl_file = self.history_dir / "execution_history.jsonl"
+        try:
+            from .cosmos import is_cosmos_enabled
+
+            use_cache = jsonl_file.exists() and not is_cosmos_enabled()
+        except Exception:
+            use_cache = jsonl_file.exists()
+
+        if use_cache:
+            if self._column_store is None or self._column_store.history_file != jsonl_file:
+                self._column_store = HistoryColumnStore(jsonl_file)
+            try:
+                return self._column_store.load(since, patches=self._pending_patches())
+            except Exception as e:
+                logger.warning(f"Failed to load history column cache: {e}")
+
+        columns = HistoryColumns.from_executions(self.load_history())
+        if since is None:
+            return columns
+        return columns.since(since.timestamp() if isinstance(since, datetime) else since)
+
     def get_history_stats(self) -> dict[str, Any]:
         """
         Get statistics about execution history.
@@ -675,25 +882,20 @@ class HistoryManager:
         Returns:
             Dictionary with statistics
         """
-        executions = self.load_history()
-        if not executions:
+        import numpy as np
+
+        columns = self.load_columns()
+        if not len(columns):
             return {"total_executions": 0}
 
-        total_time = sum(
-            e.get("total_time_seconds", 0) for e in executions if "total_time_seconds" in e
-        )
-        quality_entries = [e for e in executions if "quality" in e]
-        avg_quality = (
-            sum(e.get("quality", {}).get("score", 0) for e in quality_entries)
-            / len(quality_entries)
-            if quality_entries
-            else 0
-        )
+        total_time = float(np.nansum(columns["total_time_seconds"]))
+        scores = columns["quality_score"]
+        scores = scores[~np.isnan(scores)]
 
         return {
-            "total_executions": len(executions),
+            "total_executions": len(columns),
             "total_time_seconds": total_time,
-            "average_time_seconds": total_time / len(executions) if executions else 0,
-            "average_quality_score": avg_quality,
+            "average_time_seconds": total_time / len(columns),
+            "average_quality_score": float(scores.mean()) if len(scores) else 0,
             "format": self.history_format,
         }
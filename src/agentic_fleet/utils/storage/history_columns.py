@@ -0,0 +1,526 @@
+"""Columnar cache of execution history for analytics.
+
+Aggregating ``execution_history.jsonl`` by loading every record as a dict is
+slow and memory-hungry on large histories. ``HistoryColumnStore`` keeps the
+fields that analytics need in NumPy segment files next to the history file:
+
+- Timestamp, total time, per-phase timings, quality score and token count
+  (``float64``; ``NaN`` when a record lacks the field).
+- Routing mode (``int32`` codes) and assigned agents (codes plus a per-row
+  count), with the code vocabularies in the manifest.
+- Workflow IDs and the byte offset of each record's line.
+
+Segments hold up to ``segment_rows`` rows in file order; the manifest records
+each segment's timestamp range, so a ``since`` filter only opens segments
+that can contain matching rows. ``refresh`` parses only the bytes appended to
+the history file since the previous refresh. If the file was rewritten
+(rotation, deletion, compaction), the cache is rebuilt from scratch. Refreshes
+hold an ``flock`` on a lock file in the cache directory, so API worker
+processes sharing the cache do not extend it concurrently.
+
+Patches that ``HistoryManager`` has logged but not yet folded into the file
+are passed to ``load``. Only the patched records are re-read (by offset) and
+re-extracted, so the cache itself never goes stale.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import logging
+import math
+import os
+import tempfile
+import threading
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2
+
+NUMERIC_COLUMNS = (
+    "timestamp",
+    "total_time_seconds",
+    "analysis_seconds",
+    "routing_seconds",
+    "execution_seconds",
+    "progress_seconds",
+    "quality_seconds",
+    "quality_score",
+    "total_tokens",
+)
+"""Float columns; ``timestamp`` is seconds since the epoch."""
+
+# Bytes hashed at the start of the file and before the consumed offset to
+# detect rewrites.
+_PROBE_BYTES = 4096
+
+
+def _number(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, int | float):
+        return math.nan
+    return float(value)
+
+
+def _timestamp(execution: dict[str, Any]) -> float:
+    for key in ("start_time", "timestamp", "end_time"):
+        value = execution.get(key)
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value).timestamp()
+            except ValueError:
+                continue
+    return math.nan
+
+
+def _total_tokens(execution: dict[str, Any]) -> float:
+    metadata = execution.get("metadata")
+    usage = metadata.get("usage") if isinstance(metadata, dict) else None
+    if not isinstance(usage, dict):
+        usage = execution.get("usage")
+    if not isinstance(usage, dict):
+        return math.nan
+    if usage.get("total_tokens") is not None:
+        return _number(usage["total_tokens"])
+    parts = [
+        _number(usage.get(key))
+        for key in ("prompt_tokens", "completion_tokens", "input_tokens", "output_tokens")
+    ]
+    counted = [p for p in parts if not math.isnan(p)]
+    return sum(counted) if counted else math.nan
+
+
+def extract_row(execution: dict[str, Any]) -> dict[str, Any]:
+    """Pull the cached fields out of one history record.
+
+    Phase timings come from the legacy per-phase fields
+    (``routing.routing_time_seconds`` etc.) or from ``phase_timings``.
+    """
+
+    def section(key: str) -> dict[str, Any]:
+        value = execution.get(key)
+        return value if isinstance(value, dict) else {}
+
+    routing, quality, analysis = section("routing"), section("quality"), section("dspy_analysis")
+    timings = section("phase_timings")
+
+    def phase(legacy: float, name: str) -> float:
+        return legacy if not math.isnan(legacy) else _number(timings.get(name))
+
+    agents = routing.get("assigned_to")
+    mode = routing.get("mode")
+    return {
+        "timestamp": _timestamp(execution),
+        "total_time_seconds": _number(execution.get("total_time_seconds")),
+        "analysis_seconds": phase(_number(analysis.get("analysis_time_seconds")), "analysis"),
+        "routing_seconds": phase(_number(routing.get("routing_time_seconds")), "routing"),
+        "execution_seconds": _number(timings.get("execution")),
+        "progress_seconds": _number(timings.get("progress")),
+        "quality_seconds": phase(_number(quality.get("quality_time_seconds")), "quality"),
+        "quality_score": _number(quality.get("score")),
+        "total_tokens": _total_tokens(execution),
+        "mode": mode if isinstance(mode, str) else None,
+        "agents": [a for a in agents if isinstance(a, str)] if isinstance(agents, list) else [],
+        "workflow_id": str(execution.get("workflowId") or ""),
+    }
+
+
+@dataclass(slots=True)
+class HistoryColumns:
+    """Cached history fields as arrays, one row per execution in file order.
+
+    ``agent_codes`` holds the assigned agents of all rows back to back;
+    ``columns["agent_count"]`` says how many belong to each row.
+    """
+
+    columns: dict[str, np.ndarray]
+    agent_codes: np.ndarray
+    modes: list[str]
+    agents: list[str]
+
+    def __len__(self) -> int:
+        return len(self.columns["workflow_id"])
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.columns[name]
+
+    @classmethod
+    def from_executions(cls, executions: Iterable[dict[str, Any]]) -> HistoryColumns:
+        """Build columns in memory, e.g. for JSON-format or Cosmos history."""
+        builder = _SegmentBuilder([], [])
+        for execution in executions:
+            builder.add(extract_row(execution))
+        columns, agent_codes = builder.arrays()
+        return cls(columns, agent_codes, builder.modes, builder.agents)
+
+    @classmethod
+    def concat(
+        cls,
+        parts: list[tuple[dict[str, np.ndarray], np.ndarray]],
+        modes: list[str],
+        agents: list[str],
+    ) -> HistoryColumns:
+        """Join ``(columns, agent_codes)`` segment arrays into one table."""
+        if not parts:
+            parts = [_SegmentBuilder(modes, agents).arrays()]
+        names = parts[0][0].keys()
+        columns = {name: np.concatenate([p[0][name] for p in parts]) for name in names}
+        return cls(columns, np.concatenate([p[1] for p in parts]), modes, agents)
+
+    def select(self, mask: np.ndarray) -> HistoryColumns:
+        """Rows where ``mask`` is true."""
+        agent_mask = np.repeat(mask, self.columns["agent_count"])
+        return HistoryColumns(
+            {name: values[mask] for name, values in self.columns.items()},
+            self.agent_codes[agent_mask],
+            self.modes,
+            self.agents,
+        )
+
+    def since(self, timestamp: float) -> HistoryColumns:
+        """Rows with a timestamp at or after ``timestamp`` (epoch seconds)."""
+        return self.select(self.columns["timestamp"] >= timestamp)
+
+    def mode_counts(self) -> dict[str, int]:
+        """Executions per routing mode (rows without a mode are left out)."""
+        codes = self.columns["mode"]
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.modes))
+        return {mode: int(n) for mode, n in zip(self.modes, counts, strict=True) if n}
+
+    def agent_counts(self) -> dict[str, int]:
+        """Executions each agent was assigned to."""
+        counts = np.bincount(self.agent_codes, minlength=len(self.agents))
+        return {agent: int(n) for agent, n in zip(self.agents, counts, strict=True) if n}
+
+
+class _SegmentBuilder:
+    """Accumulates extracted rows and turns them into segment arrays."""
+
+    def __init__(self, modes: list[str], agents: list[str]) -> None:
+        self.modes = modes
+        self.agents = agents
+        self._mode_codes = {m: i for i, m in enumerate(modes)}
+        self._agent_codes = {a: i for i, a in enumerate(agents)}
+        self._numeric: dict[str, list[float]] = {name: [] for name in NUMERIC_COLUMNS}
+        self._mode: list[int] = []
+        self._agent_count: list[int] = []
+        self._agent: list[int] = []
+        self._workflow_id: list[str] = []
+        self._line_offset: list[int] = []
+
+    def __len__(self) -> int:
+        return len(self._mode)
+
+    @staticmethod
+    def _code(vocabulary: list[str], codes: dict[str, int], value: str) -> int:
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(vocabulary)
+            vocabulary.append(value)
+        return code
+
+    def add(self, row: dict[str, Any], line_offset: int = -1) -> None:
+        for name in NUMERIC_COLUMNS:
+            self._numeric[name].append(row[name])
+        mode = row["mode"]
+        self._mode.append(-1 if mode is None else self._code(self.modes, self._mode_codes, mode))
+        self._agent_count.append(len(row["agents"]))
+        self._agent.extend(self._code(self.agents, self._agent_codes, a) for a in row["agents"])
+        self._workflow_id.append(row["workflow_id"])
+        self._line_offset.append(line_offset)
+
+    def arrays(self) -> tuple[dict[str, np.ndarray], np.ndarray]:
+        columns = {
+            name: np.asarray(values, dtype=np.float64) for name, values in self._numeric.items()
+        }
+        columns["mode"] = np.asarray(self._mode, dtype=np.int32)
+        columns["agent_count"] = np.asarray(self._agent_count, dtype=np.int32)
+        columns["workflow_id"] = np.asarray(self._workflow_id, dtype=np.str_)
+        columns["line_offset"] = np.asarray(self._line_offset, dtype=np.int64)
+        return columns, np.asarray(self._agent, dtype=np.int32)
+
+
+class HistoryColumnStore:
+    """Columnar cache of a JSONL history file (see module docstring).
+
+    Args:
+        history_file: The ``execution_history.jsonl`` to mirror.
+        cache_dir: Where segments and the manifest live (defaults to a
+            ``history_columns`` directory next to the history file).
+        segment_rows: Rows per segment file.
+    """
+
+    def __init__(
+        self,
+        history_file: str | Path,
+        cache_dir: str | Path | None = None,
+        segment_rows: int = 10_000,
+    ) -> None:
+        self.history_file = Path(history_file)
+        self.cache_dir = (
+            Path(cache_dir) if cache_dir else self.history_file.parent / "history_columns"
+        )
+        self.segment_rows = max(1, segment_rows)
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def _locked(self) -> Iterator[None]:
+        """Hold this store's thread lock and an exclusive lock on the cache."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock, open(self.cache_dir / "refresh.lock", "ab") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield
+
+    @property
+    def _manifest_path(self) -> Path:
+        return self.cache_dir / "manifest.json"
+
+    def _empty_manifest(self) -> dict[str, Any]:
+        return {
+            "version": FORMAT_VERSION,
+            "source": {"inode": None, "offset": 0, "head": "", "tail": ""},
+            "modes": [],
+            "agents": [],
+            "segments": [],
+        }
+
+    def _read_manifest(self) -> dict[str, Any]:
+        try:
+            manifest = json.loads(self._manifest_path.read_text())
+        except (OSError, ValueError):
+            return self._empty_manifest()
+        if manifest.get("version") != FORMAT_VERSION:
+            return self._empty_manifest()
+        return manifest
+
+    def _write_atomic(self, path: Path, write: Any) -> None:
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False
+        ) as f:
+            try:
+                write(f)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+
+    @staticmethod
+    def _probe(f: Any, start: int, end: int) -> str:
+        f.seek(start)
+        return hashlib.sha1(f.read(end - start), usedforsecurity=False).hexdigest()
+
+    def _source_matches(self, f: Any, stat: os.stat_result, source: dict[str, Any]) -> bool:
+        offset = source["offset"]
+        if not offset:
+            return True
+        if source["inode"] != stat.st_ino or stat.st_size < offset:
+            return False
+        head = self._probe(f, 0, min(offset, _PROBE_BYTES))
+        tail = self._probe(f, max(0, offset - _PROBE_BYTES), offset)
+        return head == source["head"] and tail == source["tail"]
+
+    def refresh(self) -> int:
+        """Bring the cache up to date with the history file.
+
+        Returns:
+            Number of rows added (all rows after a rebuild).
+        """
+        with self._locked():
+            return self._refresh()
+
+    def _refresh(self) -> int:
+        manifest = self._read_manifest()
+        if not self.history_file.exists():
+            if manifest["segments"]:
+                self.clear()
+            return 0
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        added = 0
+        with open(self.history_file, "rb") as f:
+            stat = os.fstat(f.fileno())
+            if not self._source_matches(f, stat, manifest["source"]):
+                logger.info("History file was rewritten; rebuilding column cache")
+                self._remove_segments(manifest)
+                manifest = self._empty_manifest()
+
+            offset = manifest["source"]["offset"]
+            if offset and stat.st_size == offset:
+                return 0
+            segments = manifest["segments"]
+            builder = _SegmentBuilder(manifest["modes"], manifest["agents"])
+            # Reopen a partly filled last segment so it is extended, not duplicated.
+            if segments and segments[-1]["rows"] < self.segment_rows:
+                builder = self._reopen(segments.pop(), manifest)
+
+            f.seek(offset)
+            for line in iter(f.readline, b""):
+                if not line.endswith(b"\n"):
+                    break  # incomplete append; picked up next time
+                line_offset, offset = offset, offset + len(line)
+                if not line.strip():
+                    continue
+                try:
+                    execution = json.loads(line)
+                except ValueError:
+                    continue
+                if not isinstance(execution, dict):
+                    continue
+                builder.add(extract_row(execution), line_offset)
+                added += 1
+                if len(builder) >= self.segment_rows:
+                    segments.append(self._write_segment(builder, len(segments)))
+                    builder = _SegmentBuilder(builder.modes, builder.agents)
+            if len(builder):
+                segments.append(self._write_segment(builder, len(segments)))
+
+            manifest["source"] = {
+                "inode": stat.st_ino,
+                "offset": offset,
+                "head": self._probe(f, 0, min(offset, _PROBE_BYTES)),
+                "tail": self._probe(f, max(0, offset - _PROBE_BYTES), offset),
+            }
+        manifest["modes"], manifest["agents"] = builder.modes, builder.agents
+        self._write_atomic(
+            self._manifest_path, lambda out: out.write(json.dumps(manifest).encode())
+        )
+        return added
+
+    def _reopen(self, segment: dict[str, Any], manifest: dict[str, Any]) -> _SegmentBuilder:
+        builder = _SegmentBuilder(manifest["modes"], manifest["agents"])
+        columns, agent_codes = self._load_segment(segment)
+        agents = iter(agent_codes.tolist())
+        for i in range(len(columns["workflow_id"])):
+            mode_code = int(columns["mode"][i])
+            builder.add(
+                {
+                    **{name: float(columns[name][i]) for name in NUMERIC_COLUMNS},
+                    "mode": None if mode_code < 0 else builder.modes[mode_code],
+                    "agents": [
+                        builder.agents[next(agents)] for _ in range(int(columns["agent_count"][i]))
+                    ],
+                    "workflow_id": str(columns["workflow_id"][i]),
+                },
+                int(columns["line_offset"][i]),
+            )
+        return builder
+
+    def _write_segment(self, builder: _SegmentBuilder, index: int) -> dict[str, Any]:
+        columns, agent_codes = builder.arrays()
+        name = f"segment-{index:06d}.npz"
+        self._write_atomic(
+            self.cache_dir / name,
+            lambda out: np.savez(out, allow_pickle=False, agent_codes=agent_codes, **columns),
+        )
+        timestamps = columns["timestamp"][~np.isnan(columns["timestamp"])]
+        return {
+            "file": name,
+            "rows": len(builder),
+            "ts_min": float(timestamps.min()) if len(timestamps) else None,
+            "ts_max": float(timestamps.max()) if len(timestamps) else None,
+        }
+
+    def _load_segment(self, segment: dict[str, Any]) -> tuple[dict[str, np.ndarray], np.ndarray]:
+        with np.load(self.cache_dir / segment["file"]) as data:
+            arrays = {name: data[name] for name in data.files}
+        agent_codes = arrays.pop("agent_codes")
+        return arrays, agent_codes
+
+    def load(
+        self,
+        since: float | datetime | None = None,
+        refresh: bool = True,
+        patches: dict[str, dict[str, Any]] | None = None,
+    ) -> HistoryColumns:
+        """Cached columns, optionally only rows at or after ``since``.
+
+        Segments whose timestamps all fall before ``since`` are not read.
+        Rows without a timestamp are left out when ``since`` is given.
+        ``patches`` (merged patch per workflow ID) are applied to the
+        matching rows.
+        """
+        if refresh:
+            self.refresh()
+        manifest = self._read_manifest()
+        cutoff = since.timestamp() if isinstance(since, datetime) else since
+        parts = []
+        for segment in manifest["segments"]:
+            if cutoff is not None and (segment["ts_max"] is None or segment["ts_max"] < cutoff):
+                continue
+            parts.append(self._load_segment(segment))
+        columns = HistoryColumns.concat(parts, manifest["modes"], manifest["agents"])
+        if patches:
+            columns = self._apply_patches(columns, patches)
+        return columns.since(cutoff) if cutoff is not None else columns
+
+    def _apply_patches(
+        self, columns: HistoryColumns, patches: dict[str, dict[str, Any]]
+    ) -> HistoryColumns:
+        ids = columns["workflow_id"]
+        rows = np.flatnonzero(np.isin(ids, list(patches)))
+        if not len(rows):
+            return columns
+
+        def code(vocabulary: list[str], value: str) -> int:
+            if value not in vocabulary:
+                vocabulary.append(value)
+            return vocabulary.index(value)
+
+        modes, agents = list(columns.modes), list(columns.agents)
+        new_agents: dict[int, list[int]] = {}
+        with open(self.history_file, "rb") as f:
+            for i in rows.tolist():
+                workflow_id = str(ids[i])
+                f.seek(int(columns["line_offset"][i]))
+                try:
+                    execution = json.loads(f.readline())
+                except ValueError:
+                    continue
+                if not isinstance(execution, dict) or execution.get("workflowId") != workflow_id:
+                    continue  # file changed since the refresh; next load rebuilds
+                execution.update(patches[workflow_id])
+                row = extract_row(execution)
+                for name in NUMERIC_COLUMNS:
+                    columns[name][i] = row[name]
+                columns["mode"][i] = -1 if row["mode"] is None else code(modes, row["mode"])
+                new_agents[i] = [code(agents, a) for a in row["agents"]]
+
+        # Splice the patched rows' agent codes into the flat agent array.
+        counts = columns["agent_count"]
+        bounds = np.concatenate(([0], np.cumsum(counts)))
+        pieces, start = [], 0
+        for i, agent_codes in new_agents.items():
+            pieces.append(columns.agent_codes[start : bounds[i]])
+            pieces.append(np.asarray(agent_codes, dtype=np.int32))
+            start = bounds[i + 1]
+            counts[i] = len(agent_codes)
+        pieces.append(columns.agent_codes[start:])
+        return HistoryColumns(columns.columns, np.concatenate(pieces), modes, agents)
+
+    def _remove_segments(self, manifest: dict[str, Any]) -> None:
+        for segment in manifest["segments"]:
+            with contextlib.suppress(OSError):
+                (self.cache_dir / segment["file"]).unlink()
+
+    def clear(self) -> None:
+        """Delete the cache."""
+        self._remove_segments(self._read_manifest())
+        with contextlib.suppress(OSError):
+            self._manifest_path.unlink()
+
+
+__all__ = [
+    "NUMERIC_COLUMNS",
+    "HistoryColumnStore",
+    "HistoryColumns",
+    "extract_row",
+]
@@ -1,8 +1,27 @@
-"""Job persistence utilities."""
+"""Job persistence utilities.
 
+A job that is running is leased to one owner (an ``OptimizationService`` in
+some process) until ``lease_expires_at``. The owner renews the lease while the
+job runs. Only jobs whose lease has expired are recovered by other processes,
+and a job can be claimed only while it is ``pending``, so two processes never
+run the same job.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import sqlite3
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable
+from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
+from .sqlite import open_sqlite
+
 
 class JobStore(ABC):
     """Abstract base class for job persistence."""
@@ -22,6 +41,89 @@ class JobStore(ABC):
         """Delete a job."""
         pass
 
+    @abstractmethod
+    async def list_jobs(self, statuses: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Return jobs by ID, optionally only those whose ``status`` is in ``statuses``."""
+        pass
+
+    async def update_job(self, job_id: str, changes: dict[str, Any]) -> dict[str, Any] | None:
+        """Merge ``changes`` into a job and return it (``None`` if the job does not exist)."""
+        job = await self.get_job(job_id)
+        if job is None:
+            return None
+        job.update(changes)
+        await self.save_job(job_id, job)
+        return job
+
+    async def claim_job(
+        self, job_id: str, owner: str, lease_seconds: float
+    ) -> dict[str, Any] | None:
+        """Start a ``pending`` job under ``owner``'s lease.
+
+        Sets ``status`` to running, ``owner``, ``lease_expires_at`` and
+        ``started_at``, and counts the attempt. Returns the job, or ``None`` if
+        it does not exist or is not pending (e.g. another process claimed it).
+        """
+        job = await self.get_job(job_id)
+        if job is None or job.get("status") != "pending":
+            return None
+        job.update(_claim_changes(job, owner, lease_seconds))
+        await self.save_job(job_id, job)
+        return job
+
+    async def renew_lease(
+        self, job_id: str, owner: str, lease_seconds: float
+    ) -> dict[str, Any] | None:
+        """Extend ``owner``'s lease on a running job and return the job as stored.
+
+        The lease is only extended while the job is running under ``owner``;
+        callers check the returned ``status`` and ``owner`` to notice that the
+        job was cancelled or taken over.
+        """
+        job = await self.get_job(job_id)
+        if job is not None and _holds_lease(job, owner):
+            job["lease_expires_at"] = time.time() + lease_seconds
+            await self.save_job(job_id, job)
+        return job
+
+    async def release_job(
+        self, job_id: str, changes: dict[str, Any], *, owner: str | None = None
+    ) -> dict[str, Any] | None:
+        """Apply ``changes`` to an active job and clear its lease.
+
+        With ``owner``, only if the job is running under that owner; without,
+        only if no live lease is held on it (used by recovery). Returns the job,
+        or ``None`` if the condition did not hold.
+        """
+        job = await self.get_job(job_id)
+        if job is None or not _releasable(job, owner, time.time()):
+            return None
+        job.update(changes, owner=None, lease_expires_at=None)
+        await self.save_job(job_id, job)
+        return job
+
+
+def _claim_changes(job: dict[str, Any], owner: str, lease_seconds: float) -> dict[str, Any]:
+    now = time.time()
+    return {
+        "status": "running",
+        "owner": owner,
+        "lease_expires_at": now + lease_seconds,
+        "started_at": datetime.fromtimestamp(now, UTC).isoformat(),
+        "attempts": job.get("attempts", 0) + 1,
+    }
+
+
+def _holds_lease(job: dict[str, Any], owner: str) -> bool:
+    return job.get("status") == "running" and job.get("owner") == owner
+
+
+def _releasable(job: dict[str, Any], owner: str | None, now: float) -> bool:
+    if owner is not None:
+        return _holds_lease(job, owner)
+    expires = job.get("lease_expires_at")
+    return job.get("status") in ("pending", "running") and (expires is None or expires <= now)
+
 
 class InMemoryJobStore(JobStore):
     """In-memory implementation of JobStore (for development/testing)."""
@@ -42,3 +144,214 @@ class InMemoryJobStore(JobStore):
         """Delete a job."""
         if job_id in self._jobs:
             del self._jobs[job_id]
+
+    async def list_jobs(self, statuses: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Return jobs by ID, optionally filtered by status."""
+        wanted = set(statuses) if statuses is not None else None
+        return {
+            job_id: job
+            for job_id, job in self._jobs.items()
+            if wanted is None or job.get("status") in wanted
+        }
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    owner TEXT,
+    lease_expires_at REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status);
+"""
+
+
+class SQLiteJobStore(JobStore):
+    """Job store in one SQLite file; jobs survive restarts and are shared by workers.
+
+    Blocking sqlite calls run in a worker thread to keep the event loop free.
+    ``update_job`` is a single transaction, so progress updates and status
+    changes from different tasks never overwrite each other. Lease changes are
+    conditional ``UPDATE`` statements on the ``status``, ``owner`` and
+    ``lease_expires_at`` columns, so they are atomic across processes.
+
+    Args:
+        path: Database file, opened with ``open_sqlite``.
+        busy_timeout: Seconds to wait for another process's write lock.
+    """
+
+    def __init__(self, path: str | Path, busy_timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self._conn, self._lock = open_sqlite(self.path, _SQLITE_SCHEMA, busy_timeout)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+        for column, kind in (("owner", "TEXT"), ("lease_expires_at", "REAL")):
+            if column not in columns:
+                # Stores created before leases; another process may add it first.
+                with contextlib.suppress(sqlite3.OperationalError):
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+
+    async def _call(self, fn: Any, *args: Any) -> Any:
+        def run() -> Any:
+            with self._lock:
+                return fn(*args)
+
+        return await asyncio.to_thread(run)
+
+    def _write(self, job_id: str, data: dict[str, Any]) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO jobs "
+            "(job_id, status, data, updated_at, owner, lease_expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                job_id,
+                data.get("status"),
+                json.dumps(data, default=str),
+                time.time(),
+                data.get("owner"),
+                data.get("lease_expires_at"),
+            ),
+        )
+
+    def _transaction[T](self, fn: Callable[[], T]) -> T:
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = fn()
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        return result
+
+    def _update_where(
+        self, job_id: str, assignments: str, condition: str, params: tuple[Any, ...]
+    ) -> bool:
+        """Run a conditional ``UPDATE`` of one job; True if it matched."""
+        cursor = self._conn.execute(
+            f"UPDATE jobs SET {assignments} WHERE ({condition}) AND job_id = ?",
+            (*params, job_id),
+        )
+        return cursor.rowcount > 0
+
+    def _read(self, job_id: str) -> dict[str, Any] | None:
+        row = self._conn.execute("SELECT data FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    async def save_job(self, job_id: str, data: dict[str, Any]) -> None:
+        """Save or update a job."""
+        await self._call(self._write, job_id, data)
+
+    async def get_job(self, job_id: str) -> dict[str, Any] | None:
+        """Retrieve a job by ID."""
+        return await self._call(self._read, job_id)
+
+    async def delete_job(self, job_id: str) -> None:
+        """Delete a job."""
+        await self._call(self._conn.execute, "DELETE FROM jobs WHERE job_id = ?", (job_id,))
+
+    async def list_jobs(self, statuses: Iterable[str] | None = None) -> dict[str, dict[str, Any]]:
+        """Return jobs by ID (oldest update first), optionally filtered by status."""
+
+        def select() -> dict[str, dict[str, Any]]:
+            if statuses is None:
+                rows = self._conn.execute("SELECT job_id, data FROM jobs ORDER BY updated_at")
+            else:
+                wanted = list(statuses)
+                placeholders = ",".join("?" * len(wanted))
+                rows = self._conn.execute(
+                    f"SELECT job_id, data FROM jobs WHERE status IN ({placeholders}) "
+                    "ORDER BY updated_at",
+                    wanted,
+                )
+            return {job_id: json.loads(data) for job_id, data in rows.fetchall()}
+
+        return await self._call(select)
+
+    async def update_job(self, job_id: str, changes: dict[str, Any]) -> dict[str, Any] | None:
+        """Merge ``changes`` into a job in one transaction and return it."""
+
+        def update() -> dict[str, Any] | None:
+            job = self._read(job_id)
+            if job is not None:
+                job.update(changes)
+                self._write(job_id, job)
+            return job
+
+        return await self._call(self._transaction, update)
+
+    async def claim_job(
+        self, job_id: str, owner: str, lease_seconds: float
+    ) -> dict[str, Any] | None:
+        """Start a ``pending`` job under ``owner``'s lease (see ``JobStore``)."""
+
+        def claim() -> dict[str, Any] | None:
+            job = self._read(job_id)
+            if job is None:
+                return None
+            changes = _claim_changes(job, owner, lease_seconds)
+            if not self._update_where(
+                job_id,
+                "status = 'running', owner = ?, lease_expires_at = ?",
+                "status = 'pending'",
+                (owner, changes["lease_expires_at"]),
+            ):
+                return None
+            job.update(changes)
+            self._write(job_id, job)
+            return job
+
+        return await self._call(self._transaction, claim)
+
+    async def renew_lease(
+        self, job_id: str, owner: str, lease_seconds: float
+    ) -> dict[str, Any] | None:
+        """Extend ``owner``'s lease on a running job (see ``JobStore``)."""
+
+        def renew() -> dict[str, Any] | None:
+            expires = time.time() + lease_seconds
+            if self._update_where(
+                job_id,
+                "lease_expires_at = ?",
+                "status = 'running' AND owner = ?",
+                (expires, owner),
+            ):
+                job = self._read(job_id)
+                if job is not None:
+                    job["lease_expires_at"] = expires
+                    self._write(job_id, job)
+                return job
+            return self._read(job_id)
+
+        return await self._call(self._transaction, renew)
+
+    async def release_job(
+        self, job_id: str, changes: dict[str, Any], *, owner: str | None = None
+    ) -> dict[str, Any] | None:
+        """Apply ``changes`` to an active job and clear its lease (see ``JobStore``)."""
+
+        def release() -> dict[str, Any] | None:
+            if owner is not None:
+                condition, params = "status = 'running' AND owner = ?", (owner,)
+            else:
+                condition = (
+                    "status IN ('pending', 'running') "
+                    "AND (lease_expires_at IS NULL OR lease_expires_at <= ?)"
+                )
+                params = (time.time(),)
+            if not self._update_where(
+                job_id, "owner = NULL, lease_expires_at = NULL", condition, params
+            ):
+                return None
+            job = self._read(job_id)
+            if job is not None:
+                job.update(changes, owner=None, lease_expires_at=None)
+                self._write(job_id, job)
+            return job
+
+        return await self._call(self._transaction, release)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,726 @@
+"""Shared state backends for running several API workers side by side.
+
+Streaming sessions, admission slots, cancel signals, human-in-the-loop (HITL)
+responses and conversation thread state normally live in process memory. That
+breaks once several uvicorn workers (or nodes) sit behind one load balancer:
+concurrency limits become per process, a cancel request or HITL response can
+land on a worker that does not own the stream, and thread context is lost
+between turns.
+
+``SharedStateBackend`` is the pluggable store for that state:
+
+- ``InMemorySharedState``: default, single-process behavior (no relaying).
+- ``SQLiteSharedState``: single host, any number of worker processes. SQLite's
+  file locking (``BEGIN IMMEDIATE``) serializes the read-modify-write steps.
+- ``RedisSharedState``: multi-node. Speaks RESP directly over asyncio streams,
+  so it needs no client library and can be tested against a local stand-in.
+
+Select a backend with ``create_shared_state(settings)`` (``state_backend``:
+``memory`` | ``sqlite`` | ``redis``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import unquote, urlparse
+
+from agentic_fleet.models import WorkflowSession
+from agentic_fleet.utils.exceptions import ConfigurationError
+
+from .sqlite import open_sqlite
+
+if TYPE_CHECKING:
+    from agentic_fleet.utils.cfg.settings import AppSettings
+
+# Cancel signals only need to outlive the stream they target.
+CANCEL_SIGNAL_TTL_SECONDS = 3600.0
+
+
+class SharedStateError(RuntimeError):
+    """Raised when a shared state backend cannot complete an operation."""
+
+
+class SharedStateBackend(ABC):
+    """Cross-worker store for streaming session state."""
+
+    #: True when other processes can observe this state. Cancel signals and HITL
+    #: responses for streams owned by another worker are only relayed when set.
+    shared: bool = True
+
+    # -- Sessions ---------------------------------------------------------
+
+    @abstractmethod
+    async def save_session(self, session: WorkflowSession) -> None:
+        """Create or replace a workflow session."""
+
+    @abstractmethod
+    async def get_session(self, workflow_id: str) -> WorkflowSession | None:
+        """Return a workflow session by ID."""
+
+    @abstractmethod
+    async def list_sessions(self) -> list[WorkflowSession]:
+        """Return all stored workflow sessions."""
+
+    @abstractmethod
+    async def delete_sessions(self, workflow_ids: list[str]) -> None:
+        """Delete workflow sessions by ID."""
+
+    # -- Admission slots --------------------------------------------------
+
+    @abstractmethod
+    async def try_acquire_slot(self, slot_id: str, limit: int, lease_seconds: float) -> bool:
+        """Claim one of ``limit`` concurrency slots.
+
+        Slots are leases: a slot whose owner died without releasing it frees
+        itself after ``lease_seconds``.
+
+        Returns:
+            True if the slot was acquired (or was already held by ``slot_id``).
+        """
+
+    @abstractmethod
+    async def release_slot(self, slot_id: str) -> None:
+        """Release a slot claimed with ``try_acquire_slot``."""
+
+    @abstractmethod
+    async def count_slots(self) -> int:
+        """Return the number of live (unexpired) slots."""
+
+    # -- Cancellation -----------------------------------------------------
+
+    @abstractmethod
+    async def request_cancel(self, workflow_id: str) -> None:
+        """Record a cancel request for the worker that owns ``workflow_id``."""
+
+    @abstractmethod
+    async def is_cancel_requested(self, workflow_id: str) -> bool:
+        """Return True if a cancel request is pending for ``workflow_id``."""
+
+    # -- HITL responses ---------------------------------------------------
+
+    @abstractmethod
+    async def push_response(self, workflow_id: str, payload: dict[str, Any]) -> None:
+        """Queue a HITL response for the worker that owns ``workflow_id``."""
+
+    @abstractmethod
+    async def pop_responses(self, workflow_id: str) -> list[dict[str, Any]]:
+        """Remove and return all queued HITL responses, oldest first."""
+
+    # -- Conversation threads ---------------------------------------------
+
+    @abstractmethod
+    async def save_thread_state(
+        self, conversation_id: str, state: dict[str, Any], ttl_seconds: float
+    ) -> None:
+        """Store serialized AgentThread state for a conversation."""
+
+    @abstractmethod
+    async def load_thread_state(self, conversation_id: str) -> dict[str, Any] | None:
+        """Return serialized AgentThread state, or None if absent/expired."""
+
+    # -- Lifecycle --------------------------------------------------------
+
+    @abstractmethod
+    async def clear_signals(self, workflow_id: str) -> None:
+        """Drop cancel flags and undelivered responses once a stream ends."""
+
+    async def close(self) -> None:
+        """Release connections held by the backend."""
+        return None
+
+
+def _dump_session(session: WorkflowSession) -> str:
+    return session.model_dump_json()
+
+
+def _load_session(raw: str | bytes) -> WorkflowSession:
+    return WorkflowSession.model_validate_json(raw)
+
+
+class InMemorySharedState(SharedStateBackend):
+    """Process-local backend; sessions are kept as live objects."""
+
+    shared = False
+
+    def __init__(self) -> None:
+        self._sessions: dict[str, WorkflowSession] = {}
+        self._slots: dict[str, float] = {}
+        self._cancels: dict[str, float] = {}
+        self._responses: dict[str, list[dict[str, Any]]] = {}
+        self._threads: dict[str, tuple[dict[str, Any], float]] = {}
+
+    async def save_session(self, session: WorkflowSession) -> None:
+        """Create or replace a workflow session."""
+        self._sessions[session.workflow_id] = session
+
+    async def get_session(self, workflow_id: str) -> WorkflowSession | None:
+        """Return a workflow session by ID."""
+        return self._sessions.get(workflow_id)
+
+    async def list_sessions(self) -> list[WorkflowSession]:
+        """Return all stored workflow sessions."""
+        return list(self._sessions.values())
+
+    async def delete_sessions(self, workflow_ids: list[str]) -> None:
+        """Delete workflow sessions by ID."""
+        for workflow_id in workflow_ids:
+            self._sessions.pop(workflow_id, None)
+
+    def _purge_slots(self, now: float) -> None:
+        expired = [slot_id for slot_id, expires in self._slots.items() if expires <= now]
+        for slot_id in expired:
+            del self._slots[slot_id]
+
+    async def try_acquire_slot(self, slot_id: str, limit: int, lease_seconds: float) -> bool:
+        """Claim one of ``limit`` concurrency slots."""
+        now = time.monotonic()
+        if slot_id not in self._slots and len(self._slots) >= limit:
+            self._purge_slots(now)
+            if len(self._slots) >= limit:
+                return False
+        self._slots[slot_id] = now + lease_seconds
+        return True
+
+    async def release_slot(self, slot_id: str) -> None:
+        """Release a slot."""
+        self._slots.pop(slot_id, None)
+
+    async def count_slots(self) -> int:
+        """Return the number of live slots."""
+        self._purge_slots(time.monotonic())
+        return len(self._slots)
+
+    async def request_cancel(self, workflow_id: str) -> None:
+        """Record a cancel request."""
+        self._cancels[workflow_id] = time.monotonic() + CANCEL_SIGNAL_TTL_SECONDS
+
+    async def is_cancel_requested(self, workflow_id: str) -> bool:
+        """Return True if a cancel request is pending."""
+        expires = self._cancels.get(workflow_id)
+        return expires is not None and expires > time.monotonic()
+
+    async def push_response(self, workflow_id: str, payload: dict[str, Any]) -> None:
+        """Queue a HITL response."""
+        self._responses.setdefault(workflow_id, []).append(payload)
+
+    async def pop_responses(self, workflow_id: str) -> list[dict[str, Any]]:
+        """Remove and return queued HITL responses."""
+        return self._responses.pop(workflow_id, [])
+
+    async def save_thread_state(
+        self, conversation_id: str, state: dict[str, Any], ttl_seconds: float
+    ) -> None:
+        """Store serialized thread state."""
+        self._threads[conversation_id] = (state, time.monotonic() + ttl_seconds)
+
+    async def load_thread_state(self, conversation_id: str) -> dict[str, Any] | None:
+        """Return serialized thread state."""
+        entry = self._threads.get(conversation_id)
+        if entry is None:
+            return None
+        state, expires = entry
+        if expires <= time.monotonic():
+            del self._threads[conversation_id]
+            return None
+        return state
+
+    async def clear_signals(self, workflow_id: str) -> None:
+        """Drop cancel flags and undelivered responses."""
+        self._cancels.pop(workflow_id, None)
+        self._responses.pop(workflow_id, None)
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (workflow_id TEXT PRIMARY KEY, data TEXT NOT NULL);
+CREATE TABLE IF NOT EXISTS slots (slot_id TEXT PRIMARY KEY, expires_at REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS cancels (workflow_id TEXT PRIMARY KEY, expires_at REAL NOT NULL);
+CREATE TABLE IF NOT EXISTS responses (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    workflow_id TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_workflow ON responses (workflow_id);
+CREATE TABLE IF NOT EXISTS threads (
+    conversation_id TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+class SQLiteSharedState(SharedStateBackend):
+    """Single-host backend shared by worker processes through one SQLite file.
+
+    Uses wall-clock time for leases so every process agrees on expiry. Blocking
+    sqlite calls run in a worker thread to keep the event loop free.
+
+    Args:
+        path: Database file, opened with ``open_sqlite``.
+        busy_timeout: Seconds to wait for another process's write lock.
+    """
+
+    def __init__(self, path: str | Path, busy_timeout: float = 30.0) -> None:
+        self.path = Path(path)
+        self._conn, self._lock = open_sqlite(self.path, _SQLITE_SCHEMA, busy_timeout)
+
+    def _run(self, fn: Any, *args: Any) -> Any:
+        with self._lock:
+            try:
+                return fn(self._conn, *args)
+            except sqlite3.Error as exc:
+                raise SharedStateError(f"SQLite shared state error: {exc}") from exc
+
+    async def _call(self, fn: Any, *args: Any) -> Any:
+        return await asyncio.to_thread(self._run, fn, *args)
+
+    @staticmethod
+    def _transaction(conn: sqlite3.Connection, statements: Any) -> Any:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = statements(conn)
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+        return result
+
+    async def save_session(self, session: WorkflowSession) -> None:
+        """Create or replace a workflow session."""
+        await self._call(
+            lambda c, wid, data: c.execute(
+                "INSERT OR REPLACE INTO sessions (workflow_id, data) VALUES (?, ?)", (wid, data)
+            ),
+            session.workflow_id,
+            _dump_session(session),
+        )
+
+    async def get_session(self, workflow_id: str) -> WorkflowSession | None:
+        """Return a workflow session by ID."""
+        row = await self._call(
+            lambda c, wid: c.execute(
+                "SELECT data FROM sessions WHERE workflow_id = ?", (wid,)
+            ).fetchone(),
+            workflow_id,
+        )
+        return _load_session(row[0]) if row else None
+
+    async def list_sessions(self) -> list[WorkflowSession]:
+        """Return all stored workflow sessions."""
+        rows = await self._call(lambda c: c.execute("SELECT data FROM sessions").fetchall())
+        return [_load_session(row[0]) for row in rows]
+
+    async def delete_sessions(self, workflow_ids: list[str]) -> None:
+        """Delete workflow sessions by ID."""
+        if not workflow_ids:
+            return
+        await self._call(
+            lambda c, ids: c.executemany(
+                "DELETE FROM sessions WHERE workflow_id = ?", [(i,) for i in ids]
+            ),
+            list(workflow_ids),
+        )
+
+    async def try_acquire_slot(self, slot_id: str, limit: int, lease_seconds: float) -> bool:
+        """Claim one of ``limit`` concurrency slots."""
+
+        def acquire(conn: sqlite3.Connection) -> bool:
+            now = time.time()
+            conn.execute("DELETE FROM slots WHERE expires_at <= ?", (now,))
+            held = conn.execute("SELECT 1 FROM slots WHERE slot_id = ?", (slot_id,)).fetchone()
+            if not held:
+                (count,) = conn.execute("SELECT COUNT(*) FROM slots").fetchone()
+                if count >= limit:
+                    return False
+            conn.execute(
+                "INSERT OR REPLACE INTO slots (slot_id, expires_at) VALUES (?, ?)",
+                (slot_id, now + lease_seconds),
+            )
+            return True
+
+        return await self._call(lambda c: self._transaction(c, acquire))
+
+    async def release_slot(self, slot_id: str) -> None:
+        """Release a slot."""
+        await self._call(
+            lambda c, sid: c.execute("DELETE FROM slots WHERE slot_id = ?", (sid,)), slot_id
+        )
+
+    async def count_slots(self) -> int:
+        """Return the number of live slots."""
+        row = await self._call(
+            lambda c, now: c.execute(
+                "SELECT COUNT(*) FROM slots WHERE expires_at > ?", (now,)
+            ).fetchone(),
+            time.time(),
+        )
+        return int(row[0])
+
+    async def request_cancel(self, workflow_id: str) -> None:
+        """Record a cancel request."""
+        await self._call(
+            lambda c, wid, exp: c.execute(
+                "INSERT OR REPLACE INTO cancels (workflow_id, expires_at) VALUES (?, ?)",
+                (wid, exp),
+            ),
+            workflow_id,
+            time.time() + CANCEL_SIGNAL_TTL_SECONDS,
+        )
+
+    async def is_cancel_requested(self, workflow_id: str) -> bool:
+        """Return True if a cancel request is pending."""
+        row = await self._call(
+            lambda c, wid, now: c.execute(
+                "SELECT 1 FROM cancels WHERE workflow_id = ? AND expires_at > ?", (wid, now)
+            ).fetchone(),
+            workflow_id,
+            time.time(),
+        )
+        return row is not None
+
+    async def push_response(self, workflow_id: str, payload: dict[str, Any]) -> None:
+        """Queue a HITL response."""
+        await self._call(
+            lambda c, wid, data: c.execute(
+                "INSERT INTO responses (workflow_id, payload) VALUES (?, ?)", (wid, data)
+            ),
+            workflow_id,
+            json.dumps(payload, default=str),
+        )
+
+    async def pop_responses(self, workflow_id: str) -> list[dict[str, Any]]:
+        """Remove and return queued HITL responses."""
+
+        def pop(conn: sqlite3.Connection) -> list[str]:
+            rows = conn.execute(
+                "SELECT id, payload FROM responses WHERE workflow_id = ? ORDER BY id",
+                (workflow_id,),
+            ).fetchall()
+            if rows:
+                conn.execute(
+                    "DELETE FROM responses WHERE workflow_id = ? AND id <= ?",
+                    (workflow_id, rows[-1][0]),
+                )
+            return [row[1] for row in rows]
+
+        payloads = await self._call(lambda c: self._transaction(c, pop))
+        return [json.loads(p) for p in payloads]
+
+    async def save_thread_state(
+        self, conversation_id: str, state: dict[str, Any], ttl_seconds: float
+    ) -> None:
+        """Store serialized thread state."""
+        await self._call(
+            lambda c, cid, data, exp: c.execute(
+                "INSERT OR REPLACE INTO threads (conversation_id, state, expires_at) "
+                "VALUES (?, ?, ?)",
+                (cid, data, exp),
+            ),
+            conversation_id,
+            json.dumps(state, default=str),
+            time.time() + ttl_seconds,
+        )
+
+    async def load_thread_state(self, conversation_id: str) -> dict[str, Any] | None:
+        """Return serialized thread state."""
+        row = await self._call(
+            lambda c, cid, now: c.execute(
+                "SELECT state FROM threads WHERE conversation_id = ? AND expires_at > ?",
+                (cid, now),
+            ).fetchone(),
+            conversation_id,
+            time.time(),
+        )
+        return json.loads(row[0]) if row else None
+
+    async def clear_signals(self, workflow_id: str) -> None:
+        """Drop cancel flags and undelivered responses."""
+
+        def clear(conn: sqlite3.Connection) -> None:
+            conn.execute("DELETE FROM cancels WHERE workflow_id = ?", (workflow_id,))
+            conn.execute("DELETE FROM responses WHERE workflow_id = ?", (workflow_id,))
+
+        await self._call(lambda c: self._transaction(c, clear))
+
+    async def close(self) -> None:
+        """Close the database connection."""
+        await asyncio.to_thread(self._conn.close)
+
+
+# Commands that are safe to resend when the connection drops after sending them.
+_IDEMPOTENT_COMMANDS = frozenset(
+    {
+        "GET",
+        "SET",
+        "DEL",
+        "EXISTS",
+        "HGET",
+        "HSET",
+        "HVALS",
+        "ZCARD",
+        "ZCOUNT",
+        "ZREM",
+        "ZREMRANGEBYSCORE",
+    }
+)
+
+
+class _RespConnection:
+    """Minimal RESP2 client: one connection, one in-flight command at a time."""
+
+    def __init__(self, url: str, connect_timeout: float = 5.0) -> None:
+        parsed = urlparse(url)
+        if parsed.scheme not in ("redis", ""):
+            raise ConfigurationError(
+                "Only redis:// URLs are supported", config_key="state_redis_url"
+            )
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.username = unquote(parsed.username) if parsed.username else None
+        db_path = parsed.path.lstrip("/")
+        self.db = int(db_path) if db_path else 0
+        self.connect_timeout = connect_timeout
+        self._reader: asyncio.StreamReader | None = None
+        self._writer: asyncio.StreamWriter | None = None
+        self._lock = asyncio.Lock()
+
+    async def _connect(self) -> None:
+        self._reader, self._writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), timeout=self.connect_timeout
+        )
+        if self.password:
+            auth = (self.username, self.password) if self.username else (self.password,)
+            await self._roundtrip("AUTH", *auth)
+        if self.db:
+            await self._roundtrip("SELECT", self.db)
+
+    @staticmethod
+    def _encode(args: tuple[Any, ...]) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        return b"".join(parts)
+
+    async def _read_reply(self) -> Any:
+        assert self._reader is not None
+        line = await self._reader.readline()
+        if not line:
+            raise ConnectionError("Redis connection closed")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode("utf-8")
+        if prefix == b"-":
+            raise SharedStateError(f"Redis error: {body.decode('utf-8', 'replace')}")
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length < 0:
+                return None
+            data = await self._reader.readexactly(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            count = int(body)
+            if count < 0:
+                return None
+            return [await self._read_reply() for _ in range(count)]
+        raise SharedStateError(f"Unexpected RESP reply: {line!r}")
+
+    async def _roundtrip(self, *args: Any) -> Any:
+        assert self._writer is not None
+        self._writer.write(self._encode(args))
+        await self._writer.drain()
+        return await self._read_reply()
+
+    async def execute(self, *args: Any) -> Any:
+        """Send one command and return its decoded reply (reconnecting once).
+
+        A command that fails after it was sent may already have been applied, so
+        it is only resent if it is idempotent; others fail with SharedStateError.
+        """
+        async with self._lock:
+            for attempt in (1, 2):
+                sent = False
+                try:
+                    if self._writer is None:
+                        await self._connect()
+                    sent = True
+                    return await self._roundtrip(*args)
+                except (ConnectionError, OSError, asyncio.IncompleteReadError) as exc:
+                    await self._reset()
+                    retryable = not sent or str(args[0]).upper() in _IDEMPOTENT_COMMANDS
+                    if attempt == 2 or not retryable:
+                        raise SharedStateError(f"Redis unavailable: {exc}") from exc
+            raise AssertionError("unreachable")
+
+    async def _reset(self) -> None:
+        writer, self._reader, self._writer = self._writer, None, None
+        if writer is not None:
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+
+    async def close(self) -> None:
+        """Close the connection."""
+        async with self._lock:
+            await self._reset()
+
+
+class RedisSharedState(SharedStateBackend):
+    """Multi-node backend over the Redis protocol.
+
+    Admission slots live in a sorted set scored by lease expiry. A worker adds
+    its slot and then checks the set size, backing out if it overshot, so
+    concurrent admissions never exceed the limit (they may both back out near
+    the limit, which only delays one of them).
+
+    Args:
+        url: ``redis://[[user]:password@]host[:port][/db]``.
+        key_prefix: Namespace for all keys.
+    """
+
+    def __init__(self, url: str, key_prefix: str = "agentic_fleet:") -> None:
+        self._conn = _RespConnection(url)
+        self._prefix = key_prefix
+
+    def _key(self, *parts: str) -> str:
+        return self._prefix + ":".join(parts)
+
+    async def save_session(self, session: WorkflowSession) -> None:
+        """Create or replace a workflow session."""
+        await self._conn.execute(
+            "HSET", self._key("sessions"), session.workflow_id, _dump_session(session)
+        )
+
+    async def get_session(self, workflow_id: str) -> WorkflowSession | None:
+        """Return a workflow session by ID."""
+        raw = await self._conn.execute("HGET", self._key("sessions"), workflow_id)
+        return _load_session(raw) if raw is not None else None
+
+    async def list_sessions(self) -> list[WorkflowSession]:
+        """Return all stored workflow sessions."""
+        values = await self._conn.execute("HVALS", self._key("sessions"))
+        return [_load_session(raw) for raw in values or []]
+
+    async def delete_sessions(self, workflow_ids: list[str]) -> None:
+        """Delete workflow sessions by ID."""
+        if workflow_ids:
+            await self._conn.execute("HDEL", self._key("sessions"), *workflow_ids)
+
+    async def try_acquire_slot(self, slot_id: str, limit: int, lease_seconds: float) -> bool:
+        """Claim one of ``limit`` concurrency slots."""
+        key = self._key("slots")
+        now = time.time()
+        await self._conn.execute("ZREMRANGEBYSCORE", key, "-inf", repr(now))
+        added = await self._conn.execute("ZADD", key, repr(now + lease_seconds), slot_id)
+        if not added:
+            # Already held: the ZADD above renewed the lease.
+            return True
+        if await self._conn.execute("ZCARD", key) > limit:
+            await self._conn.execute("ZREM", key, slot_id)
+            return False
+        return True
+
+    async def release_slot(self, slot_id: str) -> None:
+        """Release a slot."""
+        await self._conn.execute("ZREM", self._key("slots"), slot_id)
+
+    async def count_slots(self) -> int:
+        """Return the number of live slots."""
+        return int(
+            await self._conn.execute("ZCOUNT", self._key("slots"), f"({time.time()!r}", "+inf")
+        )
+
+    async def request_cancel(self, workflow_id: str) -> None:
+        """Record a cancel request."""
+        await self._conn.execute(
+            "SET",
+            self._key("cancel", workflow_id),
+            "1",
+            "PX",
+            int(CANCEL_SIGNAL_TTL_SECONDS * 1000),
+        )
+
+    async def is_cancel_requested(self, workflow_id: str) -> bool:
+        """Return True if a cancel request is pending."""
+        return bool(await self._conn.execute("EXISTS", self._key("cancel", workflow_id)))
+
+    async def push_response(self, workflow_id: str, payload: dict[str, Any]) -> None:
+        """Queue a HITL response."""
+        await self._conn.execute(
+            "RPUSH", self._key("responses", workflow_id), json.dumps(payload, default=str)
+        )
+
+    async def pop_responses(self, workflow_id: str) -> list[dict[str, Any]]:
+        """Remove and return queued HITL responses."""
+        key = self._key("responses", workflow_id)
+        payloads: list[dict[str, Any]] = []
+        while (raw := await self._conn.execute("LPOP", key)) is not None:
+            payloads.append(json.loads(raw))
+        return payloads
+
+    async def save_thread_state(
+        self, conversation_id: str, state: dict[str, Any], ttl_seconds: float
+    ) -> None:
+        """Store serialized thread state."""
+        await self._conn.execute(
+            "SET",
+            self._key("thread", conversation_id),
+            json.dumps(state, default=str),
+            "PX",
+            max(1, int(ttl_seconds * 1000)),
+        )
+
+    async def load_thread_state(self, conversation_id: str) -> dict[str, Any] | None:
+        """Return serialized thread state."""
+        raw = await self._conn.execute("GET", self._key("thread", conversation_id))
+        return json.loads(raw) if raw is not None else None
+
+    async def clear_signals(self, workflow_id: str) -> None:
+        """Drop cancel flags and undelivered responses."""
+        await self._conn.execute(
+            "DEL", self._key("cancel", workflow_id), self._key("responses", workflow_id)
+        )
+
+    async def close(self) -> None:
+        """Close the connection."""
+        await self._conn.close()
+
+
+def create_shared_state(settings: AppSettings) -> SharedStateBackend:
+    """Build the shared state backend selected by ``settings.state_backend``.
+
+    Raises:
+        ConfigurationError: If the backend name is unknown.
+    """
+    backend = settings.state_backend.lower()
+    if backend == "memory":
+        return InMemorySharedState()
+    if backend == "sqlite":
+        return SQLiteSharedState(settings.state_sqlite_path)
+    if backend == "redis":
+        return RedisSharedState(settings.state_redis_url, key_prefix=settings.state_key_prefix)
+    raise ConfigurationError(
+        "Unknown shared state backend",
+        config_key="state_backend",
+        config_value=settings.state_backend,
+    )
+
+
+__all__ = [
+    "CANCEL_SIGNAL_TTL_SECONDS",
+    "InMemorySharedState",
+    "RedisSharedState",
+    "SQLiteSharedState",
+    "SharedStateBackend",
+    "SharedStateError",
+    "create_shared_state",
+]
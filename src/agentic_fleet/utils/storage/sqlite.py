@@ -0,0 +1,45 @@
+"""Connection setup shared by the SQLite-backed stores.
+
+Job store, shared state, GEPA evaluation cache and routing replay store all
+keep one autocommit connection per process, used from several threads under
+a lock, on a WAL-mode file that other worker processes open too.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from pathlib import Path
+
+
+def open_sqlite(
+    path: str | Path, schema: str, busy_timeout: float = 30.0
+) -> tuple[sqlite3.Connection, threading.Lock]:
+    """Open (creating if needed) a WAL-mode SQLite file shared by threads and processes.
+
+    The connection is in autocommit mode (``isolation_level=None``), so callers
+    issue their own ``BEGIN``/``COMMIT``, and may be used from any thread as
+    long as the returned lock is held.
+
+    Args:
+        path: Database file; created (with parent directories) if missing.
+        schema: SQL script run on open; use ``IF NOT EXISTS`` statements.
+        busy_timeout: Seconds to wait for another process's write lock.
+
+    Returns:
+        The connection and the lock that serializes its use.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(
+        path,
+        timeout=busy_timeout,
+        isolation_level=None,
+        check_same_thread=False,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(schema)
+    return conn, threading.Lock()
+
+
+__all__ = ["open_sqlite"]
@@ -3,9 +3,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Literal, get_args
 
-from agentic_fleet.utils.cfg import DEFAULT_GEPA_LOG_DIR, DEFAULT_HISTORY_PATH, get_agent_model
+from agentic_fleet.utils.cfg import (
+    DEFAULT_GEPA_EVAL_CACHE_PATH,
+    DEFAULT_GEPA_LOG_DIR,
+    DEFAULT_HISTORY_PATH,
+    get_agent_model,
+)
+
+SpeakerSelection = Literal["dspy", "auto", "round_robin"]
 
 
 @dataclass
@@ -19,9 +26,19 @@ class WorkflowConfig:
     # Pipeline profile:
     # - "full": full multi-stage pipeline with analysis/routing/progress/quality/judge
     # - "light": latency-optimized path for simple tasks
+    # - "adaptive": full analysis/routing; progress/quality are skipped per run
+    #   when the routing plan and similar past runs make them redundant
+    #   (see workflows/helpers/phase_policy.py)
     pipeline_profile: str = "full"
     # Heuristic threshold for simple-task detection (word count)
     simple_task_max_words: int = 40
+    # Start routing (and, for time-sensitive tasks, a web search) from the raw
+    # task while analysis runs, then reuse or cancel them once it returns.
+    enable_speculative_execution: bool = False
+    # Adaptive profile: routing confidence needed to skip phases, and how many
+    # recent history entries are searched for similar tasks.
+    adaptive_min_confidence: float = 0.8
+    adaptive_history_window: int = 200
     # ------------------------------------------------------------------
     # Conversation context injection
     # ------------------------------------------------------------------
@@ -30,12 +47,24 @@ class WorkflowConfig:
     conversation_context_max_messages: int = 8
     conversation_context_max_chars: int = 4000
     parallel_threshold: int = 2
+    # Discussion (group chat) speaker selection: "dspy", "auto" (deterministic
+    # when the next speaker is unambiguous) or "round_robin", and how many
+    # recent messages the selector sees.
+    discussion_speaker_selection: SpeakerSelection = "auto"
+    discussion_transcript_window: int = 20
     dspy_model: str = "gpt-5-mini"
     dspy_temperature: float = 1.0
     dspy_max_tokens: int = 16000
     compile_dspy: bool = True
     refinement_threshold: float = 8.0
     enable_refinement: bool = True
+    # Quality-phase refinement of low-scoring answers: "none" or "best_of_n"
+    # (candidates generated and scored concurrently, stopping at the first
+    # one that reaches refinement_threshold or when the time budget ends).
+    refinement_strategy: str = "none"
+    refinement_candidates: int = 3
+    refinement_max_concurrency: int = 3
+    refinement_time_budget_seconds: float | None = 30.0
     # Whether to call DSPy for progress/quality assessment.
     # These can be disabled in "light" profile to reduce LM calls.
     enable_progress_eval: bool = True
@@ -57,6 +86,8 @@ class WorkflowConfig:
     # Recommended: leave disabled unless you fully understand the implications.
     allow_gepa_optimization: bool = False
     enable_handoffs: bool = True
+    handoff_history_limit: int = 500
+    handoff_history_path: str | None = None
     max_task_length: int = 10000
     quality_threshold: float = 8.0
     dspy_retry_attempts: int = 3
@@ -90,6 +121,9 @@ class WorkflowConfig:
     enable_routing_cache: bool = True
     # TTL for routing cache entries (in seconds)
     routing_cache_ttl_seconds: int = 300
+    # Record routing LM calls and decisions for offline replay (None disables)
+    routing_replay_path: str | None = None
+    routing_replay_sample_rate: float = 1.0
     # Checkpoint directory for storing workflow checkpoints
     checkpoint_dir: str = ".var/checkpoints"
 
@@ -103,6 +137,17 @@ class WorkflowConfig:
         return self.__dict__
 
 
+def _speaker_selection(value: Any) -> SpeakerSelection:
+    """Validate ``workflow.execution.discussion_speaker_selection``."""
+    for mode in get_args(SpeakerSelection):
+        if value == mode:
+            return mode
+    raise ValueError(
+        f"Unknown discussion_speaker_selection {value!r}; "
+        f"expected one of {', '.join(get_args(SpeakerSelection))}"
+    )
+
+
 def build_workflow_config_from_yaml(
     yaml_config: dict[str, Any],
     *,
@@ -171,12 +216,15 @@ def build_workflow_config_from_yaml(
         "max_metric_calls": metric_calls_choice,
         "reflection_model": reflection_model_value,
         "log_dir": opt_cfg.get("gepa_log_dir", DEFAULT_GEPA_LOG_DIR),
+        "eval_cache_path": opt_cfg.get("gepa_eval_cache_path", DEFAULT_GEPA_EVAL_CACHE_PATH),
         "perfect_score": opt_cfg.get("gepa_perfect_score", 1.0),
         "use_history_examples": opt_cfg.get("gepa_use_history_examples", False),
         "history_min_quality": opt_cfg.get("gepa_history_min_quality", 8.0),
         "history_limit": opt_cfg.get("gepa_history_limit", 200),
         "val_split": opt_cfg.get("gepa_val_split", 0.2),
         "seed": opt_cfg.get("gepa_seed", 13),
+        "coreset": opt_cfg.get("gepa_coreset", False),
+        "coreset_size": opt_cfg.get("gepa_coreset_size"),
         "max_bootstrapped_demos": opt_cfg.get("max_bootstrapped_demos", 4),
     }
     if optimization_options.get("reflection_model") is None:
@@ -233,11 +281,24 @@ def build_workflow_config_from_yaml(
         enable_streaming=supervisor_cfg.get("enable_streaming", True),
         pipeline_profile=effective_profile,
         simple_task_max_words=simple_task_max_words,
+        enable_speculative_execution=bool(supervisor_cfg.get("speculative_execution", False)),
+        adaptive_min_confidence=float(supervisor_cfg.get("adaptive_min_confidence", 0.8)),
+        adaptive_history_window=int(supervisor_cfg.get("adaptive_history_window", 200)),
         conversation_context_max_messages=int(conversation_context_max_messages),
         conversation_context_max_chars=int(conversation_context_max_chars),
         parallel_threshold=yaml_config.get("workflow", {})
         .get("execution", {})
         .get("parallel_threshold", 3),
+        discussion_speaker_selection=_speaker_selection(
+            yaml_config.get("workflow", {})
+            .get("execution", {})
+            .get("discussion_speaker_selection", "auto")
+        ),
+        discussion_transcript_window=int(
+            yaml_config.get("workflow", {})
+            .get("execution", {})
+            .get("discussion_transcript_window", 20)
+        ),
         dspy_model=effective_model,
         dspy_temperature=yaml_config.get("dspy", {}).get("temperature", 0.7),
         dspy_max_tokens=yaml_config.get("dspy", {}).get("max_tokens", 2000),
@@ -245,6 +306,10 @@ def build_workflow_config_from_yaml(
         require_compiled=yaml_config.get("dspy", {}).get("require_compiled", False),
         refinement_threshold=quality_cfg.get("refinement_threshold", 8.0),
         enable_refinement=quality_cfg.get("enable_refinement", True),
+        refinement_strategy=quality_cfg.get("refinement_strategy", "none"),
+        refinement_candidates=int(quality_cfg.get("refinement_candidates", 3)),
+        refinement_max_concurrency=int(quality_cfg.get("refinement_max_concurrency", 3)),
+        refinement_time_budget_seconds=quality_cfg.get("refinement_time_budget_seconds", 30.0),
         enable_progress_eval=quality_cfg.get("enable_progress_eval", True),
         enable_quality_eval=quality_cfg.get("enable_quality_eval", True),
         judge_threshold=quality_cfg.get("judge_threshold", 7.0),
@@ -272,9 +337,15 @@ def build_workflow_config_from_yaml(
         dspy_optimizer="gepa" if use_gepa else "bootstrap",
         gepa_options=optimization_options,
         enable_handoffs=handoffs_enabled,
+        handoff_history_limit=int(handoffs_cfg.get("history_limit", 500)),
+        handoff_history_path=handoffs_cfg.get("history_path"),
         allow_gepa_optimization=allow_gepa,
         use_typed_signatures=yaml_config.get("dspy", {}).get("use_typed_signatures", True),
         enable_routing_cache=yaml_config.get("dspy", {}).get("enable_routing_cache", True),
         routing_cache_ttl_seconds=yaml_config.get("dspy", {}).get("routing_cache_ttl_seconds", 300),
+        routing_replay_path=yaml_config.get("dspy", {}).get("routing_replay_path"),
+        routing_replay_sample_rate=float(
+            yaml_config.get("dspy", {}).get("routing_replay_sample_rate", 1.0)
+        ),
         checkpoint_dir=checkpoint_dir_value,
     )
@@ -6,6 +6,7 @@ Consolidated from: context.py, compilation.py
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import logging
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
@@ -202,6 +203,14 @@ def get_compiled_supervisor(
 # =============================================================================
 
 
+# Cancel event of the streaming run in progress (see ``SupervisorWorkflow.run_stream``).
+# A context variable, not a SupervisorContext field: one context serves concurrent
+# runs, while each run's executors inherit the variable from the run's task.
+current_cancel_event: contextvars.ContextVar[asyncio.Event | None] = contextvars.ContextVar(
+    "current_cancel_event", default=None
+)
+
+
 @dataclass
 class SupervisorContext:
     """Container for SupervisorWorkflow orchestration state."""
@@ -250,3 +259,10 @@ class SupervisorContext:
     # Stored in context for strategies to access without relying on shared agent mutation.
     # Note: Use get_current_reasoning_effort() from supervisor module for contextvar access.
     reasoning_effort: str | None = None
+
+    # Speculative routing/search started by the analysis executor for the current
+    # task (a SpeculativePrefetch); consumed by the routing executor.
+    speculation: Any | None = None
+
+    # PhasePolicy for the "adaptive" pipeline profile, created on first use.
+    phase_policy: Any | None = None
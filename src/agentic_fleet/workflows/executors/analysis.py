@@ -6,10 +6,12 @@ Split out of `workflows/executors.py` to keep each executor implementation focus
 from __future__ import annotations
 
 import re
+from collections.abc import Callable
 from dataclasses import replace
+from functools import partial
 from hashlib import sha256
 from time import perf_counter
-from typing import Any
+from typing import Any, cast
 
 from agent_framework._workflows import Executor, WorkflowContext
 
@@ -27,6 +29,7 @@ from ..conversation_context import (
 from ..exceptions import ToolError
 from ..models import AnalysisMessage, AnalysisResult, TaskMessage
 from .base import handler
+from .speculation import SpeculativePrefetch, run_off_loop, speculation_enabled
 
 logger = setup_logger(__name__)
 
@@ -138,6 +141,16 @@ class AnalysisExecutor(Executor):
             is_simple = self._is_simple_task(task_msg.task, simple_threshold)
             use_light_path = pipeline_profile == "light" and is_simple
 
+            # Speculatively route (and search) while analysis runs; the routing
+            # executor picks the routing up from the context.
+            speculation = None
+            if not use_light_path and speculation_enabled(cfg):
+                speculation = SpeculativePrefetch.start(
+                    self.supervisor, self.context, task_msg.task, conversation_context
+                )
+            self.context.speculation = speculation
+
+            analysis_dict: dict[str, Any]
             try:
                 if use_light_path:
                     analysis_dict = self._fallback_analysis(task_msg.task)
@@ -159,13 +172,21 @@ class AnalysisExecutor(Executor):
                         retry_backoff = max(
                             0.0, float(self.context.config.dspy_retry_backoff_seconds)
                         )
-                        analysis_dict = await async_call_with_retry(
-                            self.supervisor.analyze_task,
-                            analysis_input,
-                            use_tools=True,
-                            perform_search=True,
-                            attempts=retry_attempts,
-                            backoff_seconds=retry_backoff,
+                        analyze: Callable[..., Any] = self.supervisor.analyze_task
+                        if speculation is not None:
+                            # Keep the event loop free for the speculative search.
+                            analyze = partial(run_off_loop, analyze)
+                        # Coroutine results are awaited, so this is analyze_task's dict.
+                        analysis_dict = cast(
+                            dict[str, Any],
+                            await async_call_with_retry(
+                                analyze,
+                                analysis_input,
+                                use_tools=True,
+                                perform_search=True,
+                                attempts=retry_attempts,
+                                backoff_seconds=retry_backoff,
+                            ),
                         )
                         if cache is not None:
                             cache.set(cache_key, analysis_dict)
@@ -184,6 +205,8 @@ class AnalysisExecutor(Executor):
 
                 # Convert to AnalysisResult
                 analysis_result = self._to_analysis_result(analysis_dict)
+                if speculation is not None:
+                    speculation.analysis_finished()
 
                 # Async search if needed
                 if (
@@ -193,9 +216,13 @@ class AnalysisExecutor(Executor):
                     and not use_light_path
                 ):
                     try:
-                        search_context = await self.supervisor.perform_web_search_async(
-                            analysis_result.search_query
-                        )
+                        search_context = None
+                        if speculation is not None:
+                            search_context = await speculation.take_search()
+                        if not search_context:
+                            search_context = await self.supervisor.perform_web_search_async(
+                                analysis_result.search_query
+                            )
                         if search_context:
                             analysis_result = replace(
                                 analysis_result, search_context=search_context
@@ -210,6 +237,10 @@ class AnalysisExecutor(Executor):
                     except Exception as exc:
                         logger.warning("Async web search failed: %s", exc)
 
+                if speculation is not None:
+                    speculation.discard_search()
+                    speculation.record(metadata)
+
                 # Record timing
                 duration = max(0.0, perf_counter() - start_t)
                 self.context.latest_phase_timings["analysis"] = duration
@@ -245,6 +276,8 @@ class AnalysisExecutor(Executor):
                 self.context.latest_phase_status["analysis"] = "fallback"
                 await ctx.send_message(analysis_msg)
             finally:
+                if speculation is not None:
+                    speculation.discard_search()
                 end_mem_mb = get_process_rss_mb()
                 try:
                     self.context.latest_phase_memory_mb["analysis"] = end_mem_mb
@@ -14,7 +14,7 @@ from agentic_fleet.utils.infra.logging import setup_logger
 from agentic_fleet.utils.infra.telemetry import optional_span
 
 from ...utils.infra.profiling import get_process_rss_mb
-from ..context import SupervisorContext
+from ..context import SupervisorContext, current_cancel_event
 from ..models import ExecutionMessage, ExecutionOutcome, MagenticAgentMessageEvent, RoutingMessage
 from ..strategies import run_execution_phase_streaming
 from .base import handler
@@ -82,6 +82,7 @@ class ExecutionExecutor(Executor):
                     routing=routing_decision,
                     task=task,
                     context=self.context,
+                    cancel_event=current_cancel_event.get(),
                 ):
                     if isinstance(event, MagenticAgentMessageEvent):
                         # Emit intermediate event
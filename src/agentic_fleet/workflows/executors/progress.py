@@ -18,6 +18,7 @@ from ...dspy_modules.reasoner import DSPyReasoner
 from ...utils.infra.profiling import get_process_rss_mb
 from ...utils.models import RoutingDecision
 from ..context import SupervisorContext
+from ..helpers import PhasePlan
 from ..models import ExecutionMessage, ProgressMessage, ProgressReport
 from .base import handler
 
@@ -67,8 +68,10 @@ class ProgressExecutor(Executor):
                 cfg = self.context.config
                 pipeline_profile = getattr(cfg, "pipeline_profile", "full")
                 enable_eval = getattr(cfg, "enable_progress_eval", True)
+                phase_plan = PhasePlan.from_metadata(execution_msg.metadata)
+                skipped = phase_plan is not None and phase_plan.progress.skipped
 
-                if pipeline_profile == "light" or not enable_eval:
+                if pipeline_profile == "light" or not enable_eval or skipped:
                     progress_report = ProgressReport(
                         action="complete", feedback="", used_fallback=True
                     )
@@ -105,7 +108,7 @@ class ProgressExecutor(Executor):
                 duration = max(0.0, perf_counter() - start_t)
                 self.context.latest_phase_timings["progress"] = duration
                 self.context.latest_phase_status["progress"] = (
-                    "fallback" if used_fallback else "success"
+                    "skipped" if skipped else "fallback" if used_fallback else "success"
                 )
 
                 progress_msg = ProgressMessage(
@@ -15,9 +15,11 @@ from agentic_fleet.utils.infra.resilience import async_call_with_retry
 from agentic_fleet.utils.infra.telemetry import optional_span
 
 from ...dspy_modules.reasoner import DSPyReasoner
+from ...dspy_modules.refinement import BestOfN
 from ...utils.infra.profiling import get_process_rss_mb
 from ...utils.models import ExecutionMode, RoutingDecision
 from ..context import SupervisorContext
+from ..helpers import PhasePlan
 from ..models import FinalResultMessage, ProgressMessage, QualityMessage, QualityReport
 from .base import handler
 
@@ -56,8 +58,12 @@ class QualityExecutor(Executor):
                 cfg = self.context.config
                 pipeline_profile = getattr(cfg, "pipeline_profile", "full")
                 enable_eval = getattr(cfg, "enable_quality_eval", True)
+                phase_plan = PhasePlan.from_metadata(progress_msg.metadata)
+                skipped = phase_plan is not None and phase_plan.quality.skipped
+                result = progress_msg.result
+                metadata = progress_msg.metadata
 
-                if pipeline_profile == "light" or not enable_eval:
+                if pipeline_profile == "light" or not enable_eval or skipped:
                     # Use 0.0 to indicate "not evaluated" or missing quality data
                     quality_report = QualityReport(
                         score=0.0, missing="", improvements="", used_fallback=True
@@ -76,6 +82,16 @@ class QualityExecutor(Executor):
                     quality_report = self._to_quality_report(quality_dict)
                     used_fallback = False
 
+                    if (
+                        getattr(cfg, "enable_refinement", False)
+                        and getattr(cfg, "refinement_strategy", "none") == "best_of_n"
+                        and quality_report.score < cfg.refinement_threshold
+                    ):
+                        result, quality_report, refinement = await self._refine_best_of_n(
+                            progress_msg.task, result, quality_report
+                        )
+                        metadata = {**metadata, "refinement": refinement}
+
                 routing = None
                 if "routing" in progress_msg.metadata:
                     routing_data = progress_msg.metadata["routing"]
@@ -87,7 +103,7 @@ class QualityExecutor(Executor):
                 duration = max(0.0, perf_counter() - start_t)
                 self.context.latest_phase_timings["quality"] = duration
                 self.context.latest_phase_status["quality"] = (
-                    "fallback" if used_fallback else "success"
+                    "skipped" if skipped else "fallback" if used_fallback else "success"
                 )
 
                 # Build FinalResultMessage and yield as workflow output
@@ -120,14 +136,14 @@ class QualityExecutor(Executor):
                         logger.warning(f"Failed to generate narrative: {e}")
 
                 final_msg = FinalResultMessage(
-                    result=progress_msg.result,
+                    result=result,
                     routing=routing,
                     quality=quality_report,
                     judge_evaluations=[],
                     execution_summary=execution_summary,
                     phase_timings=self.context.latest_phase_timings.copy(),
                     phase_status=self.context.latest_phase_status.copy(),
-                    metadata=progress_msg.metadata,
+                    metadata=metadata,
                 )
                 await ctx.yield_output(final_msg)
 
@@ -180,6 +196,61 @@ class QualityExecutor(Executor):
                     # Memory metrics are optional and should never fail the workflow.
                     pass
 
+    async def _refine_best_of_n(
+        self, task: str, result: str, report: QualityReport
+    ) -> tuple[str, QualityReport, dict[str, Any]]:
+        """Replace a low-scoring result with the best of N refined candidates.
+
+        Candidates come from the response refiner, given the user's task, the
+        current result as the draft and the quality assessment's missing
+        elements and improvements, and are scored with ``assess_quality``
+        against the task. The original result is kept unless a candidate
+        scores higher.
+
+        Returns:
+            The result, its quality report and refinement metadata.
+        """
+        cfg = self.context.config
+        assessments: dict[str, dict[str, Any]] = {}
+
+        def score(task: str, candidate: str) -> float:
+            assessment = self.supervisor.assess_quality(task=task, result=candidate)
+            assessments[candidate] = assessment
+            return float(assessment.get("score", 0.0) or 0.0)
+
+        strategy = BestOfN(
+            self.supervisor.response_refiner,
+            score,
+            n=cfg.refinement_candidates,
+            max_concurrency=cfg.refinement_max_concurrency,
+            stop_threshold=cfg.refinement_threshold,
+            time_budget_seconds=cfg.refinement_time_budget_seconds,
+        )
+        feedback = (
+            f"Missing elements: {report.missing or 'none'}\n"
+            f"Required improvements: {report.improvements or 'none'}"
+        )
+        refined = await strategy.refine(
+            task, initial_answer=result, inputs={"draft": result, "feedback": feedback}
+        )
+        metadata = dict(refined.metadata or {})
+        best_score = max(refined.scores or [0.0])
+        applied = bool(refined.candidates) and best_score > report.score
+        metadata.update(initial_score=report.score, best_score=best_score, applied=applied)
+        logger.info(
+            "Best-of-N refinement: %d/%d candidates in %.2fs (saved ~%.2fs), score %.1f -> %.1f",
+            metadata["candidates_generated"],
+            metadata["n"],
+            metadata["elapsed_seconds"],
+            metadata["time_saved_seconds"],
+            report.score,
+            best_score if applied else report.score,
+        )
+        if not applied:
+            return result, report, metadata
+        best = refined.best_answer
+        return best, self._to_quality_report(assessments[best]), metadata
+
     def _to_quality_report(self, payload: dict[str, Any]) -> QualityReport:
         """Convert dictionary payload to QualityReport.
 
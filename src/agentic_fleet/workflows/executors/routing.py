@@ -5,9 +5,7 @@ Split out of `workflows/executors.py` to keep each executor implementation focus
 
 from __future__ import annotations
 
-from collections.abc import Iterable
 from time import perf_counter
-from typing import Any, cast
 
 from agent_framework._workflows import Executor, WorkflowContext
 
@@ -20,9 +18,18 @@ from ...dspy_modules.reasoner import DSPyReasoner
 from ...utils.infra.profiling import get_process_rss_mb
 from ...utils.models import ExecutionMode, RoutingDecision, ensure_routing_decision
 from ..context import SupervisorContext
-from ..helpers import detect_routing_edge_cases, normalize_routing_decision
+from ..helpers import (
+    PhasePlan,
+    PhasePolicy,
+    QualityHistory,
+    build_routing_context,
+    build_team_descriptions,
+    detect_routing_edge_cases,
+    normalize_routing_decision,
+)
 from ..models import AnalysisMessage, RoutingMessage, RoutingPlan
 from .base import handler
+from .speculation import SpeculativePrefetch
 
 logger = setup_logger(__name__)
 
@@ -68,6 +75,11 @@ class RoutingExecutor(Executor):
             cfg = self.context.config
             pipeline_profile = getattr(cfg, "pipeline_profile", "full")
             use_light_routing = pipeline_profile == "light" and simple_mode
+            # Routing started by the analysis executor, if speculation is enabled.
+            speculation = getattr(self.context, "speculation", None)
+            if not isinstance(speculation, SpeculativePrefetch):
+                speculation = None
+            self.context.speculation = None
 
             try:
                 if use_light_routing:
@@ -78,83 +90,39 @@ class RoutingExecutor(Executor):
                     )
                     edge_cases = []
                     used_fallback = True
+                    used_speculation = False
                 else:
                     agents = self.context.agents or {}
 
-                    team_descriptions = {}
-                    for name, agent in agents.items():
-                        desc = getattr(agent, "description", "") or getattr(agent, "name", "")
-
-                        # Inspect for rich metadata (Tools)
-                        tools_info: list[str] = []
-                        tool_names_obj = getattr(agent, "tool_names", None)
-                        tools_obj = getattr(agent, "tools", None)
-                        if tool_names_obj:
-                            # Foundry Agents might store names directly
-                            if isinstance(tool_names_obj, str):
-                                tools_info = [tool_names_obj]
-                            elif isinstance(tool_names_obj, Iterable):
-                                tools_info = [
-                                    str(name) for name in cast(Iterable[Any], tool_names_obj)
-                                ]
-                        elif tools_obj:
-                            # Local agents have tool objects
-                            if isinstance(tools_obj, str):
-                                tools_info = [tools_obj]
-                            elif isinstance(tools_obj, Iterable):
-                                tools_info = [
-                                    getattr(t, "name", str(t))
-                                    for t in cast(Iterable[Any], tools_obj)
-                                ]
-
-                        # Inspect for Capabilities
-                        caps_info: list[str] = []
-                        caps_obj = getattr(agent, "capabilities", None)
-                        if caps_obj:
-                            if isinstance(caps_obj, str):
-                                caps_info = [caps_obj]
-                            elif isinstance(caps_obj, Iterable):
-                                caps_info = [str(cap) for cap in cast(Iterable[Any], caps_obj)]
-
-                        # Construct rich description
-                        extras = []
-                        if tools_info:
-                            extras.append(f"Tools: [{', '.join(tools_info)}]")
-                        if caps_info:
-                            extras.append(f"Capabilities: [{', '.join(caps_info)}]")
-
-                        if extras:
-                            desc += " " + " ".join(extras)
-
-                        team_descriptions[name] = desc
+                    team_descriptions = build_team_descriptions(agents)
 
                     retry_attempts = max(1, int(cfg.dspy_retry_attempts))
                     retry_backoff = max(0.0, float(cfg.dspy_retry_backoff_seconds))
 
                     conversation_context = str(metadata.get("conversation_context", "") or "")
-                    routing_context_parts: list[str] = []
-                    if conversation_context:
-                        routing_context_parts.append(
-                            "Conversation context (most recent messages):\n" + conversation_context
+                    routing_context = build_routing_context(
+                        conversation_context, analysis_msg.analysis.search_context
+                    )
+
+                    raw_routing = None
+                    if speculation is not None:
+                        raw_routing = await speculation.take_routing(
+                            analysis_msg.task, routing_context
                         )
-                    if analysis_msg.analysis.search_context:
-                        routing_context_parts.append(
-                            "Web/search context:\n" + str(analysis_msg.analysis.search_context)
+                    used_speculation = raw_routing is not None
+                    if raw_routing is None:
+                        raw_routing = await async_call_with_retry(
+                            self.supervisor.route_task,
+                            task=analysis_msg.task,
+                            team=team_descriptions,
+                            context=routing_context,
+                            handoff_history="",
+                            max_backtracks=getattr(cfg, "dspy_max_backtracks", 2),
+                            # Routing cache keys are task-only; bypass cache when conversation context is present.
+                            skip_cache=bool(conversation_context),
+                            attempts=retry_attempts,
+                            backoff_seconds=retry_backoff,
                         )
-                    routing_context = "\n\n".join(routing_context_parts).strip()
-
-                    raw_routing = await async_call_with_retry(
-                        self.supervisor.route_task,
-                        task=analysis_msg.task,
-                        team=team_descriptions,
-                        context=routing_context,
-                        handoff_history="",
-                        max_backtracks=getattr(cfg, "dspy_max_backtracks", 2),
-                        # Routing cache keys are task-only; bypass cache when conversation context is present.
-                        skip_cache=bool(conversation_context),
-                        attempts=retry_attempts,
-                        backoff_seconds=retry_backoff,
-                    )
 
                     if isinstance(raw_routing, dict):
                         tool_plan = raw_routing.get("tool_plan")
@@ -215,6 +183,21 @@ class RoutingExecutor(Executor):
                         logger.info(f"Edge cases detected: {', '.join(edge_cases)}")
                     used_fallback = False
 
+                    if pipeline_profile == "adaptive":
+                        latency_budget = ""
+                        if isinstance(raw_routing, dict):
+                            latency_budget = str(raw_routing.get("latency_budget") or "")
+                        phase_plan = await self._plan_phases(
+                            analysis_msg, routing_decision, latency_budget
+                        )
+                        metadata["phase_policy"] = phase_plan.to_metadata()
+                        self.context.latest_phase_status["progress_policy"] = (
+                            phase_plan.progress.status()
+                        )
+                        self.context.latest_phase_status["quality_policy"] = (
+                            phase_plan.quality.status()
+                        )
+
                 routing_plan = RoutingPlan(
                     decision=routing_decision,
                     edge_cases=edge_cases,
@@ -225,8 +208,15 @@ class RoutingExecutor(Executor):
                 duration = max(0.0, perf_counter() - start_t)
                 self.context.latest_phase_timings["routing"] = duration
                 self.context.latest_phase_status["routing"] = (
-                    "fallback" if used_fallback else "success"
+                    "fallback"
+                    if used_fallback
+                    else "speculative"
+                    if used_speculation
+                    else "success"
                 )
+                if speculation is not None:
+                    speculation.cancel()
+                    speculation.record(metadata)
 
                 routing_msg = RoutingMessage(
                     task=analysis_msg.task,
@@ -266,6 +256,8 @@ class RoutingExecutor(Executor):
                 )
                 await ctx.send_message(routing_msg)
             finally:
+                if speculation is not None:
+                    speculation.cancel()
                 end_mem_mb = get_process_rss_mb()
                 try:
                     self.context.latest_phase_memory_mb["routing"] = end_mem_mb
@@ -274,6 +266,38 @@ class RoutingExecutor(Executor):
                     # Memory metrics are optional and should never fail the workflow.
                     pass
 
+    async def _plan_phases(
+        self,
+        analysis_msg: AnalysisMessage,
+        routing_decision: RoutingDecision,
+        latency_budget: str,
+    ) -> PhasePlan:
+        """Decide which later phases to skip (``adaptive`` pipeline profile)."""
+        policy = getattr(self.context, "phase_policy", None)
+        if not isinstance(policy, PhasePolicy):
+            cfg = self.context.config
+            history_manager = self.context.history_manager
+            policy = PhasePolicy(
+                min_confidence=float(getattr(cfg, "adaptive_min_confidence", 0.8)),
+                quality_threshold=float(getattr(cfg, "quality_threshold", 8.0)),
+                history=(
+                    QualityHistory(
+                        history_manager,
+                        window=int(getattr(cfg, "adaptive_history_window", 200)),
+                    )
+                    if history_manager is not None
+                    else None
+                ),
+            )
+            self.context.phase_policy = policy
+        return await policy.decide(
+            analysis_msg.task,
+            routing_decision,
+            complexity=analysis_msg.analysis.complexity,
+            latency_budget=latency_budget,
+            analysis_cached=self.context.latest_phase_status.get("analysis") == "cached",
+        )
+
     def _fallback_routing(self, task: str) -> RoutingDecision:
         """Perform fallback routing when DSPy fails.
 
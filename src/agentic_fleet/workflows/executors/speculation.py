@@ -0,0 +1,215 @@
+"""Speculative routing and web search, overlapped with the analysis phase.
+
+Enabled with ``workflow.supervisor.speculative_execution``. Before the analysis
+executor calls the analyzer it starts:
+
+- routing for the raw task (plus conversation context), and
+- a web search for the raw task when ``is_time_sensitive_task`` fires.
+
+Both run while analysis does. Afterwards they are reconciled:
+
+- the search result is reused if analysis asks for a web search, otherwise it
+  is discarded;
+- the routing executor reuses the speculative routing when its inputs match the
+  ones it would have used (same task, no search context the speculative call
+  did not see), otherwise it cancels it and routes normally.
+
+Durations and the overlap with analysis are recorded in the phase timings
+(``speculative_routing``, ``speculative_routing_overlap``, ...), and the outcome
+and the saved latency in run metadata under ``speculation``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import Callable
+from dataclasses import dataclass
+from functools import partial
+from time import perf_counter
+from typing import Any
+
+from agentic_fleet.utils.infra.logging import setup_logger
+
+from ...dspy_modules.reasoner_utils import is_time_sensitive_task
+from ..context import SupervisorContext
+from ..helpers import build_routing_context, build_team_descriptions
+
+logger = setup_logger(__name__)
+
+
+def _submit(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> asyncio.Future[Any]:
+    """Start ``fn`` now, in the default thread pool if it is synchronous.
+
+    Sync DSPy calls block the event loop, so they run in a thread; submitting
+    to the pool (rather than scheduling a task) starts them even if the caller
+    blocks right after.
+    """
+    if inspect.iscoroutinefunction(fn):
+        return asyncio.ensure_future(fn(*args, **kwargs))
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, partial(fn, *args, **kwargs))
+
+
+async def run_off_loop(fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+    """Await ``fn`` without blocking the event loop (see ``_submit``)."""
+    return await _submit(fn, *args, **kwargs)
+
+
+@dataclass(slots=True)
+class _Job:
+    future: asyncio.Future[Any]
+    started_at: float
+    finished_at: float | None = None
+    outcome: str = "pending"
+    saved_seconds: float = 0.0
+
+    def __post_init__(self) -> None:
+        self.future.add_done_callback(self._finished)
+
+    def _finished(self, _future: asyncio.Future[Any]) -> None:
+        self.finished_at = perf_counter()
+
+    def cancel(self, outcome: str) -> None:
+        if self.outcome == "pending":
+            self.outcome = outcome
+        if not self.future.done():
+            self.future.cancel()
+        else:
+            # Retrieve the exception (if any) so asyncio does not log it as unhandled.
+            _ = self.future.cancelled() or self.future.exception()
+
+    async def take(self) -> Any | None:
+        """Await the job and return its result, or ``None`` if it failed."""
+        waited_from = perf_counter()
+        try:
+            result = await self.future
+        except asyncio.CancelledError:
+            if self.future.cancelled():
+                self.outcome = "cancelled"
+                return None
+            raise
+        except Exception as exc:
+            logger.warning("Speculative job failed: %s", exc)
+            self.outcome = "failed"
+            return None
+        # Serially the job would have cost its full duration; only the wait is paid.
+        waited = perf_counter() - waited_from
+        self.saved_seconds = max(0.0, self.duration() - waited)
+        self.outcome = "hit"
+        return result
+
+    def duration(self) -> float:
+        return max(0.0, (self.finished_at or perf_counter()) - self.started_at)
+
+    def overlap(self, until: float) -> float:
+        """Seconds the job ran concurrently with a phase ending at ``until``."""
+        return max(0.0, min(self.finished_at or until, until) - self.started_at)
+
+
+class SpeculativePrefetch:
+    """Routing and web-search jobs started alongside analysis for one task."""
+
+    def __init__(
+        self,
+        context: SupervisorContext,
+        task: str,
+        routing_context: str,
+        routing: _Job | None,
+        search: _Job | None,
+    ) -> None:
+        self.context = context
+        self.task = task
+        self.routing_context = routing_context
+        self._routing = routing
+        self._search = search
+        self._analysis_finished_at: float | None = None
+
+    @classmethod
+    def start(
+        cls,
+        supervisor: Any,
+        context: SupervisorContext,
+        task: str,
+        conversation_context: str = "",
+    ) -> SpeculativePrefetch:
+        """Start speculative routing (and a web search for time-sensitive tasks)."""
+        cfg = context.config
+        routing_context = build_routing_context(conversation_context)
+        routing = _Job(
+            _submit(
+                supervisor.route_task,
+                task=task,
+                team=build_team_descriptions(context.agents or {}),
+                context=routing_context,
+                handoff_history="",
+                max_backtracks=getattr(cfg, "dspy_max_backtracks", 2),
+                skip_cache=bool(conversation_context),
+            ),
+            perf_counter(),
+        )
+        search = None
+        if is_time_sensitive_task(task):
+            search = _Job(_submit(supervisor.perform_web_search_async, task), perf_counter())
+        logger.debug("Speculation started: routing=yes, search=%s", search is not None)
+        return cls(context, task, routing_context, routing, search)
+
+    def analysis_finished(self) -> None:
+        """Mark the end of analysis; overlaps are measured up to this point."""
+        if self._analysis_finished_at is None:
+            self._analysis_finished_at = perf_counter()
+
+    async def take_search(self) -> str | None:
+        """Return the speculative search result, or ``None`` if there is none."""
+        if self._search is None or self._search.outcome != "pending":
+            return None
+        return await self._search.take() or None
+
+    def discard_search(self) -> None:
+        """Drop the speculative search (analysis did not ask for one)."""
+        if self._search is not None:
+            self._search.cancel("discarded")
+
+    async def take_routing(self, task: str, routing_context: str) -> Any | None:
+        """Return the speculative routing if it was made with the same inputs.
+
+        On a mismatch the job is cancelled and ``None`` is returned, so the caller
+        routes normally.
+        """
+        if self._routing is None or self._routing.outcome != "pending":
+            return None
+        if task != self.task or routing_context != self.routing_context:
+            self._routing.cancel("miss")
+            return None
+        return await self._routing.take()
+
+    def cancel(self) -> None:
+        """Cancel whatever has not been reused."""
+        for job in (self._routing, self._search):
+            if job is not None:
+                job.cancel("cancelled")
+
+    def record(self, metadata: dict[str, Any]) -> None:
+        """Write phase timings/status and the ``speculation`` metadata entry."""
+        analysis_end = self._analysis_finished_at or perf_counter()
+        summary: dict[str, Any] = {"saved_seconds": 0.0}
+        for name, job in (("routing", self._routing), ("search", self._search)):
+            if job is None:
+                summary[name] = "skipped"
+                continue
+            phase = f"speculative_{name}"
+            self.context.latest_phase_timings[phase] = job.duration()
+            self.context.latest_phase_timings[f"{phase}_overlap"] = job.overlap(analysis_end)
+            self.context.latest_phase_status[phase] = job.outcome
+            summary[name] = job.outcome
+            summary["saved_seconds"] += job.saved_seconds
+        summary["saved_seconds"] = round(summary["saved_seconds"], 4)
+        metadata["speculation"] = summary
+
+
+def speculation_enabled(cfg: Any) -> bool:
+    """Whether speculative execution is switched on (tolerates mock configs)."""
+    return getattr(cfg, "enable_speculative_execution", False) is True
+
+
+__all__ = ["SpeculativePrefetch", "run_off_loop", "speculation_enabled"]
@@ -12,9 +12,11 @@ from __future__ import annotations
 
 import json
 import logging
-from collections.abc import Callable
+from collections import Counter, OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass, field
 from datetime import datetime
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import dspy
@@ -81,6 +83,96 @@ class HandoffContext:
         return cls(**data_copy)
 
 
+class HandoffHistory:
+    """Recent handoffs plus running statistics over every handoff recorded.
+
+    The last ``maxlen`` ``HandoffContext`` records are kept in a ring buffer.
+    Pair counts, the effort distribution and the handoffs-per-task average are
+    updated on ``append``, so summaries never rescan the records. With ``path``
+    set, every record is also appended to that file as one JSON line, which
+    keeps the full history on disk without holding it in memory.
+
+    Tasks are told apart by their text: a handoff starts a new task unless its
+    task was seen among the last ``task_window`` distinct tasks.
+    """
+
+    def __init__(
+        self,
+        maxlen: int = 500,
+        path: str | Path | None = None,
+        *,
+        task_window: int = 256,
+    ) -> None:
+        self._recent: deque[HandoffContext] = deque(maxlen=max(1, maxlen))
+        self.path = Path(path) if path else None
+        self._task_window = task_window
+        self._recent_tasks: OrderedDict[int, None] = OrderedDict()
+        self.pair_counts: Counter[str] = Counter()
+        self.effort_counts = {"simple": 0, "moderate": 0, "complex": 0}
+        self.total = 0
+        self.tasks = 0
+
+    @property
+    def maxlen(self) -> int:
+        """Number of records kept in memory."""
+        return self._recent.maxlen or 0
+
+    def append(self, handoff: HandoffContext) -> None:
+        """Record a handoff, update the counters and stream it to ``path``."""
+        self._recent.append(handoff)
+        self.total += 1
+        self.pair_counts[f"{handoff.from_agent} → {handoff.to_agent}"] += 1
+        effort = handoff.estimated_effort.lower()
+        if effort in self.effort_counts:
+            self.effort_counts[effort] += 1
+
+        task_key = hash(handoff.task)
+        if task_key in self._recent_tasks:
+            self._recent_tasks.move_to_end(task_key)
+        else:
+            self.tasks += 1
+            self._recent_tasks[task_key] = None
+            if len(self._recent_tasks) > self._task_window:
+                self._recent_tasks.popitem(last=False)
+
+        if self.path is not None:
+            self._write(self.path, (handoff,), mode="a")
+
+    def clear(self) -> None:
+        """Drop the recent records and reset every counter."""
+        self._recent.clear()
+        self._recent_tasks.clear()
+        self.pair_counts.clear()
+        self.effort_counts = dict.fromkeys(self.effort_counts, 0)
+        self.total = 0
+        self.tasks = 0
+
+    def avg_handoffs_per_task(self) -> float:
+        """Average number of handoffs per distinct task."""
+        return self.total / self.tasks if self.tasks else 0.0
+
+    def export(self, filepath: str | Path) -> None:
+        """Write the recent records to ``filepath`` as JSON lines."""
+        self._write(Path(filepath), self._recent, mode="w")
+
+    @staticmethod
+    def _write(path: Path, handoffs: Iterable[HandoffContext], *, mode: str) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open(mode, encoding="utf-8") as f:
+            for handoff in handoffs:
+                f.write(json.dumps(handoff.to_dict(), default=str))
+                f.write("\n")
+
+    def __len__(self) -> int:
+        return len(self._recent)
+
+    def __iter__(self) -> Iterator[HandoffContext]:
+        return iter(self._recent)
+
+    def __getitem__(self, index: int) -> HandoffContext:
+        return self._recent[index]
+
+
 class HandoffManager:
     """Manages agent-to-agent handoffs with DSPy intelligence.
 
@@ -96,6 +188,8 @@ class HandoffManager:
         self,
         dspy_supervisor: DSPyReasoner,
         get_compiled_supervisor: Callable[[], DSPyReasoner] | None = None,
+        history_limit: int = 500,
+        history_path: str | Path | None = None,
     ):
         """Initialize HandoffManager.
 
@@ -104,6 +198,8 @@ class HandoffManager:
             get_compiled_supervisor: Optional provider that returns the compiled reasoner.
                 When provided, handoff chains are invoked on the compiled reasoner;
                 otherwise local ChainOfThought fallbacks are used.
+            history_limit: Number of recent handoff records kept in memory
+            history_path: Optional JSONL file every handoff record is appended to
         """
         self.supervisor = dspy_supervisor
         self._get_compiled_supervisor = get_compiled_supervisor
@@ -120,7 +216,7 @@ class HandoffManager:
             if get_compiled_supervisor is not None
             else dspy.ChainOfThought(HandoffQualityAssessment)  # type: ignore[arg-type]
         )
-        self.handoff_history: list[HandoffContext] = []
+        self.handoff_history = HandoffHistory(history_limit, history_path)
 
     def _sup(self) -> DSPyReasoner:
         """Return preferred reasoner (compiled if provider is available).
@@ -309,10 +405,10 @@ class HandoffManager:
             )
 
             # Store in history
-            # Append the full HandoffContext object to handoff_history.
+            # Record the full HandoffContext object in handoff_history.
             # This captures all relevant handoff data (agents, objectives, artifacts, quality checklist, etc.)
             # for later analysis of handoff quality, pattern tracking, and auditability.
-            self.handoff_history.append(handoff_context)
+            self._record_handoff(handoff_context)
             logger.info(f"Handoff package created: {from_agent} → {to_agent}")
             logger.debug(f"Estimated effort: {handoff_context.estimated_effort}")
 
@@ -397,13 +493,23 @@ class HandoffManager:
                 "improvements": "Unable to assess",
             }
 
+    def _record_handoff(self, handoff_context: HandoffContext) -> None:
+        """Add a handoff to the history without letting a write failure break the handoff."""
+        try:
+            self.handoff_history.append(handoff_context)
+        except OSError as e:
+            logger.warning(f"Error streaming handoff history: {e}")
+
     def get_handoff_summary(self) -> dict[str, Any]:
         """Get statistics on handoffs.
 
+        Counters cover every handoff since the last ``clear_history``, not
+        just the records still held in memory.
+
         Returns:
             Dictionary with handoff statistics
         """
-        if not self.handoff_history:
+        if not self.handoff_history.total:
             return {
                 "total_handoffs": 0,
                 "handoff_pairs": {},
@@ -412,11 +518,12 @@ class HandoffManager:
             }
 
         return {
-            "total_handoffs": len(self.handoff_history),
+            "total_handoffs": self.handoff_history.total,
             "handoff_pairs": self._count_handoff_pairs(),
             "avg_handoffs_per_task": self._calculate_avg_handoffs(),
             "most_common_handoffs": self._get_common_handoffs(top_n=5),
             "effort_distribution": self._get_effort_distribution(),
+            "recent_handoffs": len(self.handoff_history),
         }
 
     def _derive_success_criteria(self, objectives: list[str]) -> list[str]:
@@ -515,33 +622,18 @@ class HandoffManager:
     def _count_handoff_pairs(self) -> dict[str, int]:
         """Count occurrences of each handoff pair.
 
-        Analyzes handoff history to identify common agent-to-agent patterns.
-
         Returns:
             Dictionary mapping "FromAgent → ToAgent" strings to occurrence counts.
         """
-        pairs: dict[str, int] = {}
-        for handoff in self.handoff_history:
-            pair = f"{handoff.from_agent} → {handoff.to_agent}"
-            pairs[pair] = pairs.get(pair, 0) + 1
-        return pairs
+        return dict(self.handoff_history.pair_counts)
 
     def _calculate_avg_handoffs(self) -> float:
         """Calculate average handoffs per task.
 
-        Note: This is a simplified implementation that returns total handoffs.
-        A full implementation would track unique tasks and compute true averages.
-
         Returns:
-            Total number of handoffs (simplified metric).
+            Handoffs divided by the number of distinct tasks they belonged to.
         """
-        if not self.handoff_history:
-            return 0.0
-
-        # Group by task (approximate - use timestamp proximity)
-        # For now, return total / estimated unique tasks
-        # This is simplified - real implementation would track tasks
-        return float(len(self.handoff_history))
+        return self.handoff_history.avg_handoffs_per_task()
 
     def _get_common_handoffs(self, top_n: int = 5) -> list[tuple]:
         """Get most common handoff patterns.
@@ -552,25 +644,15 @@ class HandoffManager:
         Returns:
             List of (pair_string, count) tuples sorted by frequency descending.
         """
-        pairs = self._count_handoff_pairs()
-        sorted_pairs = sorted(pairs.items(), key=lambda x: x[1], reverse=True)
-        return sorted_pairs[:top_n]
+        return self.handoff_history.pair_counts.most_common(top_n)
 
     def _get_effort_distribution(self) -> dict[str, int]:
         """Get distribution of estimated effort across handoffs.
 
-        Aggregates estimated effort levels (simple, moderate, complex)
-        from handoff history.
-
         Returns:
             Dictionary mapping effort level to count.
         """
-        distribution = {"simple": 0, "moderate": 0, "complex": 0}
-        for handoff in self.handoff_history:
-            effort = handoff.estimated_effort.lower()
-            if effort in distribution:
-                distribution[effort] += 1
-        return distribution
+        return dict(self.handoff_history.effort_counts)
 
     def clear_history(self) -> None:
         """Clear handoff history.
@@ -582,15 +664,15 @@ class HandoffManager:
         logger.info("Handoff history cleared")
 
     def export_history(self, filepath: str):
-        """Export handoff history to JSON file.
+        """Export the in-memory handoff history to a JSONL file, one record per line.
+
+        For the complete history, pass ``history_path`` to the manager instead.
 
         Args:
             filepath: Path to output file
         """
         try:
-            data = [handoff.to_dict() for handoff in self.handoff_history]
-            with open(filepath, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+            self.handoff_history.export(filepath)
             logger.info(f"Handoff history exported to {filepath}")
         except Exception as e:
             logger.error(f"Error exporting handoff history: {e}")
@@ -5,6 +5,7 @@ This package provides helpers split into focused modules:
 - execution: Result synthesis, artifact extraction, work estimation
 - routing: Routing decision normalization, edge case detection, subtask preparation
 - quality: Quality assessment, judge prompting, result refinement
+- phase_policy: Per-run phase skipping for the adaptive pipeline profile
 
 Public API is maintained via re-exports for backward compatibility.
 """
@@ -19,6 +20,7 @@ from .execution import (
     synthesize_results,
 )
 from .fast_path import FastPathDetector, is_simple_task
+from .phase_policy import PhasePlan, PhasePolicy, QualityHistory
 from .quality import (
     build_refinement_task,
     call_judge_with_reasoning,
@@ -27,6 +29,8 @@ from .quality import (
     refine_results,
 )
 from .routing import (
+    build_routing_context,
+    build_team_descriptions,
     detect_routing_edge_cases,
     normalize_routing_decision,
     prepare_subtasks,
@@ -36,8 +40,14 @@ from .thread_utils import thread_has_history
 __all__ = [
     # Fast path
     "FastPathDetector",
+    # Phase policy
+    "PhasePlan",
+    "PhasePolicy",
+    "QualityHistory",
     # Quality helpers
     "build_refinement_task",
+    "build_routing_context",
+    "build_team_descriptions",
     "call_judge_with_reasoning",
     # Execution utilities
     "create_openai_client_with_store",
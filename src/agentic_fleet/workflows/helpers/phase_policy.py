@@ -0,0 +1,288 @@
+"""Adaptive phase policy for the ``adaptive`` pipeline profile.
+
+The ``full`` profile always runs the progress and quality LM calls; ``light``
+never does. ``adaptive`` decides per run, once routing has produced a plan:
+
+- Progress evaluation is skipped for plans that are cheap to trust: one agent,
+  delegated mode, routing confidence above ``adaptive_min_confidence``, and a
+  ``low`` latency budget or a ``simple`` analysis.
+- Quality assessment is additionally skipped only when similar past tasks in
+  execution history scored at least ``quality_threshold`` (one such run is
+  enough when the analysis came from cache, i.e. the task was seen recently).
+  A skipped assessment leaves the score at 0.0, so background scoring still
+  records the quality of the run for later audit.
+- Complex tasks always run every phase.
+
+Each decision and its reason is recorded in ``phase_status`` (``progress_policy``,
+``quality_policy``), together with the latency it is expected to save (the mean
+duration of the phase in similar past runs).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from agentic_fleet.utils.infra.logging import setup_logger
+
+from ...utils.models import ExecutionMode, RoutingDecision
+
+logger = setup_logger(__name__)
+
+RUN = "run"
+SKIP = "skip"
+
+_TOKEN_RE = re.compile(r"\w{3,}")
+
+
+def _tokens(text: str) -> frozenset[str]:
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseDecision:
+    """Whether to run one phase, and why."""
+
+    action: str
+    reason: str
+
+    @property
+    def skipped(self) -> bool:
+        """True when the phase's LM call should be skipped."""
+        return self.action == SKIP
+
+    def status(self) -> str:
+        """Render the decision for ``phase_status``."""
+        return f"{self.action}: {self.reason}"
+
+
+@dataclass(frozen=True, slots=True)
+class PhasePlan:
+    """Per-run decisions for the phases after execution."""
+
+    progress: PhaseDecision
+    quality: PhaseDecision
+    estimated_saved_seconds: float = 0.0
+
+    def to_metadata(self) -> dict[str, Any]:
+        """Serialize for message metadata (and run history)."""
+        return {
+            "progress": {"action": self.progress.action, "reason": self.progress.reason},
+            "quality": {"action": self.quality.action, "reason": self.quality.reason},
+            "estimated_saved_seconds": round(self.estimated_saved_seconds, 4),
+        }
+
+    @classmethod
+    def from_metadata(cls, metadata: dict[str, Any] | None) -> PhasePlan | None:
+        """Read a plan written by ``to_metadata``; ``None`` if absent or malformed."""
+        data = (metadata or {}).get("phase_policy")
+        if not isinstance(data, dict):
+            return None
+        try:
+            return cls(
+                progress=PhaseDecision(**data["progress"]),
+                quality=PhaseDecision(**data["quality"]),
+                estimated_saved_seconds=float(data.get("estimated_saved_seconds", 0.0)),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+@dataclass(slots=True)
+class HistoricalStats:
+    """Quality and phase durations of past runs similar to a task."""
+
+    samples: int = 0
+    mean_quality: float | None = None
+    mean_phase_seconds: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class _PastRun:
+    tokens: frozenset[str]
+    score: float | None
+    phase_seconds: dict[str, float]
+
+
+class QualityHistory:
+    """Recent execution history, summarised for similar-task lookups.
+
+    The history tail is loaded off the event loop and cached for ``ttl_seconds``,
+    so lookups do not re-read the history file on every run.
+    """
+
+    def __init__(
+        self,
+        history_manager: Any,
+        *,
+        window: int = 200,
+        ttl_seconds: float = 60.0,
+        min_similarity: float = 0.5,
+    ) -> None:
+        self._history_manager = history_manager
+        self._window = window
+        self._ttl_seconds = ttl_seconds
+        self._min_similarity = min_similarity
+        self._runs: list[_PastRun] = []
+        self._loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    async def similar(self, task: str) -> HistoricalStats:
+        """Summarise past runs whose task shares enough words with ``task``."""
+        runs = await self._recent_runs()
+        tokens = _tokens(task)
+        if not tokens:
+            return HistoricalStats()
+
+        scores: list[float] = []
+        durations: dict[str, list[float]] = {}
+        for run in runs:
+            union = len(tokens | run.tokens)
+            if not union or len(tokens & run.tokens) / union < self._min_similarity:
+                continue
+            if run.score is not None:
+                scores.append(run.score)
+            for phase, seconds in run.phase_seconds.items():
+                durations.setdefault(phase, []).append(seconds)
+
+        return HistoricalStats(
+            samples=len(scores),
+            mean_quality=sum(scores) / len(scores) if scores else None,
+            mean_phase_seconds={
+                phase: sum(values) / len(values) for phase, values in durations.items()
+            },
+        )
+
+    async def _recent_runs(self) -> list[_PastRun]:
+        async with self._lock:
+            now = monotonic()
+            if self._loaded_at is None or now - self._loaded_at >= self._ttl_seconds:
+                try:
+                    executions = await asyncio.to_thread(
+                        self._history_manager.get_recent_executions, limit=self._window
+                    )
+                    self._runs = [run for run in map(self._parse, executions) if run]
+                except Exception as exc:
+                    logger.warning("Failed to load execution history for phase policy: %s", exc)
+                self._loaded_at = now
+            return self._runs
+
+    @staticmethod
+    def _parse(execution: dict[str, Any]) -> _PastRun | None:
+        task = execution.get("task")
+        if not isinstance(task, str) or not task:
+            return None
+        quality = execution.get("quality") or {}
+        score: float | None = None
+        if isinstance(quality, dict) and not quality.get("pending"):
+            try:
+                score = float(quality.get("score") or 0.0) or None
+            except (TypeError, ValueError):
+                score = None
+        # Only durations of phases that actually ran an LM call are representative.
+        timings = execution.get("phase_timings") or {}
+        status = execution.get("phase_status") or {}
+        phase_seconds = {
+            phase: float(timings[phase])
+            for phase in ("progress", "quality")
+            if status.get(phase) == "success" and isinstance(timings.get(phase), int | float)
+        }
+        return _PastRun(_tokens(task), score, phase_seconds)
+
+
+class PhasePolicy:
+    """Decide which post-execution phases a run can skip.
+
+    Args:
+        min_confidence: Routing confidence needed to trust a single-agent plan.
+        quality_threshold: Mean historical quality (0-10) needed to skip quality.
+        history: Similar-task history; without it, quality always runs.
+        min_history_samples: Similar scored runs needed to skip quality.
+    """
+
+    def __init__(
+        self,
+        *,
+        min_confidence: float = 0.8,
+        quality_threshold: float = 8.0,
+        history: QualityHistory | None = None,
+        min_history_samples: int = 3,
+    ) -> None:
+        self.min_confidence = min_confidence
+        self.quality_threshold = quality_threshold
+        self.history = history
+        self.min_history_samples = min_history_samples
+
+    async def decide(
+        self,
+        task: str,
+        routing: RoutingDecision,
+        *,
+        complexity: str,
+        latency_budget: str = "",
+        analysis_cached: bool = False,
+    ) -> PhasePlan:
+        """Return the phase plan for a routed task."""
+        blocker = self._blocker(routing, complexity, latency_budget)
+        if blocker is not None:
+            run = PhaseDecision(RUN, blocker)
+            return PhasePlan(progress=run, quality=run)
+
+        confidence = routing.confidence or 0.0
+        progress = PhaseDecision(
+            SKIP,
+            f"single agent, confidence {confidence:.2f}, "
+            f"latency budget {latency_budget or 'unknown'}, {complexity} task",
+        )
+
+        stats = await self.history.similar(task) if self.history else HistoricalStats()
+        needed = 1 if analysis_cached else self.min_history_samples
+        if stats.mean_quality is None or stats.samples < needed:
+            quality = PhaseDecision(
+                RUN, f"{stats.samples} similar scored run(s) in history, need {needed}"
+            )
+        elif stats.mean_quality < self.quality_threshold:
+            quality = PhaseDecision(
+                RUN,
+                f"similar tasks averaged {stats.mean_quality:.1f} < {self.quality_threshold:g}",
+            )
+        else:
+            quality = PhaseDecision(
+                SKIP,
+                f"similar tasks averaged {stats.mean_quality:.1f} over {stats.samples} run(s)"
+                + (" (cached analysis)" if analysis_cached else ""),
+            )
+
+        saved = sum(
+            stats.mean_phase_seconds.get(phase, 0.0)
+            for phase, decision in (("progress", progress), ("quality", quality))
+            if decision.skipped
+        )
+        return PhasePlan(progress=progress, quality=quality, estimated_saved_seconds=saved)
+
+    def _blocker(
+        self, routing: RoutingDecision, complexity: str, latency_budget: str
+    ) -> str | None:
+        """Return why every phase must run, or ``None`` if skipping is possible."""
+        if complexity == "complex":
+            return "complex task"
+        if len(routing.assigned_to) != 1 or routing.mode != ExecutionMode.DELEGATED:
+            return f"{routing.mode.value} plan with {len(routing.assigned_to)} agent(s)"
+        confidence = routing.confidence or 0.0
+        if confidence < self.min_confidence:
+            return f"routing confidence {confidence:.2f} < {self.min_confidence:.2f}"
+        if latency_budget != "low" and complexity != "simple":
+            return f"latency budget {latency_budget or 'unknown'}, {complexity} task"
+        return None
+
+
+__all__ = [
+    "HistoricalStats",
+    "PhaseDecision",
+    "PhasePlan",
+    "PhasePolicy",
+    "QualityHistory",
+]
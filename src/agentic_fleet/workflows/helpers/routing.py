@@ -6,7 +6,8 @@ routing decisions for the workflow execution pipeline.
 
 from __future__ import annotations
 
-from typing import Any
+from collections.abc import Iterable
+from typing import Any, cast
 
 from agentic_fleet.utils.infra.logging import setup_logger
 
@@ -41,6 +42,64 @@ def _create_routing_decision(
     )
 
 
+def build_team_descriptions(agents: dict[str, Any]) -> dict[str, str]:
+    """Describe each agent for the router, including its tools and capabilities."""
+    team_descriptions = {}
+    for name, agent in agents.items():
+        desc = getattr(agent, "description", "") or getattr(agent, "name", "")
+
+        # Inspect for rich metadata (Tools)
+        tools_info: list[str] = []
+        tool_names_obj = getattr(agent, "tool_names", None)
+        tools_obj = getattr(agent, "tools", None)
+        if tool_names_obj:
+            # Foundry Agents might store names directly
+            if isinstance(tool_names_obj, str):
+                tools_info = [tool_names_obj]
+            elif isinstance(tool_names_obj, Iterable):
+                tools_info = [str(name) for name in cast(Iterable[Any], tool_names_obj)]
+        elif tools_obj:
+            # Local agents have tool objects
+            if isinstance(tools_obj, str):
+                tools_info = [tools_obj]
+            elif isinstance(tools_obj, Iterable):
+                tools_info = [getattr(t, "name", str(t)) for t in cast(Iterable[Any], tools_obj)]
+
+        # Inspect for Capabilities
+        caps_info: list[str] = []
+        caps_obj = getattr(agent, "capabilities", None)
+        if caps_obj:
+            if isinstance(caps_obj, str):
+                caps_info = [caps_obj]
+            elif isinstance(caps_obj, Iterable):
+                caps_info = [str(cap) for cap in cast(Iterable[Any], caps_obj)]
+
+        # Construct rich description
+        extras = []
+        if tools_info:
+            extras.append(f"Tools: [{', '.join(tools_info)}]")
+        if caps_info:
+            extras.append(f"Capabilities: [{', '.join(caps_info)}]")
+
+        if extras:
+            desc += " " + " ".join(extras)
+
+        team_descriptions[name] = desc
+    return team_descriptions
+
+
+def build_routing_context(conversation_context: str, search_context: str = "") -> str:
+    """Combine conversation and web/search context into the router's context string."""
+    routing_context_parts: list[str] = []
+    if conversation_context:
+        routing_context_parts.append(
+            "Conversation context (most recent messages):\n" + conversation_context
+        )
+    if search_context:
+        routing_context_parts.append("Web/search context:\n" + str(search_context))
+    return "\n\n".join(routing_context_parts).strip()
+
+
 def normalize_routing_decision(
     routing: RoutingDecision | dict[str, Any], task: str
 ) -> RoutingDecision:
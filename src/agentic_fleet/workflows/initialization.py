@@ -172,6 +172,48 @@ def _setup_dspy_compilation(
         context.compilation_status = "skipped"
 
 
+async def _create_agents(
+    agent_factory: AgentFactory,
+    agent_configs: dict[str, dict[str, Any]],
+    config: WorkflowConfig,
+) -> dict[str, Any]:
+    """Construct the configured agents concurrently, preserving YAML order.
+
+    Agents are independent of each other (clients, tools and prompts are
+    resolved per agent), so each is built in a worker thread.
+
+    Raises:
+        Exception: The first agent construction failure, after all finish.
+    """
+    agent_models = config.agent_models or {}
+
+    def create(name: str, agent_config: dict[str, Any]) -> Any:
+        # Allow workflow config to override model
+        model_override = agent_models.get(name.lower())
+        if model_override:
+            agent_config["model"] = model_override
+        return agent_factory.create_agent(name, agent_config)
+
+    names = list(agent_configs)
+    results = await asyncio.gather(
+        *(asyncio.to_thread(create, name, agent_configs[name]) for name in names),
+        return_exceptions=True,
+    )
+
+    agents: dict[str, Any] = {}
+    failure: BaseException | None = None
+    for name, result in zip(names, results, strict=True):
+        if isinstance(result, BaseException):
+            logger.error(f"Failed to create agent '{name}': {result}", exc_info=result)
+            failure = failure or result
+            continue
+        agents[name] = result
+        logger.info(f"Successfully created agent: {name}")
+    if failure is not None:
+        raise failure
+    return agents
+
+
 async def initialize_workflow_context(
     config: WorkflowConfig | None = None,
     compile_dspy: bool = True,
@@ -234,6 +276,15 @@ async def initialize_workflow_context(
             "Initialized zero-shot DSPyReasoner; compiled weights, if any, are loaded "
             "separately during API startup via the compiled registry"
         )
+        replay_path = getattr(config, "routing_replay_path", None)
+        if replay_path:
+            from ..evaluation.routing_replay import RoutingRecorder, RoutingReplayStore
+
+            dspy_supervisor.routing_recorder = RoutingRecorder(
+                RoutingReplayStore(replay_path),
+                sample_rate=getattr(config, "routing_replay_sample_rate", 1.0),
+            )
+            logger.info("Recording routing calls for offline replay to %s", replay_path)
 
     elif not getattr(dspy_supervisor, "use_enhanced_signatures", False):
         logger.warning(
@@ -264,20 +315,7 @@ async def initialize_workflow_context(
         logger.error(f"Config file not found: {config_path}")
         raise
 
-    agents = {}
-    for name, agent_config in agent_configs.items():
-        try:
-            # Allow workflow config to override model
-            agent_models = config.agent_models or {}
-            model_override = agent_models.get(name.lower())
-            if model_override:
-                agent_config["model"] = model_override
-
-            agents[name] = agent_factory.create_agent(name, agent_config)
-            logger.info(f"Successfully created agent: {name}")
-        except Exception as e:
-            logger.error(f"Failed to create agent '{name}': {e}", exc_info=True)
-            raise  # Or continue with other agents depending on requirements
+    agents = await _create_agents(agent_factory, agent_configs, config)
 
     logger.info(f"Created {len(agents)} agents: {', '.join(agents.keys())}")
 
@@ -295,6 +333,8 @@ async def initialize_workflow_context(
     handoff = HandoffManager(
         dspy_supervisor,
         get_compiled_supervisor=get_compiled_supervisor_fn,
+        history_limit=config.handoff_history_limit,
+        history_path=config.handoff_history_path,
     )
 
     # Create analysis cache
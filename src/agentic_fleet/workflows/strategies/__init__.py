@@ -41,6 +41,7 @@ from .sequential import (
 )
 
 if TYPE_CHECKING:
+    import asyncio
     from collections.abc import AsyncIterator
 
     from ..context import SupervisorContext
@@ -117,8 +118,9 @@ async def run_execution_phase_streaming(
     routing: RoutingDecision,
     task: str,
     context: SupervisorContext,
+    cancel_event: asyncio.Event | None = None,
 ) -> AsyncIterator[MagenticAgentMessageEvent | WorkflowOutputEvent]:
-    """Execute task with streaming events."""
+    """Execute task with streaming events; ``cancel_event`` stops a discussion between rounds."""
     agents_map = context.agents
     if not agents_map:
         raise ExecutionPhaseError("Agents must be initialized before execution phase runs.")
@@ -162,6 +164,9 @@ async def run_execution_phase_streaming(
                 reasoner=context.dspy_supervisor,
                 progress_callback=context.progress_callback,
                 thread=thread,
+                speaker_selection=context.config.discussion_speaker_selection,
+                transcript_window=context.config.discussion_transcript_window,
+                cancel_event=cancel_event,
             ):
                 yield event
             return
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING, Any
 
 from agent_framework._agents import ChatAgent
@@ -15,7 +16,7 @@ from ...utils.models import ExecutionMode, RoutingDecision
 from ..exceptions import AgentExecutionError
 from ..models import MagenticAgentMessageEvent
 from .base import _get_agent, create_agent_event, create_system_event
-from .group_chat_adapter import GroupChatBuilder
+from .group_chat_adapter import DEFAULT_TRANSCRIPT_WINDOW, GroupChatBuilder, SpeakerSelection
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
@@ -37,8 +38,9 @@ class DiscussionExecutionStrategy:
         routing: RoutingDecision,
         task: str,
         context: SupervisorContext,
+        cancel_event: asyncio.Event | None = None,
     ) -> AsyncIterator[MagenticAgentMessageEvent | WorkflowOutputEvent]:
-        """Stream discussion events for the routing decision."""
+        """Stream discussion events for the routing decision until ``cancel_event`` is set."""
         agents_map = context.agents or {}
         async for event in execute_discussion_streaming(
             agents_map,
@@ -47,6 +49,9 @@ class DiscussionExecutionStrategy:
             reasoner=context.dspy_supervisor,
             progress_callback=context.progress_callback,
             thread=context.conversation_thread,
+            speaker_selection=context.config.discussion_speaker_selection,
+            transcript_window=context.config.discussion_transcript_window,
+            cancel_event=cancel_event,
         ):
             yield event
 
@@ -58,11 +63,15 @@ async def execute_discussion_streaming(
     reasoner: Any,  # DSPyReasoner
     progress_callback: ProgressCallback | None = None,
     thread: AgentThread | None = None,  # Reserved for future use
+    speaker_selection: SpeakerSelection = "auto",
+    transcript_window: int = DEFAULT_TRANSCRIPT_WINDOW,
+    cancel_event: asyncio.Event | None = None,
 ):
-    """Execute task via group chat discussion.
+    """Execute task via group chat discussion, streaming each round as it happens.
 
     Note: thread parameter is reserved for future use. Group chat currently
-    manages its own internal conversation history.
+    manages its own internal conversation history. ``cancel_event`` stops the
+    discussion before its next round.
     """
 
     if not agent_names:
@@ -81,6 +90,7 @@ async def execute_discussion_streaming(
 
     if reasoner:
         builder.set_reasoner(reasoner)
+    builder.set_speaker_selection(speaker_selection, transcript_window)
 
     manager = builder.build()
 
@@ -94,9 +104,56 @@ async def execute_discussion_streaming(
         payload={"participants": agent_names},
     )
 
-    # Run chat
+    # Run chat, forwarding each speaker pick, text delta and message as it happens
+    history: list[ChatMessage] = []
+    end_reason = None
     try:
-        history = await manager.run_chat(initial_message=task)
+        async for chat_event in manager.stream_chat(
+            initial_message=task, cancel_event=cancel_event
+        ):
+            if chat_event.kind == "speaker":
+                if progress_callback:
+                    progress_callback.on_progress(
+                        f"Round {chat_event.round}: {chat_event.speaker} speaking..."
+                    )
+                yield create_agent_event(
+                    stage="execution",
+                    event="agent.start",
+                    agent=chat_event.speaker or "unknown",
+                    text=f"{chat_event.speaker} speaking (round {chat_event.round})",
+                    payload={"round": chat_event.round, "selector": chat_event.selector},
+                )
+            elif chat_event.kind == "delta":
+                yield create_agent_event(
+                    stage="execution",
+                    event="agent.delta",
+                    agent=chat_event.speaker or "unknown",
+                    text=chat_event.text,
+                    payload={"round": chat_event.round, "delta": True},
+                )
+            elif chat_event.kind == "message":
+                yield create_agent_event(
+                    stage="execution",
+                    event="agent.message",
+                    agent=chat_event.speaker or "unknown",
+                    text=chat_event.text,
+                    payload={
+                        "role": Role.ASSISTANT,
+                        "round": chat_event.round,
+                        "selector": chat_event.selector,
+                    },
+                )
+            else:
+                end_reason = chat_event.reason
+                if end_reason == "error":
+                    yield create_agent_event(
+                        stage="execution",
+                        event="agent.error",
+                        agent=chat_event.speaker or "unknown",
+                        text=f"{chat_event.speaker} failed in group discussion",
+                        payload={"round": chat_event.round + 1, "error": chat_event.text},
+                    )
+        history = manager.history
     except Exception as exc:
         if progress_callback:
             progress_callback.on_error("Group discussion failed", exc)
@@ -112,21 +169,14 @@ async def execute_discussion_streaming(
         )
         return
 
-    # Yield events for each message in history (except the first user message)
-    for msg in history[1:]:
-        yield create_agent_event(
-            stage="execution",
-            event="agent.message",
-            agent=getattr(msg, "name", "unknown"),
-            text=msg.text,
-            payload={"role": msg.role},
-        )
-
+    selectors: dict[str, int] = {}
+    for selection in manager.selections:
+        selectors[selection["selector"]] = selectors.get(selection["selector"], 0) + 1
     yield create_system_event(
         stage="execution",
         event="discussion.completed",
         text="Group discussion completed",
-        payload={"rounds": len(history)},
+        payload={"rounds": len(history), "selectors": selectors, "reason": end_reason},
     )
 
     # Yield final result (last message content)
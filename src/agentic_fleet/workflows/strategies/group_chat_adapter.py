@@ -3,20 +3,87 @@
 This module provides an adapter for managing group chats using DSPy for
 speaker selection and termination decisions, plus a builder pattern for
 easy configuration.
+
+``DSPyGroupChatManager.stream_chat`` yields ``GroupChatEvent`` objects as the
+chat unfolds; ``run_chat`` drains it and returns the history.
+
+Speaker selection modes:
+- ``dspy``: every round asks the reasoner.
+- ``auto``: a deterministic pick when the next speaker is unambiguous (the
+  last message ``@``-mentions exactly one other participant, or a
+  single-agent chat is starting), the reasoner otherwise.
+- ``round_robin``: mentions, then participants in order, with no LM calls;
+  the chat ends at ``max_rounds`` or when a message ends with ``TERMINATE``.
 """
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import re
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any, Literal, get_args
 
+from agent_framework._agents import ChatAgent
 from agent_framework._types import ChatMessage, Role
 
 from agentic_fleet.utils.infra.logging import setup_logger
 
 from ...dspy_modules.reasoner import DSPyReasoner
+from ..config import SpeakerSelection
 
 logger = setup_logger(__name__)
 
+SPEAKER_SELECTION_MODES: tuple[str, ...] = get_args(SpeakerSelection)
+DEFAULT_TRANSCRIPT_WINDOW = 20
+
+# Dots only between name parts, so "@Reviewer." at the end of a sentence still matches.
+_MENTION_PATTERN = re.compile(r"@([\w-]+(?:\.[\w-]+)*)")
+
+
+@dataclass(slots=True)
+class GroupChatEvent:
+    """One step of a streamed group chat (see ``DSPyGroupChatManager.stream_chat``).
+
+    ``kind`` is ``speaker``, ``delta``, ``message`` or ``end``; ``round`` is
+    the 1-based round it belongs to (for ``end``, the rounds completed).
+    """
+
+    kind: Literal["speaker", "delta", "message", "end"]
+    round: int
+    speaker: str | None = None
+    text: str = ""
+    selector: str | None = None
+    message: ChatMessage | None = None
+    reason: str | None = None
+
+
+class _Transcript:
+    """Rendered ``name: text`` lines of the last ``window`` chat messages.
+
+    Each message is rendered once, when it is appended, so building the
+    selector's history input costs O(window) per round rather than
+    re-rendering the whole chat.
+    """
+
+    __slots__ = ("_lines", "total")
+
+    def __init__(self, window: int = DEFAULT_TRANSCRIPT_WINDOW) -> None:
+        self._lines: deque[str] = deque(maxlen=max(1, window))
+        self.total = 0
+
+    def append(self, message: ChatMessage) -> None:
+        name = (message.additional_properties or {}).get("name", "unknown")
+        self._lines.append(f"{name}: {message.text}")
+        self.total += 1
+
+    def render(self) -> str:
+        omitted = self.total - len(self._lines)
+        if omitted > 0:
+            return f"[{omitted} earlier messages omitted]\n" + "\n".join(self._lines)
+        return "\n".join(self._lines)
+
 
 # =============================================================================
 # GroupChatBuilder
@@ -32,6 +99,8 @@ class GroupChatBuilder:
         self.reasoner: DSPyReasoner | None = None
         self.max_rounds: int = 10
         self.admin_name: str = "Admin"
+        self.speaker_selection: SpeakerSelection = "dspy"
+        self.transcript_window: int = DEFAULT_TRANSCRIPT_WINDOW
 
     def add_agent(self, agent: Any) -> GroupChatBuilder:
         """Add an agent to the group chat."""
@@ -53,6 +122,15 @@ class GroupChatBuilder:
         self.admin_name = admin_name
         return self
 
+    def set_speaker_selection(
+        self, speaker_selection: SpeakerSelection, transcript_window: int | None = None
+    ) -> GroupChatBuilder:
+        """Set the speaker selection mode and, optionally, the transcript window."""
+        self.speaker_selection = speaker_selection
+        if transcript_window is not None:
+            self.transcript_window = transcript_window
+        return self
+
     def build(self) -> DSPyGroupChatManager:
         """Build the DSPyGroupChatManager instance."""
         if not self.agents:
@@ -66,6 +144,8 @@ class GroupChatBuilder:
             reasoner=self.reasoner,
             max_rounds=self.max_rounds,
             admin_name=self.admin_name,
+            speaker_selection=self.speaker_selection,
+            transcript_window=self.transcript_window,
         )
 
 
@@ -83,6 +163,8 @@ class DSPyGroupChatManager:
         reasoner: DSPyReasoner,
         max_rounds: int = 10,
         admin_name: str = "Admin",
+        speaker_selection: SpeakerSelection = "dspy",
+        transcript_window: int = DEFAULT_TRANSCRIPT_WINDOW,
     ) -> None:
         """Initialize the group chat manager.
 
@@ -91,13 +173,35 @@ class DSPyGroupChatManager:
             reasoner: DSPy reasoner instance
             max_rounds: Maximum number of conversation rounds
             admin_name: Name of the admin agent (default: "Admin")
+            speaker_selection: "dspy", "auto" or "round_robin" (see module docstring)
+            transcript_window: Number of recent messages shown to the speaker selector
         """
+        if speaker_selection not in SPEAKER_SELECTION_MODES:
+            raise ValueError(
+                f"Unknown speaker selection {speaker_selection!r}; "
+                f"expected one of {', '.join(SPEAKER_SELECTION_MODES)}"
+            )
         self.agents = {agent.name: agent for agent in agents}
         self.agent_names = list(self.agents.keys())
         self.reasoner = reasoner
         self.max_rounds = max_rounds
         self.admin_name = admin_name
+        self.speaker_selection = speaker_selection
+        self.transcript_window = transcript_window
         self.history: list[ChatMessage] = []
+        # Which selector picked each speaker: {"round", "speaker", "selector"}.
+        self.selections: list[dict[str, Any]] = []
+        self._transcript = _Transcript(transcript_window)
+        self._mention_lookup = {name.lower(): name for name in self.agent_names}
+        self._participants_str = "\n".join(
+            f"- {name}: {getattr(agent, 'description', 'No description')}"
+            for name, agent in self.agents.items()
+        )
+
+    def _append(self, message: ChatMessage) -> None:
+        """Add a message to the history and the selector transcript."""
+        self.history.append(message)
+        self._transcript.append(message)
 
     async def run_chat(
         self,
@@ -113,135 +217,213 @@ class DSPyGroupChatManager:
         Returns:
             List of chat messages from the conversation
         """
-        self.history = [
+        async for _event in self.stream_chat(initial_message, sender):
+            pass
+        return self.history
+
+    async def stream_chat(
+        self,
+        initial_message: str,
+        sender: str = "User",
+        *,
+        cancel_event: asyncio.Event | None = None,
+    ) -> AsyncIterator[GroupChatEvent]:
+        """Run the group chat loop, yielding events as the conversation unfolds.
+
+        Each round yields a ``speaker`` event once the next speaker is chosen,
+        ``delta`` events while a streaming agent (``ChatAgent``) writes, and a
+        ``message`` event with the complete reply. The chat ends with one
+        ``end`` event whose ``reason`` is ``terminated``, ``max_rounds``,
+        ``cancelled`` or ``error``. ``cancel_event`` is checked between rounds.
+
+        Args:
+            initial_message: The starting message
+            sender: The sender of the initial message
+            cancel_event: Optional event that stops the chat before the next round
+        """
+        self.history = []
+        self.selections = []
+        self._transcript = _Transcript(self.transcript_window)
+        self._append(
             ChatMessage(
                 role=Role.USER, text=initial_message, additional_properties={"name": sender}
             )
-        ]
+        )
 
         current_speaker = sender
         rounds = 0
 
         while rounds < self.max_rounds:
+            if cancel_event is not None and cancel_event.is_set():
+                logger.info(f"Group chat cancelled after {rounds} rounds")
+                yield GroupChatEvent("end", rounds, reason="cancelled")
+                return
+
             # Select next speaker
             next_speaker_name = await self._select_next_speaker(current_speaker)
+            selector = self.selections[-1]["selector"]
 
             if next_speaker_name == "TERMINATE" or next_speaker_name not in self.agents:
                 logger.info(f"Group chat terminated by {next_speaker_name}")
-                break
+                yield GroupChatEvent(
+                    "end", rounds, next_speaker_name, selector=selector, reason="terminated"
+                )
+                return
 
             logger.info(f"Next speaker selected: {next_speaker_name}")
+            round_number = rounds + 1
+            yield GroupChatEvent("speaker", round_number, next_speaker_name, selector=selector)
 
             # Execute agent
             agent = self.agents[next_speaker_name]
 
             try:
-                if hasattr(agent, "run"):
-                    # Pass the full history to the agent
-                    # Note: We pass the history as messages.
-                    # The agent's run method should handle list[ChatMessage].
-                    try:
-                        response_obj = await agent.run(messages=self.history)
-                    except TypeError as e:
-                        logger.warning(
-                            f"Agent {next_speaker_name}.run() does not accept 'messages' parameter: {e}. "
-                            "Falling back to process method or mock response."
-                        )
-                        # Try fallback to process method
-                        if hasattr(agent, "process") and self.history:
-                            last_msg = self.history[-1]
-                            response = await agent.process(last_msg)
-                        else:
-                            response = ChatMessage(
-                                role=Role.ASSISTANT,
-                                text=f"Mock response from {next_speaker_name} (method signature mismatch)",
-                                additional_properties={"name": next_speaker_name},
+                if isinstance(agent, ChatAgent):
+                    chunks: list[str] = []
+                    async for update in agent.run_stream(messages=self.history):
+                        if update.text:
+                            chunks.append(update.text)
+                            yield GroupChatEvent(
+                                "delta",
+                                round_number,
+                                next_speaker_name,
+                                text=update.text,
+                                selector=selector,
                             )
-                        self.history.append(response)
-                        current_speaker = next_speaker_name
-                        rounds += 1
-                        continue
-
-                    # Extract the last message from the response
-                    if response_obj.messages:
-                        response = response_obj.messages[-1]
-                        # Ensure name is set by creating a new ChatMessage to avoid mutating frozen objects
-                        additional_props = response.additional_properties or {}
-                        if "name" not in additional_props:
-                            response = ChatMessage(
-                                role=response.role,
-                                text=response.text,
-                                additional_properties={
-                                    **additional_props,
-                                    "name": next_speaker_name,
-                                },
-                            )
-                    else:
-                        response = ChatMessage(
-                            role=Role.ASSISTANT,
-                            text=response_obj.text or "",
-                            additional_properties={"name": next_speaker_name},
-                        )
-                elif hasattr(agent, "process"):
-                    # Legacy or mock support
-                    last_msg = self.history[-1]
-                    response = await agent.process(last_msg)
-                else:
-                    # Fallback
                     response = ChatMessage(
                         role=Role.ASSISTANT,
-                        text=f"Mock response from {next_speaker_name}",
+                        text="".join(chunks),
                         additional_properties={"name": next_speaker_name},
                     )
-
-                # Ensure response is ChatMessage
-                if not isinstance(response, ChatMessage):
-                    # If it's a WorkflowOutputEvent or similar, extract data
-                    if (
-                        hasattr(response, "data")
-                        and isinstance(response.data, list)
-                        and len(response.data) > 0
-                    ):
-                        response = response.data[-1]
-                    else:
-                        # Fallback
-                        response = ChatMessage(
-                            role=Role.ASSISTANT,
-                            text=str(response),
-                            additional_properties={"name": next_speaker_name},
-                        )
-
-                self.history.append(response)
-                current_speaker = next_speaker_name
-                rounds += 1
-
+                else:
+                    response = await self._run_agent(next_speaker_name, agent)
             except Exception as e:
                 logger.error(f"Error executing agent {next_speaker_name}: {e}")
-                break
+                yield GroupChatEvent(
+                    "end", rounds, next_speaker_name, text=str(e), selector=selector, reason="error"
+                )
+                return
+
+            self._append(response)
+            current_speaker = next_speaker_name
+            rounds += 1
+            yield GroupChatEvent(
+                "message",
+                round_number,
+                next_speaker_name,
+                text=response.text or "",
+                selector=selector,
+                message=response,
+            )
 
-        return self.history
+        yield GroupChatEvent("end", rounds, reason="max_rounds")
 
-    async def _select_next_speaker(self, last_speaker: str) -> str:
-        """Select the next speaker using DSPy."""
-
-        # Format history for DSPy
-        history_str = "\n".join(
-            [
-                f"{msg.additional_properties.get('name', 'unknown')}: {msg.text}"
-                for msg in self.history
-            ]
-        )
+    async def _run_agent(self, name: str, agent: Any) -> ChatMessage:
+        """Run a non-streaming participant on the history and return its reply."""
+        if hasattr(agent, "run"):
+            # Pass the full history to the agent
+            # Note: We pass the history as messages.
+            # The agent's run method should handle list[ChatMessage].
+            try:
+                response_obj = await agent.run(messages=self.history)
+            except TypeError as e:
+                logger.warning(
+                    f"Agent {name}.run() does not accept 'messages' parameter: {e}. "
+                    "Falling back to process method or mock response."
+                )
+                # Try fallback to process method
+                if hasattr(agent, "process") and self.history:
+                    return await agent.process(self.history[-1])
+                return ChatMessage(
+                    role=Role.ASSISTANT,
+                    text=f"Mock response from {name} (method signature mismatch)",
+                    additional_properties={"name": name},
+                )
+
+            # Extract the last message from the response
+            if response_obj.messages:
+                response = response_obj.messages[-1]
+                # Ensure name is set by creating a new ChatMessage to avoid mutating frozen objects
+                additional_props = response.additional_properties or {}
+                if "name" not in additional_props:
+                    response = ChatMessage(
+                        role=response.role,
+                        text=response.text,
+                        additional_properties={**additional_props, "name": name},
+                    )
+            else:
+                response = ChatMessage(
+                    role=Role.ASSISTANT,
+                    text=response_obj.text or "",
+                    additional_properties={"name": name},
+                )
+        elif hasattr(agent, "process"):
+            # Legacy or mock support
+            response = await agent.process(self.history[-1])
+        else:
+            # Fallback
+            response = ChatMessage(
+                role=Role.ASSISTANT,
+                text=f"Mock response from {name}",
+                additional_properties={"name": name},
+            )
 
-        # Format participants
-        participants_str = "\n".join(
-            [
-                f"- {name}: {getattr(agent, 'description', 'No description')}"
-                for name, agent in self.agents.items()
-            ]
-        )
+        # Ensure response is ChatMessage
+        if not isinstance(response, ChatMessage):
+            # If it's a WorkflowOutputEvent or similar, extract data
+            if hasattr(response, "data") and isinstance(response.data, list) and response.data:
+                response = response.data[-1]
+            else:
+                # Fallback
+                response = ChatMessage(
+                    role=Role.ASSISTANT,
+                    text=str(response),
+                    additional_properties={"name": name},
+                )
+        return response
 
-        result = self.reasoner.select_next_speaker(
-            history=history_str, participants=participants_str, last_speaker=last_speaker
-        )
+    async def _select_next_speaker(self, last_speaker: str) -> str:
+        """Select the next speaker, deterministically when possible, else via DSPy."""
+        next_speaker, selector = None, "dspy"
+        if self.speaker_selection != "dspy":
+            next_speaker, selector = self._select_deterministically(last_speaker)
+
+        if next_speaker is None:
+            result = self.reasoner.select_next_speaker(
+                history=self._transcript.render(),
+                participants=self._participants_str,
+                last_speaker=last_speaker,
+            )
+            next_speaker, selector = result["next_speaker"], "dspy"
 
-        return result["next_speaker"]
+        self.selections.append(
+            {"round": len(self.selections) + 1, "speaker": next_speaker, "selector": selector}
+        )
+        logger.debug(f"Speaker {next_speaker} selected by {selector}")
+        return next_speaker
+
+    def _select_deterministically(self, last_speaker: str) -> tuple[str | None, str]:
+        """Return ``(speaker, selector)`` when no LM call is needed, else ``(None, "")``."""
+        last_text = (self.history[-1].text or "") if self.history else ""
+
+        mentioned = {
+            self._mention_lookup[match.lower()]
+            for match in _MENTION_PATTERN.findall(last_text)
+            if match.lower() in self._mention_lookup
+        }
+        mentioned.discard(last_speaker)
+        if len(mentioned) == 1:
+            return mentioned.pop(), "mention"
+
+        if self.speaker_selection == "round_robin":
+            if last_text.rstrip().endswith("TERMINATE"):
+                return "TERMINATE", "round_robin"
+            if last_speaker in self.agents:
+                index = (self.agent_names.index(last_speaker) + 1) % len(self.agent_names)
+            else:
+                index = 0
+            return self.agent_names[index], "round_robin"
+
+        if len(self.agent_names) == 1 and last_speaker not in self.agents:
+            return self.agent_names[0], "single_agent"
+        return None, ""
@@ -37,7 +37,7 @@ from ..utils.tool_registry import ToolRegistry
 from ..utils.ttl_cache import SyncTTLCache
 from .builder import build_fleet_workflow
 from .config import WorkflowConfig
-from .context import SupervisorContext
+from .context import SupervisorContext, current_cancel_event
 from .handoff import HandoffManager
 from .helpers import is_simple_task
 from .initialization import initialize_workflow_context
@@ -392,6 +392,7 @@ class SupervisorWorkflow:
             start_time = datetime.now()
             workflow_id = workflow_id or str(uuid4())
             current_mode = self.mode
+            current_cancel_event.set(None)
 
             # Notify middlewares
             if hasattr(self.context, "middlewares"):
@@ -863,6 +864,7 @@ class SupervisorWorkflow:
         checkpoint_id: str | None = None,
         checkpoint_storage: Any | None = None,
         schedule_quality_eval: bool = True,
+        cancel_event: asyncio.Event | None = None,
     ) -> AsyncIterator[Any]:
         """
         Execute the workflow for a single task and stream WorkflowEvent objects representing progress and results.
@@ -873,6 +875,8 @@ class SupervisorWorkflow:
             task (str): The task prompt to execute.
             reasoning_effort (str | None): Optional override; must be one of "minimal", "medium", or "maximal". An invalid value yields a FAILED status and terminates the stream.
             thread (AgentThread | None): Optional multi-turn conversation context to store in the workflow context.
+            cancel_event (asyncio.Event | None): Optional event that, once set, stops group chat / handoff
+                streaming and discussion rounds at the next boundary.
 
         Yields:
             Any: Events emitted during execution. Most callers should expect a mix of
@@ -906,6 +910,7 @@ class SupervisorWorkflow:
 
             # Store thread in context for strategies to use
             self.context.conversation_thread = thread
+            current_cancel_event.set(cancel_event)
             # Store persisted conversation history for context rendering (best-effort).
             try:
                 self.context.conversation_history = list(conversation_history or [])
@@ -1016,6 +1021,9 @@ class SupervisorWorkflow:
                         checkpoint_id=checkpoint_id,
                         checkpoint_storage=checkpoint_storage,
                     ):
+                        if cancel_event is not None and cancel_event.is_set():
+                            logger.info(f"{current_mode} workflow cancelled: {workflow_id}")
+                            break
                         # Surface MagenticAgentMessageEvent from executors (agent.start, agent.output, etc.)
                         if isinstance(event, MagenticAgentMessageEvent):
                             yield event
@@ -1457,6 +1465,47 @@ class SupervisorWorkflow:
         )
 
 
+def attach_decision_modules(
+    context: SupervisorContext,
+    *,
+    routing_module: Any | None = None,
+    quality_module: Any | None = None,
+    tool_planning_module: Any | None = None,
+) -> None:
+    """Attach preloaded decision modules (Phase 2) to a context and its reasoner.
+
+    The reasoner resolves its decision modules per call, so this can also run
+    after the workflow has been built (API startup loads artifacts concurrently
+    with workflow construction).
+
+    Raises:
+        RuntimeError: If the context has no DSPy reasoner.
+    """
+    if routing_module is not None:
+        context.dspy_routing_module = routing_module
+    if quality_module is not None:
+        context.dspy_quality_module = quality_module
+    if tool_planning_module is not None:
+        context.dspy_tool_planning_module = tool_planning_module
+
+    if context.dspy_supervisor is None:
+        raise RuntimeError("DSPy reasoner not initialized in context")
+
+    # Phase 2: Inject preloaded decision modules into DSPy reasoner
+    # This allows the reasoner to use compiled modules loaded at startup
+    if (
+        context.dspy_routing_module is not None
+        or context.dspy_quality_module is not None
+        or context.dspy_tool_planning_module is not None
+    ):
+        context.dspy_supervisor.set_decision_modules(
+            routing_module=context.dspy_routing_module,
+            quality_module=context.dspy_quality_module,
+            tool_planning_module=context.dspy_tool_planning_module,
+        )
+        logger.info("Injected preloaded decision modules into DSPy reasoner")
+
+
 async def create_supervisor_workflow(
     *,
     compile_dspy: bool = True,
@@ -1484,30 +1533,15 @@ async def create_supervisor_workflow(
     if context is None:
         context = await initialize_workflow_context(config=config, compile_dspy=compile_dspy)
 
-    # Phase 2: Attach decision modules to context if provided
-    if dspy_routing_module is not None:
-        context.dspy_routing_module = dspy_routing_module
-    if dspy_quality_module is not None:
-        context.dspy_quality_module = dspy_quality_module
-    if dspy_tool_planning_module is not None:
-        context.dspy_tool_planning_module = dspy_tool_planning_module
+    attach_decision_modules(
+        context,
+        routing_module=dspy_routing_module,
+        quality_module=dspy_quality_module,
+        tool_planning_module=dspy_tool_planning_module,
+    )
 
     if context.dspy_supervisor is None:
-        raise RuntimeError("DSPy reasoner not initialized in context")
-
-    # Phase 2: Inject preloaded decision modules into DSPy reasoner
-    # This allows the reasoner to use compiled modules loaded at startup
-    if (
-        context.dspy_routing_module is not None
-        or context.dspy_quality_module is not None
-        or context.dspy_tool_planning_module is not None
-    ):
-        context.dspy_supervisor.set_decision_modules(
-            routing_module=context.dspy_routing_module,
-            quality_module=context.dspy_quality_module,
-            tool_planning_module=context.dspy_tool_planning_module,
-        )
-        logger.info("Injected preloaded decision modules into DSPy reasoner")
+        raise RuntimeError("Workflow context has no DSPy supervisor.")
 
     # Build workflow
     workflow_builder = build_fleet_workflow(
@@ -153,6 +153,7 @@ export interface StreamEvent {
     | "connected"
     | "cancelled"
     | "heartbeat"
+    | "queued"
     | "workflow.status";
   delta?: string;
   agent_id?: string;
@@ -98,6 +98,39 @@ export function addStepToLastMessage(
   return { messages: newMessages };
 }
 
+/**
+ * Add an agent step, except that a final discussion message replaces the
+ * output step its deltas streamed into (same agent and round).
+ */
+function addAgentStep(
+  state: ChatState,
+  step: ConversationStep,
+  eventType: string,
+): Partial<ChatState> {
+  const round = step.data?.round;
+  const lastIdx = state.messages.length - 1;
+  const last = state.messages[lastIdx];
+  if (eventType !== "agent.message" || round === undefined || !last) {
+    return addStepToLastMessage(state, step);
+  }
+  const steps = last.role === "assistant" ? last.steps || [] : [];
+  const stepIdx = steps.findIndex(
+    (s) =>
+      s.type === "agent_output" &&
+      s.data?.agent_id === step.data?.agent_id &&
+      s.data?.round === round,
+  );
+  if (stepIdx < 0) return addStepToLastMessage(state, step);
+  const newSteps = [...steps];
+  newSteps[stepIdx] = {
+    ...newSteps[stepIdx],
+    data: { ...newSteps[stepIdx].data, output: step.data?.output },
+  };
+  const newMessages = [...state.messages];
+  newMessages[lastIdx] = { ...last, steps: newSteps };
+  return { messages: newMessages };
+}
+
 function lastAssistantHasSteps(state: ChatState): boolean {
   const lastIdx = state.messages.length - 1;
   if (lastIdx < 0) return false;
@@ -426,6 +459,52 @@ export function handleStreamEvent(
     });
   }
 
+  // Live discussion text: grow the speaker's output step for the round
+  // instead of adding a step per chunk.
+  else if (event.type === "agent.message" && event.data?.delta) {
+    const agentLabel = event.author || event.agent_id || "agent";
+    const round = event.data.round;
+    const delta = event.message || "";
+    set((state) => {
+      const lastIdx = state.messages.length - 1;
+      const last = state.messages[lastIdx];
+      if (!last || last.role !== "assistant") return {};
+      const steps = last.steps || [];
+      const stepIdx = steps.findIndex(
+        (s) =>
+          s.type === "agent_output" &&
+          s.data?.agent_id === event.agent_id &&
+          s.data?.round === round,
+      );
+      if (stepIdx < 0) {
+        const newStep: ConversationStep = {
+          id: generateStepId(),
+          type: "agent_output",
+          content: `${agentLabel}: Produced output`,
+          timestamp: new Date().toISOString(),
+          kind: event.kind,
+          data: {
+            agent_id: event.agent_id,
+            author: event.author,
+            round,
+            output: delta,
+          },
+          category: event.category as ConversationStep["category"],
+        };
+        return addStepToLastMessage(state, newStep, false);
+      }
+      const newSteps = [...steps];
+      const step = newSteps[stepIdx];
+      newSteps[stepIdx] = {
+        ...step,
+        data: { ...step.data, output: `${step.data?.output ?? ""}${delta}` },
+      };
+      const newMessages = [...state.messages];
+      newMessages[lastIdx] = { ...last, steps: newSteps };
+      return { messages: newMessages };
+    });
+  }
+
   // Agent Events
   else if (
     event.type === "agent.start" ||
@@ -519,15 +598,18 @@ export function handleStreamEvent(
         category: event.category as ConversationStep["category"],
       };
 
-      set((state) => ({
-        ...addStepToLastMessage(state, newStep),
-        ...updateLastAssistantMessage(state, () => ({
-          workflowPhase: phase,
-          workflow_id:
-            event.workflow_id ||
-            state.messages[state.messages.length - 1]?.workflow_id,
-        })),
-      }));
+      set((state) => {
+        const withStep = addAgentStep(state, newStep, event.type);
+        return updateLastAssistantMessage(
+          { ...state, ...withStep },
+          () => ({
+            workflowPhase: phase,
+            workflow_id:
+              event.workflow_id ||
+              state.messages[state.messages.length - 1]?.workflow_id,
+          }),
+        );
+      });
     }
   }
 
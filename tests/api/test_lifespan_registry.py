@@ -37,6 +37,13 @@ class TestLifespanArtifactRegistry:
         mock_settings = MagicMock()
         mock_settings.max_concurrent_workflows = 10
         mock_settings.conversations_path = ".var/data/conversations.json"
+        mock_settings.state_backend = "memory"
+        mock_settings.state_slot_lease_seconds = 3600.0
+        mock_settings.fast_path_max_concurrent = 4
+        mock_settings.admission_queue_size = 32
+        mock_settings.admission_queue_per_user = 4
+        mock_settings.admission_queue_timeout_seconds = 20.0
+        mock_settings.state_poll_interval_seconds = 0.25
         mock_get_settings.return_value = mock_settings
 
         # Mock config
@@ -137,6 +144,13 @@ class TestLifespanArtifactRegistry:
         mock_settings = MagicMock()
         mock_settings.max_concurrent_workflows = 10
         mock_settings.conversations_path = ".var/data/conversations.json"
+        mock_settings.state_backend = "memory"
+        mock_settings.state_slot_lease_seconds = 3600.0
+        mock_settings.fast_path_max_concurrent = 4
+        mock_settings.admission_queue_size = 32
+        mock_settings.admission_queue_per_user = 4
+        mock_settings.admission_queue_timeout_seconds = 20.0
+        mock_settings.state_poll_interval_seconds = 0.25
         mock_get_settings.return_value = mock_settings
 
         # Mock config with require_compiled=False
@@ -162,3 +176,109 @@ class TestLifespanArtifactRegistry:
             # Artifact registry should not be set due to error
             # (depending on implementation, may be None)
             pass
+
+    @pytest.mark.asyncio
+    @patch("agentic_fleet.api.lifespan.create_supervisor_workflow")
+    @patch("agentic_fleet.api.lifespan.load_required_compiled_modules")
+    @patch("agentic_fleet.api.lifespan.load_config")
+    @patch("agentic_fleet.api.lifespan.get_settings")
+    async def test_lifespan_records_startup_steps_and_attaches_modules(
+        self,
+        mock_get_settings,
+        mock_load_config,
+        mock_load_modules,
+        mock_create_workflow,
+        mock_app,
+        tmp_path,
+    ):
+        """Artifacts and workflow load concurrently; modules are attached afterwards."""
+        import asyncio
+
+        mock_settings = MagicMock()
+        mock_settings.max_concurrent_workflows = 10
+        mock_settings.conversations_path = str(tmp_path / "conversations.json")
+        mock_settings.state_backend = "memory"
+        mock_settings.state_slot_lease_seconds = 3600.0
+        mock_settings.fast_path_max_concurrent = 4
+        mock_settings.admission_queue_size = 32
+        mock_settings.admission_queue_per_user = 4
+        mock_settings.admission_queue_timeout_seconds = 20.0
+        mock_settings.state_poll_interval_seconds = 0.25
+        mock_get_settings.return_value = mock_settings
+        mock_load_config.return_value = {"dspy": {"require_compiled": False}}
+
+        routing = MagicMock(name="routing")
+        mock_load_modules.return_value = ArtifactRegistry(
+            routing=routing, timings={"routing": 0.01}
+        )
+        workflow = MagicMock()
+        workflow_started = asyncio.Event()
+
+        async def create_workflow(**kwargs):
+            assert kwargs == {}
+            workflow_started.set()
+            return workflow
+
+        mock_create_workflow.side_effect = create_workflow
+
+        async with lifespan(mock_app):
+            startup = mock_app.state.startup
+            assert workflow_started.is_set()
+            assert startup.ready
+            assert not startup.degraded
+            assert {"config", "artifacts", "workflow", "decision_modules"} <= set(startup.steps)
+            assert startup.steps["artifacts"].status == "ok"
+            assert startup.to_dict()["steps"]["artifacts"]["detail"]["seconds"] == {"routing": 0.01}
+            # The compiled routing module reaches the reasoner of the built workflow.
+            assert workflow.context.dspy_routing_module is mock_app.state.dspy_routing_module
+            workflow.context.dspy_supervisor.set_decision_modules.assert_called_once()
+
+        assert not startup.ready
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("require_compiled", [False, True])
+    @patch("agentic_fleet.api.lifespan.create_supervisor_workflow")
+    @patch("agentic_fleet.api.lifespan.load_required_compiled_modules")
+    @patch("agentic_fleet.api.lifespan.load_config")
+    @patch("agentic_fleet.api.lifespan.get_settings")
+    async def test_workflow_creation_is_retried_only_in_lenient_mode(
+        self,
+        mock_get_settings,
+        mock_load_config,
+        mock_load_modules,
+        mock_create_workflow,
+        require_compiled,
+        mock_app,
+        tmp_path,
+    ):
+        """An unexpected workflow error is retried once unless require_compiled is on."""
+        mock_settings = MagicMock()
+        mock_settings.max_concurrent_workflows = 10
+        mock_settings.conversations_path = str(tmp_path / "conversations.json")
+        mock_settings.state_backend = "memory"
+        mock_settings.state_slot_lease_seconds = 3600.0
+        mock_settings.fast_path_max_concurrent = 4
+        mock_settings.admission_queue_size = 32
+        mock_settings.admission_queue_per_user = 4
+        mock_settings.admission_queue_timeout_seconds = 20.0
+        mock_settings.state_poll_interval_seconds = 0.25
+        mock_get_settings.return_value = mock_settings
+        mock_load_config.return_value = {"dspy": {"require_compiled": require_compiled}}
+        mock_load_modules.return_value = ArtifactRegistry(routing=MagicMock())
+        workflow = MagicMock()
+        mock_create_workflow.side_effect = [ValueError("agent init failed"), workflow]
+
+        if require_compiled:
+            with pytest.raises(RuntimeError, match="agent init failed"):
+                async with lifespan(mock_app):
+                    pass
+            assert mock_create_workflow.call_count == 1
+            return
+
+        async with lifespan(mock_app):
+            startup = mock_app.state.startup
+            assert mock_app.state.workflow is workflow
+            assert mock_create_workflow.call_count == 2
+            assert startup.steps["workflow"].status == "failed"
+            assert startup.steps["workflow_retry"].status == "ok"
+            assert startup.degraded
@@ -26,6 +26,13 @@ def client(mock_optimization_service):
     mock_settings = MagicMock()
     mock_settings.max_concurrent_workflows = 10
     mock_settings.conversations_path = ".var/data/conversations.json"
+    mock_settings.state_backend = "memory"
+    mock_settings.state_slot_lease_seconds = 3600.0
+    mock_settings.fast_path_max_concurrent = 4
+    mock_settings.admission_queue_size = 32
+    mock_settings.admission_queue_per_user = 4
+    mock_settings.admission_queue_timeout_seconds = 20.0
+    mock_settings.state_poll_interval_seconds = 0.25
 
     # Override the FastAPI dependency
     app.dependency_overrides[get_optimization_service] = lambda: mock_optimization_service
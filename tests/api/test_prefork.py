@@ -0,0 +1,130 @@
+"""Tests for the pre-fork multi-worker server."""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+import urllib.request
+
+import pytest
+
+from agentic_fleet.api import prefork
+from agentic_fleet.dspy_modules import compiled_registry
+from agentic_fleet.dspy_modules.compiled_registry import ArtifactRegistry
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+
+_SERVER_SCRIPT = """
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+
+from agentic_fleet.api.prefork import PreforkServer
+
+
+@asynccontextmanager
+async def failing_startup(app):
+    raise RuntimeError("startup failed")
+    yield
+
+
+app = FastAPI(lifespan=failing_startup if {fail_startup} else None)
+
+
+@app.get("/pid")
+def pid():
+    return {{"pid": os.getpid(), "ppid": os.getppid()}}
+
+
+if __name__ == "__main__":
+    raise SystemExit(
+        PreforkServer(
+            "__main__:app", port={port}, workers=2, preload=None, log_level="warning",
+            min_uptime=1.0,
+        ).run()
+    )
+"""
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _start(tmp_path, port: int, *, fail_startup: bool = False) -> subprocess.Popen:
+    script = tmp_path / "server.py"
+    script.write_text(textwrap.dedent(_SERVER_SCRIPT.format(port=port, fail_startup=fail_startup)))
+    return subprocess.Popen(
+        [sys.executable, str(script)], stdout=subprocess.PIPE, stderr=subprocess.STDOUT
+    )
+
+
+def test_preload_warms_caches_and_freezes(monkeypatch):
+    calls = []
+
+    def fake_load(dspy_config, require_compiled=True, **kwargs):
+        calls.append(require_compiled)
+        return ArtifactRegistry()
+
+    monkeypatch.setattr(compiled_registry, "load_required_compiled_modules", fake_load)
+    try:
+        report = prefork.preload(modules=("json",))
+        assert not gc.isenabled()
+    finally:
+        gc.unfreeze()
+        gc.enable()
+
+    assert calls == [False]
+    assert report.frozen_objects > 0
+    assert set(report.seconds) == {"imports", "config", "artifacts", "freeze"}
+    assert report.artifacts == {
+        "routing": False,
+        "tool_planning": False,
+        "quality": False,
+        "reasoner": False,
+    }
+
+
+def test_server_forks_workers_and_stops_on_sigterm(tmp_path):
+    port = _free_port()
+    proc = _start(tmp_path, port)
+    try:
+        pids: set[int] = set()
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline and len(pids) < 2:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/pid", timeout=2) as resp:
+                    body = json.loads(resp.read())
+            except OSError:
+                time.sleep(0.2)
+                continue
+            assert body["ppid"] == proc.pid
+            pids.add(body["pid"])
+        assert pids, proc.stdout.read1().decode() if proc.stdout else ""
+
+        proc.send_signal(signal.SIGTERM)
+        assert proc.wait(timeout=30) == 0
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
+
+
+def test_server_stops_when_workers_fail_to_start(tmp_path):
+    proc = _start(tmp_path, _free_port(), fail_startup=True)
+    try:
+        assert proc.wait(timeout=30) != 0
+        assert b"during startup; stopping" in proc.stdout.read()
+    finally:
+        if proc.poll() is None:
+            proc.kill()
+            proc.wait()
@@ -0,0 +1,104 @@
+"""Tests for the byte-level stream event encoder."""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+import pytest
+
+from agentic_fleet.api.events.encoding import EventRecord, StreamEventEncoder
+from agentic_fleet.api.events.mapping import classify_event
+from agentic_fleet.models import StreamEvent, StreamEventType
+from agentic_fleet.services.chat_helpers import ResponseState
+
+
+def _event(event_type: StreamEventType, **kwargs) -> StreamEvent:
+    category, ui_hint = classify_event(event_type, kwargs.get("kind"))
+    return StreamEvent(type=event_type, category=category, ui_hint=ui_hint, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "event",
+    [
+        StreamEvent(type=StreamEventType.DONE),
+        _event(StreamEventType.RESPONSE_DELTA, delta="Héllo ✏️", agent_id="writer"),
+        _event(
+            StreamEventType.ORCHESTRATOR_THOUGHT,
+            kind="routing",
+            message="Routing to researcher",
+            data={"agents": ["researcher"], "confidence": 0.9},
+            workflow_id="wf-123",
+            log_line="[wf-123] routing",
+        ),
+        _event(
+            StreamEventType.RESPONSE_COMPLETED,
+            message="Final",
+            author="Writer",
+            quality_score=7.5,
+            quality_flag="low_confidence",
+            reasoning_partial=False,
+            workflow_id="other-workflow",
+        ),
+        _event(StreamEventType.ERROR, error="boom", timestamp=datetime(2026, 1, 2, 3, 4, 5)),
+    ],
+)
+def test_encode_matches_to_sse_dict(event: StreamEvent):
+    encoder = StreamEventEncoder("wf-123")
+
+    encoded = json.loads(encoder.encode(event))
+    expected = json.loads(json.dumps(event.to_sse_dict()))
+
+    assert encoded == expected
+    assert list(encoded) == list(expected)
+
+
+def test_event_record_matches_stream_event():
+    event = _event(
+        StreamEventType.AGENT_START, agent_id="researcher", message="go", workflow_id="wf-1"
+    )
+    record = EventRecord.from_stream_event(event)
+    encoder = StreamEventEncoder("wf-1")
+
+    assert record.to_sse_dict() == event.to_sse_dict()
+    assert encoder.encode(record) == encoder.encode(event)
+
+
+def test_static_fragments_are_encoded_once_per_session():
+    encoder = StreamEventEncoder("wf-1")
+    for i in range(5):
+        encoder.encode(_event(StreamEventType.RESPONSE_DELTA, delta=str(i), workflow_id="wf-1"))
+    encoder.encode(_event(StreamEventType.AGENT_START, agent_id="a", workflow_id="wf-1"))
+
+    assert len(encoder._ui_hint_fragments) == 2
+
+
+def test_encode_sse_frame():
+    frame = StreamEventEncoder("wf-1").encode_sse(
+        EventRecord(type=StreamEventType.HEARTBEAT, message="heartbeat", workflow_id="wf-1")
+    )
+
+    assert frame.startswith(b"data: {")
+    assert frame.endswith(b"}\n\n")
+    payload = json.loads(frame[len(b"data: ") :])
+    assert payload["type"] == "heartbeat"
+    assert payload["workflow_id"] == "wf-1"
+
+
+def test_response_state_from_event_object_matches_dict():
+    events = [
+        _event(StreamEventType.AGENT_MESSAGE, agent_id="researcher", message="notes"),
+        _event(StreamEventType.RESPONSE_DELTA, delta="Hel", author="Writer"),
+        _event(StreamEventType.RESPONSE_DELTA, delta="lo"),
+        _event(StreamEventType.DONE),
+    ]
+    from_dicts = ResponseState()
+    from_objects = ResponseState()
+    for event in events:
+        from_dicts.update_from_event(event.to_sse_dict())
+        from_objects.update_from_stream_event(event)
+
+    assert from_objects == from_dicts
+    assert from_objects.get_final_text() == "Hello"
+    assert from_objects.last_author == "Writer"
+    assert from_objects.saw_done
@@ -15,6 +15,16 @@ def test_health_check(client: TestClient):
     assert "version" in data
 
 
+def test_readiness_reports_startup_steps(client: TestClient):
+    response = client.get("/ready")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "ready"
+    assert data["startup"]["ready"] is True
+    assert data["startup"]["steps"]["workflow"]["status"] == "ok"
+    assert "artifacts" in data["startup"]["steps"]
+
+
 def test_run_workflow(client: TestClient, mock_workflow: MagicMock):
     mock_workflow.run.return_value = {
         "result": "Task completed",
@@ -52,7 +52,7 @@ class TestRunCommand:
         assert result.exit_code == 0
         assert "run" in result.stdout.lower() or "Usage" in result.stdout
 
-    @patch("agentic_fleet.cli.commands.run.WorkflowRunner")
+    @patch("agentic_fleet.cli.runner.WorkflowRunner")
     def test_run_command_with_message(self, mock_runner_class, runner):
         """Test run command with message."""
         mock_instance = MagicMock()
@@ -0,0 +1,62 @@
+"""Import budgets for the CLI and API entry points.
+
+Each case runs in a fresh interpreter so that modules already imported by the
+test session do not hide regressions. The budget is the set of heavy modules
+an entry point may not load, not a wall-clock limit, so it holds on slow or
+loaded machines too.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ("dspy", "litellm", "agentic_fleet.workflows.supervisor")
+
+# (label, entry-point module, code run after importing its ``app``)
+CASES = [
+    ("cli --help", "agentic_fleet.cli.console", "app(['--help'])"),
+    ("cli list-agents", "agentic_fleet.cli.console", "app(['list-agents'])"),
+    ("api app", "agentic_fleet.main", ""),
+]
+
+
+def _loaded_heavy_modules(module: str, code: str) -> list[str]:
+    """Import ``module`` (then run ``code``) in a fresh interpreter; return heavy modules loaded."""
+    script = "\n".join(
+        [
+            "import json, sys",
+            f"from {module} import app",
+            "try:",
+            f"    {code or 'pass'}",
+            "except SystemExit:",
+            "    pass",
+            f"print(json.dumps([m for m in {list(HEAVY_MODULES)!r} if m in sys.modules]))",
+        ]
+    )
+    env = {**os.environ, "LOG_JSON": "0", "PYTHONDONTWRITEBYTECODE": "1"}
+    proc = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        env=env,
+        timeout=120,
+        check=False,
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize(
+    ("module", "code"),
+    [case[1:] for case in CASES],
+    ids=[case[0] for case in CASES],
+)
+def test_entry_point_does_not_load_heavy_modules(module, code):
+    loaded = _loaded_heavy_modules(module, code)
+
+    assert not loaded, f"{module} loaded heavy modules: {loaded}"
@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from agentic_fleet.dspy_modules.compiled_registry import (
+    ArtifactCache,
     ArtifactMetadata,
     ArtifactRegistry,
     CompiledArtifact,
@@ -340,3 +341,58 @@ class TestLoadRequiredCompiledModulesPhase3:
         assert registry.routing is mock_module
         assert registry.tool_planning is mock_module
         assert registry.quality is mock_module
+
+
+class TestArtifactCache:
+    """Tests for the content-hash keyed artifact cache."""
+
+    def test_unchanged_artifact_is_not_reloaded(self, tmp_path):
+        path = tmp_path / "compiled_routing.json"
+        path.write_text('{"demos": []}')
+        loader = MagicMock(side_effect=lambda *_args, **_kwargs: MagicMock())
+        cache = ArtifactCache()
+
+        first, first_hit = cache.load(path, "routing", loader)
+        second, second_hit = cache.load(path, "routing", loader)
+
+        assert (first_hit, second_hit) == (False, True)
+        assert second is first
+        loader.assert_called_once_with(str(path), module_type="routing")
+
+        # New content means a new key; the same bytes under another type do too.
+        path.write_text('{"demos": [1]}')
+        changed, changed_hit = cache.load(path, "routing", loader)
+        other, _ = cache.load(path, "tool_planning", loader)
+        assert not changed_hit
+        assert changed is not first
+        assert other is not changed
+        assert loader.call_count == 3
+
+    def test_failed_loads_and_unreadable_paths_are_not_cached(self, tmp_path):
+        path = tmp_path / "compiled_quality.pkl"
+        path.write_bytes(b"not a module")
+        cache = ArtifactCache()
+        loader = MagicMock(return_value=None)
+
+        assert cache.load(path, "quality", loader) == (None, False)
+        assert cache.load(path, "quality", loader) == (None, False)
+        assert loader.call_count == 2
+        assert cache.digest(tmp_path / "missing.json") is None
+
+    @patch("agentic_fleet.utils.compiler.load_compiled_module")
+    def test_registry_loads_through_cache_and_records_timings(self, mock_load, tmp_path):
+        dspy_config = {}
+        for name in ("routing", "tool_planning", "quality", "reasoner"):
+            path = tmp_path / f"{name}.json"
+            path.write_text(json.dumps({"name": name}))
+            dspy_config[f"compiled_{name}_path"] = str(path)
+        mock_load.side_effect = lambda path, module_type: MagicMock(name=module_type)
+        cache = ArtifactCache()
+
+        first = load_required_compiled_modules(dspy_config, require_compiled=True, cache=cache)
+        second = load_required_compiled_modules(dspy_config, require_compiled=True, cache=cache)
+
+        assert mock_load.call_count == 4
+        assert (cache.hits, cache.misses) == (4, 4)
+        assert second.routing is first.routing
+        assert set(second.timings) == {"routing", "tool_planning", "quality", "reasoner"}
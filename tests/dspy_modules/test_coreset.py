@@ -0,0 +1,86 @@
+"""Tests for budget-aware GEPA coreset selection."""
+
+from __future__ import annotations
+
+import json
+import random
+
+from agentic_fleet.dspy_modules.optimization.coreset import (
+    coreset_size_for_budget,
+    routing_stratum,
+    select_coreset,
+)
+from agentic_fleet.dspy_modules.optimization.gepa import prepare_gepa_datasets
+
+
+def _corpus() -> list[dict]:
+    records = [
+        {"task": f"Research the latest news about {topic}", "assigned_to": "Researcher",
+         "mode": "delegated", "tool_requirements": ["TavilySearchTool"]}
+        for topic in ("GPUs", "solar panels", "vaccines", "chip exports", "EV batteries",
+                      "rust compilers", "quantum sensors", "fusion startups")
+    ]  # fmt: skip
+    records += [
+        {"task": task, "assigned_to": "Writer", "mode": "delegated"}
+        for task in ("Write a haiku about autumn", "Draft a wedding toast", "Compose a limerick")
+    ]
+    records.append(
+        {"task": "Research X then write a report", "assigned_to": "Researcher,Writer",
+         "mode": "sequential", "tool_requirements": ["TavilySearchTool"]}
+    )  # fmt: skip
+    return records
+
+
+def test_every_routing_pattern_is_covered_and_singletons_stay_in_train():
+    selection = select_coreset(_corpus(), 6, val_split=0.34, seed=7)
+
+    strata = {routing_stratum(r) for r in selection.train + selection.val}
+    assert len(strata) == 3
+    assert len(selection.train) + len(selection.val) == 6
+    assert len(selection.val) == 2
+    assert any(r["mode"] == "sequential" for r in selection.train)
+    report = selection.report
+    assert report["strata"] == {"total": 3, "covered": 3}
+    assert sorted(s["available"] for s in report["by_stratum"]) == [1, 3, 8]
+    assert len(report["train"]) + len(report["val"]) == 6
+
+
+def test_selection_is_reproducible_and_order_independent():
+    records = _corpus()
+    shuffled = records[:]
+    random.Random(1).shuffle(shuffled)
+
+    first = select_coreset(records, 5, seed=3)
+    second = select_coreset(shuffled, 5, seed=3)
+
+    assert first.report == second.report
+    assert select_coreset(records, 5, seed=4).report["seed"] == 4
+
+
+def test_k_center_prefers_distinct_phrasings():
+    records = [
+        {"task": "Summarize the quarterly sales report", "assigned_to": "Analyst", "mode": "delegated"},
+        {"task": "Summarize the quarterly sales report please", "assigned_to": "Analyst", "mode": "delegated"},
+        {"task": "Calculate compound interest on a loan", "assigned_to": "Analyst", "mode": "delegated"},
+    ]  # fmt: skip
+
+    picked = select_coreset(records, 2, val_split=0.0, seed=0).train
+
+    assert "Calculate compound interest on a loan" in {r["task"] for r in picked}
+
+
+def test_prepare_gepa_datasets_writes_the_coreset_report(tmp_path):
+    report_path = tmp_path / "gepa" / "coreset.json"
+
+    trainset, valset = prepare_gepa_datasets(
+        base_examples_path=str(tmp_path / "missing.json"),
+        base_records=_corpus(),
+        coreset_size=coreset_size_for_budget(20, val_split=0.2, full_val_evals=10),
+        report_path=report_path,
+    )
+
+    assert len(trainset) + len(valset) == 10
+    report = json.loads(report_path.read_text())
+    assert report["selected"] == 10
+    assert report["total_records"] == 12
+    assert len(report["val"]) == len(valset)
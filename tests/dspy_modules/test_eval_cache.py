@@ -0,0 +1,140 @@
+"""Tests for the persistent GEPA evaluation cache."""
+
+from __future__ import annotations
+
+import dspy
+import pytest
+from dspy.utils.dummies import DummyLM
+
+from agentic_fleet.dspy_modules.optimization import gepa
+from agentic_fleet.dspy_modules.optimization.eval_cache import GEPAEvaluationCache
+from agentic_fleet.dspy_modules.optimization.gepa import RoutingFeedbackMetric, optimize_with_gepa
+
+
+class _Router(dspy.Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.route = dspy.Predict("task -> assigned_to, execution_mode")
+
+    def forward(self, task: str) -> dspy.Prediction:
+        return self.route(task=task)
+
+
+def _lm() -> DummyLM:
+    return DummyLM([{"assigned_to": "Researcher", "execution_mode": "delegated"}] * 20)
+
+
+def _examples() -> list[dspy.Example]:
+    return [
+        dspy.Example(task=task, assigned_to="Researcher", execution_mode="delegated").with_inputs(
+            "task"
+        )
+        for task in ("Find recent AI papers", "Summarize the market report")
+    ]
+
+
+def test_predictor_outputs_are_reused_across_cache_instances(tmp_path):
+    path = tmp_path / "eval.sqlite"
+    program = _Router()
+    lm = _lm()
+
+    with dspy.context(lm=lm):
+        first = GEPAEvaluationCache(path)
+        with first.activate():
+            cold = [program(task=ex.task) for ex in _examples()]
+        first.close()
+
+        second = GEPAEvaluationCache(path)
+        with second.activate(), dspy.context(trace=[]):
+            warm = [program(task=ex.task) for ex in _examples()]
+            # Cached calls still record a trace for GEPA's reflective dataset.
+            assert len(dspy.settings.trace) == 2
+        program.route.signature = program.route.signature.with_instructions("Route carefully.")
+        with second.activate():
+            program(task="Find recent AI papers")
+
+    assert len(lm.history) == 3
+    assert [p.toDict() for p in warm] == [p.toDict() for p in cold]
+    assert (second.stats.prediction_hits, second.stats.prediction_misses) == (2, 1)
+
+
+def test_metric_results_are_keyed_by_metric_version(tmp_path):
+    calls: list[str] = []
+
+    class CountingMetric(RoutingFeedbackMetric):
+        def __call__(self, gold, pred, trace=None, pred_name=None, pred_trace=None):
+            calls.append(pred_name)
+            return super().__call__(gold, pred, trace, pred_name, pred_trace)
+
+    cache = GEPAEvaluationCache(tmp_path / "eval.sqlite")
+    gold = _examples()[0]
+    pred = dspy.Prediction(assigned_to="Writer", execution_mode="delegated")
+
+    metric = cache.wrap_metric(CountingMetric())
+    first = metric(gold, pred)
+    again = metric(gold, pred)
+    metric(gold, pred, pred_name="route")
+
+    bumped = CountingMetric()
+    bumped.version = 2
+    cache.wrap_metric(bumped)(gold, pred)
+
+    assert calls == [None, "route", None]
+    assert (again.score, again.feedback) == (first.score, first.feedback)
+    assert (cache.stats.metric_hits, cache.stats.metric_misses) == (1, 3)
+
+    def unversioned(gold, pred, trace=None, pred_name=None, pred_trace=None):
+        return 1.0
+
+    assert cache.wrap_metric(unversioned) is unversioned
+
+
+@pytest.mark.parametrize("budget", ["light", "heavy"])
+def test_rerun_reports_cache_hits_in_progress(tmp_path, monkeypatch, budget):
+    class FakeGEPA:
+        """Evaluates the student once per example, like a GEPA baseline pass."""
+
+        def __init__(self, metric, **kwargs):
+            self.metric = metric
+
+        def compile(self, student, trainset, valset=None):
+            for example in trainset:
+                self.metric(example, student(**example.inputs()))
+            return student
+
+    class Progress:
+        def __init__(self) -> None:
+            self.completed: list[str] = []
+
+        def on_start(self, message):
+            pass
+
+        def on_progress(self, message, current=None, total=None):
+            pass
+
+        def on_complete(self, message, duration=None):
+            self.completed.append(message)
+
+        def on_error(self, message, error=None):
+            raise AssertionError(message)
+
+    monkeypatch.setattr(gepa.dspy, "GEPA", FakeGEPA, raising=False)
+    monkeypatch.setattr(gepa, "record_dspy_optimization_run", lambda *a, **k: None)
+    cache_path = str(tmp_path / "eval.sqlite")
+    lm = _lm()
+    progress = Progress()
+
+    with dspy.context(lm=lm):
+        for run_budget in ("medium", budget):
+            optimize_with_gepa(
+                _Router(),
+                _examples(),
+                auto=run_budget,
+                log_dir=str(tmp_path / "logs"),
+                progress_callback=progress,
+                eval_cache_path=cache_path,
+            )
+
+    assert len(lm.history) == 2
+    assert "eval cache: 0/2 LM calls and 0/2 metric calls reused" in progress.completed[0]
+    assert "eval cache: 2/2 LM calls and 2/2 metric calls reused" in progress.completed[1]
@@ -0,0 +1,122 @@
+"""Tests for the append-only training-example store."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from agentic_fleet.dspy_modules.optimization import example_store
+from agentic_fleet.dspy_modules.optimization.example_store import ExampleStore
+from agentic_fleet.dspy_modules.optimization.gepa import load_example_dicts
+
+
+@pytest.fixture(autouse=True)
+def store_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "stores"
+    monkeypatch.setattr(example_store, "DEFAULT_EXAMPLE_STORE_DIR", str(directory))
+    return directory
+
+
+def _example(task: str, agents: str = "Researcher", mode: str = "delegated") -> dict:
+    return {"task": task, "assigned_to": agents, "mode": mode}
+
+
+def test_exact_and_near_duplicates_are_rejected(tmp_path):
+    store = ExampleStore(tmp_path / "examples.jsonl")
+
+    added = store.add_many(
+        [
+            _example("Research the latest developments in quantum computing and summarize them"),
+            _example("research the latest developments in quantum computing and summarize them "),
+            _example(
+                "Please research the latest developments in quantum computing and summarize them"
+            ),
+            _example("Write a haiku about autumn", agents="Writer"),
+        ]
+    )
+
+    assert [e["task"] for e in added] == [
+        "Research the latest developments in quantum computing and summarize them",
+        "Write a haiku about autumn",
+    ]
+    assert store.is_duplicate(_example("Write a haiku about autumn!", agents="Writer"))
+    assert not store.is_duplicate(_example("Compare Rust and Go for web servers"))
+
+
+def test_reopening_reads_the_index_and_reindexes_an_unindexed_tail(tmp_path):
+    path = tmp_path / "examples.jsonl"
+    store = ExampleStore(path)
+    store.add_many([_example("Summarize the quarterly report"), _example("Plan a trip to Rome")])
+    index_lines = store.index_path.read_text().splitlines()
+
+    # A record written without its index entry, then a torn write.
+    with path.open("a") as f:
+        f.write(json.dumps(_example("Translate this email to French")) + "\n")
+        f.write('{"task": "tor')
+
+    reopened = ExampleStore(path)
+    assert len(reopened) == 3
+    assert len(reopened.index_path.read_text().splitlines()) == len(index_lines) + 1
+    assert reopened.is_duplicate(_example("Translate this email to French"))
+    assert reopened.add(_example("Draft a product launch announcement"))
+    assert [r["task"] for r in reopened.iter_records()][-1] == "Draft a product launch announcement"
+
+
+def test_json_seed_is_imported_once_and_resynced_when_edited(tmp_path, store_dir):
+    seed = tmp_path / "supervisor_examples.json"
+    curated = [_example("What is Gemini 3 Pro?"), _example("What is Gemini 3 Pro, exactly?")]
+    seed.write_text(json.dumps(curated))
+
+    store = ExampleStore.open(seed)
+    assert store.path.parent == store_dir
+    assert store.path.name.startswith("supervisor_examples-")
+    assert not (tmp_path / "supervisor_examples.jsonl").exists()
+    # Curated seed examples are only deduplicated exactly.
+    assert len(store) == 2
+    assert store.add(_example("Plan a sprint for the API team", agents="Planner"))
+
+    assert len(ExampleStore.open(seed)) == 3
+    seed.write_text(json.dumps([*curated, _example("Explain CRDTs", agents="Writer")]))
+    assert len(ExampleStore.open(seed)) == 4
+    assert "Explain CRDTs" in [r["task"] for r in load_example_dicts(str(seed))]
+
+
+def test_corrected_or_removed_seed_examples_propagate(tmp_path):
+    seed = tmp_path / "supervisor_examples.json"
+    seed.write_text(
+        json.dumps([_example("Explain CRDTs", agents="Researcher"), _example("What is MCP?")])
+    )
+    store = ExampleStore.open(seed)
+    assert store.add(_example("Plan a sprint for the API team", agents="Planner"))
+
+    # Fix the routing of one curated example and drop the other.
+    seed.write_text(json.dumps([_example("Explain CRDTs", agents="Writer")]))
+    reopened = ExampleStore.open(seed)
+
+    records = list(reopened.iter_records())
+    assert [(r["task"], r["assigned_to"]) for r in records] == [
+        ("Explain CRDTs", "Writer"),
+        ("Plan a sprint for the API team", "Planner"),
+    ]
+    assert len(reopened) == 2
+    assert not reopened.is_duplicate(_example("What is MCP?"))
+    assert len(ExampleStore.open(seed)) == 2
+
+
+def test_self_improvement_appends_instead_of_rewriting(tmp_path, monkeypatch, store_dir):
+    from agentic_fleet.dspy_modules.optimization import self_improvement
+
+    monkeypatch.setattr(self_improvement, "mirror_dspy_examples", lambda *a, **k: None)
+    seed = tmp_path / "examples.json"
+    seed.write_text(json.dumps([_example("Summarize the quarterly report")]))
+    engine = self_improvement.SelfImprovementEngine(user_id="test")
+
+    added = engine._add_new_examples(
+        [_example("Summarize the quarterly report"), _example("Plan a trip to Rome")], str(seed)
+    )
+
+    assert [e["task"] for e in added] == ["Plan a trip to Rome"]
+    assert json.loads(seed.read_text()) == [_example("Summarize the quarterly report")]
+    (store_path,) = store_dir.glob("examples-????????.jsonl")
+    assert store_path.read_text().count("\n") == 2
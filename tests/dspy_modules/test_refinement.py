@@ -0,0 +1,118 @@
+"""Tests for concurrent Best-of-N refinement."""
+
+from __future__ import annotations
+
+import threading
+import time
+
+import dspy
+import pytest
+
+from agentic_fleet.dspy_modules.refinement import BestOfN
+
+
+class _SlowGenerator:
+    """Returns answers in call order; the i-th call sleeps ``delays[i]`` seconds.
+
+    A ``None`` delay blocks until ``release`` is set, so tests can tell
+    abandoned candidates apart without relying on wall-clock limits.
+    """
+
+    def __init__(self, delays: list[float | None]) -> None:
+        self.delays = delays
+        self.calls = 0
+        self.active = 0
+        self.peak = 0
+        self.inputs: list[dict] = []
+        self.release = threading.Event()
+        self._lock = threading.Lock()
+
+    def __call__(self, task: str, **inputs) -> dspy.Prediction:
+        with self._lock:
+            index = self.calls
+            self.calls += 1
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.inputs.append(inputs)
+        delay = self.delays[index]
+        if delay is None:
+            self.release.wait(timeout=5)
+        else:
+            time.sleep(delay)
+        with self._lock:
+            self.active -= 1
+        return dspy.Prediction(answer=f"answer-{index}")
+
+
+def _score_by_suffix(task: str, candidate: str) -> float:
+    return float(candidate.rsplit("-", 1)[1])
+
+
+@pytest.mark.asyncio
+async def test_candidates_are_generated_and_scored_concurrently():
+    generator = _SlowGenerator([0.05] * 4)
+    scored: list[str] = []
+
+    def score(task: str, candidate: str) -> float:
+        scored.append(candidate)
+        return _score_by_suffix(task, candidate)
+
+    strategy = BestOfN(generator, score, n=4, max_concurrency=2)
+
+    result = await strategy.refine("task", inputs={"draft": "d"})
+
+    assert generator.calls == 4
+    assert generator.peak == 2
+    assert generator.inputs == [{"draft": "d"}] * 4
+    assert sorted(scored) == [f"answer-{i}" for i in range(4)]
+    assert sorted(result.candidates) == [f"answer-{i}" for i in range(4)]
+    assert result.best_answer == "answer-3"
+    assert result.metadata["candidates_generated"] == 4
+    assert result.metadata["stopped"] is None
+
+
+@pytest.mark.asyncio
+async def test_stops_once_a_candidate_passes_the_threshold():
+    generator = _SlowGenerator([0.0, None, None])
+    scored: list[str] = []
+
+    async def score(task: str, candidate: str) -> float:
+        scored.append(candidate)
+        return 9.0 if candidate == "answer-0" else 1.0
+
+    try:
+        result = await BestOfN(generator, score, n=3, stop_threshold=8.0).refine("task")
+    finally:
+        generator.release.set()
+
+    # Returned while the other candidates were still blocked in the generator.
+    assert scored == ["answer-0"]
+    assert result.best_answer == "answer-0"
+    assert result.scores == [9.0]
+    assert result.metadata["stopped"] == "threshold"
+    assert result.metadata["candidates_generated"] == 1
+
+
+@pytest.mark.asyncio
+async def test_time_budget_returns_the_best_finished_candidate():
+    generator = _SlowGenerator([0.0, None])
+    strategy = BestOfN(generator, _score_by_suffix, n=2, time_budget_seconds=0.3)
+
+    try:
+        result = await strategy.refine("task", initial_answer="draft")
+    finally:
+        generator.release.set()
+
+    assert result.best_answer == "answer-0"
+    assert result.metadata["stopped"] == "budget"
+    assert result.metadata["candidates_generated"] == 1
+
+    blocked = _SlowGenerator([None])
+    try:
+        empty = await BestOfN(blocked, _score_by_suffix, n=1, time_budget_seconds=0.05).refine(
+            "task", initial_answer="draft"
+        )
+    finally:
+        blocked.release.set()
+    assert empty.best_answer == "draft"
+    assert empty.candidates == []
@@ -0,0 +1,122 @@
+"""Tests for batched, resumable history quality scoring."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from agentic_fleet.evaluation.batch_scoring import BatchQualityScorer, pair_key
+from agentic_fleet.utils.storage import HistoryManager
+
+
+class _RateLimitError(Exception):
+    status_code = 429
+
+
+class _Scorer:
+    """Thread-safe fake scorer that records calls and can rate-limit or fail."""
+
+    def __init__(self, rate_limits: int = 0, fail: str | None = None) -> None:
+        self.calls: list[str] = []
+        self.rate_limits = rate_limits
+        self.fail = fail
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, task: str, answer: str) -> dict[str, Any]:
+        with self._lock:
+            self.calls.append(task)
+            if self.rate_limits:
+                self.rate_limits -= 1
+                raise _RateLimitError("slow down")
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(0.02)
+            if task == self.fail:
+                raise ValueError("bad answer")
+            return {"score": float(len(answer)), "pending": False}
+        finally:
+            with self._lock:
+                self.running -= 1
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> HistoryManager:
+    manager = HistoryManager()
+    manager.history_dir = tmp_path
+    rows = [
+        {"workflowId": "w1", "task": "2+2?", "result": "4", "quality": {"score": 0.0}},
+        {"workflowId": "w2", "task": "2+2?", "result": "4"},
+        {"workflowId": "w3", "task": "capital of France?", "result": "Paris"},
+        {"workflowId": "w4", "task": "scored", "result": "done", "quality": {"score": 7.0}},
+        {"workflowId": "w5", "task": "haiku", "result": "old pond"},
+    ]
+    (tmp_path / "execution_history.jsonl").write_text(
+        "".join(json.dumps(row) + "\n" for row in rows)
+    )
+    return manager
+
+
+def _scores(manager: HistoryManager) -> dict[str, Any]:
+    lines = (manager.history_dir / "execution_history.jsonl").read_text().splitlines()
+    return {
+        row["workflowId"]: row.get("quality", {}).get("score") for row in map(json.loads, lines)
+    }
+
+
+@pytest.mark.asyncio
+async def test_unscored_pairs_are_deduped_scored_concurrently_and_written_in_batch(
+    history, monkeypatch
+):
+    scorer = _Scorer()
+    writes: list[int] = []
+    update = history.update_executions
+    monkeypatch.setattr(
+        history, "update_executions", lambda patches: writes.append(len(patches)) or update(patches)
+    )
+
+    stats = await BatchQualityScorer(scorer, history, concurrency=3).run()
+
+    assert sorted(scorer.calls) == ["2+2?", "capital of France?", "haiku"]
+    assert scorer.peak == 3
+    assert (stats.selected, stats.unique, stats.scored, stats.updated) == (4, 3, 3, 4)
+    assert writes == [4]
+    assert _scores(history) == {"w1": 1.0, "w2": 1.0, "w3": 5.0, "w4": 7.0, "w5": 8.0}
+    assert not (history.history_dir / "quality_backfill.jsonl").exists()
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_pause_and_retry(history):
+    scorer = _Scorer(rate_limits=2)
+
+    stats = await BatchQualityScorer(scorer, history, concurrency=2, backoff_seconds=0.01).run()
+
+    assert stats.rate_limited == 2
+    assert stats.scored == 3
+    assert stats.failed == 0
+
+
+@pytest.mark.asyncio
+async def test_interrupted_run_resumes_from_marker(history):
+    marker = history.history_dir / "quality_backfill.jsonl"
+    marker.write_text(
+        json.dumps({"key": pair_key("2+2?", "4"), "quality": {"score": 9.0}})
+        + "\n"
+        + '{"key": "torn'
+    )
+    scorer = _Scorer(fail="haiku")
+
+    stats = await BatchQualityScorer(scorer, history).run()
+
+    assert sorted(scorer.calls) == ["capital of France?", "haiku"]
+    assert (stats.resumed, stats.scored, stats.failed) == (1, 1, 1)
+    scores = _scores(history)
+    assert scores["w1"] == scores["w2"] == 9.0
+    assert scores["w5"] is None
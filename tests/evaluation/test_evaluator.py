@@ -0,0 +1,169 @@
+"""Tests for the concurrent, resumable evaluation runner."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from agentic_fleet.evaluation import Evaluator
+
+
+class _FakeWorkflow:
+    """Workflow stand-in whose per-message behaviour tests can script."""
+
+    def __init__(self, delay: float = 0.02) -> None:
+        self.delay = delay
+        self.calls: list[str] = []
+        self.running = 0
+        self.peak = 0
+
+    async def run(self, message: str) -> dict[str, Any]:
+        self.calls.append(message)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            if message == "hang":
+                await asyncio.sleep(5)
+            if message == "boom":
+                raise RuntimeError("workflow failed")
+            await asyncio.sleep(self.delay)
+        finally:
+            self.running -= 1
+        return {
+            "result": f"answer to {message}",
+            "quality": {"score": 8.0},
+            "routing": {"agents": ["Researcher", "Writer"]},
+            "metadata": {"usage": {"prompt_tokens": 10, "completion_tokens": 5}},
+        }
+
+
+def _dataset(tmp_path: Path, messages: list[str]) -> str:
+    path = tmp_path / "tasks.jsonl"
+    path.write_text(
+        "\n".join(json.dumps({"id": f"t{i}", "message": m}) for i, m in enumerate(messages))
+    )
+    return str(path)
+
+
+def _evaluator(tmp_path: Path, dataset: str, workflow: _FakeWorkflow, **kwargs: Any) -> Evaluator:
+    async def factory() -> _FakeWorkflow:
+        return workflow
+
+    return Evaluator(
+        workflow_factory=factory,
+        dataset_path=dataset,
+        output_dir=str(tmp_path / "out"),
+        metrics=["quality_score", "latency_seconds", "routing_efficiency", "total_tokens"],
+        **kwargs,
+    )
+
+
+def _report(tmp_path: Path) -> list[dict[str, Any]]:
+    lines = (tmp_path / "out" / "evaluation_report.jsonl").read_text().splitlines()
+    return [json.loads(line) for line in lines]
+
+
+@pytest.mark.asyncio
+async def test_tasks_run_concurrently_with_metrics_from_the_run(tmp_path):
+    workflow = _FakeWorkflow()
+    dataset = _dataset(tmp_path, [f"task {i}" for i in range(6)])
+
+    summary = await _evaluator(tmp_path, dataset, workflow, concurrency=3).run()
+
+    assert workflow.peak == 3
+    assert summary["total_tasks"] == 6
+    assert summary["failed_tasks"] == 0
+    assert summary["metrics"]["quality_score"]["mean"] == 8.0
+    assert summary["metrics"]["routing_efficiency"]["mean"] == 1.0
+    assert summary["metrics"]["total_tokens"]["mean"] == 15
+    assert summary["metrics"]["latency_seconds"]["min"] > 0
+    rows = _report(tmp_path)
+    assert sorted(row["task_id"] for row in rows) == [f"t{i}" for i in range(6)]
+    assert all(row["status"] == "ok" for row in rows)
+
+
+class _SingleRunWorkflow(_FakeWorkflow):
+    """Rejects a run while another is in progress, like agent_framework workflows."""
+
+    async def run(self, message: str) -> dict[str, Any]:
+        if self.running:
+            raise RuntimeError("Workflow is already running")
+        return await super().run(message)
+
+
+@pytest.mark.asyncio
+async def test_each_worker_runs_on_its_own_workflow(tmp_path):
+    workflows: list[_SingleRunWorkflow] = []
+
+    async def factory() -> _SingleRunWorkflow:
+        workflows.append(_SingleRunWorkflow())
+        return workflows[-1]
+
+    evaluator = Evaluator(
+        workflow_factory=factory,
+        dataset_path=_dataset(tmp_path, [f"task {i}" for i in range(6)]),
+        output_dir=str(tmp_path / "out"),
+        metrics=["quality_score"],
+        concurrency=3,
+    )
+    summary = await evaluator.run()
+
+    assert summary["failed_tasks"] == 0
+    assert len(workflows) == 3
+    assert sum(len(workflow.calls) for workflow in workflows) == 6
+
+
+@pytest.mark.asyncio
+async def test_timeouts_and_errors_are_reported_and_retried_on_resume(tmp_path):
+    workflow = _FakeWorkflow()
+    dataset = _dataset(tmp_path, ["a", "hang", "boom", "b"])
+
+    summary = await _evaluator(tmp_path, dataset, workflow, concurrency=2, task_timeout=0.2).run()
+
+    assert summary["total_tasks"] == 2
+    assert summary["failed_tasks"] == 2
+    statuses = {row["task_id"]: row["status"] for row in _report(tmp_path)}
+    assert statuses == {"t0": "ok", "t1": "timeout", "t2": "error", "t3": "ok"}
+
+    # Simulate an interrupted write, then resume: only the failed tasks run again.
+    report = tmp_path / "out" / "evaluation_report.jsonl"
+    report.write_text(report.read_text() + '{"task_id": "t9", "sta')
+    workflow.calls.clear()
+    summary = await _evaluator(
+        tmp_path, dataset, workflow, concurrency=2, task_timeout=0.2, resume=True
+    ).run()
+
+    assert sorted(workflow.calls) == ["boom", "hang"]
+    assert summary["resumed_tasks"] == 2
+    assert summary["total_tasks"] == 2
+    assert summary["failed_tasks"] == 2
+    assert len(_report(tmp_path)) == 6
+
+
+@pytest.mark.asyncio
+async def test_second_run_reports_drift_against_baseline(tmp_path):
+    workflow = _FakeWorkflow(delay=0)
+    dataset = _dataset(tmp_path, ["a", "b"])
+
+    await _evaluator(tmp_path, dataset, workflow).run()
+    baseline = json.loads((tmp_path / "out" / "baseline_snapshot.json").read_text())
+    assert set(baseline["hashes"]) == {"t0", "t1"}
+
+    summary = await _evaluator(tmp_path, dataset, workflow, concurrency=2).run()
+    assert summary["metrics"]["output_drift"]["max"] == 0
+    assert {row["metrics"]["output_drift"] for row in _report(tmp_path)} == {0}
+
+
+@pytest.mark.asyncio
+async def test_stop_on_failure_starts_no_new_tasks(tmp_path):
+    workflow = _FakeWorkflow(delay=0)
+    dataset = _dataset(tmp_path, ["boom", "a", "b", "c"])
+
+    summary = await _evaluator(tmp_path, dataset, workflow, stop_on_failure=True).run()
+
+    assert workflow.calls == ["boom"]
+    assert summary["failed_tasks"] == 1
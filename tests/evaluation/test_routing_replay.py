@@ -0,0 +1,109 @@
+"""Tests for recording and offline replay of routing decisions."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import dspy
+import pytest
+from dspy.utils.dummies import DummyLM
+
+from agentic_fleet.evaluation.routing_replay import (
+    ReplayLM,
+    ReplayMissError,
+    RoutingRecorder,
+    RoutingReplayStore,
+    replay_routing,
+)
+
+TEAM = {"Researcher": "Searches the web", "Writer": "Writes reports"}
+
+
+class _Reasoner:
+    """Minimal ``route_task`` implementation backed by one DSPy predictor."""
+
+    def __init__(
+        self, signature: str = "task -> assigned_to, execution_mode", mode: str = ""
+    ) -> None:
+        self.predict = dspy.Predict(signature)
+        self.forced_mode = mode
+        self.recorder: RoutingRecorder | None = None
+
+    def route_task(
+        self, task: str, team: dict[str, str], context: str = "", skip_cache: bool = False
+    ) -> dict[str, Any]:
+        del context, skip_cache
+        if self.recorder is None:
+            return self._route(task, team)
+        with self.recorder.record({"task": task, "team": team, "context": ""}) as recording:
+            decision = self._route(task, team)
+            if recording is not None:
+                recording.decision = decision
+        return decision
+
+    def _route(self, task: str, team: dict[str, str]) -> dict[str, Any]:
+        prediction = self.predict(task=task)
+        return {
+            "task": task,
+            "assigned_to": [prediction.assigned_to],
+            "mode": self.forced_mode or prediction.execution_mode,
+            "subtasks": [task],
+        }
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = RoutingReplayStore(tmp_path / "replay.sqlite")
+    yield store
+    store.close()
+
+
+def _record(store: RoutingReplayStore, tasks: list[str]) -> None:
+    reasoner = _Reasoner()
+    reasoner.recorder = RoutingRecorder(store)
+    lm = DummyLM([{"assigned_to": "Researcher", "execution_mode": "delegated"}] * len(tasks))
+    with dspy.context(lm=lm):
+        for task in tasks:
+            reasoner.route_task(task=task, team=TEAM)
+
+
+def test_recorded_cases_replay_offline_without_lm(store):
+    _record(store, ["Find recent AI papers", "Summarize the market report"])
+    assert store.counts() == {"lm_calls": 2, "cases": 2}
+
+    with dspy.context(lm=None):
+        report = replay_routing(_Reasoner(), store, mode="offline")
+
+    assert report.cases == report.replayed == 2
+    assert report.lm_hits == 2
+    assert report.lm_misses == 0
+    assert report.missing == report.errors == 0
+    assert report.changed == []
+
+
+def test_changed_decisions_are_reported(store):
+    _record(store, ["Find recent AI papers"])
+
+    report = replay_routing(_Reasoner(mode="sequential"), store, mode="offline")
+
+    assert report.replayed == 1
+    assert report.changed[0]["diff"] == {
+        "mode": {"recorded": "delegated", "replayed": "sequential"}
+    }
+
+
+def test_changed_prompts_are_missing_offline(store):
+    _record(store, ["Find recent AI papers"])
+
+    changed_prompt = _Reasoner(signature="task -> assigned_to, execution_mode, notes")
+    report = replay_routing(changed_prompt, store)
+
+    assert report.cases == report.missing == 1
+    assert report.replayed == 0
+
+
+def test_replay_lm_offline_miss_raises(store):
+    lm = ReplayLM(None, store, mode="offline")
+    with pytest.raises(ReplayMissError):
+        lm(messages=[{"role": "user", "content": "hello"}])
+    assert lm.misses == 1
@@ -0,0 +1,228 @@
+"""Tests for fair-queue admission control."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import HTTPException
+from starlette.authentication import SimpleUser, UnauthenticatedUser
+from starlette.requests import Request
+
+from agentic_fleet.models import WorkflowStatus
+from agentic_fleet.services.admission import AdmissionController, AdmissionLane, admission_key
+from agentic_fleet.services.chat_sse import ChatSSEService
+from agentic_fleet.services.conversation import WorkflowSessionManager
+from agentic_fleet.utils.storage.shared_state import InMemorySharedState
+
+
+def _controller(**kwargs) -> AdmissionController:
+    kwargs.setdefault("max_queue", 10)
+    kwargs.setdefault("queue_timeout_seconds", 5.0)
+    return AdmissionController(InMemorySharedState(), 1, **kwargs)
+
+
+async def _settle() -> None:
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_queued_request_is_admitted_when_slot_frees():
+    admission = _controller()
+    await admission.acquire("a")
+    positions: list[int] = []
+
+    waiter = asyncio.create_task(admission.acquire("b", on_queued=positions.append))
+    await _settle()
+    assert positions == [1]
+    assert admission.stats()["queued"] == 1
+
+    await admission.release("a")
+    assert await asyncio.wait_for(waiter, 1) is AdmissionLane.DEFAULT
+    assert admission.stats()["active"] == 1
+    assert admission.stats()["queued"] == 0
+
+
+async def test_waiters_are_served_round_robin_per_user():
+    admission = _controller()
+    await admission.acquire("running")
+    admitted: list[str] = []
+
+    async def wait(slot_id: str, user_id: str) -> None:
+        await admission.acquire(slot_id, user_id=user_id)
+        admitted.append(slot_id)
+
+    tasks = [
+        asyncio.create_task(wait(slot_id, user))
+        for slot_id, user in [("a1", "alice"), ("a2", "alice"), ("a3", "alice"), ("b1", "bob")]
+    ]
+    await _settle()
+
+    for expected in ["running", "a1", "b1", "a2"]:
+        await admission.release(expected)
+        await _settle()
+    await admission.release("a3")
+    await asyncio.gather(*tasks)
+
+    assert admitted == ["a1", "b1", "a2", "a3"]
+
+
+async def test_positions_reflect_fair_order():
+    admission = _controller()
+    await admission.acquire("running")
+    positions: dict[str, list[int]] = {"a1": [], "a2": [], "b1": []}
+    tasks = [
+        asyncio.create_task(
+            admission.acquire(slot_id, user_id=user, on_queued=positions[slot_id].append)
+        )
+        for slot_id, user in [("a1", "alice"), ("a2", "alice"), ("b1", "bob")]
+    ]
+    await _settle()
+
+    # bob's first request is served before alice's second one.
+    assert positions == {"a1": [1], "a2": [2, 3], "b1": [2]}
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert admission.stats()["queued"] == 0
+
+
+async def test_queue_bounds_and_deadline_reject_with_429():
+    admission = _controller(max_queue=1, queue_timeout_seconds=0.05, poll_interval_seconds=0.01)
+    await admission.acquire("a")
+    waiter = asyncio.create_task(admission.acquire("b"))
+    await _settle()
+
+    with pytest.raises(HTTPException) as full:
+        await admission.acquire("c")
+    assert full.value.status_code == 429
+
+    with pytest.raises(HTTPException, match="Timed out") as timed_out:
+        await waiter
+    assert timed_out.value.status_code == 429
+    assert timed_out.value.headers["Retry-After"]
+    assert admission.stats()["queued"] == 0
+
+
+async def test_per_user_queue_cap():
+    admission = _controller(max_queue_per_user=1)
+    await admission.acquire("a")
+    waiter = asyncio.create_task(admission.acquire("b", user_id="alice"))
+    await _settle()
+
+    with pytest.raises(HTTPException):
+        await admission.acquire("c", user_id="alice")
+    other = asyncio.create_task(admission.acquire("d", user_id="bob"))
+    await _settle()
+    assert admission.stats()["queued"] == 2
+
+    for task in (waiter, other):
+        task.cancel()
+    await asyncio.gather(waiter, other, return_exceptions=True)
+
+
+async def test_fast_path_lane_skips_the_queue():
+    admission = _controller(fast_path_max_concurrent=1)
+    await admission.acquire("heavy")
+    heavy_waiter = asyncio.create_task(admission.acquire("heavy-2"))
+    await _settle()
+
+    assert await admission.acquire("hi", fast_path=True) is AdmissionLane.FAST
+    assert admission.stats()["fast_active"] == 1
+
+    # Fast lane full: the next fast task waits like everyone else.
+    fast_waiter = asyncio.create_task(admission.acquire("hello", fast_path=True))
+    await _settle()
+    assert not fast_waiter.done()
+
+    await admission.release("hi")
+    assert await asyncio.wait_for(fast_waiter, 1) is AdmissionLane.FAST
+    heavy_waiter.cancel()
+    await asyncio.gather(heavy_waiter, return_exceptions=True)
+
+
+async def test_session_manager_releases_slot_on_terminal_status():
+    manager = WorkflowSessionManager(
+        max_concurrent=1,
+        state=(state := InMemorySharedState()),
+        admission=AdmissionController(state, 1, max_queue=5, queue_timeout_seconds=5.0),
+    )
+    first = await manager.create_session(task="first")
+    second = asyncio.create_task(manager.create_session(task="second"))
+    await _settle()
+    assert not second.done()
+
+    await manager.update_status(first.workflow_id, WorkflowStatus.COMPLETED)
+    session = await asyncio.wait_for(second, 1)
+    assert await manager.count_active() == 1
+    assert (await manager.get_session(session.workflow_id)).status == WorkflowStatus.CREATED
+
+
+async def test_sse_stream_reports_queue_position():
+    state = InMemorySharedState()
+    manager = WorkflowSessionManager(
+        max_concurrent=1,
+        state=state,
+        admission=AdmissionController(state, 1, max_queue=5, queue_timeout_seconds=5.0),
+    )
+    blocker = await manager.create_session(task="running")
+
+    async def run_stream(*_args, **_kwargs):
+        if False:  # pragma: no cover
+            yield None
+
+    workflow = MagicMock()
+    workflow.run_stream = run_stream
+    workflow.history_manager = None
+    conversations = MagicMock()
+    conversations.get_conversation.return_value = None
+    service = ChatSSEService(workflow, manager, conversations)
+
+    stream = service.stream_chat("conv-1", "Write a detailed report on solar power")
+    queued = json.loads((await anext(stream))[len(b"data: ") :])
+    assert queued["type"] == "queued"
+    assert queued["data"]["position"] == 1
+
+    await manager.update_status(blocker.workflow_id, WorkflowStatus.COMPLETED)
+    connected = json.loads((await anext(stream))[len(b"data: ") :])
+    assert connected["type"] == "connected"
+    await stream.aclose()
+
+
+async def test_held_slot_leases_are_renewed():
+    state = InMemorySharedState()
+    admission = AdmissionController(state, 1, lease_seconds=0.09)
+    await admission.acquire("a")
+
+    await asyncio.sleep(0.2)  # two lease lengths
+
+    assert await state.count_slots() == 1
+    assert not await state.try_acquire_slot("b", 1, 60)
+    await admission.release("a")
+    await admission.close()
+
+
+def _connection(host: str, user_id: str | None = None, user=None) -> Request:
+    headers = [(b"x-user-id", user_id.encode())] if user_id else []
+    scope = {"type": "http", "headers": headers, "client": (host, 1234)}
+    if user is not None:
+        scope["user"] = user
+    return Request(scope)
+
+
+def test_admission_key_trusts_user_header_only_from_configured_proxies():
+    proxies = ["10.0.0.2"]
+
+    assert admission_key(_connection("10.0.0.2", "alice"), proxies) == "alice"
+    assert admission_key(_connection("203.0.113.9", "alice"), proxies) == "203.0.113.9"
+    assert admission_key(_connection("10.0.0.2"), proxies) == "10.0.0.2"
+
+
+def test_admission_key_prefers_the_authenticated_principal():
+    connection = _connection("10.0.0.2", "mallory", user=SimpleUser("alice"))
+    assert admission_key(connection, ["10.0.0.2"]) == "alice"
+
+    anonymous = _connection("203.0.113.9", "mallory", user=UnauthenticatedUser())
+    assert admission_key(anonymous, []) == "203.0.113.9"
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 from agentic_fleet.models import WorkflowSession
@@ -71,3 +73,22 @@ async def test_event_generator_forwards_checkpoint_id_on_resume():
     assert workflow.last_kwargs is not None
     assert workflow.last_kwargs.get("checkpoint_id") == "cp-123"
     assert "checkpoint_storage" in workflow.last_kwargs
+
+
+@pytest.mark.asyncio
+async def test_event_generator_forwards_cancel_event():
+    """Discussions stop on a WebSocket cancel only if run_stream receives the event."""
+
+    workflow = _DummyWorkflow()
+    session = WorkflowSession(workflow_id="wf-test", task="hello")
+    cancel_event = asyncio.Event()
+
+    _ = [
+        event
+        async for event in _event_generator(
+            workflow, session, _DummySessionManager(), cancel_event=cancel_event
+        )
+    ]
+
+    assert workflow.last_kwargs is not None
+    assert workflow.last_kwargs["cancel_event"] is cancel_event
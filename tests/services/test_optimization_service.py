@@ -1,10 +1,37 @@
 import asyncio
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from agentic_fleet.services.optimization_service import OptimizationService
-from agentic_fleet.utils.storage.job_store import InMemoryJobStore
+from agentic_fleet.services.optimization_service import InProcessJobRunner, OptimizationService
+from agentic_fleet.services.optimization_worker import ProcessJobRunner, WorkerLimits
+from agentic_fleet.utils.storage.job_store import InMemoryJobStore, SQLiteJobStore
+
+
+def _progress_then_succeed(job_id, spec, conn, limits):
+    """Worker target: reports progress and a result without loading DSPy."""
+    conn.send(
+        {"type": "progress", "data": {"progress_message": f"threads={limits.threads_per_job}"}}
+    )
+    conn.send({"type": "result", "data": {"result_artifact_path": spec["artifact_path"]}})
+    conn.close()
+
+
+def _run_forever(job_id, spec, conn, limits):
+    conn.send({"type": "progress", "data": {"progress_message": "started"}})
+    while True:
+        time.sleep(0.1)
+
+
+async def _wait_for_status(service, job_id, *statuses, timeout=20.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = await service.get_job_status(job_id)
+        if job and job["status"] in statuses:
+            return job
+        await asyncio.sleep(0.05)
+    raise AssertionError(f"job {job_id} never reached {statuses}: {job}")
 
 
 @pytest.mark.asyncio
@@ -13,10 +40,10 @@ async def test_submit_job_and_run():
     with patch("agentic_fleet.services.optimization_service.compile_reasoner") as mock_compile:
         mock_compile.return_value = MagicMock()
 
-        service = OptimizationService(job_store=InMemoryJobStore())
+        service = OptimizationService(job_store=InMemoryJobStore(), runner=InProcessJobRunner())
 
         job_id = await service.submit_job(
-            module="dummy_module",
+            module=MagicMock(),
             base_examples_path="dummy.json",
             user_id="test_user",
             auto_mode="light",
@@ -44,10 +71,10 @@ async def test_submit_job_failure():
     with patch("agentic_fleet.services.optimization_service.compile_reasoner") as mock_compile:
         mock_compile.side_effect = ValueError("Optimization failed")
 
-        service = OptimizationService(job_store=InMemoryJobStore())
+        service = OptimizationService(job_store=InMemoryJobStore(), runner=InProcessJobRunner())
 
         job_id = await service.submit_job(
-            module="dummy_module", base_examples_path="dummy.json", user_id="test_user"
+            module=MagicMock(), base_examples_path="dummy.json", user_id="test_user"
         )
 
         await asyncio.sleep(0.1)
@@ -55,3 +82,140 @@ async def test_submit_job_failure():
         status = await service.get_job_status(job_id)
         assert status["status"] == "failed"
         assert status["error"] == "Optimization failed"
+
+
+@pytest.mark.asyncio
+async def test_sqlite_job_store_persists_across_instances(tmp_path):
+    path = tmp_path / "jobs.db"
+    store = SQLiteJobStore(path)
+    await store.save_job("a", {"status": "running", "config": {"auto_mode": "light"}})
+    await store.save_job("b", {"status": "completed"})
+    updates = [store.update_job("a", {f"progress_{i}": i}) for i in range(10)]
+    await asyncio.gather(*updates)
+    store.close()
+
+    reopened = SQLiteJobStore(path)
+    job = await reopened.get_job("a")
+    assert all(job[f"progress_{i}"] == i for i in range(10))
+    assert list(await reopened.list_jobs(["pending", "running"])) == ["a"]
+    assert await reopened.update_job("missing", {"status": "failed"}) is None
+    await reopened.delete_job("b")
+    assert await reopened.get_job("b") is None
+    reopened.close()
+
+
+@pytest.mark.asyncio
+async def test_process_runner_streams_progress_from_worker_process(tmp_path):
+    service = OptimizationService(
+        job_store=SQLiteJobStore(tmp_path / "jobs.db"),
+        runner=ProcessJobRunner(
+            WorkerLimits(threads_per_job=3), target=_progress_then_succeed, poll_interval=0.05
+        ),
+    )
+
+    job_id = await service.submit_job("DSPyReasoner", "dummy.json", "test_user")
+    job = await _wait_for_status(service, job_id, "completed", "failed")
+
+    assert job["status"] == "completed"
+    assert job["progress_message"] == "threads=3"
+    assert job["result_artifact_path"] == f".var/logs/gepa/{job_id}/compiled.json"
+    assert job["attempts"] == 1
+    assert job["config"]["module_name"] == "DSPyReasoner"
+
+
+@pytest.mark.asyncio
+async def test_cancel_terminates_the_worker_and_queued_jobs_stay_pending(tmp_path):
+    runner = ProcessJobRunner(target=_run_forever, poll_interval=0.05)
+    service = OptimizationService(job_store=InMemoryJobStore(), runner=runner)
+
+    running = await service.submit_job("DSPyReasoner", "dummy.json", "u")
+    queued = await service.submit_job("DSPyReasoner", "dummy.json", "u")
+    job = await _wait_for_status(service, running, "running")
+    while "progress_message" not in job:
+        await asyncio.sleep(0.05)
+        job = await service.get_job_status(running)
+    assert (await service.get_job_status(queued))["status"] == "pending"
+
+    cancelled = await service.cancel_job(running)
+
+    assert cancelled["status"] == "cancelled"
+    await _wait_for_status(service, queued, "running")
+    await service.cancel_job(queued)
+    assert not service._tasks
+
+
+@pytest.mark.asyncio
+async def test_recover_jobs_requeues_interrupted_jobs_until_max_attempts():
+    store = InMemoryJobStore()
+    config = {
+        "module_name": "X",
+        "auto_mode": "light",
+        "base_examples_path": "d.json",
+        "gepa_options": {},
+    }
+    await store.save_job("fresh", {"status": "running", "attempts": 1, "config": config})
+    await store.save_job("retried", {"status": "running", "attempts": 2, "config": config})
+    await store.save_job("done", {"status": "completed", "attempts": 1, "config": config})
+
+    with patch("agentic_fleet.services.optimization_service.compile_reasoner") as mock_compile:
+        service = OptimizationService(job_store=store, runner=InProcessJobRunner(), max_attempts=2)
+        module = MagicMock()
+        with patch("agentic_fleet.services.optimization_worker.build_module", return_value=module):
+            assert await service.recover_jobs() == ["fresh"]
+            job = await _wait_for_status(service, "fresh", "completed", "failed")
+
+    assert job["status"] == "completed"
+    assert job["attempts"] == 2
+    assert mock_compile.call_args.kwargs["module"] is module
+    assert (await store.get_job("retried"))["status"] == "failed"
+    assert (await store.get_job("done"))["status"] == "completed"
+
+
+@pytest.mark.asyncio
+async def test_claim_and_recovery_respect_live_leases(tmp_path):
+    path = tmp_path / "jobs.db"
+    store, sibling_store = SQLiteJobStore(path), SQLiteJobStore(path)
+    await store.save_job("a", {"status": "pending", "attempts": 0, "config": {}})
+
+    claims = await asyncio.gather(
+        store.claim_job("a", "owner-1", 60.0), sibling_store.claim_job("a", "owner-2", 60.0)
+    )
+    assert sum(claim is not None for claim in claims) == 1
+    job = await store.get_job("a")
+    assert job["attempts"] == 1
+
+    sibling = OptimizationService(job_store=sibling_store, runner=InProcessJobRunner())
+    assert await sibling.recover_jobs() == []
+    assert (await store.get_job("a"))["owner"] == job["owner"]
+
+    await store.update_job("a", {"lease_expires_at": time.time() - 1})
+    assert await store.renew_lease("a", "someone-else", 60.0) is not None
+    assert await store.release_job("a", {"status": "pending"}) is not None
+    assert (await store.get_job("a"))["owner"] is None
+    store.close()
+    sibling_store.close()
+
+
+@pytest.mark.asyncio
+async def test_cancel_from_another_process_stops_the_owner(tmp_path):
+    path = tmp_path / "jobs.db"
+    owner = OptimizationService(
+        job_store=SQLiteJobStore(path),
+        runner=ProcessJobRunner(target=_run_forever, poll_interval=0.05),
+        lease_seconds=0.3,
+    )
+    sibling = OptimizationService(job_store=SQLiteJobStore(path), lease_seconds=0.3)
+
+    job_id = await owner.submit_job("DSPyReasoner", "dummy.json", "u")
+    job = await _wait_for_status(sibling, job_id, "running")
+    assert job["owner"] == owner.owner
+    await asyncio.sleep(0.5)  # past the initial lease: it is being renewed
+    assert await sibling.recover_jobs() == []
+
+    assert (await sibling.cancel_job(job_id))["status"] == "cancelled"
+
+    deadline = time.monotonic() + 10
+    while owner._tasks and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    assert not owner._tasks
+    assert (await owner.get_job_status(job_id))["status"] == "cancelled"
@@ -0,0 +1,69 @@
+"""Per-workflow sampling of high-frequency stream event logs."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from agentic_fleet.models import StreamEvent, StreamEventType
+from agentic_fleet.services import chat_helpers
+from agentic_fleet.services.chat_helpers import StreamLogSampler, _log_stream_event
+
+
+def test_sampler_logs_first_then_every_nth():
+    sampler = StreamLogSampler(every=3)
+    decisions = [sampler.admit("wf", StreamEventType.RESPONSE_DELTA) for _ in range(7)]
+    assert decisions == [0, None, None, 2, None, None, 2]
+    # Workflows and event types are counted separately.
+    assert sampler.admit("other", StreamEventType.RESPONSE_DELTA) == 0
+    assert sampler.admit("wf", StreamEventType.HEARTBEAT) == 0
+
+
+def test_sampler_is_bounded_and_forgets_finished_workflows():
+    sampler = StreamLogSampler(every=5, max_entries=2)
+    for workflow_id in ("a", "b", "c"):
+        sampler.admit(workflow_id, StreamEventType.RESPONSE_DELTA)
+    assert len(sampler._counts) == 2
+    sampler.forget("c")
+    assert ("c", StreamEventType.RESPONSE_DELTA) not in sampler._counts
+
+
+def test_log_stream_event_samples_deltas_but_returns_every_line(monkeypatch, caplog):
+    monkeypatch.setattr(chat_helpers, "_stream_log_sampler", StreamLogSampler(every=4))
+    monkeypatch.setattr(chat_helpers.logger, "propagate", True)
+    chat_helpers.logger.setLevel(logging.DEBUG)
+    try:
+        with caplog.at_level(logging.DEBUG, logger=chat_helpers.logger.name):
+            lines = [
+                _log_stream_event(
+                    StreamEvent(type=StreamEventType.RESPONSE_DELTA, delta=f"chunk {i}"),
+                    "workflow-12345678",
+                )
+                for i in range(9)
+            ]
+            _log_stream_event(StreamEvent(type=StreamEventType.DONE), "workflow-12345678")
+    finally:
+        chat_helpers.logger.setLevel(logging.INFO)
+
+    assert all(line and line.startswith("[12345678]") for line in lines)
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == [
+        "[12345678] ✏️  delta: chunk 0",
+        "[12345678] ✏️  delta: chunk 4 (+3 similar)",
+        "[12345678] ✏️  delta: chunk 8 (+3 similar)",
+        "[12345678] 🏁 Stream completed",
+    ]
+    assert not chat_helpers._stream_log_sampler._counts
+
+
+@pytest.mark.parametrize("event_type", [StreamEventType.HEARTBEAT, StreamEventType.REASONING_DELTA])
+def test_disabled_level_skips_sampler(monkeypatch, event_type):
+    sampler = StreamLogSampler(every=2)
+    monkeypatch.setattr(chat_helpers, "_stream_log_sampler", sampler)
+    assert not chat_helpers.logger.isEnabledFor(logging.DEBUG)
+
+    line = _log_stream_event(StreamEvent(type=event_type), "wf")
+
+    assert line
+    assert not sampler._counts
@@ -0,0 +1,212 @@
+"""Tests for the browser page pool and page-content cache, against a local HTTP server."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+import pytest
+
+from agentic_fleet.tools.browser_pool import BrowserPool, BrowserPoolConfig, PageContentCache
+
+PAGE = b"""<html><body><main><h1>Quarterly report</h1><p>Revenue grew.</p>
+<img src="/chart.png"><a href="http://example.com/more">More</a></main></body></html>"""
+
+
+class _Site:
+    """Local site whose page carries an ETag that tests can change."""
+
+    def __init__(self) -> None:
+        self.etag = '"v1"'
+        self.hits: dict[str, int] = {}
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                site.hits[self.path] = site.hits.get(self.path, 0) + 1
+                if self.path == "/chart.png":
+                    self.send_response(200)
+                    self.send_header("Content-Type", "image/png")
+                    self.end_headers()
+                    self.wfile.write(b"\x89PNG")
+                    return
+                if self.headers.get("If-None-Match") == site.etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+                self.send_header("ETag", site.etag)
+                self.send_header("Content-Length", str(len(PAGE)))
+                self.end_headers()
+                self.wfile.write(PAGE)
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/"
+
+
+@pytest.fixture
+def site() -> Iterator[_Site]:
+    site = _Site()
+    thread = threading.Thread(target=site.server.serve_forever, daemon=True)
+    thread.start()
+    yield site
+    site.server.shutdown()
+    site.server.server_close()
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_fresh_entries_and_revalidates_stale_ones(site):
+    cache = PageContentCache(ttl=60)
+    key = (site.url, "extract_text", "")
+    assert await cache.get(key, site.url) is None
+
+    cache.put(key, "Revenue grew.", etag='"v1"')
+    assert await cache.get(key, site.url) == "Revenue grew."
+    assert site.hits == {}
+
+    cache.ttl = 0  # everything is stale from now on
+    assert await cache.get(key, site.url) == "Revenue grew."
+    assert cache.stats()["revalidated"] == 1
+    assert site.hits == {"/": 1}
+
+    site.etag = '"v2"'
+    assert await cache.get(key, site.url) is None
+    assert cache.stats()["entries"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cache_without_validators_expires_and_is_bounded(site):
+    cache = PageContentCache(ttl=60, max_entries=2)
+    for path in ("a", "b", "c"):
+        cache.put((site.url + path,), path)
+    assert cache.stats()["entries"] == 2
+    assert await cache.get((site.url + "a",), site.url + "a") is None
+
+    cache.ttl = 0
+    assert await cache.get((site.url + "c",), site.url + "c") is None
+    assert site.hits == {}
+
+
+class _FakePage:
+    def __init__(self, *stats: dict[str, int]) -> None:
+        self.url = "about:blank"
+        self._stats = stats
+        for counters in stats:
+            counters["open"] += 1
+            counters["peak"] = max(counters["peak"], counters["open"])
+
+    async def route(self, pattern: str, handler: Any) -> None:
+        pass
+
+    def on(self, event: str, handler: Any) -> None:
+        pass
+
+    async def close(self) -> None:
+        for counters in self._stats:
+            counters["open"] -= 1
+
+
+class _FakeContext:
+    def __init__(self, pool_stats: dict[str, int]) -> None:
+        self._pool_stats = pool_stats
+        self.stats = {"open": 0, "peak": 0}
+        self.pages = 0
+
+    async def new_page(self) -> _FakePage:
+        self.pages += 1
+        return _FakePage(self._pool_stats, self.stats)
+
+    async def new_cdp_session(self, page: _FakePage) -> Any:
+        raise RuntimeError("not chromium")
+
+    async def close(self) -> None:
+        pass
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.stats = {"open": 0, "peak": 0}
+        self.contexts: list[_FakeContext] = []
+
+    async def new_context(self) -> _FakeContext:
+        context = _FakeContext(self.stats)
+        self.contexts.append(context)
+        return context
+
+
+@pytest.mark.asyncio
+async def test_pool_caps_open_pages_and_spreads_them_over_contexts():
+    browser = _FakeBrowser()
+    pool = BrowserPool(BrowserPoolConfig(contexts=2, max_pages=3), browser=browser)
+
+    async def visit() -> None:
+        async with pool.page():
+            await asyncio.sleep(0.02)
+
+    await asyncio.gather(*(visit() for _ in range(10)))
+
+    assert browser.stats["peak"] == 3
+    assert browser.stats["open"] == 0
+    # Pages go to the least-busy context: with 3 slots, neither holds all of them.
+    assert max(context.stats["peak"] for context in browser.contexts) == 2
+    assert all(context.pages for context in browser.contexts)
+    stats = pool.stats()
+    assert stats["pages_opened"] == 10
+    assert stats["peak_pages"] == 3
+    assert stats["active_pages"] == 0
+    assert stats["waits"] > 0
+    assert len(pool.metrics) == 10
+    await pool.close()
+
+
+@pytest.fixture
+async def chromium_pool():
+    pytest.importorskip("playwright.async_api")
+    pool = BrowserPool(BrowserPoolConfig(contexts=1, max_pages=2))
+    try:
+        await pool.start()
+    except Exception as exc:
+        pytest.skip(f"Chromium is not available: {exc}")
+    yield pool
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_pool_blocks_images_and_records_metrics(site, chromium_pool):
+    async with chromium_pool.page() as page:
+        await page.goto(site.url, wait_until="networkidle")
+        assert "Revenue grew." in await page.inner_text("main")
+
+    assert site.hits.get("/chart.png") is None
+    metrics = chromium_pool.metrics[-1]
+    assert metrics.blocked_requests == 1
+    assert metrics.cpu_seconds is not None
+    assert metrics.js_heap_bytes
+
+    async with chromium_pool.page(block_resources=False) as page:
+        await page.goto(site.url, wait_until="networkidle")
+    assert site.hits["/chart.png"] == 1
+
+
+@pytest.mark.asyncio
+async def test_browser_tool_caches_extracted_text(site, chromium_pool, monkeypatch):
+    from agentic_fleet.tools.browser_tool import BrowserTool
+
+    monkeypatch.setattr(BrowserTool, "_shared_pool", chromium_pool)
+    monkeypatch.setattr(BrowserTool, "_shared_cache", PageContentCache(ttl=60))
+    tool = BrowserTool()
+
+    first = await tool.run(site.url)
+    second = await tool.run(site.url)
+
+    assert "Revenue grew." in first
+    assert first == second
+    assert site.hits["/"] == 1
+    assert BrowserTool._shared_cache.stats()["hits"] == 1
@@ -0,0 +1,204 @@
+"""Tests for the per-endpoint MCP session pool against an in-process MCP server."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import Any
+
+import pytest
+from mcp.server.fastmcp import FastMCP
+from mcp.shared.exceptions import McpError
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from agentic_fleet.tools.base_mcp_tool import BaseMCPTool
+from agentic_fleet.tools.mcp_pool import MCPPoolConfig, MCPSessionPool
+
+
+def _server() -> FastMCP:
+    server = FastMCP("stand-in")
+
+    @server.tool()
+    async def search(query: str) -> str:
+        """Search the stand-in index."""
+        return f"results for {query}"
+
+    @server.tool()
+    async def slow(seconds: float) -> str:
+        """Sleep, then answer."""
+        await asyncio.sleep(seconds)
+        return "done"
+
+    @server.tool()
+    async def fail() -> str:
+        """Always fail."""
+        raise ValueError("boom")
+
+    return server
+
+
+class _Endpoint:
+    """Session factory for the stand-in server that can refuse or drop connections."""
+
+    def __init__(self) -> None:
+        self.server = _server()
+        self.opened = 0
+        self.refuse = 0
+        self.sessions: list[Any] = []
+
+    @asynccontextmanager
+    async def __call__(self):
+        if self.refuse:
+            self.refuse -= 1
+            raise OSError("connection refused")
+        self.opened += 1
+        async with create_connected_server_and_client_session(self.server) as session:
+            self.sessions.append(session)
+            yield session
+
+    async def drop(self, session: Any) -> None:
+        """Simulate a dropped connection: the session can no longer send."""
+        await session._write_stream.aclose()
+
+
+def _text(result: Any) -> str:
+    return result.content[0].text
+
+
+@pytest.fixture
+def endpoint() -> _Endpoint:
+    return _Endpoint()
+
+
+def _pool(endpoint: _Endpoint, **config: Any) -> MCPSessionPool:
+    config.setdefault("health_interval", 0)
+    return MCPSessionPool(endpoint, name="stand-in", config=MCPPoolConfig(**config))
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_are_spread_over_a_bounded_pool(endpoint):
+    pool = _pool(endpoint, size=3)
+    try:
+        results = await asyncio.gather(
+            *(pool.call_tool("slow", {"seconds": 0.05}) for _ in range(9))
+        )
+        assert [_text(r) for r in results] == ["done"] * 9
+        assert endpoint.opened == 3
+        assert pool.stats()["idle"] == 3
+        assert pool.stats()["in_use"] == 0
+
+        # Sessions are reused by later calls.
+        assert _text(await pool.call_tool("search", {"query": "mcp"})) == "results for mcp"
+        assert endpoint.opened == 3
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_call_timeout_and_cancellation_release_the_session(endpoint):
+    pool = _pool(endpoint, size=1)
+    try:
+        with pytest.raises(TimeoutError):
+            await pool.call_tool("slow", {"seconds": 5}, timeout=0.1)
+
+        task = asyncio.create_task(pool.call_tool("slow", {"seconds": 5}))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert pool.stats()["in_use"] == 0
+        assert _text(await pool.call_tool("search", {"query": "x"})) == "results for x"
+        assert endpoint.opened == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_server_errors_keep_the_session(endpoint):
+    pool = _pool(endpoint)
+    try:
+        result = await pool.call_tool("fail")
+        assert result.isError
+        with pytest.raises(McpError):
+            await pool.run(lambda session: session.get_prompt("missing"))
+        assert pool.stats()["reconnects"] == 0
+        assert endpoint.opened == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_dropped_session_is_replaced_transparently(endpoint):
+    pool = _pool(endpoint, size=1)
+    try:
+        await pool.call_tool("search", {"query": "a"})
+        await endpoint.drop(endpoint.sessions[0])
+
+        assert _text(await pool.call_tool("search", {"query": "b"})) == "results for b"
+        assert endpoint.opened == 2
+        assert pool.stats()["reconnects"] == 1
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connect_failures_back_off(endpoint):
+    endpoint.refuse = 1
+    pool = _pool(endpoint, backoff_initial=0.2)
+    try:
+        with pytest.raises(ConnectionError, match="connection refused"):
+            await pool.call_tool("search", {"query": "a"})
+        assert pool.stats()["consecutive_failures"] == 1
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        assert _text(await pool.call_tool("search", {"query": "a"})) == "results for a"
+        assert loop.time() - started >= 0.1
+        assert pool.stats()["consecutive_failures"] == 0
+    finally:
+        await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_health_check_closes_dead_and_expired_sessions(endpoint):
+    pool = _pool(endpoint, size=3, idle_timeout=0, min_idle=1)
+    try:
+        await asyncio.gather(*(pool.call_tool("slow", {"seconds": 0.05}) for _ in range(3)))
+        assert pool.stats()["idle"] == 3
+
+        await pool.check_health()
+        assert pool.stats()["idle"] == 1
+
+        await endpoint.drop(pool._idle[0].session)
+        pool.config.idle_timeout = 300
+        await pool.check_health()
+        assert pool.stats()["idle"] == 0
+        assert pool.stats()["last_error"]
+    finally:
+        await pool.close()
+
+
+class _StandInTool(BaseMCPTool):
+    async def run(self, query: str, **kwargs: Any) -> str:
+        await self._ensure_connection()
+        contents = await self.call_tool(self._resolve_remote_tool_name(), query=query)
+        return self._format_contents(contents)
+
+
+@pytest.mark.asyncio
+async def test_base_mcp_tool_uses_the_pool(endpoint, monkeypatch):
+    pool = _pool(endpoint, size=2)
+    monkeypatch.setattr(_StandInTool, "_get_pool", lambda self: pool)
+    tools = [
+        _StandInTool(name="stand_in", url="http://stand-in/mcp", description="Stand-in")
+        for _ in range(3)
+    ]
+    try:
+        results = await asyncio.gather(*(tool.run(f"q{i}") for i, tool in enumerate(tools)))
+
+        assert results == ["results for q0", "results for q1", "results for q2"]
+        assert {func.name for func in tools[0].functions} == {"search", "slow", "fail"}
+        assert endpoint.opened <= 2
+    finally:
+        await pool.close()
@@ -0,0 +1,129 @@
+"""Tests for the columnar execution-history cache."""
+
+from __future__ import annotations
+
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from agentic_fleet.utils.storage import HistoryManager
+from agentic_fleet.utils.storage.history_columns import HistoryColumns, HistoryColumnStore
+
+START = datetime(2025, 6, 1, 12, 0)
+
+
+def _execution(i: int, **overrides) -> dict:
+    execution = {
+        "workflowId": f"wf-{i}",
+        "task": f"task {i}",
+        "start_time": (START + timedelta(days=i)).isoformat(),
+        "total_time_seconds": 10.0 + i,
+        "routing": {
+            "mode": "parallel" if i % 2 else "delegated",
+            "assigned_to": ["Researcher", "Writer"] if i % 2 else ["Writer"],
+        },
+        "quality": {"score": float(i % 10)},
+        "phase_timings": {"analysis": 1.0, "routing": 0.5, "quality": 2.0, "execution": 6.0},
+        "metadata": {"usage": {"prompt_tokens": 100, "completion_tokens": 20}},
+    }
+    execution.update(overrides)
+    return execution
+
+
+def _append(path: Path, executions: list[dict]) -> None:
+    with open(path, "a") as f:
+        for execution in executions:
+            f.write(json.dumps(execution) + "\n")
+
+
+@pytest.fixture
+def history_file(tmp_path: Path) -> Path:
+    path = tmp_path / "execution_history.jsonl"
+    _append(path, [_execution(i) for i in range(10)])
+    return path
+
+
+def test_columns_match_records(history_file: Path):
+    store = HistoryColumnStore(history_file, segment_rows=4)
+    columns = store.load()
+
+    assert len(columns) == 10
+    assert columns.mode_counts() == {"delegated": 5, "parallel": 5}
+    assert columns.agent_counts() == {"Writer": 10, "Researcher": 5}
+    assert columns["total_tokens"][0] == 120
+    assert columns["routing_seconds"][3] == 0.5
+    assert list(columns["workflow_id"][:2]) == ["wf-0", "wf-1"]
+    in_memory = HistoryColumns.from_executions(_execution(i) for i in range(10))
+    assert in_memory.agent_counts() == columns.agent_counts()
+
+
+def test_refresh_only_parses_appended_rows(history_file: Path):
+    store = HistoryColumnStore(history_file, segment_rows=4)
+    assert store.refresh() == 10
+    assert store.refresh() == 0
+
+    _append(history_file, [_execution(i) for i in range(10, 13)])
+    with open(history_file, "a") as f:
+        f.write('{"workflowId": "partial"')  # append still in progress
+
+    assert store.refresh() == 3
+    columns = store.load()
+    assert len(columns) == 13
+    assert columns["workflow_id"][-1] == "wf-12"
+
+
+def test_concurrent_refreshes_share_one_cache(history_file: Path):
+    stores = [HistoryColumnStore(history_file, segment_rows=4) for _ in range(4)]
+
+    with ThreadPoolExecutor(len(stores)) as pool:
+        added = list(pool.map(HistoryColumnStore.refresh, stores))
+
+    assert sum(added) == 10
+    assert len(stores[0].load()) == 10
+    assert not list(stores[0].cache_dir.glob("*.tmp"))
+
+
+def test_rewritten_history_is_rebuilt(history_file: Path):
+    store = HistoryColumnStore(history_file, segment_rows=4)
+    store.refresh()
+
+    lines = history_file.read_text().splitlines(keepends=True)
+    history_file.write_text("".join(lines[5:]))
+
+    columns = store.load()
+    assert len(columns) == 5
+    assert columns["workflow_id"][0] == "wf-5"
+
+
+def test_since_skips_older_segments(history_file: Path, monkeypatch):
+    store = HistoryColumnStore(history_file, segment_rows=4)
+    store.refresh()
+    opened = []
+    load_segment = store._load_segment
+    monkeypatch.setattr(
+        store,
+        "_load_segment",
+        lambda segment: opened.append(segment["file"]) or load_segment(segment),
+    )
+
+    columns = store.load(since=START + timedelta(days=7))
+
+    assert list(columns["workflow_id"]) == ["wf-7", "wf-8", "wf-9"]
+    assert columns.agent_counts() == {"Researcher": 2, "Writer": 3}
+    assert opened == ["segment-000001.npz", "segment-000002.npz"]
+
+
+def test_history_manager_stats_use_columns(history_file: Path):
+    manager = HistoryManager()
+    manager.history_dir = history_file.parent
+    _append(history_file, [_execution(10, quality={}, total_time_seconds=None)])
+
+    stats = manager.get_history_stats()
+
+    assert stats["total_executions"] == 11
+    assert stats["total_time_seconds"] == sum(10.0 + i for i in range(10))
+    assert math.isclose(stats["average_quality_score"], 4.5)
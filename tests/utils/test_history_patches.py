@@ -0,0 +1,126 @@
+"""Tests for the write-behind patch log of HistoryManager."""
+
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from agentic_fleet.utils.storage import HistoryManager
+
+
+def _rows() -> list[dict]:
+    return [
+        {
+            "workflowId": f"w{i}",
+            "task": f"task {i}",
+            "routing": {"mode": "delegated", "assigned_to": ["Writer"]},
+            "quality": {"score": 0.0, "pending": True},
+        }
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def history(tmp_path: Path) -> HistoryManager:
+    manager = HistoryManager(compact_every=3)
+    manager.history_dir = tmp_path
+    (tmp_path / "execution_history.jsonl").write_text(
+        "".join(json.dumps(row) + "\n" for row in _rows())
+    )
+    return manager
+
+
+def _file_rows(manager: HistoryManager) -> dict[str, dict]:
+    lines = (manager.history_dir / "execution_history.jsonl").read_text().splitlines()
+    return {row["workflowId"]: row for row in map(json.loads, lines)}
+
+
+def test_patches_are_appended_and_applied_on_read(history):
+    before = (history.history_dir / "execution_history.jsonl").read_bytes()
+
+    assert history.update_execution("w1", {"quality": {"score": 6.0}})
+    assert history.update_execution("w1", {"quality": {"score": 8.0}, "flag": "ok"})
+
+    assert (history.history_dir / "execution_history.jsonl").read_bytes() == before
+    by_id = {e["workflowId"]: e for e in history.load_history()}
+    assert by_id["w1"]["quality"] == {"score": 8.0}
+    assert by_id["w1"]["flag"] == "ok"
+    assert by_id["w2"]["quality"]["pending"] is True
+    assert history.get_recent_executions(limit=3)[-1]["quality"] == {"score": 8.0}
+    assert history.get_execution("w1")["flag"] == "ok"
+
+
+def test_compaction_folds_patches_into_history(history):
+    history.update_executions(
+        {"w0": {"quality": {"score": 5.0}}, "w1": {"quality": {"score": 6.0}}}
+    )
+    patch_log = history.history_dir / "execution_history.patches.jsonl"
+    assert patch_log.exists()
+
+    history.update_execution("w2", {"quality": {"score": 7.0}})  # reaches compact_every
+
+    assert not patch_log.exists()
+    rows = _file_rows(history)
+    assert [rows[f"w{i}"]["quality"].get("score") for i in range(4)] == [5.0, 6.0, 7.0, 0.0]
+
+
+def test_interrupted_compaction_is_resumed(history):
+    history.update_execution("w3", {"quality": {"score": 9.0}})
+    patch_log = history.history_dir / "execution_history.patches.jsonl"
+    patch_log.replace(patch_log.with_suffix(".compacting"))
+    history.update_execution("w0", {"quality": {"score": 4.0}})
+
+    assert {e["workflowId"]: e["quality"]["score"] for e in history.load_history()}["w3"] == 9.0
+    assert history.compact_history() == 2
+    rows = _file_rows(history)
+    assert (rows["w3"]["quality"]["score"], rows["w0"]["quality"]["score"]) == (9.0, 4.0)
+
+
+def test_managers_sharing_a_directory_do_not_lose_patches(history):
+    other = HistoryManager(compact_every=2)
+    other.history_dir = history.history_dir
+
+    def patch(manager: HistoryManager, workflow_id: str) -> None:
+        for score in range(1, 6):
+            manager.update_execution(workflow_id, {"quality": {"score": float(score)}})
+
+    with ThreadPoolExecutor(2) as pool:
+        list(pool.map(patch, (history, other), ("w0", "w1")))
+    history.compact_history()
+
+    rows = _file_rows(history)
+    assert (rows["w0"]["quality"]["score"], rows["w1"]["quality"]["score"]) == (5.0, 5.0)
+
+
+def test_columns_reflect_pending_patches(history):
+    history.update_executions(
+        {
+            "w1": {"quality": {"score": 9.0}},
+            "w2": {"routing": {"mode": "parallel", "assigned_to": ["Researcher", "Analyst"]}},
+        }
+    )
+
+    columns = history.load_columns()
+
+    assert list(columns["quality_score"]) == [0.0, 9.0, 0.0, 0.0]
+    assert columns.mode_counts() == {"delegated": 3, "parallel": 1}
+    assert columns.agent_counts() == {"Writer": 3, "Researcher": 1, "Analyst": 1}
+
+
+def test_analyze_history_script_sees_pending_patches(history, monkeypatch):
+    from agentic_fleet.scripts import analyze_history
+    from agentic_fleet.utils.storage import history as history_module
+
+    monkeypatch.setattr(
+        history_module,
+        "DEFAULT_HISTORY_PATH",
+        str(history.history_dir / "execution_history.jsonl"),
+    )
+    history.update_execution("w1", {"quality": {"score": 9.0}})
+
+    assert list(analyze_history.load_columns()["quality_score"]) == [0.0, 9.0, 0.0, 0.0]
+    executions = analyze_history.load_history()
+    assert [e["quality"]["score"] for e in executions] == [0.0, 9.0, 0.0, 0.0]
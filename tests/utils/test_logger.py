@@ -1,9 +1,17 @@
 import logging
 import os
+import threading
+from logging.handlers import QueueHandler
 from unittest.mock import patch
 
 from agentic_fleet.utils.cfg import env_config
-from agentic_fleet.utils.infra.logging import setup_logger
+from agentic_fleet.utils.infra.logging import (
+    _DroppingQueueHandler,
+    _LogQueue,
+    get_log_queue_stats,
+    setup_logger,
+    stop_queue_logging,
+)
 
 
 def test_setup_logger_defaults():
@@ -44,3 +52,48 @@ def test_setup_logger_env_override():
         logger = setup_logger("env_logger")
         handler = logger.handlers[0]
         assert "JsonFormatter" in str(type(handler.formatter))
+
+
+def test_setup_logger_queue_mode(tmp_path):
+    log_file = tmp_path / "queued.log"
+    with patch.dict(os.environ, {"LOG_QUEUE": "1"}):
+        env_config.clear_cache()
+        try:
+            logger = setup_logger("queued_logger", log_file=str(log_file))
+        finally:
+            env_config.clear_cache()
+
+    assert len(logger.handlers) == 1
+    assert isinstance(logger.handlers[0], QueueHandler)
+
+    logger.info("queued %s", "message")
+    stop_queue_logging()
+    assert "queued message" in log_file.read_text()
+    assert get_log_queue_stats()["queued"] == 0
+
+
+def test_queue_handler_drops_when_full():
+    release = threading.Event()
+    seen: list[str] = []
+
+    class _SlowHandler(logging.Handler):
+        def emit(self, record):
+            release.wait(5)
+            seen.append(record.getMessage())
+
+    log_queue = _LogQueue()
+    log_queue.configure(2)
+    log_queue.routes["slow"] = [_SlowHandler()]
+    handler = _DroppingQueueHandler(log_queue, "slow")
+    logger = logging.getLogger("slow_logger")
+    logger.propagate = False
+    logger.handlers = [handler]
+
+    for i in range(20):
+        logger.warning("record %d", i)
+    release.set()
+    log_queue.stop()
+
+    assert log_queue.dropped > 0
+    assert len(seen) == 20 - log_queue.dropped + 1
+    assert any(message.startswith("Log queue full: dropped") for message in seen)
@@ -11,6 +11,7 @@ import pytest
 from agentic_fleet.utils.infra.profiling import (
     PerformanceTracker,
     get_performance_stats,
+    get_process_memory_breakdown_mb,
     log_performance_summary,
     profile_function,
     reset_performance_stats,
@@ -222,3 +223,12 @@ def test_performance_tracker_no_stats():
     assert stats["avg_ms"] == 0
     assert stats["min_ms"] == 0
     assert stats["max_ms"] == 0
+
+
+def test_process_memory_breakdown():
+    """Test RSS/PSS/USS breakdown for the current process."""
+    usage = get_process_memory_breakdown_mb()
+
+    assert set(usage) == {"rss", "pss", "uss", "shared"}
+    assert usage["rss"] > 0
+    assert usage["uss"] <= usage["rss"]
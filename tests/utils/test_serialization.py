@@ -0,0 +1,19 @@
+"""Tests for JSON/JSONL serialization helpers."""
+
+from agentic_fleet.utils.serialization import read_complete_jsonl
+
+
+def test_read_complete_jsonl_truncates_a_torn_tail(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_bytes(b'{"a": 1}\n{"b": 2}\n{"c": ')
+
+    assert read_complete_jsonl(path) == b'{"a": 1}\n{"b": 2}\n'
+    assert path.read_bytes() == b'{"a": 1}\n{"b": 2}\n'
+
+    with path.open("ab") as f:
+        f.write(b'{"d": 4}\n')
+    assert read_complete_jsonl(path, offset=9) == b'{"b": 2}\n{"d": 4}\n'
+
+
+def test_read_complete_jsonl_missing_file(tmp_path):
+    assert read_complete_jsonl(tmp_path / "missing.jsonl") == b""
@@ -0,0 +1,375 @@
+"""Tests for the cross-worker shared state backends."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+import pytest_asyncio
+from fastapi import HTTPException
+
+from agentic_fleet.models import WorkflowStatus
+from agentic_fleet.services import chat_helpers
+from agentic_fleet.services.chat_sse import ChatSSEService
+from agentic_fleet.services.conversation import WorkflowSessionManager
+from agentic_fleet.utils.storage.shared_state import (
+    InMemorySharedState,
+    RedisSharedState,
+    SharedStateBackend,
+    SharedStateError,
+    SQLiteSharedState,
+)
+
+
+class _RespStandIn:
+    """Tiny in-process server speaking the subset of RESP2 the backend uses."""
+
+    def __init__(self) -> None:
+        self.strings: dict[bytes, tuple[bytes, float | None]] = {}
+        self.hashes: dict[bytes, dict[bytes, bytes]] = {}
+        self.zsets: dict[bytes, dict[bytes, float]] = {}
+        self.lists: dict[bytes, list[bytes]] = {}
+        # Commands to apply once and then drop the connection instead of replying.
+        self.drop_after: set[str] = set()
+        self.server: asyncio.AbstractServer | None = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self.server.sockets[0].getsockname()[1]
+        return f"redis://127.0.0.1:{port}/0"
+
+    async def stop(self) -> None:
+        assert self.server is not None
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                header = await reader.readline()
+                if not header:
+                    break
+                args = []
+                for _ in range(int(header[1:-2])):
+                    length = int((await reader.readline())[1:-2])
+                    args.append((await reader.readexactly(length + 2))[:-2])
+                reply = self._reply(self._dispatch(args))
+                command = args[0].upper().decode()
+                if command in self.drop_after:
+                    self.drop_after.discard(command)
+                    break
+                writer.write(reply)
+                await writer.drain()
+        finally:
+            writer.close()
+
+    @staticmethod
+    def _reply(value: object) -> bytes:
+        if value is True:
+            return b"+OK\r\n"
+        if value is None:
+            return b"$-1\r\n"
+        if isinstance(value, int):
+            return b":%d\r\n" % value
+        if isinstance(value, bytes):
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+        assert isinstance(value, list)
+        return b"*%d\r\n" % len(value) + b"".join(_RespStandIn._reply(v) for v in value)
+
+    def _string(self, key: bytes) -> bytes | None:
+        entry = self.strings.get(key)
+        if entry is None:
+            return None
+        value, expires = entry
+        if expires is not None and expires <= time.time():
+            del self.strings[key]
+            return None
+        return value
+
+    def _dispatch(self, args: list[bytes]) -> object:
+        cmd, rest = args[0].upper().decode(), args[1:]
+        if cmd in ("SELECT", "AUTH"):
+            return True
+        if cmd == "HSET":
+            self.hashes.setdefault(rest[0], {})[rest[1]] = rest[2]
+            return 1
+        if cmd == "HGET":
+            return self.hashes.get(rest[0], {}).get(rest[1])
+        if cmd == "HVALS":
+            return list(self.hashes.get(rest[0], {}).values())
+        if cmd == "HDEL":
+            table = self.hashes.get(rest[0], {})
+            return sum(table.pop(field, None) is not None for field in rest[1:])
+        if cmd == "ZADD":
+            zset = self.zsets.setdefault(rest[0], {})
+            added = rest[2] not in zset
+            zset[rest[2]] = float(rest[1])
+            return int(added)
+        if cmd == "ZREM":
+            return int(self.zsets.get(rest[0], {}).pop(rest[1], None) is not None)
+        if cmd == "ZCARD":
+            return len(self.zsets.get(rest[0], {}))
+        if cmd == "ZREMRANGEBYSCORE":
+            zset = self.zsets.get(rest[0], {})
+            doomed = [m for m, score in zset.items() if score <= float(rest[2])]
+            for member in doomed:
+                del zset[member]
+            return len(doomed)
+        if cmd == "ZCOUNT":
+            low = float(rest[1].lstrip(b"("))
+            return sum(score > low for score in self.zsets.get(rest[0], {}).values())
+        if cmd == "SET":
+            expires = time.time() + int(rest[3]) / 1000 if len(rest) > 3 else None
+            self.strings[rest[0]] = (rest[1], expires)
+            return True
+        if cmd == "GET":
+            return self._string(rest[0])
+        if cmd == "EXISTS":
+            return sum(self._string(key) is not None for key in rest)
+        if cmd == "DEL":
+            removed = 0
+            for key in rest:
+                for store in (self.strings, self.lists):
+                    removed += store.pop(key, None) is not None
+            return removed
+        if cmd == "RPUSH":
+            self.lists.setdefault(rest[0], []).extend(rest[1:])
+            return len(self.lists[rest[0]])
+        if cmd == "LPOP":
+            items = self.lists.get(rest[0])
+            return items.pop(0) if items else None
+        raise AssertionError(f"Unsupported command in stand-in: {cmd}")
+
+
+@pytest_asyncio.fixture(params=["memory", "sqlite", "redis"], loop_scope="function")
+async def backend(request, tmp_path) -> AsyncIterator[SharedStateBackend]:
+    if request.param == "memory":
+        state: SharedStateBackend = InMemorySharedState()
+        yield state
+    elif request.param == "sqlite":
+        state = SQLiteSharedState(tmp_path / "state.db")
+        yield state
+        await state.close()
+    else:
+        server = _RespStandIn()
+        state = RedisSharedState(await server.start())
+        yield state
+        await state.close()
+        await server.stop()
+
+
+@pytest_asyncio.fixture(params=["sqlite", "redis"], loop_scope="function")
+async def shared_pair(request, tmp_path) -> AsyncIterator[tuple[SharedStateBackend, ...]]:
+    """Two backend instances over one store, as two worker processes would have."""
+    if request.param == "sqlite":
+        pair = (SQLiteSharedState(tmp_path / "s.db"), SQLiteSharedState(tmp_path / "s.db"))
+        yield pair
+    else:
+        server = _RespStandIn()
+        url = await server.start()
+        pair = (RedisSharedState(url), RedisSharedState(url))
+        yield pair
+    for state in pair:
+        await state.close()
+    if request.param == "redis":
+        await server.stop()
+
+
+async def test_session_roundtrip(backend):
+    manager = WorkflowSessionManager(max_concurrent=5, state=backend)
+    session = await manager.create_session(task="Task", reasoning_effort="minimal")
+
+    stored = await backend.get_session(session.workflow_id)
+    assert stored is not None
+    assert stored.task == "Task"
+    assert stored.reasoning_effort == "minimal"
+
+    await manager.update_status(session.workflow_id, WorkflowStatus.RUNNING)
+    assert (await manager.get_session(session.workflow_id)).status == WorkflowStatus.RUNNING
+    assert [s.workflow_id for s in await manager.list_sessions()] == [session.workflow_id]
+
+    await backend.delete_sessions([session.workflow_id])
+    assert await backend.get_session(session.workflow_id) is None
+
+
+async def test_slots_enforce_limit_and_expire(backend):
+    assert await backend.try_acquire_slot("a", 2, 60)
+    assert await backend.try_acquire_slot("b", 2, 60)
+    assert not await backend.try_acquire_slot("c", 2, 60)
+    # Re-acquiring a held slot renews it rather than failing.
+    assert await backend.try_acquire_slot("a", 2, 60)
+    assert await backend.count_slots() == 2
+
+    await backend.release_slot("a")
+    assert await backend.try_acquire_slot("c", 2, 0.05)
+    await asyncio.sleep(0.1)
+    assert await backend.count_slots() == 1
+    assert await backend.try_acquire_slot("d", 2, 60)
+
+
+async def test_cancel_and_responses(backend):
+    assert not await backend.is_cancel_requested("wf-1")
+    await backend.request_cancel("wf-1")
+    assert await backend.is_cancel_requested("wf-1")
+
+    await backend.push_response("wf-1", {"request_id": "r1", "response": {"ok": True}})
+    await backend.push_response("wf-1", {"request_id": "r2", "response": {"ok": False}})
+    assert [p["request_id"] for p in await backend.pop_responses("wf-1")] == ["r1", "r2"]
+    assert await backend.pop_responses("wf-1") == []
+
+    await backend.push_response("wf-1", {"request_id": "r3", "response": {}})
+    await backend.clear_signals("wf-1")
+    assert not await backend.is_cancel_requested("wf-1")
+    assert await backend.pop_responses("wf-1") == []
+
+
+async def test_thread_state_ttl(backend):
+    state = {"type": "agent_thread_state", "service_thread_id": "t-1"}
+    await backend.save_thread_state("conv-1", state, ttl_seconds=60)
+    assert await backend.load_thread_state("conv-1") == state
+
+    await backend.save_thread_state("conv-2", state, ttl_seconds=0.05)
+    await asyncio.sleep(0.1)
+    assert await backend.load_thread_state("conv-2") is None
+
+
+async def test_concurrency_limit_is_global_across_workers(shared_pair):
+    worker_a = WorkflowSessionManager(max_concurrent=2, state=shared_pair[0])
+    worker_b = WorkflowSessionManager(max_concurrent=2, state=shared_pair[1])
+
+    first = await worker_a.create_session(task="one")
+    await worker_b.create_session(task="two")
+    with pytest.raises(HTTPException) as exc_info:
+        await worker_a.create_session(task="three")
+    assert exc_info.value.status_code == 429
+    assert await worker_b.count_active() == 2
+
+    await worker_a.update_status(first.workflow_id, WorkflowStatus.COMPLETED)
+    await worker_b.create_session(task="three")
+
+
+async def test_cancel_and_hitl_relayed_to_owning_worker(shared_pair):
+    owner_state, other_state = shared_pair
+    release = asyncio.Event()
+
+    async def run_stream(*_args, **_kwargs):
+        await release.wait()
+        yield MagicMock()
+
+    owner_workflow = MagicMock()
+    owner_workflow.run_stream = run_stream
+    owner_workflow.send_workflow_responses = AsyncMock()
+    owner_workflow.history_manager = None
+    conversations = MagicMock()
+    conversations.get_conversation.return_value = None
+
+    owner = ChatSSEService(
+        owner_workflow,
+        WorkflowSessionManager(state=owner_state),
+        conversations,
+        signal_poll_interval=0.01,
+    )
+    other = ChatSSEService(
+        MagicMock(),
+        WorkflowSessionManager(state=other_state),
+        conversations,
+        signal_poll_interval=0.01,
+    )
+
+    stream = owner.stream_chat("conv-1", "hello")
+    await anext(stream)  # connected
+    (workflow_id,) = owner._cancel_events
+
+    assert await other.submit_response(workflow_id, "req-1", {"approved": True})
+    for _ in range(100):
+        if owner_workflow.send_workflow_responses.await_count:
+            break
+        await asyncio.sleep(0.01)
+    owner_workflow.send_workflow_responses.assert_awaited_once_with({"req-1": {"approved": True}})
+
+    assert await other.cancel_stream(workflow_id)
+    for _ in range(100):
+        if owner._cancel_events[workflow_id].is_set():
+            break
+        await asyncio.sleep(0.01)
+    assert owner._cancel_events[workflow_id].is_set()
+
+    release.set()
+    async for _ in stream:
+        pass
+    session = await other_state.get_session(workflow_id)
+    assert session.status == WorkflowStatus.CANCELLED
+    assert not await other.cancel_stream(workflow_id)
+
+
+async def test_resp_resends_only_idempotent_commands_after_disconnect():
+    server = _RespStandIn()
+    state = RedisSharedState(await server.start())
+    try:
+        await state.save_thread_state("conv-1", {"v": 1}, ttl_seconds=60)
+        server.drop_after.add("GET")
+        assert await state.load_thread_state("conv-1") == {"v": 1}
+
+        server.drop_after.add("RPUSH")
+        with pytest.raises(SharedStateError):
+            await state.push_response("wf-1", {"approved": True})
+        assert await state.pop_responses("wf-1") == [{"approved": True}]
+    finally:
+        await state.close()
+        await server.stop()
+
+
+async def test_thread_cache_defers_to_newer_shared_version(tmp_path):
+    worker_a = SQLiteSharedState(tmp_path / "s.db")
+    worker_b = SQLiteSharedState(tmp_path / "s.db")
+    chat_helpers.configure_thread_state(worker_a)
+    try:
+        thread = await chat_helpers._get_or_create_thread("conv-1")
+        assert thread is not None
+        await chat_helpers.persist_thread_state("conv-1", thread)
+        assert await chat_helpers._get_or_create_thread("conv-1") is thread
+
+        # Another worker ran a later turn of the same conversation.
+        entry = await worker_b.load_thread_state("conv-1")
+        assert entry is not None
+        entry["version"] = "from-worker-b"
+        await worker_b.save_thread_state("conv-1", entry, ttl_seconds=60)
+
+        restored = await chat_helpers._get_or_create_thread("conv-1")
+        assert restored is not None
+        assert restored is not thread
+        assert await chat_helpers._get_or_create_thread("conv-1") is restored
+    finally:
+        chat_helpers.configure_thread_state(None)
+        chat_helpers._conversation_threads.pop("conv-1", None)
+        await worker_a.close()
+        await worker_b.close()
+
+
+async def test_slow_shared_read_does_not_block_other_conversations():
+    release = asyncio.Event()
+    state = MagicMock()
+
+    async def load_thread_state(conversation_id: str):
+        if conversation_id == "slow":
+            await release.wait()
+        return None
+
+    state.load_thread_state = load_thread_state
+    chat_helpers.configure_thread_state(state)
+    try:
+        slow = asyncio.create_task(chat_helpers._get_or_create_thread("slow"))
+        await asyncio.sleep(0)
+        fast = await asyncio.wait_for(chat_helpers._get_or_create_thread("fast"), timeout=1)
+        assert fast is not None
+        assert not slow.done()
+
+        release.set()
+        assert await slow is not None
+    finally:
+        chat_helpers.configure_thread_state(None)
+        for cid in ("slow", "fast"):
+            chat_helpers._conversation_threads.pop(cid, None)
@@ -0,0 +1,106 @@
+"""Tests for the optional_span tracing facade."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+
+import pytest
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from agentic_fleet.utils.infra import langfuse, telemetry
+from agentic_fleet.utils.infra.telemetry import (
+    SpanPolicy,
+    configure_span_policy,
+    optional_span,
+    prepare_span_attributes,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_policy() -> Generator[None, None, None]:
+    configure_span_policy()
+    yield
+    configure_span_policy()
+
+
+@pytest.fixture
+def exporter(monkeypatch) -> InMemorySpanExporter:
+    """Enable tracing with an in-memory exporter (without touching the global provider)."""
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    telemetry._policy.enabled = True
+    telemetry._active = None
+    monkeypatch.setattr(telemetry, "_get_tracer", provider.get_tracer)
+    return exporter
+
+
+def test_disabled_tracing_returns_shared_noop():
+    configure_span_policy(SpanPolicy(enabled=False))
+
+    first = optional_span("DSPyReasoner.route_task", attributes={"task": "x" * 10_000})
+    second = optional_span("RoutingExecutor.handle_analysis")
+
+    assert first is second
+    with first as span:
+        assert span is None
+
+
+def test_langfuse_span_helper_skips_context_when_disabled():
+    configure_span_policy(SpanPolicy(enabled=False))
+    before = langfuse.get_langfuse_context()
+
+    with langfuse.create_dspy_span("route_task", module_name="router"):
+        pass
+
+    assert langfuse.get_langfuse_context() == before
+
+
+def test_attributes_are_truncated_hashed_and_coerced():
+    policy = SpanPolicy(max_attribute_length=32, hash_attributes={"query"})
+    long_task = "plan the trip " * 10
+
+    prepared = prepare_span_attributes(
+        {"task": long_task, "query": "secret", "mode": {"a": 1}, "agents": ("a", "b"), "x": None},
+        policy,
+    )
+
+    assert len(prepared["task"]) == 32
+    assert prepared["task"].endswith("…")
+    assert prepared["task.length"] == len(long_task)
+    assert len(prepared["task.sha256"]) == 16
+    assert "query" not in prepared
+    assert prepared["query.length"] == 6
+    assert prepared["mode"] == "{'a': 1}"
+    assert prepared["agents"] == ["a", "b"]
+    assert "x" not in prepared
+
+
+def test_sampled_spans_record_truncated_attributes(exporter):
+    telemetry._policy.max_attribute_length = 20
+
+    with optional_span("DSPyReasoner.route_task", attributes={"task": "t" * 100}) as span:
+        assert span is not None
+
+    (recorded,) = exporter.get_finished_spans()
+    assert recorded.name == "DSPyReasoner.route_task"
+    assert recorded.attributes["task"] == "t" * 19 + "…"
+    assert recorded.attributes["task.length"] == 100
+
+
+def test_sampled_out_family_drops_nested_spans(exporter):
+    telemetry._policy.sample_rates = {"RoutingExecutor": 0.0}
+
+    with (
+        optional_span("RoutingExecutor.handle_analysis"),
+        optional_span("DSPyReasoner.route_task") as nested,
+    ):
+        assert nested is None
+    with optional_span("QualityExecutor.handle_progress", family="RoutingExecutor"):
+        pass
+    with optional_span("DSPyReasoner.assess_quality"):
+        pass
+
+    assert [span.name for span in exporter.get_finished_spans()] == ["DSPyReasoner.assess_quality"]
@@ -7,19 +7,27 @@ QualityExecutor.
 
 from __future__ import annotations
 
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from agentic_fleet.utils.models import ExecutionMode, RoutingDecision
-from agentic_fleet.workflows.context import SupervisorContext
+from agentic_fleet.workflows.context import SupervisorContext, current_cancel_event
 from agentic_fleet.workflows.executors import (
     AnalysisExecutor,
+    ExecutionExecutor,
     ProgressExecutor,
     QualityExecutor,
     RoutingExecutor,
 )
-from agentic_fleet.workflows.models import AnalysisResult, ProgressReport, QualityReport
+from agentic_fleet.workflows.models import (
+    AnalysisResult,
+    ProgressReport,
+    QualityReport,
+    RoutingMessage,
+    RoutingPlan,
+)
 
 # =============================================================================
 # Fixtures
@@ -320,6 +328,48 @@ class TestRoutingExecutor:
             executor._fallback_routing("Test task")
 
 
+# =============================================================================
+# Test: ExecutionExecutor
+# =============================================================================
+
+
+class TestExecutionExecutor:
+    """Tests for ExecutionExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_each_run_gets_its_own_cancel_event(self, mock_supervisor_context):
+        """Concurrent runs sharing one context each pass their own cancel event on."""
+        executor = ExecutionExecutor("execution-1", mock_supervisor_context)
+        seen: dict[str, asyncio.Event | None] = {}
+
+        async def fake_phase(*, routing, task, context, cancel_event=None):
+            await asyncio.sleep(0)  # let the other run start in between
+            seen[task] = cancel_event
+            return
+            yield
+
+        async def run(task: str, event: asyncio.Event) -> None:
+            current_cancel_event.set(event)
+            decision = RoutingDecision(
+                task=task, assigned_to=("Writer",), mode=ExecutionMode.DISCUSSION
+            )
+            ctx = MagicMock()
+            ctx.send_message = AsyncMock()
+            await executor.handle_routing(
+                RoutingMessage(task=task, routing=RoutingPlan(decision=decision)), ctx
+            )
+
+        events = {"a": asyncio.Event(), "b": asyncio.Event()}
+        with patch(
+            "agentic_fleet.workflows.executors.execution.run_execution_phase_streaming",
+            fake_phase,
+        ):
+            await asyncio.gather(*(run(task, event) for task, event in events.items()))
+
+        assert seen == events
+        assert current_cancel_event.get() is None
+
+
 # =============================================================================
 # Test: ProgressExecutor
 # =============================================================================
@@ -452,6 +502,58 @@ class TestQualityExecutor:
         assert result.missing == ""
         assert result.improvements == ""
 
+    @pytest.mark.asyncio
+    async def test_best_of_n_refinement_keeps_the_better_candidate(
+        self, mock_dspy_reasoner, mock_supervisor_context
+    ):
+        """Best-of-N refinement replaces the result only when a candidate scores higher."""
+        import dspy
+
+        config = mock_supervisor_context.config
+        config.refinement_threshold = 8.0
+        config.refinement_candidates = 2
+        config.refinement_max_concurrency = 2
+        config.refinement_time_budget_seconds = None
+        candidates = iter(["better answer", "worse answer"])
+        prompts: list[dict[str, str]] = []
+        judged_tasks: list[str] = []
+
+        def refiner(**inputs: str) -> dspy.Prediction:
+            prompts.append(inputs)
+            return dspy.Prediction(answer=next(candidates))
+
+        def assess_quality(task: str, result: str) -> dict:
+            judged_tasks.append(task)
+            return {
+                "score": 7.5 if result == "better answer" else 2.0,
+                "missing": "",
+                "improvements": "tighten wording",
+            }
+
+        mock_dspy_reasoner.response_refiner = refiner
+        mock_dspy_reasoner.assess_quality = assess_quality
+        executor = QualityExecutor("quality-1", mock_dspy_reasoner, mock_supervisor_context)
+        initial = QualityReport(score=5.0, missing="sources", improvements="add sources")
+
+        result, report, metadata = await executor._refine_best_of_n("task", "draft", initial)
+
+        assert prompts[0]["task"] == "task"
+        assert prompts[0]["draft"] == "draft"
+        assert "sources" in prompts[0]["feedback"]
+        assert "add sources" in prompts[0]["feedback"]
+        assert judged_tasks == ["task", "task"]
+        assert result == "better answer"
+        assert report.score == 7.5
+        assert report.improvements == "tighten wording"
+        assert metadata["applied"] is True
+        assert metadata["candidates_generated"] == 2
+
+        candidates = iter(["worse answer", "worse answer"])
+        result, report, metadata = await executor._refine_best_of_n("task", "draft", initial)
+
+        assert (result, report) == ("draft", initial)
+        assert metadata["applied"] is False
+
 
 # Note: Handler decorator tests removed as they require valid WorkflowContext signatures
 # which are framework-specific and not easily mockable in unit tests.
@@ -1,11 +1,16 @@
 """Tests for DSPy-powered Group Chat."""
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from agent_framework._types import ChatMessage, Role
+from agent_framework._agents import ChatAgent
+from agent_framework._types import AgentRunResponseUpdate, ChatMessage, Role
+from agent_framework._workflows import WorkflowOutputEvent
 
 from agentic_fleet.dspy_modules.reasoner import DSPyReasoner
+from agentic_fleet.workflows.config import build_workflow_config_from_yaml
+from agentic_fleet.workflows.strategies.discussion import execute_discussion_streaming
 from agentic_fleet.workflows.strategies.group_chat_adapter import (
     DSPyGroupChatManager,
     GroupChatBuilder,
@@ -178,3 +183,195 @@ async def test_group_chat_run_with_fallback(mock_agent_with_neither, mock_reason
     # Verify neither run nor process exist on the mock (spec limits attributes)
     assert not hasattr(mock_agent_with_neither, "run")
     assert not hasattr(mock_agent_with_neither, "process")
+
+
+def _scripted_agent(name: str, *replies: str) -> MagicMock:
+    """Agent (process-only) that answers with the given replies in order."""
+    agent = MagicMock(spec=["name", "description", "process"])
+    agent.name = name
+    agent.description = f"{name} agent"
+    agent.process = AsyncMock(
+        side_effect=[
+            ChatMessage(role=Role.ASSISTANT, text=reply, additional_properties={"name": name})
+            for reply in replies
+        ]
+    )
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_auto_selection_skips_the_lm_when_the_speaker_is_unambiguous(mock_reasoner):
+    """Mentions pick the next speaker; the reasoner is only asked when it is ambiguous."""
+    writer = _scripted_agent("Writer", "Draft ready, @Reviewer please check.")
+    reviewer = _scripted_agent("Reviewer", "Looks good.")
+    mock_reasoner.select_next_speaker.side_effect = [{"next_speaker": "TERMINATE"}]
+
+    manager = DSPyGroupChatManager(
+        agents=[writer, reviewer],
+        reasoner=mock_reasoner,
+        speaker_selection="auto",
+    )
+    history = await manager.run_chat("@Writer draft the release notes")
+
+    assert [msg.text for msg in history[1:]] == [
+        "Draft ready, @Reviewer please check.",
+        "Looks good.",
+    ]
+    assert [s["selector"] for s in manager.selections] == ["mention", "mention", "dspy"]
+    assert mock_reasoner.select_next_speaker.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_mention_at_the_end_of_a_sentence_selects_the_speaker(mock_reasoner):
+    """Trailing punctuation is not part of the mentioned name."""
+    writer = _scripted_agent("Writer", "Draft ready, over to @Reviewer.")
+    reviewer = _scripted_agent("Reviewer", "Looks good.")
+    mock_reasoner.select_next_speaker.side_effect = [{"next_speaker": "TERMINATE"}]
+
+    manager = DSPyGroupChatManager(
+        agents=[writer, reviewer],
+        reasoner=mock_reasoner,
+        speaker_selection="auto",
+    )
+    history = await manager.run_chat("Please draft the notes, @Writer.")
+
+    assert [msg.text for msg in history[1:]] == ["Draft ready, over to @Reviewer.", "Looks good."]
+    assert [s["selector"] for s in manager.selections] == ["mention", "mention", "dspy"]
+
+
+@pytest.mark.asyncio
+async def test_round_robin_selection_never_calls_the_lm(mock_reasoner):
+    """Round robin cycles through participants until a message ends with TERMINATE."""
+    first = _scripted_agent("First", "one", "three TERMINATE")
+    second = _scripted_agent("Second", "two")
+
+    manager = DSPyGroupChatManager(
+        agents=[first, second], reasoner=mock_reasoner, speaker_selection="round_robin"
+    )
+    history = await manager.run_chat("Count to three")
+
+    assert [msg.text for msg in history[1:]] == ["one", "two", "three TERMINATE"]
+    assert manager.selections[-1] == {"round": 4, "speaker": "TERMINATE", "selector": "round_robin"}
+    mock_reasoner.select_next_speaker.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_selector_sees_a_bounded_transcript(mock_reasoner):
+    """The reasoner gets the last messages of the chat and the cached participants block."""
+    agent = _scripted_agent("Solo", "a", "b", "c")
+    mock_reasoner.select_next_speaker.side_effect = [{"next_speaker": "Solo"}] * 3 + [
+        {"next_speaker": "TERMINATE"}
+    ]
+
+    manager = DSPyGroupChatManager(agents=[agent], reasoner=mock_reasoner, transcript_window=2)
+    await manager.run_chat("go")
+
+    last_call = mock_reasoner.select_next_speaker.call_args.kwargs
+    assert last_call["history"] == "[2 earlier messages omitted]\nSolo: b\nSolo: c"
+    assert last_call["participants"] == "- Solo: Solo agent"
+
+
+def test_unknown_speaker_selection_is_rejected(mock_agent_with_run, mock_reasoner):
+    """Invalid selection modes fail fast."""
+    with pytest.raises(ValueError, match="speaker selection"):
+        DSPyGroupChatManager(
+            agents=[mock_agent_with_run], reasoner=mock_reasoner, speaker_selection="random"
+        )
+
+
+def test_speaker_selection_is_validated_when_loading_yaml():
+    """The YAML setting is checked before any discussion runs."""
+    execution = {"discussion_speaker_selection": "round_robin"}
+    config = build_workflow_config_from_yaml({"workflow": {"execution": execution}})
+    assert config.discussion_speaker_selection == "round_robin"
+
+    execution["discussion_speaker_selection"] = "random"
+    with pytest.raises(ValueError, match="discussion_speaker_selection"):
+        build_workflow_config_from_yaml({"workflow": {"execution": execution}})
+
+
+class _StreamingAgent(ChatAgent):
+    """ChatAgent whose run_stream yields fixed chunks."""
+
+    chunks = ("Draft ", "ready.")
+
+    async def run_stream(self, messages=None, **kwargs):
+        for chunk in self.chunks:
+            await asyncio.sleep(0)
+            yield AgentRunResponseUpdate(text=chunk)
+
+
+def _streaming_agent() -> _StreamingAgent:
+    return _StreamingAgent(chat_client=MagicMock(), name="Writer", description="Writes drafts")
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_yields_speaker_deltas_and_messages(mock_reasoner):
+    """Events arrive per round: speaker pick, text deltas, the full message, then the end."""
+    mock_reasoner.select_next_speaker.side_effect = [
+        {"next_speaker": "Writer"},
+        {"next_speaker": "TERMINATE"},
+    ]
+    manager = DSPyGroupChatManager(agents=[_streaming_agent()], reasoner=mock_reasoner)
+
+    events = [event async for event in manager.stream_chat("Write the notes")]
+
+    assert [(e.kind, e.round, e.text) for e in events] == [
+        ("speaker", 1, ""),
+        ("delta", 1, "Draft "),
+        ("delta", 1, "ready."),
+        ("message", 1, "Draft ready."),
+        ("end", 1, ""),
+    ]
+    assert events[-1].reason == "terminated"
+    assert manager.history[-1].additional_properties["name"] == "Writer"
+
+
+@pytest.mark.asyncio
+async def test_stream_chat_checks_cancellation_between_rounds(mock_reasoner):
+    """A set cancel event stops the chat before the next speaker is selected."""
+    mock_reasoner.select_next_speaker.return_value = {"next_speaker": "Writer"}
+    manager = DSPyGroupChatManager(agents=[_streaming_agent()], reasoner=mock_reasoner)
+    cancel = asyncio.Event()
+
+    kinds = []
+    async for event in manager.stream_chat("Write the notes", cancel_event=cancel):
+        kinds.append(event.kind)
+        if event.kind == "message":
+            cancel.set()
+
+    assert kinds[-1] == "end"
+    assert event.reason == "cancelled"
+    assert mock_reasoner.select_next_speaker.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_discussion_strategy_forwards_events_live(mock_reasoner):
+    """The discussion strategy turns chat events into agent events as they happen."""
+    mock_reasoner.select_next_speaker.side_effect = [
+        {"next_speaker": "Writer"},
+        {"next_speaker": "TERMINATE"},
+    ]
+    agents = {"Writer": _streaming_agent()}
+
+    events = [
+        event
+        async for event in execute_discussion_streaming(
+            agents, ["Writer"], "Write the notes", reasoner=mock_reasoner, speaker_selection="dspy"
+        )
+    ]
+
+    names = [getattr(event, "event", type(event).__name__) for event in events]
+    assert names == [
+        "discussion.start",
+        "agent.start",
+        "agent.delta",
+        "agent.delta",
+        "agent.message",
+        "discussion.completed",
+        "WorkflowOutputEvent",
+    ]
+    assert events[4].payload["round"] == 1
+    assert events[5].payload["reason"] == "terminated"
+    assert isinstance(events[-1], WorkflowOutputEvent)
+    assert events[-1].data[0].text == "Draft ready."
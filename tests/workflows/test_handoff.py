@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import json
 from dataclasses import dataclass
 from typing import Any
 from unittest.mock import MagicMock
@@ -208,7 +209,7 @@ class TestHandoffManager:
     def test_manager_initialization(self, manager):
         """Test HandoffManager initialization."""
         assert manager.supervisor is not None
-        assert manager.handoff_history == []
+        assert list(manager.handoff_history) == []
 
     def test_manager_with_compiled_supervisor_provider(self, mock_supervisor):
         """Test manager with compiled supervisor provider."""
@@ -513,7 +514,7 @@ class TestHandoffManagerEdgeCases:
 
     def test_handoff_history_tracking(self, manager):
         """Test that handoff history is tracked."""
-        assert manager.handoff_history == []
+        assert list(manager.handoff_history) == []
 
         # After creating handoff packages, history should be updated
         # (tested via create_handoff_package)
@@ -545,7 +546,7 @@ class TestHandoffManagerEdgeCases:
 
         manager.clear_history()
 
-        assert manager.handoff_history == []
+        assert list(manager.handoff_history) == []
 
 
 # =============================================================================
@@ -596,3 +597,43 @@ class TestHandoffManagerStatistics:
 
         assert "effort_distribution" in summary
         assert summary["effort_distribution"]["moderate"] == 3
+
+    def test_history_is_bounded_but_counters_cover_everything(self, tmp_path):
+        """Test the ring buffer keeps recent records while counters keep totals."""
+        path = tmp_path / "handoffs.jsonl"
+        manager = HandoffManager(dspy_supervisor=MagicMock(), history_limit=2, history_path=path)
+        for i, (to_agent, effort) in enumerate(
+            [("analyst", "simple"), ("writer", "complex"), ("analyst", "moderate")]
+        ):
+            manager._record_handoff(
+                HandoffContext(
+                    from_agent="researcher",
+                    to_agent=to_agent,
+                    task="Task A" if i < 2 else "Task B",
+                    work_completed="Work done",
+                    artifacts={},
+                    remaining_objectives=[],
+                    success_criteria=[],
+                    tool_requirements=[],
+                    estimated_effort=effort,
+                    quality_checklist=[],
+                )
+            )
+
+        assert [h.to_agent for h in manager.handoff_history] == ["writer", "analyst"]
+        summary = manager.get_handoff_summary()
+        assert summary["total_handoffs"] == 3
+        assert summary["recent_handoffs"] == 2
+        assert summary["most_common_handoffs"][0] == ("researcher → analyst", 2)
+        assert summary["effort_distribution"] == {"simple": 1, "moderate": 1, "complex": 1}
+        assert summary["avg_handoffs_per_task"] == 1.5
+
+        streamed = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["to_agent"] for record in streamed] == ["analyst", "writer", "analyst"]
+
+        export = tmp_path / "export.jsonl"
+        manager.export_history(str(export))
+        assert len(export.read_text().splitlines()) == 2
+
+        manager.clear_history()
+        assert manager.get_handoff_summary()["total_handoffs"] == 0
@@ -0,0 +1,218 @@
+"""Tests for the adaptive pipeline profile's phase policy."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from agentic_fleet.dspy_modules.reasoner import DSPyReasoner
+from agentic_fleet.utils.models import ExecutionMode, RoutingDecision
+from agentic_fleet.workflows.config import WorkflowConfig
+from agentic_fleet.workflows.context import SupervisorContext
+from agentic_fleet.workflows.executors import ProgressExecutor, QualityExecutor, RoutingExecutor
+from agentic_fleet.workflows.helpers import PhasePlan, PhasePolicy, QualityHistory
+from agentic_fleet.workflows.models import (
+    AnalysisMessage,
+    AnalysisResult,
+    ExecutionMessage,
+    ExecutionOutcome,
+    ProgressMessage,
+    ProgressReport,
+)
+
+
+def _routing(*agents: str, confidence: float = 0.95) -> RoutingDecision:
+    return RoutingDecision(
+        task="t",
+        assigned_to=agents,
+        mode=ExecutionMode.DELEGATED if len(agents) == 1 else ExecutionMode.PARALLEL,
+        subtasks=("t",),
+        confidence=confidence,
+    )
+
+
+def _history(*runs: tuple[str, float]) -> MagicMock:
+    manager = MagicMock()
+    manager.get_recent_executions.return_value = [
+        {
+            "task": task,
+            "quality": {"score": score},
+            "phase_timings": {"progress": 1.5, "quality": 2.5},
+            "phase_status": {"progress": "success", "quality": "success"},
+        }
+        for task, score in runs
+    ]
+    return manager
+
+
+async def test_complex_or_uncertain_plans_run_every_phase():
+    policy = PhasePolicy()
+
+    for routing, complexity, expected in [
+        (_routing("Writer"), "complex", "complex task"),
+        (_routing("Writer", "Researcher"), "simple", "parallel plan with 2 agent(s)"),
+        (_routing("Writer", confidence=0.5), "simple", "routing confidence 0.50 < 0.80"),
+        (_routing("Writer"), "moderate", "latency budget medium, moderate task"),
+    ]:
+        plan = await policy.decide("t", routing, complexity=complexity, latency_budget="medium")
+        assert not plan.progress.skipped
+        assert not plan.quality.skipped
+        assert plan.progress.reason == expected
+
+
+async def test_quality_needs_good_history_for_similar_tasks():
+    task = "Translate the greeting into French"
+    similar = [(task, 9.0), ("Translate this greeting into French", 8.5), (task, 9.5)]
+
+    no_history = await PhasePolicy().decide(
+        task, _routing("Writer"), complexity="moderate", latency_budget="low"
+    )
+    assert no_history.progress.skipped
+    assert not no_history.quality.skipped
+
+    good = PhasePolicy(history=QualityHistory(_history(*similar, ("Write a poem", 2.0))))
+    plan = await good.decide(task, _routing("Writer"), complexity="moderate", latency_budget="low")
+    assert plan.quality.skipped
+    assert plan.quality.reason == "similar tasks averaged 9.0 over 3 run(s)"
+    assert plan.estimated_saved_seconds == 4.0
+
+    poor = PhasePolicy(history=QualityHistory(_history((task, 5.0), (task, 6.0), (task, 7.0))))
+    plan = await poor.decide(task, _routing("Writer"), complexity="simple")
+    assert plan.progress.skipped
+    assert plan.quality.status() == "run: similar tasks averaged 6.0 < 8"
+
+
+async def test_cached_analysis_lowers_the_history_requirement():
+    task = "Translate the greeting into French"
+    policy = PhasePolicy(history=QualityHistory(_history((task, 9.0))))
+
+    uncached = await policy.decide(task, _routing("Writer"), complexity="simple")
+    cached = await policy.decide(
+        task, _routing("Writer"), complexity="simple", analysis_cached=True
+    )
+
+    assert not uncached.quality.skipped
+    assert cached.quality.skipped
+    assert cached.quality.reason.endswith("(cached analysis)")
+
+
+def _simple_analysis() -> AnalysisResult:
+    return AnalysisResult(
+        complexity="simple",
+        capabilities=[],
+        tool_requirements=[],
+        steps=1,
+        search_context="",
+        needs_web_search=False,
+        search_query="",
+    )
+
+
+async def test_reasoner_routing_confidence_reaches_the_policy():
+    supervisor = DSPyReasoner(use_enhanced_signatures=False)
+    predictions = [
+        SimpleNamespace(assigned_to=[agent], mode="delegated", subtasks=["Sum sales"], **reported)
+        for agent, reported in (
+            ("Analyst", {"confidence": "0.9"}),
+            ("Analyst", {"confidence": 0.5}),
+            ("Auditor", {"confidence": 0.9}),
+            ("Analyst", {}),
+        )
+    ]
+    supervisor.router = MagicMock(side_effect=predictions)
+    context = SupervisorContext(
+        config=WorkflowConfig(pipeline_profile="adaptive", dspy_retry_attempts=1),
+        agents={"Analyst": SimpleNamespace(description="Analyzes data")},
+    )
+    ctx = MagicMock()
+    ctx.send_message = AsyncMock()
+    executor = RoutingExecutor("routing", supervisor, context)
+    message = AnalysisMessage(
+        task="Sum the quarterly sales figures", analysis=_simple_analysis(), metadata={}
+    )
+
+    await executor.handle_analysis(message, ctx)
+    routing = ctx.send_message.call_args[0][0].routing.decision
+    assert routing.confidence == 0.9
+    assert context.latest_phase_status["progress_policy"].startswith("skip: single agent")
+
+    await executor.handle_analysis(message, ctx)  # the router is unsure
+    assert context.latest_phase_status["progress_policy"] == "run: routing confidence 0.50 < 0.80"
+
+    await executor.handle_analysis(message, ctx)  # routed to an agent not on the team
+    assert ctx.send_message.call_args[0][0].routing.decision.confidence == 0.0
+    assert context.latest_phase_status["progress_policy"] == "run: routing confidence 0.00 < 0.80"
+
+    await executor.handle_analysis(message, ctx)  # no confidence reported: never trusted
+    assert ctx.send_message.call_args[0][0].routing.decision.confidence is None
+    assert context.latest_phase_status["progress_policy"] == "run: routing confidence 0.00 < 0.80"
+
+
+async def test_adaptive_profile_records_and_applies_decisions():
+    supervisor = MagicMock()
+    supervisor.route_task = AsyncMock(
+        return_value={
+            "assigned_to": ["Writer"],
+            "mode": "delegated",
+            "subtasks": ["Say hi"],
+            "confidence": 0.95,
+            "latency_budget": "low",
+        }
+    )
+    supervisor.evaluate_progress = AsyncMock()
+    supervisor.assess_quality = AsyncMock(return_value={"score": 9.0})
+    context = SupervisorContext(
+        config=WorkflowConfig(pipeline_profile="adaptive", dspy_retry_attempts=1),
+        agents={"Writer": MagicMock()},
+    )
+    ctx = MagicMock()
+    ctx.send_message = AsyncMock()
+    ctx.yield_output = AsyncMock()
+
+    analysis = AnalysisResult(
+        complexity="simple",
+        capabilities=[],
+        tool_requirements=[],
+        steps=1,
+        search_context="",
+        needs_web_search=False,
+        search_query="",
+    )
+    await RoutingExecutor("routing", supervisor, context).handle_analysis(
+        AnalysisMessage(task="Say hi", analysis=analysis, metadata={}), ctx
+    )
+    metadata = ctx.send_message.call_args[0][0].metadata
+    plan = PhasePlan.from_metadata(metadata)
+    assert plan is not None
+    assert plan.progress.skipped
+    assert not plan.quality.skipped
+    assert context.latest_phase_status["progress_policy"].startswith("skip: single agent")
+    assert context.latest_phase_status["quality_policy"].startswith("run: 0 similar")
+
+    outcome = ExecutionOutcome(
+        result="Hi!",
+        mode=ExecutionMode.DELEGATED,
+        assigned_agents=["Writer"],
+        subtasks=["Say hi"],
+        status="success",
+        artifacts={},
+    )
+    await ProgressExecutor("progress", supervisor, context).handle_execution(
+        ExecutionMessage(task="Say hi", outcome=outcome, metadata=metadata), ctx
+    )
+    supervisor.evaluate_progress.assert_not_called()
+    assert context.latest_phase_status["progress"] == "skipped"
+
+    await QualityExecutor("quality", supervisor, context).handle_progress(
+        ProgressMessage(
+            task="Say hi",
+            result="Hi!",
+            progress=ProgressReport(action="complete", feedback=""),
+            metadata=metadata,
+        ),
+        ctx,
+    )
+    supervisor.assess_quality.assert_awaited_once()
+    final = ctx.yield_output.call_args[0][0]
+    assert final.phase_status["quality"] == "success"
+    assert final.metadata["phase_policy"]["progress"]["action"] == "skip"
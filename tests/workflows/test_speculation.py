@@ -0,0 +1,132 @@
+"""Tests for speculative routing/search overlapped with analysis."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+from agentic_fleet.workflows.config import WorkflowConfig
+from agentic_fleet.workflows.context import SupervisorContext
+from agentic_fleet.workflows.executors import AnalysisExecutor, RoutingExecutor
+from agentic_fleet.workflows.models import AnalysisMessage, RoutingMessage, TaskMessage
+
+ROUTING = {
+    "assigned_to": ["Researcher"],
+    "mode": "delegated",
+    "subtasks": ["subtask1"],
+    "confidence": 0.9,
+}
+
+
+def _supervisor(analysis: dict, *, analysis_seconds: float = 0.2) -> MagicMock:
+    def analyze_task(*_args, **_kwargs):
+        time.sleep(analysis_seconds)  # sync DSPy call
+        return analysis
+
+    def route_task(**_kwargs):
+        time.sleep(0.1)
+        return dict(ROUTING)
+
+    async def web_search(_query):
+        await asyncio.sleep(0.1)
+        return "fresh results"
+
+    supervisor = MagicMock()
+    supervisor.analyze_task = MagicMock(side_effect=analyze_task)
+    supervisor.route_task = MagicMock(side_effect=route_task)
+    supervisor.perform_web_search_async = AsyncMock(side_effect=web_search)
+    supervisor.tool_registry = None
+    return supervisor
+
+
+def _context(*, speculative: bool = True) -> SupervisorContext:
+    config = WorkflowConfig(
+        enable_speculative_execution=speculative,
+        dspy_retry_attempts=1,
+        dspy_retry_backoff_seconds=0.0,
+    )
+    return SupervisorContext(config=config, agents={"Researcher": MagicMock()})
+
+
+async def _run(supervisor: MagicMock, context: SupervisorContext, task: str) -> RoutingMessage:
+    ctx = MagicMock()
+    ctx.send_message = AsyncMock()
+    await AnalysisExecutor("analysis", supervisor, context).handle_task(
+        TaskMessage(task=task, metadata={}), ctx
+    )
+    analysis_msg = ctx.send_message.call_args[0][0]
+    assert isinstance(analysis_msg, AnalysisMessage)
+
+    ctx.send_message.reset_mock()
+    await RoutingExecutor("routing", supervisor, context).handle_analysis(analysis_msg, ctx)
+    routing_msg = ctx.send_message.call_args[0][0]
+    assert isinstance(routing_msg, RoutingMessage)
+    return routing_msg
+
+
+async def test_speculative_routing_is_reused_and_overlaps_analysis():
+    supervisor = _supervisor({"complexity": "moderate", "needs_web_search": False})
+    context = _context()
+
+    routing_msg = await _run(supervisor, context, "Summarize the attached design doc")
+
+    supervisor.route_task.assert_called_once()
+    assert routing_msg.routing.decision.assigned_to == ("Researcher",)
+    assert context.latest_phase_status["routing"] == "speculative"
+    assert context.latest_phase_status["speculative_routing"] == "hit"
+    # Routing (0.1s) finished while analysis (0.2s) was still running.
+    assert context.latest_phase_timings["speculative_routing_overlap"] > 0.05
+    speculation = routing_msg.metadata["speculation"]
+    assert speculation["routing"] == "hit"
+    assert speculation["search"] == "skipped"
+    assert speculation["saved_seconds"] > 0.05
+    assert context.speculation is None
+
+
+async def test_speculative_search_is_reused_and_stale_routing_redone():
+    supervisor = _supervisor(
+        {
+            "complexity": "moderate",
+            "needs_web_search": True,
+            "search_query": "latest solar news",
+            "search_context": "",
+        }
+    )
+    context = _context()
+
+    routing_msg = await _run(supervisor, context, "What is the latest news on solar power?")
+
+    # The search started from the raw task is reused instead of searching again.
+    supervisor.perform_web_search_async.assert_awaited_once_with(
+        "What is the latest news on solar power?"
+    )
+    # Routing saw no search context speculatively, so it is redone with it.
+    assert supervisor.route_task.call_count == 2
+    assert "fresh results" in supervisor.route_task.call_args.kwargs["context"]
+    assert context.latest_phase_status["routing"] == "success"
+    assert routing_msg.metadata["speculation"]["search"] == "hit"
+    assert routing_msg.metadata["speculation"]["routing"] == "miss"
+    assert context.latest_phase_timings["speculative_search_overlap"] > 0.05
+
+
+async def test_unused_speculative_search_is_discarded():
+    supervisor = _supervisor({"complexity": "moderate", "needs_web_search": False})
+    context = _context()
+
+    routing_msg = await _run(supervisor, context, "Explain today's date handling in Python")
+
+    assert routing_msg.metadata["speculation"]["search"] == "discarded"
+    assert routing_msg.metadata["speculation"]["routing"] == "hit"
+
+
+async def test_disabled_by_default():
+    supervisor = _supervisor({"complexity": "moderate"}, analysis_seconds=0.0)
+    context = _context(speculative=False)
+
+    routing_msg = await _run(supervisor, context, "What is the latest news on solar power?")
+
+    supervisor.route_task.assert_called_once()
+    supervisor.perform_web_search_async.assert_not_called()
+    assert "speculation" not in routing_msg.metadata
+    assert context.latest_phase_status["routing"] == "success"